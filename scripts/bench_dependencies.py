@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Benchmark the dependency engine on synthetic task graphs.
+
+Builds random DAGs (fixed seed) of 1k, 10k and 100k tasks and times
+graph construction, cycle detection, topological ordering, critical-path
+analysis and an incremental ready-set drain (completing every task in
+order). Each phase runs --repeats times and the median is reported.
+Per-task cost should stay roughly flat as the graph grows; the script
+exits non-zero if any phase scales worse than --max-growth per 10x.
+
+Usage:
+    uv run python scripts/bench_dependencies.py [--sizes 1000 10000 100000] [--repeats 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import math
+import random
+import statistics
+import sys
+import time
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from ralph_gold.dependencies import (  # noqa: E402
+    DependencyGraph,
+    ReadySet,
+    _topological_sort,
+    build_dependency_graph,
+    compute_critical_path,
+    detect_circular_dependencies,
+)
+
+
+def synthetic_tasks(count: int, fan_in: int = 3, seed: int = 7) -> List[Dict[str, object]]:
+    """Tasks where each depends on up to `fan_in` earlier tasks.
+
+    Most edges point to recent tasks so the graph has long chains as well
+    as wide levels; the first task of every 1000 also depends on its
+    predecessor, giving a chain through the whole graph.
+    """
+    rng = random.Random(seed)
+    tasks: List[Dict[str, object]] = []
+    for i in range(count):
+        deps = set()
+        if i and i % 1000 == 0:
+            deps.add(i - 1)
+        for _ in range(rng.randint(0, fan_in) if i else 0):
+            deps.add(max(0, i - 1 - int(rng.expovariate(1 / 50))))
+        tasks.append({"id": f"task-{i}", "depends_on": [f"task-{d}" for d in sorted(deps)]})
+    return tasks
+
+
+def _timed(fn: Callable[[], object]) -> float:
+    # Like timeit: keep the cyclic GC from charging its sweeps to whichever
+    # phase happens to trigger them.
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+# Phases whose median at the smaller size is below this are too close to
+# timer and scheduler noise to judge, and are reported as skipped.
+MIN_MEASURABLE_SECONDS = 2e-3
+
+# Fixed headroom over --max-growth for machine noise between the two sizes.
+NOISE_TOLERANCE = 1.5
+
+
+def _median(fn: Callable[[], object], repeats: int) -> float:
+    """Median time of `repeats` runs of `fn`."""
+    return statistics.median(_timed(fn) for _ in range(max(1, repeats)))
+
+
+def _drain(graph: DependencyGraph) -> None:
+    """Complete every task in dependency order through a ReadySet."""
+    ready = ReadySet(graph)
+    frontier = ready.ready()
+    while frontier:
+        unlocked: List[str] = []
+        for task_id in frontier:
+            unlocked.extend(ready.mark_done(task_id))
+        frontier = unlocked
+
+
+def run(sizes: List[int], repeats: int = 5) -> Dict[int, Dict[str, float]]:
+    results: Dict[int, Dict[str, float]] = {}
+    for size in sizes:
+        tasks = synthetic_tasks(size)
+        phases: Dict[str, float] = {}
+        phases["build"] = _median(partial(build_dependency_graph, tasks), repeats)
+        graph = build_dependency_graph(tasks)
+        phases["cycles"] = _median(partial(detect_circular_dependencies, graph), repeats)
+        phases["toposort"] = _median(partial(_topological_sort, graph), repeats)
+        durations = {f"task-{i}": float(1 + i % 7) for i in range(size)}
+        phases["critical"] = _median(partial(compute_critical_path, graph, durations), repeats)
+        phases["ready-drain"] = _median(partial(_drain, graph), repeats)
+        results[size] = phases
+    return results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="Runs per phase; the median is used"
+    )
+    parser.add_argument(
+        "--max-growth",
+        type=float,
+        default=3.0,
+        help="Fail if per-task time grows by more than this factor per 10x tasks",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(sorted(args.sizes), args.repeats)
+    phases = list(next(iter(results.values())))
+    print(f"{'tasks':>8} " + " ".join(f"{p:>12}" for p in phases) + "   (µs/task, median)")
+    for size, timings in results.items():
+        print(f"{size:>8} " + " ".join(f"{timings[p] / size * 1e6:>12.2f}" for p in phases))
+
+    ok = True
+    sizes = list(results)
+    for small, large in zip(sizes, sizes[1:]):
+        limit = args.max_growth ** math.log10(large / small)
+        for phase in phases:
+            small_time = results[small][phase]
+            large_time = results[large][phase]
+            if small_time < MIN_MEASURABLE_SECONDS:
+                print(f"skipped: {phase} at {small} tasks took {small_time * 1e3:.2f} ms")
+                continue
+            tolerance = limit * NOISE_TOLERANCE
+            growth = (large_time / large) / (small_time / small)
+            if growth > tolerance:
+                print(
+                    f"non-linear: {phase} grew {growth:.1f}x per task from {small} to {large}"
+                    f" (limit {tolerance:.1f}x)"
+                )
+                ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,8 +14,36 @@ Security Considerations (NIST SSDF v1.2):
 from __future__ import annotations
 
 import json
+import os
+import uuid
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Union
+
+
+def _replace_via_temp(path: Path, content: Union[str, bytes], encoding: str = "utf-8") -> None:
+    """Write content to a temp file unique to this writer, then rename it over path.
+
+    The temp name carries the pid and a random suffix and is created
+    exclusively, so concurrent writers of the same path (threads or
+    processes) never share or clobber a temp file; the last rename wins and
+    readers always see a complete file.
+    """
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex[:12]}.tmp")
+    try:
+        if isinstance(content, bytes):
+            with open(temp_path, "xb") as f:
+                f.write(content)
+        else:
+            with open(temp_path, "x", encoding=encoding) as f:
+                f.write(content)
+        # Atomic rename (POSIX guarantee: same filesystem, no partial state)
+        temp_path.replace(path)
+    except BaseException:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
 
 
 def atomic_write_text(path: Path, content: str, encoding: str = "utf-8") -> None:
@@ -32,13 +60,7 @@ def atomic_write_text(path: Path, content: str, encoding: str = "utf-8") -> None
     Example:
         >>> atomic_write_text(Path("config.txt"), "hello world")
     """
-    temp_path = path.with_suffix(".tmp")
-
-    # Write to temp file first
-    temp_path.write_text(content, encoding=encoding)
-
-    # Atomic rename (POSIX guarantee: same filesystem, no partial state)
-    temp_path.replace(path)
+    _replace_via_temp(path, content, encoding)
 
 
 def atomic_write_json(path: Path, data: Dict[str, Any], indent: int = 2) -> None:
@@ -73,6 +95,4 @@ def atomic_write_bytes(path: Path, content: bytes) -> None:
     Example:
         >>> atomic_write_bytes(Path("data.bin"), b"\\x00\\x01\\x02")
     """
-    temp_path = path.with_suffix(".tmp")
-    temp_path.write_bytes(content)
-    temp_path.replace(path)
+    _replace_via_temp(path, content)
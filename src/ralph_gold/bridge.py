@@ -12,7 +12,7 @@ from typing import Any, Dict, Optional
 from . import __version__
 from .config import Config, load_config
 from .loop import IterationResult, _resolve_loop_mode, next_iteration_number, run_iteration
-from .trackers import make_tracker
+from .trackers import make_tracker, tracker_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -82,22 +82,14 @@ class BridgeServer:
     def _status(self) -> Dict[str, Any]:
         cfg = self._cfg()
         tracker = make_tracker(self.project_root, cfg)
-        done, total = 0, 0
         next_task = None
 
-        try:
-            done, total = tracker.counts()
-        except (AttributeError, NotImplementedError, OSError) as e:
-            logger.debug("Tracker counts failed: %s", e)
-            done, total = 0, 0
-
-        try:
-            t = tracker.select_next_task()
-            if t is not None:
-                next_task = {"id": t.id, "title": t.title, "kind": t.kind}
-        except (AttributeError, NotImplementedError, IndexError) as e:
-            logger.debug("Next task selection failed: %s", e)
-            next_task = None
+        # One backend read for counts and the next task.
+        snap = tracker_snapshot(tracker)
+        done, total = snap.counts()
+        t = snap.next_task
+        if t is not None:
+            next_task = {"id": t.id, "title": t.title, "kind": t.kind}
 
         state_path = self.project_root / ".ralph" / "state.json"
         last = None
@@ -38,6 +38,8 @@ from .commands.planning import (
     cmd_snapshot,
     cmd_specs_check,
     cmd_task_add,
+    cmd_task_done,
+    cmd_task_list,
     cmd_task_templates,
     cmd_watch,
 )
@@ -228,16 +230,16 @@ def _doctor_check_github(project_root: Path, args: argparse.Namespace) -> int:
 
         # Try token auth
         try:
-            token_auth = TokenAuth()
-            if token_auth.validate():
-                token_result["ok"] = True
-                try:
-                    user_data = token_auth.api_call("GET", "/user")
-                    token_result["user"] = user_data.get("login")
-                except Exception as e:
-                    logger.debug("Failed to get token user data: %s", e)
-            else:
-                token_result["error"] = "invalid or expired"
+            with TokenAuth() as token_auth:
+                if token_auth.validate():
+                    token_result["ok"] = True
+                    try:
+                        user_data = token_auth.api_call("GET", "/user")
+                        token_result["user"] = user_data.get("login")
+                    except Exception as e:
+                        logger.debug("Failed to get token user data: %s", e)
+                else:
+                    token_result["error"] = "invalid or expired"
         except GitHubAuthError as e:
             token_result["error"] = str(e)
 
@@ -287,25 +289,25 @@ def _doctor_check_github(project_root: Path, args: argparse.Namespace) -> int:
     # Try token auth
     print_output("\n[2/2] Checking token authentication...", level="normal")
     try:
-        token_auth = TokenAuth()
-        if token_auth.validate():
-            print_output(
-                "[OK]   Token: authenticated (GITHUB_TOKEN)", level="normal"
-            )
-
-            # Get user info to show who's authenticated
-            try:
-                user_data = token_auth.api_call("GET", "/user")
+        with TokenAuth() as token_auth:
+            if token_auth.validate():
                 print_output(
-                    f"       User: {user_data.get('login', 'unknown')}",
-                    level="normal",
+                    "[OK]   Token: authenticated (GITHUB_TOKEN)", level="normal"
                 )
-            except OSError as e:
-                logger.debug("State load failed: %s", e)
 
-            return 0
-        else:
-            print_output("[WARN] Token: invalid or expired", level="normal")
+                # Get user info to show who's authenticated
+                try:
+                    user_data = token_auth.api_call("GET", "/user")
+                    print_output(
+                        f"       User: {user_data.get('login', 'unknown')}",
+                        level="normal",
+                    )
+                except OSError as e:
+                    logger.debug("State load failed: %s", e)
+
+                return 0
+            else:
+                print_output("[WARN] Token: invalid or expired", level="normal")
     except GitHubAuthError as e:
         print_output(f"[MISS] Token: {e}", level="normal")
 
@@ -1215,6 +1217,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Stream runner output live instead of buffering it (sequential mode only)",
     )
+    p_run.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Prepare the next iteration while gates/judge/review run (sequential mode only)",
+    )
     p_run.set_defaults(func=cmd_run)
 
     p_supervise = sub.add_parser(
@@ -1586,6 +1593,19 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_task_templates.set_defaults(func=cmd_task_templates)
 
+    p_task_done = task_sub.add_parser(
+        "done",
+        help="Mark a task done (use this for SQLite PRDs instead of editing the file)",
+    )
+    p_task_done.add_argument("task_id", help="Task ID to mark done")
+    p_task_done.set_defaults(func=cmd_task_done)
+
+    p_task_list = task_sub.add_parser(
+        "list",
+        help="List every task in the PRD with its status",
+    )
+    p_task_list.set_defaults(func=cmd_task_list)
+
     p_bridge = sub.add_parser(
         "bridge", help="Start a JSON-RPC bridge over stdio (for VS Code)"
     )
@@ -1604,10 +1624,16 @@ def build_parser() -> argparse.ArgumentParser:
 
     # Convert
     p_convert = sub.add_parser(
-        "convert", help="Convert PRD files (JSON or Markdown) to YAML format"
+        "convert",
+        help="Convert PRD files (JSON or Markdown) to YAML, or to/from a SQLite task database",
+    )
+    p_convert.add_argument(
+        "input_file", help="Input PRD file (JSON, Markdown, or .db/.sqlite)"
+    )
+    p_convert.add_argument(
+        "output_file",
+        help="Output file path (.yaml/.yml, .db/.sqlite, or .md/.json from SQLite)",
     )
-    p_convert.add_argument("input_file", help="Input PRD file (JSON or Markdown)")
-    p_convert.add_argument("output_file", help="Output YAML file path")
     p_convert.add_argument(
         "--infer-groups",
         action="store_true",
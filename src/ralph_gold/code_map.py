@@ -0,0 +1,411 @@
+"""Built-in context packs: a ranked code map of the repository.
+
+The RepoPrompt integration runs ``rp-cli`` to build a context pack every
+iteration. This module is a dependency-free alternative. It keeps a symbol
+index of the repository in ``.ralph/cache/code_index.json``: Python files
+are parsed with ``ast``, other languages use line-based regex extractors,
+and only files whose size or mtime changed are re-parsed. Files are ranked
+against the task title and acceptance criteria with BM25 over path and
+symbol-name tokens. The best ones are rendered as a bounded code map for the
+``<REPOPROMPT_CONTEXT_PACK>`` slot.
+
+Used when ``[repoprompt].context_backend = "builtin"``.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import logging
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from .atomic_file import atomic_write_json
+from .prd import SelectedTask
+from .spec_index import bm25_scores, task_query, tokenize
+from .subprocess_helper import run_subprocess
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+# Files larger than this are listed by path only (generated code, fixtures).
+MAX_FILE_BYTES = 512_000
+MAX_INDEXED_FILES = 20_000
+MAX_SYMBOLS_PER_FILE = 30
+
+_SKIP_DIRS = frozenset(
+    {".git", ".ralph", "node_modules", ".venv", "venv", "__pycache__", "dist", "build", "target", ".tox"}
+)
+
+# name-group regexes per file extension: (kind, pattern)
+_JS_PATTERNS: List[Tuple[str, Pattern[str]]] = [
+    ("function", re.compile(r"^\s*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\*?\s+(?P<name>[A-Za-z_$][\w$]*)\s*\(")),
+    ("class", re.compile(r"^\s*(?:export\s+)?(?:default\s+)?(?:abstract\s+)?class\s+(?P<name>[A-Za-z_$][\w$]*)")),
+    ("function", re.compile(r"^\s*(?:export\s+)?const\s+(?P<name>[A-Za-z_$][\w$]*)\s*=\s*(?:async\s*)?(?:\([^)]*\)|[A-Za-z_$][\w$]*)\s*(?::[^=]+)?=>")),
+    ("type", re.compile(r"^\s*(?:export\s+)?(?:interface|type|enum)\s+(?P<name>[A-Za-z_$][\w$]*)")),
+]
+_REGEX_EXTRACTORS: Dict[str, List[Tuple[str, Pattern[str]]]] = {
+    ".js": _JS_PATTERNS,
+    ".jsx": _JS_PATTERNS,
+    ".mjs": _JS_PATTERNS,
+    ".cjs": _JS_PATTERNS,
+    ".ts": _JS_PATTERNS,
+    ".tsx": _JS_PATTERNS,
+    ".go": [
+        ("function", re.compile(r"^func\s+(?:\([^)]*\)\s*)?(?P<name>[A-Za-z_]\w*)\s*[\[(]")),
+        ("type", re.compile(r"^type\s+(?P<name>[A-Za-z_]\w*)\s")),
+    ],
+    ".rs": [
+        ("function", re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:const\s+)?(?:async\s+)?(?:unsafe\s+)?fn\s+(?P<name>[A-Za-z_]\w*)")),
+        ("type", re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:struct|enum|trait|type)\s+(?P<name>[A-Za-z_]\w*)")),
+    ],
+    ".rb": [
+        ("function", re.compile(r"^\s*def\s+(?P<name>(?:self\.)?[\w?!=]+)")),
+        ("class", re.compile(r"^\s*(?:class|module)\s+(?P<name>[A-Z]\w*(?:::\w+)*)")),
+    ],
+    ".java": [
+        ("class", re.compile(r"^\s*(?:(?:public|private|protected|abstract|final|static|sealed)\s+)*(?:class|interface|enum|record)\s+(?P<name>[A-Za-z_]\w*)")),
+    ],
+    ".kt": [
+        ("class", re.compile(r"^\s*(?:(?:public|private|internal|abstract|open|data|sealed)\s+)*(?:class|interface|object)\s+(?P<name>[A-Za-z_]\w*)")),
+        ("function", re.compile(r"^\s*(?:(?:public|private|internal|override|suspend)\s+)*fun\s+(?:<[^>]*>\s*)?(?P<name>[A-Za-z_]\w*)")),
+    ],
+    ".sh": [
+        ("function", re.compile(r"^\s*(?:function\s+)?(?P<name>[A-Za-z_][\w-]*)\s*\(\)\s*\{")),
+    ],
+}
+
+_CAMEL_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+# One index update per index file at a time. A caller that arrives while
+# another thread (e.g. the loop pipeline's warm-up) is updating the same
+# index waits for it and then finds the files already indexed, instead of
+# re-indexing them in parallel.
+_INDEX_LOCKS: Dict[str, threading.Lock] = {}
+_INDEX_LOCKS_GUARD = threading.Lock()
+
+
+def _index_lock(index_path: Path) -> threading.Lock:
+    key = str(index_path.resolve())
+    with _INDEX_LOCKS_GUARD:
+        return _INDEX_LOCKS.setdefault(key, threading.Lock())
+
+
+@dataclass
+class CodeSymbol:
+    """A definition found in a source file."""
+
+    kind: str  # class|function|method|type
+    name: str
+    line: int
+    signature: str
+    depth: int = 0  # 1 for members nested in a class
+
+    def to_list(self) -> List[Any]:
+        return [self.kind, self.name, self.line, self.signature, self.depth]
+
+    @classmethod
+    def from_list(cls, raw: List[Any]) -> "CodeSymbol":
+        kind, name, line, signature, depth = raw
+        return cls(str(kind), str(name), int(line), str(signature), int(depth))
+
+
+def identifier_tokens(name: str) -> List[str]:
+    """Search tokens for an identifier: the whole name plus its snake/camel parts."""
+    parts = [p.lower() for chunk in re.split(r"[_\W]+", name) for p in _CAMEL_RE.findall(chunk)]
+    return tokenize(" ".join([name, *parts]))
+
+
+def _python_signature(node: ast.AST) -> str:
+    if isinstance(node, ast.ClassDef):
+        bases = ", ".join(ast.unparse(b) for b in node.bases)
+        return f"class {node.name}({bases})" if bases else f"class {node.name}"
+    assert isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+    returns = f" -> {ast.unparse(node.returns)}" if node.returns is not None else ""
+    return f"{prefix} {node.name}({ast.unparse(node.args)}){returns}"
+
+
+def extract_python_symbols(text: str) -> List[CodeSymbol]:
+    """Top-level classes and functions, plus class methods, via ast."""
+    try:
+        tree = ast.parse(text)
+    except (SyntaxError, ValueError):
+        return []
+    symbols: List[CodeSymbol] = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols.append(CodeSymbol("function", node.name, node.lineno, _python_signature(node)))
+        elif isinstance(node, ast.ClassDef):
+            symbols.append(CodeSymbol("class", node.name, node.lineno, _python_signature(node)))
+            for member in node.body:
+                if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    symbols.append(
+                        CodeSymbol("method", member.name, member.lineno, _python_signature(member), depth=1)
+                    )
+    return symbols
+
+
+def extract_regex_symbols(text: str, suffix: str) -> List[CodeSymbol]:
+    """Definitions matched line by line with the extractors for suffix."""
+    patterns = _REGEX_EXTRACTORS.get(suffix)
+    if not patterns:
+        return []
+    symbols: List[CodeSymbol] = []
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        for kind, pattern in patterns:
+            match = pattern.match(line)
+            if match:
+                depth = 1 if line[:1].isspace() else 0
+                signature = line.strip().rstrip("{").strip()[:120]
+                symbols.append(CodeSymbol(kind, match.group("name"), lineno, signature, depth))
+                break
+    return symbols
+
+
+def extract_symbols(path: Path, text: str) -> List[CodeSymbol]:
+    """Symbols of a source file, chosen by extension (empty if unsupported)."""
+    if path.suffix == ".py":
+        return extract_python_symbols(text)
+    return extract_regex_symbols(text, path.suffix)
+
+
+def is_indexable(rel: str) -> bool:
+    path = Path(rel)
+    if any(part in _SKIP_DIRS for part in path.parts[:-1]):
+        return False
+    return path.suffix == ".py" or path.suffix in _REGEX_EXTRACTORS
+
+
+def list_source_files(project_root: Path) -> List[str]:
+    """Indexable files relative to project_root.
+
+    Uses git (tracked plus untracked, honouring .gitignore) and falls back
+    to a directory walk outside a repository.
+    """
+    try:
+        result = run_subprocess(
+            ["git", "ls-files", "--cached", "--others", "--exclude-standard"],
+            cwd=project_root,
+            timeout=30,
+        )
+    except RuntimeError as e:
+        logger.debug("git ls-files failed: %s", e)
+        result = None
+    if result is not None and result.success:
+        files = sorted({line.strip() for line in result.stdout.splitlines() if line.strip()})
+    else:
+        files = []
+        for dirpath, dirnames, filenames in os.walk(project_root):
+            dirnames[:] = sorted(d for d in dirnames if d not in _SKIP_DIRS)
+            for name in sorted(filenames):
+                files.append((Path(dirpath) / name).relative_to(project_root).as_posix())
+    return [rel for rel in files if is_indexable(rel)][:MAX_INDEXED_FILES]
+
+
+@dataclass
+class CodeFile:
+    """Index entry for one source file."""
+
+    path: str
+    symbols: List[CodeSymbol] = field(default_factory=list)
+    length: int = 0
+    tf: Dict[str, int] = field(default_factory=dict)
+
+
+class CodeIndex:
+    """Persistent symbol index over a repository's source files."""
+
+    def __init__(self, project_root: Path, index_path: Path) -> None:
+        self.project_root = project_root
+        self.index_path = index_path
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(raw, dict) or raw.get("version") != INDEX_VERSION:
+            return
+        files = raw.get("files")
+        if isinstance(files, dict):
+            self.files = files
+
+    def _save(self) -> None:
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_json(self.index_path, {"version": INDEX_VERSION, "files": self.files})
+        except OSError as e:
+            logger.debug("Failed to save code index: %s", e)
+
+    def update(self, paths: Optional[List[str]] = None) -> int:
+        """Re-index changed files and drop files that are gone.
+
+        Args:
+            paths: Files to index (default: list_source_files)
+
+        Returns:
+            Number of files (re)indexed
+        """
+        rels = paths if paths is not None else list_source_files(self.project_root)
+        seen: Dict[str, Tuple[int, int]] = {}
+        for rel in rels:
+            try:
+                st = (self.project_root / rel).stat()
+            except OSError:
+                continue
+            seen[rel] = (st.st_size, st.st_mtime_ns)
+
+        removed = [rel for rel in self.files if rel not in seen]
+        for rel in removed:
+            del self.files[rel]
+        reindexed = 0
+        for rel, (size, mtime_ns) in seen.items():
+            entry = self.files.get(rel)
+            if entry and entry.get("size") == size and entry.get("mtime_ns") == mtime_ns:
+                continue
+            symbols: List[CodeSymbol] = []
+            if size <= MAX_FILE_BYTES:
+                try:
+                    text = (self.project_root / rel).read_text(encoding="utf-8", errors="replace")
+                except OSError:
+                    continue
+                symbols = extract_symbols(Path(rel), text)
+            tokens = identifier_tokens(Path(rel).with_suffix("").as_posix().replace("/", " "))
+            for symbol in symbols:
+                tokens += identifier_tokens(symbol.name)
+            self.files[rel] = {
+                "size": size,
+                "mtime_ns": mtime_ns,
+                "symbols": [s.to_list() for s in symbols],
+                "length": len(tokens),
+                "tf": dict(Counter(tokens)),
+            }
+            reindexed += 1
+
+        if removed or reindexed or not self.index_path.exists():
+            self._save()
+        return reindexed
+
+    def file(self, rel: str) -> CodeFile:
+        raw = self.files[rel]
+        return CodeFile(
+            path=rel,
+            symbols=[CodeSymbol.from_list(s) for s in raw.get("symbols", [])],
+            length=int(raw.get("length", 0)),
+            tf={str(k): int(v) for k, v in (raw.get("tf") or {}).items()},
+        )
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Files ranked by BM25 score against query (score > 0 only)."""
+        rels = sorted(self.files)
+        docs = [
+            (int(self.files[rel].get("length", 0)), self.files[rel].get("tf") or {})
+            for rel in rels
+        ]
+        scores = bm25_scores(identifier_tokens(query), docs)
+        scored = [(rel, score) for rel, score in zip(rels, scores) if score > 0]
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit] if limit is not None else scored
+
+
+def format_code_map(
+    index: CodeIndex,
+    ranked: List[Tuple[str, float]],
+    task: SelectedTask,
+    max_chars: int,
+    max_symbols: int = MAX_SYMBOLS_PER_FILE,
+) -> str:
+    """Render ranked files and their symbols, stopping before max_chars."""
+    query_terms = set(identifier_tokens(task_query(task)))
+    header = (
+        f"Code map for task {task.id}: {task.title}\n"
+        f"Files ranked by relevance ({len(ranked)} shown of {len(index.files)} indexed); "
+        "line numbers point at definitions. Start exploring here.\n"
+    )
+    blocks: List[str] = [header]
+    used = len(header)
+    for rel, _score in ranked:
+        code_file = index.file(rel)
+        symbols = code_file.symbols
+        if len(symbols) > max_symbols:
+            # Keep symbols matching the task, then the first others, in file order.
+            matching = {id(s) for s in symbols if query_terms & set(identifier_tokens(s.name))}
+            keep = [s for s in symbols if id(s) in matching][:max_symbols]
+            others = [s for s in symbols if id(s) not in matching]
+            keep_ids = {id(s) for s in keep} | {id(s) for s in others[: max_symbols - len(keep)]}
+            omitted = len(symbols) - len(keep_ids)
+            symbols = [s for s in symbols if id(s) in keep_ids]
+        else:
+            omitted = 0
+        lines = [f"### {rel}"]
+        for symbol in symbols:
+            lines.append(f"{'  ' * symbol.depth}- L{symbol.line}: {symbol.signature}")
+        if omitted:
+            lines.append(f"- ... {omitted} more definitions")
+        block = "\n".join(lines) + "\n"
+        if used + len(block) + 1 > max_chars:
+            break
+        blocks.append(block)
+        used += len(block) + 1
+    if len(blocks) == 1:
+        return ""
+    return "\n".join(blocks)
+
+
+@dataclass
+class CodeMapResult:
+    """Code map text and indexing figures for receipts."""
+
+    text: str
+    files_indexed: int
+    files_reindexed: int
+    files_ranked: int
+
+    def to_notes(self) -> Dict[str, Any]:
+        return {
+            "backend": "builtin",
+            "files_indexed": self.files_indexed,
+            "files_reindexed": self.files_reindexed,
+            "files_ranked": self.files_ranked,
+            "chars": len(self.text),
+        }
+
+
+def build_code_map(
+    project_root: Path,
+    task: SelectedTask,
+    *,
+    max_files: int = 15,
+    max_chars: int = 20_000,
+) -> CodeMapResult:
+    """Update the code index and render the code map for task.
+
+    The text is empty when no file matches the task.
+    """
+    index_path = project_root / ".ralph" / "cache" / "code_index.json"
+    with _index_lock(index_path):
+        index = CodeIndex(project_root, index_path)
+        reindexed = index.update()
+    ranked = index.search(task_query(task), limit=max_files)
+    text = format_code_map(index, ranked, task, max_chars) if ranked else ""
+    logger.debug(
+        "Code map for %s: %d/%d files ranked, %d re-indexed",
+        task.id,
+        len(ranked),
+        len(index.files),
+        reindexed,
+    )
+    return CodeMapResult(
+        text=text,
+        files_indexed=len(index.files),
+        files_reindexed=reindexed,
+        files_ranked=len(ranked),
+    )
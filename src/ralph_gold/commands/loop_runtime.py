@@ -339,6 +339,8 @@ def run_run_command(
         cfg = replace(
             cfg, loop=replace(cfg.loop, runner_timeout_seconds=timeout_override)
         )
+    if getattr(args, "pipeline", False):
+        cfg = replace(cfg, loop=replace(cfg.loop, pipeline=True))
 
     # Validate file paths to prevent path traversal attacks
     if args.prompt_file:
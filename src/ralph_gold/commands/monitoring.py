@@ -17,7 +17,7 @@ from ..output import (
 )
 from ..progress import calculate_progress, format_burndown_chart, format_progress_bar
 from ..stats import calculate_stats, export_stats_csv, format_flow_report, format_stats_report
-from ..trackers import make_tracker
+from ..trackers import make_tracker, tracker_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -179,17 +179,30 @@ def cmd_status(args: argparse.Namespace) -> int:
     last_iteration = None
 
     if getattr(args, "graph", False):
-        from ..dependencies import build_dependency_graph, format_dependency_graph
-        from ..prd import get_all_tasks
+        from ..dependencies import (
+            analyze_critical_path,
+            format_critical_path,
+            format_dependency_graph,
+            graph_tasks_for_tracker,
+        )
 
         prd_path = root / cfg.files.prd
         try:
-            tasks = get_all_tasks(prd_path)
+            tasks = graph_tasks_for_tracker(tracker, prd_path)
             if not tasks:
                 print_output("No tasks found in PRD file.", level="normal")
                 return 0
-            graph = build_dependency_graph(tasks)
+            history = []
+            if state_path.exists():
+                try:
+                    state = json.loads(state_path.read_text(encoding="utf-8"))
+                    history = state.get("history", []) or []
+                except (OSError, json.JSONDecodeError):
+                    history = []
+            graph, analysis = analyze_critical_path(tasks, history)
             print_output(format_dependency_graph(graph), level="normal")
+            print_output("", level="normal")
+            print_output(format_critical_path(analysis), level="normal")
             return 0
         except Exception as e:
             print_output(f"Error building dependency graph: {e}", level="error")
@@ -209,32 +222,12 @@ def cmd_status(args: argparse.Namespace) -> int:
         print_output("No history data available for burndown chart.", level="normal")
         return 0
 
-    try:
-        done, total = tracker.counts()
-    except (OSError, ValueError) as e:
-        logger.debug("Tracker operation failed: %s", e)
-        done, total = 0, 0
-
-    try:
-        if hasattr(tracker, "peek_next_task"):
-            next_task = tracker.peek_next_task()
-        elif hasattr(tracker, "select_next_task"):
-            next_task = tracker.select_next_task()
-    except (OSError, ValueError) as e:
-        logger.debug("Failed to resolve next task: %s", e)
-
-    blocked = 0
-    open_count = 0
-    try:
-        from ..prd import status_counts
-
-        prd_path = root / cfg.files.prd
-        done_detailed, blocked, open_count, total_from_prd = status_counts(prd_path)
-        if total_from_prd > 0:
-            total = total_from_prd
-            done = done_detailed
-    except (json.JSONDecodeError, OSError) as e:
-        logger.debug("Failed to load PRD status counts: %s", e)
+    # Counts, status breakdown and next task from a single tracker read.
+    snap = tracker_snapshot(tracker)
+    done, total = snap.counts()
+    next_task = snap.next_task
+    blocked = snap.status_counts.get("blocked", 0)
+    open_count = snap.status_counts.get("open", 0)
 
     state = {}
     if state_path.exists():
@@ -677,3 +677,60 @@ def cmd_task_templates(args: argparse.Namespace) -> int:
     except Exception as e:
         print_output(f"Error: {e}", level="error")
         return 2
+
+
+def cmd_task_done(args: argparse.Namespace) -> int:
+    """Mark a task done through the tracker (the way to complete SQLite tasks)."""
+    root = _project_root()
+    cfg = load_config(root)
+    task_id = args.task_id
+
+    try:
+        tracker = make_tracker(root, cfg, reuse=False)
+    except ValueError as e:
+        print_output(f"Error: {e}", level="error")
+        return 2
+    try:
+        mark_done = getattr(tracker, "mark_task_done", None)
+        if not callable(mark_done):
+            print_output(
+                f"Error: the {tracker.kind} tracker cannot mark tasks done; "
+                f"update {cfg.files.prd} instead",
+                level="error",
+            )
+            return 2
+        if tracker.get_task_by_id(task_id) is None:
+            print_output(f"Error: Task '{task_id}' not found", level="error")
+            return 2
+        changed = bool(mark_done(task_id))
+    finally:
+        close = getattr(tracker, "close", None)
+        if callable(close):
+            close()
+
+    if get_output_config().format == "json":
+        print_json_output({"cmd": "task_done", "task_id": str(task_id), "changed": changed})
+        return 0
+    if changed:
+        print_output(f"✓ Marked task '{task_id}' done", level="quiet")
+    else:
+        print_output(f"Task '{task_id}' was already done", level="quiet")
+    return 0
+
+
+def cmd_task_list(args: argparse.Namespace) -> int:
+    """Print every task in the PRD as a checklist (readable for any format)."""
+    from ..prd_slice import build_prd_view, load_prd_tasks
+
+    root = _project_root()
+    cfg = load_config(root)
+    prd_path = root / cfg.files.prd
+    if not prd_path.exists():
+        print_output(f"Error: PRD file not found: {cfg.files.prd}", level="error")
+        return 2
+
+    if get_output_config().format == "json":
+        print_json_output({"cmd": "task_list", "tasks": load_prd_tasks(prd_path)})
+        return 0
+    print_output(build_prd_view(prd_path, cfg.files.prd), end="", level="quiet")
+    return 0
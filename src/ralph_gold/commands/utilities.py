@@ -97,18 +97,40 @@ def cmd_completion(args: argparse.Namespace) -> int:
 
 
 def cmd_convert(args: argparse.Namespace) -> int:
-    """Convert PRD files (JSON or Markdown) to YAML format."""
-    from ..converters import convert_to_yaml
+    """Convert PRD files between Markdown, JSON, YAML and SQLite.
+
+    The output format follows the output file's suffix: .db/.sqlite imports
+    into a SQLite task database, and a SQLite input can be exported back to
+    .md/.json/.yaml. Everything else converts to YAML as before.
+    """
+    from ..converters import (
+        convert_to_sqlite,
+        convert_to_yaml,
+        export_sqlite,
+        load_task_document,
+    )
+    from ..trackers.sqlite_tracker import is_sqlite_prd
 
     input_path = Path(args.input_file).resolve()
     output_path = Path(args.output_file).resolve()
 
     try:
-        convert_to_yaml(
-            input_path=input_path,
-            output_path=output_path,
-            infer_groups=bool(args.infer_groups),
-        )
+        if is_sqlite_prd(output_path):
+            convert_to_sqlite(
+                input_path=input_path,
+                output_path=output_path,
+                infer_groups=bool(args.infer_groups),
+            )
+        elif is_sqlite_prd(input_path) and output_path.suffix.lower() not in {".yaml", ".yml"}:
+            if not input_path.exists():
+                raise FileNotFoundError(f"Input file not found: {input_path}")
+            export_sqlite(input_path, output_path)
+        else:
+            convert_to_yaml(
+                input_path=input_path,
+                output_path=output_path,
+                infer_groups=bool(args.infer_groups),
+            )
 
         print_output(f"✓ Converted {input_path.name} to {output_path}", level="quiet")
 
@@ -116,10 +138,7 @@ def cmd_convert(args: argparse.Namespace) -> int:
             print_output("  Groups inferred from task titles", level="quiet")
 
         # Show summary
-        import yaml
-
-        with open(output_path) as f:
-            data = yaml.safe_load(f)
+        data = load_task_document(output_path)
 
         tasks = data.get("tasks", [])
         total = len(tasks)
@@ -11,7 +11,7 @@ from ..config import load_config
 from ..output import get_output_config, print_json_output, print_output
 from ..prd import get_all_tasks
 from ..scaffold import init_project
-from ..trackers import make_tracker
+from ..trackers import make_tracker, tracker_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -157,20 +157,9 @@ def cmd_explain(args: argparse.Namespace) -> int:
     tracker = make_tracker(root, cfg)
     prd_path = root / cfg.files.prd
 
-    try:
-        done, total = tracker.counts()
-    except (OSError, ValueError) as e:
-        logger.debug("Tracker operation failed: %s", e)
-        done, total = 0, 0
-
-    next_task = None
-    try:
-        if hasattr(tracker, "peek_next_task"):
-            next_task = tracker.peek_next_task()
-        elif hasattr(tracker, "select_next_task"):
-            next_task = tracker.select_next_task()
-    except (OSError, ValueError) as e:
-        logger.debug("Failed to resolve next task: %s", e)
+    snap = tracker_snapshot(tracker)
+    done, total = snap.counts()
+    next_task = snap.next_task
 
     last_iteration = None
     state_path = root / ".ralph" / "state.json"
@@ -108,7 +108,7 @@ _ralph_completion() {
     local snapshot_flags="--list --description"
     local rollback_flags="--force"
     local watch_flags="--gates-only --auto-commit"
-    local task_flags="add templates"
+    local task_flags="add templates done list"
     local task_add_flags="--template --title --var"
     local specs_flags="check"
     local specs_check_flags="--specs-dir --strict"
@@ -644,6 +644,8 @@ _ralph() {
                     task_commands=(
                         'add:Add a new task from a template'
                         'templates:List available task templates'
+                        'done:Mark a task done'
+                        'list:List every task with its status'
                     )
                     _arguments \
                         '1: :->task_command' \
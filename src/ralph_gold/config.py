@@ -80,6 +80,10 @@ class LoopConfig:
     max_attempts_per_task: int = 3
     skip_blocked_tasks: bool = True
     batch_enabled: bool = False
+    critical_path_first: bool = False  # prefer zero-slack ready tasks
+    pipeline: bool = False  # prepare iteration N+1 while N's gates run
+    runner_capture: str = "memory"  # memory|stream (runner output to the log as produced)
+    runner_tail_chars: int = 65536  # in-memory output tail per stream when streaming
     mode: str = "speed"
     modes: Dict[str, LoopModeConfig] = field(default_factory=_default_loop_modes)
     adaptive: AdaptiveConfig = field(default_factory=AdaptiveConfig)
@@ -302,6 +306,8 @@ class WebTrackerConfig:
     headless_nav: bool = False
     cache_ttl_seconds: int = 3600
     output_path: str = ".ralph/web_analysis.json"
+    max_concurrency: int = 16  # parallel page fetches
+    headless_pages: int = 4  # browser pages crawling in parallel
 
     def __post_init__(self) -> None:
         """Initialize derived values."""
@@ -340,6 +346,15 @@ class RepoPromptConfig:
     copy_preset: str = ""
     timeout_seconds: int = 300
     fail_open: bool = True
+    # "rp-cli" runs the Repo Prompt builder; "builtin" emits a ranked code map
+    # from a local symbol index (no external tool).
+    context_backend: str = "rp-cli"  # rp-cli|builtin
+    map_max_files: int = 15
+    map_max_chars: int = 20000
+    # Reuse packs per (task, acceptance, HEAD tree); prefetch also builds the
+    # likely next task's pack in the background (implies pack_cache).
+    pack_cache: bool = False
+    prefetch: bool = False
 
 
 @dataclass(frozen=True)
@@ -351,6 +366,7 @@ class ParallelConfig:
     worktree_root: str = ".ralph/worktrees"
     strategy: str = "queue"  # queue|group
     merge_policy: str = "manual"  # manual|auto_merge
+    critical_path_first: bool = False  # start zero-slack tasks first
 
 
 @dataclass(frozen=True)
@@ -504,13 +520,24 @@ class PromptConfig:
         max_specs_chars: Maximum total characters across all specs (default: 100000)
         max_single_spec_chars: Maximum characters for a single spec file (default: 50000)
         truncate_long_specs: Whether to truncate oversized specs vs excluding them (default: true)
-        specs_inclusion_order: How to order specs - "sorted", "recency", or "manual" (default: "sorted")
+        specs_inclusion_order: How to order specs - "sorted", "recency", "manual", or
+            "relevance" (BM25-ranked spec sections for the selected task) (default: "sorted")
         context_total_budget: Total character budget for all context (default: 50000)
         context_progress_max_lines: Maximum number of progress entries to include (default: 100)
         context_progress_max_chars: Maximum characters for progress section (default: 10000)
         context_prune_on_build: Automatically truncate progress when building prompt (default: true)
         context_archive_old_entries: Archive old progress entries (default: true)
         context_archive_dir: Directory for archived progress relative to .ralph/ (default: archive/progress)
+        prd_mode: "full" embeds the whole PRD; "slice" embeds only the selected task,
+            its direct dependencies/dependents, group siblings and status counts
+            (default: "full")
+        layout: Prompt section order - "classic" or "cache_friendly" (stable sections
+            first so agent CLIs can reuse provider prompt caches; default: "classic")
+        token_budget: Token target for the whole prompt; sections are truncated or
+            dropped by priority to fit (default: 0, disabled)
+        runner_token_budgets: Per-runner token targets overriding token_budget
+        tokenizer: Token estimator - "approx", "chars" or "tiktoken" (default: "approx")
+        token_sections: Per-section policy overrides (priority, min_share, max_share, keep)
     """
 
     enable_limits: bool = False
@@ -518,7 +545,7 @@ class PromptConfig:
     max_specs_chars: int = 100000  # Increased from 50000 (2x) to reduce spec truncation
     max_single_spec_chars: int = 50000  # Increased from 10000 (5x) for larger individual specs
     truncate_long_specs: bool = True
-    specs_inclusion_order: str = "sorted"  # sorted|recency|manual
+    specs_inclusion_order: str = "sorted"  # sorted|recency|manual|relevance
     # Context management settings
     context_total_budget: int = 50000
     context_progress_max_lines: int = 100
@@ -526,6 +553,12 @@ class PromptConfig:
     context_prune_on_build: bool = True
     context_archive_old_entries: bool = True
     context_archive_dir: str = "archive/progress"
+    prd_mode: str = "full"  # full|slice
+    layout: str = "classic"  # classic|cache_friendly
+    token_budget: int = 0
+    runner_token_budgets: Dict[str, int] = field(default_factory=dict)
+    tokenizer: str = "approx"  # approx|chars|tiktoken
+    token_sections: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -924,6 +957,10 @@ def load_config(project_root: Path) -> Config:
         max_attempts_per_task=_coerce_int(loop_raw.get("max_attempts_per_task"), 3),
         skip_blocked_tasks=_coerce_bool(loop_raw.get("skip_blocked_tasks"), True),
         batch_enabled=_coerce_bool(loop_raw.get("batch_enabled"), False),
+        critical_path_first=_coerce_bool(loop_raw.get("critical_path_first"), False),
+        pipeline=_coerce_bool(loop_raw.get("pipeline"), False),
+        runner_capture=_normalize_mode_name(loop_raw.get("runner_capture"), "memory"),
+        runner_tail_chars=_coerce_int(loop_raw.get("runner_tail_chars"), 65536),
         mode=mode_name,
         modes=modes,
         adaptive=adaptive,
@@ -1240,6 +1277,8 @@ def load_config(project_root: Path) -> Config:
         headless_nav=_coerce_bool(web_raw.get("headless_nav"), False),
         cache_ttl_seconds=_coerce_int(web_raw.get("cache_ttl_seconds"), 3600),
         output_path=str(web_raw.get("output_path", ".ralph/web_analysis.json")),
+        max_concurrency=max(1, _coerce_int(web_raw.get("max_concurrency"), 16)),
+        headless_pages=max(1, _coerce_int(web_raw.get("headless_pages"), 4)),
     )
 
     tracker = TrackerConfig(
@@ -1269,6 +1308,11 @@ def load_config(project_root: Path) -> Config:
         copy_preset=str(repoprompt_raw.get("copy_preset", "")),
         timeout_seconds=_coerce_int(repoprompt_raw.get("timeout_seconds"), 300),
         fail_open=_coerce_bool(repoprompt_raw.get("fail_open"), True),
+        context_backend=_normalize_mode_name(repoprompt_raw.get("context_backend"), "rp-cli").replace("_", "-"),
+        map_max_files=_coerce_int(repoprompt_raw.get("map_max_files"), 15),
+        map_max_chars=_coerce_int(repoprompt_raw.get("map_max_chars"), 20000),
+        pack_cache=_coerce_bool(repoprompt_raw.get("pack_cache"), False),
+        prefetch=_coerce_bool(repoprompt_raw.get("prefetch"), False),
     )
 
     # Parse parallel configuration
@@ -1301,6 +1345,7 @@ def load_config(project_root: Path) -> Config:
         worktree_root=str(parallel_raw.get("worktree_root", ".ralph/worktrees")),
         strategy=strategy,
         merge_policy=merge_policy,
+        critical_path_first=_coerce_bool(parallel_raw.get("critical_path_first"), False),
     )
 
     # Parse diagnostics configuration
@@ -1533,6 +1578,12 @@ def load_config(project_root: Path) -> Config:
     prompt_raw = data.get("prompt", {}) or {}
     if not isinstance(prompt_raw, dict):
         prompt_raw = {}
+    runner_budgets_raw = prompt_raw.get("runner_token_budgets", {}) or {}
+    if not isinstance(runner_budgets_raw, dict):
+        runner_budgets_raw = {}
+    token_sections_raw = prompt_raw.get("token_sections", {}) or {}
+    if not isinstance(token_sections_raw, dict):
+        token_sections_raw = {}
 
     prompt = PromptConfig(
         enable_limits=_coerce_bool(prompt_raw.get("enable_limits"), False),
@@ -1548,6 +1599,19 @@ def load_config(project_root: Path) -> Config:
         context_prune_on_build=_coerce_bool(prompt_raw.get("context_prune_on_build"), True),
         context_archive_old_entries=_coerce_bool(prompt_raw.get("context_archive_old_entries"), True),
         context_archive_dir=str(prompt_raw.get("context_archive_dir", "archive/progress")),
+        prd_mode=_normalize_mode_name(prompt_raw.get("prd_mode"), "full"),
+        layout=_normalize_mode_name(prompt_raw.get("layout"), "classic").replace("-", "_"),
+        token_budget=max(0, _coerce_int(prompt_raw.get("token_budget"), 0)),
+        runner_token_budgets={
+            str(name): max(0, _coerce_int(value, 0))
+            for name, value in runner_budgets_raw.items()
+        },
+        tokenizer=_normalize_mode_name(prompt_raw.get("tokenizer"), "approx"),
+        token_sections={
+            str(name): dict(policy)
+            for name, policy in token_sections_raw.items()
+            if isinstance(policy, dict)
+        },
     )
 
     # Parse authorization configuration
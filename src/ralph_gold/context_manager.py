@@ -13,16 +13,30 @@ This module implements:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, List, Optional, Tuple
+
+from .atomic_file import atomic_write_json
+from .path_utils import ralph_cache_dir
 
 logger = logging.getLogger(__name__)
 
+# Pattern for progress entry timestamp lines: [ISO8601] or [compact timestamp].
+# Also handles the "2026-01-19 Iteration N:" format.
+_ENTRY_PATTERN = r"^(\[[^\]]+\]|2026-\d{2}-\d{2}\s+Iteration\s+\d+:)"
+_ENTRY_RE = re.compile(_ENTRY_PATTERN, re.MULTILINE)
+
+# Bytes hashed at the end of the indexed region to detect rewrites.
+_INDEX_TAIL_BYTES = 256
+_INDEX_VERSION = 1
+
 
 @dataclass(frozen=True)
 class ContextConfig:
@@ -128,9 +142,7 @@ def _split_progress_entries(content: str) -> List[str]:
     if not content.strip():
         return []
 
-    # Pattern for timestamp lines: [ISO8601] or [compact timestamp]
-    # Also handles "2026-01-19 Iteration N:" format
-    timestamp_pattern = r"^(\[[^\]]+\]|2026-\d{2}-\d{2}\s+Iteration\s+\d+:)"
+    timestamp_pattern = _ENTRY_PATTERN
 
     # Split by timestamp lines, keeping the delimiter
     parts = re.split(timestamp_pattern, content, flags=re.MULTILINE)
@@ -159,6 +171,176 @@ def _split_progress_entries(content: str) -> List[str]:
     return entries
 
 
+def _entry_starts(text: str) -> List[int]:
+    """Character offsets where _split_progress_entries would start entries.
+
+    Only starts of non-blank entries are returned, so entry i is
+    ``text[starts[i]:starts[i + 1]].strip()``.
+    """
+    bounds: List[int] = []
+    matches = list(_ENTRY_RE.finditer(text))
+    if not matches or matches[0].start() > 0:
+        bounds.append(0)
+    for i, m in enumerate(matches):
+        bounds.append(m.start())
+        following_end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        # The splitter treats a part that itself starts like a timestamp as
+        # another delimiter; mirror that so both agree entry for entry.
+        if following_end > m.end() and re.match(_ENTRY_PATTERN, text[m.end():following_end], flags=re.MULTILINE):
+            bounds.append(m.end())
+    ends = bounds[1:] + [len(text)]
+    return [b for b, e in zip(bounds, ends) if text[b:e].strip()]
+
+
+class ProgressIndex:
+    """Byte offsets of progress entries, persisted in the project cache.
+
+    progress.md is append-only between archivals, so the index is extended
+    by scanning only from the last known entry start to EOF. A size drop or
+    a changed tail fingerprint (the file was rewritten) triggers a rescan.
+    The sidecar lives at ``.ralph/cache/<name>.offsets.json`` (see
+    `ralph_cache_dir`), which auto-commits leave out.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.sidecar = ralph_cache_dir(path) / f"{path.name}.offsets.json"
+        self.starts: List[int] = []
+        self.size = 0
+        self.mtime_ns = 0
+        self.tail_hash = ""
+
+    @classmethod
+    def open(cls, path: Path) -> "ProgressIndex":
+        """Load the sidecar (if valid) and bring it up to date with the file."""
+        index = cls(path)
+        index._load()
+        index.refresh()
+        return index
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.sidecar.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(raw, dict) or raw.get("version") != _INDEX_VERSION:
+            return
+        starts = raw.get("starts")
+        if isinstance(starts, list) and all(isinstance(x, int) for x in starts):
+            self.starts = starts
+            self.size = int(raw.get("size", 0))
+            self.mtime_ns = int(raw.get("mtime_ns", 0))
+            self.tail_hash = str(raw.get("tail_hash", ""))
+
+    def _save(self) -> None:
+        try:
+            self.sidecar.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_json(
+                self.sidecar,
+                {
+                    "version": _INDEX_VERSION,
+                    "size": self.size,
+                    "mtime_ns": self.mtime_ns,
+                    "tail_hash": self.tail_hash,
+                    "starts": self.starts,
+                },
+            )
+        except OSError as e:
+            logger.debug("Failed to save progress index: %s", e)
+
+    @staticmethod
+    def _tail_hash(f: Any, size: int) -> str:
+        start = max(0, size - _INDEX_TAIL_BYTES)
+        f.seek(start)
+        return hashlib.sha1(f.read(size - start)).hexdigest()
+
+    def refresh(self) -> bool:
+        """Scan bytes appended since the last refresh.
+
+        Returns:
+            True if the index changed
+        """
+        st = self.path.stat()
+        if st.st_size == self.size and st.st_mtime_ns == self.mtime_ns:
+            return False
+        with self.path.open("rb") as f:
+            valid = (
+                self.size <= st.st_size
+                and self.tail_hash == self._tail_hash(f, self.size)
+            )
+            if not valid:
+                self.starts = []
+            # Re-scan from the last entry start: appended text may extend it.
+            scan_from = self.starts[-1] if self.starts else 0
+            f.seek(scan_from)
+            text = f.read(st.st_size - scan_from).decode("utf-8", errors="replace")
+            self.starts = self.starts[:-1] if self.starts else []
+            offset = scan_from
+            consumed = 0
+            for char_start in _entry_starts(text):
+                offset += len(text[consumed:char_start].encode("utf-8"))
+                consumed = char_start
+                self.starts.append(offset)
+            self.size = st.st_size
+            self.mtime_ns = st.st_mtime_ns
+            self.tail_hash = self._tail_hash(f, self.size)
+        self._save()
+        return True
+
+    def drop_before(self, first: int, cut: int) -> None:
+        """Rebase the index after the file's first `cut` bytes were removed.
+
+        Entries before `first` are dropped and later offsets shifted, so
+        archival does not need a rescan of the rewritten file.
+        """
+        self.starts = [start - cut for start in self.starts[first:]]
+        st = self.path.stat()
+        self.size = st.st_size
+        self.mtime_ns = st.st_mtime_ns
+        with self.path.open("rb") as f:
+            self.tail_hash = self._tail_hash(f, self.size)
+        self._save()
+
+    def read_entries(self, first: int, last: int, max_chars: Optional[int] = None) -> List[str]:
+        """Stripped text of entries first..last-1, reading only their bytes.
+
+        Stops early once the entries joined with blank lines exceed
+        max_chars, since callers truncate there anyway.
+        """
+        entries: List[str] = []
+        joined = -2
+        with self.path.open("rb") as f:
+            if first < len(self.starts):
+                f.seek(self.starts[first])
+            for i in range(first, last):
+                end = self.starts[i + 1] if i + 1 < len(self.starts) else self.size
+                entry = f.read(end - self.starts[i]).decode("utf-8", errors="replace").strip()
+                entries.append(entry)
+                joined += len(entry) + 2
+                if max_chars is not None and joined > max_chars:
+                    break
+        return entries
+
+    def window(self, max_lines: int = 100, max_chars: int = 10000) -> Tuple[str, int, int]:
+        """Same result as load_progress_window's sliding window."""
+        total_count = len(self.starts)
+        if total_count == 0:
+            return "", 0, 0
+        positions = range(total_count)
+        window = positions[-max_lines:] if max_lines < total_count else positions
+        if not window:
+            return "", 0, total_count
+        entries = self.read_entries(window[0], window[-1] + 1, max_chars=max_chars)
+        content, _, _ = progress_window_from_entries(entries, max_lines=len(entries), max_chars=max_chars)
+        logger.debug(
+            f"Loaded progress window: {len(window)}/{total_count} entries, {len(content)} chars"
+        )
+        return content, len(window), total_count
+
+
 def load_progress_window(
     path: Path,
     max_lines: int = 100,
@@ -168,6 +350,8 @@ def load_progress_window(
 
     Uses a sliding window approach to keep context size bounded while
     preserving recent history that's most relevant to the current task.
+    Entry start offsets come from a ProgressIndex sidecar, so only the
+    window's bytes (and any newly appended ones) are read.
 
     Args:
         path: Path to progress.md file
@@ -181,16 +365,31 @@ def load_progress_window(
         return "", 0, 0
 
     try:
-        full_content = path.read_text(encoding="utf-8")
-    except Exception as e:
+        index = ProgressIndex.open(path)
+        return index.window(max_lines=max_lines, max_chars=max_chars)
+    except OSError as e:
         logger.warning(f"Failed to read progress file {path}: {e}")
         return "", 0, 0
 
-    if not full_content.strip():
-        return "", 0, 0
 
-    # Split into entries
-    all_entries = _split_progress_entries(full_content)
+def progress_window_from_entries(
+    all_entries: List[str],
+    max_lines: int = 100,
+    max_chars: int = 10000,
+) -> Tuple[str, int, int]:
+    """Apply the sliding window to already-split progress entries.
+
+    Lets callers that cache the entry split (see prompt_cache) reuse it
+    across windows and iterations.
+
+    Args:
+        all_entries: Entries as returned by _split_progress_entries
+        max_lines: Maximum number of entries to return
+        max_chars: Maximum characters to return
+
+    Returns:
+        Tuple of (windowed_content, entries_loaded, total_entries)
+    """
     total_count = len(all_entries)
 
     if total_count == 0:
@@ -236,23 +435,21 @@ def archive_old_progress(
         return 0
 
     try:
-        full_content = path.read_text(encoding="utf-8")
-    except Exception as e:
+        index = ProgressIndex.open(path)
+    except OSError as e:
         logger.warning(f"Failed to read progress file for archival: {e}")
         return 0
 
-    all_entries = _split_progress_entries(full_content)
-
-    if len(all_entries) <= keep_lines:
-        logger.debug(f"Progress has {len(all_entries)} entries, no archival needed")
+    total_count = len(index)
+    if total_count <= keep_lines:
+        logger.debug(f"Progress has {total_count} entries, no archival needed")
         return 0
 
-    # Split into keep and archive portions
-    keep_entries = all_entries[-keep_lines:]
-    archive_entries = all_entries[:-keep_lines]
-
-    if not archive_entries:
+    # Split into keep and archive portions at the first kept entry's offset
+    archived_count = len(range(total_count)[:-keep_lines])
+    if not archived_count:
         return 0
+    cut = index.starts[archived_count] if archived_count < total_count else index.size
 
     # Create archive directory
     try:
@@ -266,21 +463,27 @@ def archive_old_progress(
     archive_path = archive_dir / f"progress-{today}.md"
 
     try:
-        # Append to existing archive file for today (if any)
-        existing_archive = ""
-        if archive_path.exists():
-            existing_archive = archive_path.read_text(encoding="utf-8")
-            if existing_archive and not existing_archive.endswith("\n\n"):
-                existing_archive += "\n\n"
+        with path.open("rb") as f:
+            archived = f.read(cut).strip()
+            kept = f.read()
 
-        archive_content = existing_archive + "\n\n".join(archive_entries)
-        archive_path.write_text(archive_content, encoding="utf-8")
-
-        # Write truncated progress.md
-        truncated_content = "\n\n".join(keep_entries)
-        path.write_text(truncated_content, encoding="utf-8")
+        # Append to existing archive file for today (if any), looking only
+        # at its last bytes to decide whether a separator is needed
+        separator = b""
+        if archive_path.exists():
+            with archive_path.open("rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - 2))
+                tail = f.read()
+            if tail and not tail.endswith(b"\n\n"):
+                separator = b"\n\n"
+        with archive_path.open("ab") as f:
+            f.write(separator + archived)
+
+        # Write truncated progress.md and shift the index to match
+        path.write_bytes(kept)
+        index.drop_before(archived_count, cut)
 
-        archived_count = len(archive_entries)
         logger.info(
             f"Archived {archived_count} progress entries to {archive_path.relative_to(path.parent.parent)}"
         )
@@ -0,0 +1,239 @@
+"""Cached and prefetched RepoPrompt context packs.
+
+Building a context pack with ``rp-cli`` adds its full latency to every
+iteration before the agent can start. Packs are stored under
+``.ralph/cache/context_packs/`` keyed by the task id, a hash of its title and
+acceptance criteria, the working tree's content hash and the builder
+settings, so a retry of the same task on the same tree reuses its pack.
+
+While an iteration's gates, judge and review run, the pack for the task
+that is likely to run next is built in a background thread. The next
+iteration then finds it in the cache (or waits for the in-flight build
+rather than starting a second one), and only falls back to the synchronous
+build on a miss.
+
+The tree hash skips the top-level ``.ralph`` entry: progress notes and PRD
+checkboxes change every iteration without changing the code a pack covers.
+
+Used when ``[repoprompt].pack_cache`` or ``[repoprompt].prefetch`` is on.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .atomic_file import atomic_write_json
+from .config import RepoPromptConfig
+from .prd import SelectedTask
+from .repoprompt import RepoPromptError, build_context_pack
+from .subprocess_helper import run_subprocess
+
+logger = logging.getLogger(__name__)
+
+# Packs kept on disk; older ones are pruned when a new pack is stored.
+MAX_CACHED_PACKS = 50
+
+
+def source_tree_hash(project_root: Path) -> Optional[str]:
+    """Hash of the working tree's top-level tree without .ralph (None outside git).
+
+    The tree is what ``git add -A`` would stage, written through a scratch
+    copy of the index so the real index is untouched. Packs are built from
+    the files on disk, and the auto-commit that follows a prefetch commits
+    exactly that content, so the key is the same before and after it.
+    """
+    try:
+        found = run_subprocess(
+            ["git", "rev-parse", "--git-path", "index"], cwd=project_root, timeout=30
+        )
+        if not found.success:
+            return None
+        index = Path(found.stdout.strip())
+        if not index.is_absolute():
+            index = project_root / index
+        with tempfile.TemporaryDirectory(prefix="ralph-pack-index-") as tmp:
+            scratch = Path(tmp) / "index"
+            if index.exists():
+                # Start from the real index so unchanged files are not rehashed.
+                shutil.copyfile(index, scratch)
+            env = {**os.environ, "GIT_INDEX_FILE": str(scratch)}
+            added = run_subprocess(["git", "add", "-A"], cwd=project_root, timeout=120, env=env)
+            if not added.success:
+                return None
+            tree = run_subprocess(["git", "write-tree"], cwd=project_root, timeout=30, env=env)
+            if not tree.success:
+                return None
+        result = run_subprocess(
+            ["git", "ls-tree", tree.stdout.strip()], cwd=project_root, timeout=30
+        )
+    except (OSError, RuntimeError) as e:
+        logger.debug("Working tree hash failed: %s", e)
+        return None
+    if not result.success:
+        return None
+    entries = [
+        line for line in result.stdout.splitlines() if line and line.split("\t", 1)[-1] != ".ralph"
+    ]
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+def acceptance_hash(task: SelectedTask) -> str:
+    return hashlib.sha256(
+        json.dumps([task.title, list(task.acceptance)], ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+def pack_cache_key(project_root: Path, cfg: RepoPromptConfig, task: SelectedTask) -> Optional[str]:
+    """Cache key for task's pack on the current working tree, or None outside git."""
+    tree = source_tree_hash(project_root)
+    if tree is None:
+        return None
+    builder = [cfg.workspace, cfg.builder_type, cfg.copy_preset, cfg.window_id, cfg.tab]
+    raw = json.dumps([str(task.id), acceptance_hash(task), tree, builder], default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+@dataclass
+class CachedPack:
+    """A stored context pack and how it was built."""
+
+    key: str
+    text: str
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+
+class ContextPackCache:
+    """Context packs on disk, one ``<key>.md`` plus ``<key>.json`` per pack."""
+
+    def __init__(self, project_root: Path) -> None:
+        self.root = project_root / ".ralph" / "cache" / "context_packs"
+
+    def get(self, key: str) -> Optional[CachedPack]:
+        try:
+            meta = json.loads((self.root / f"{key}.json").read_text(encoding="utf-8"))
+            text = (self.root / f"{key}.md").read_text(encoding="utf-8")
+        except (OSError, ValueError):
+            return None
+        return CachedPack(key=key, text=text, meta=meta if isinstance(meta, dict) else {})
+
+    def put(self, key: str, text: str, meta: Dict[str, Any]) -> None:
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = self.root / f"{key}.md.tmp"
+            tmp.write_text(text, encoding="utf-8")
+            tmp.replace(self.root / f"{key}.md")
+            # The metadata file marks the pack complete; written last.
+            atomic_write_json(self.root / f"{key}.json", {**meta, "stored_at": time.time()})
+        except OSError as e:
+            logger.debug("Failed to store context pack %s: %s", key, e)
+            return
+        self._prune()
+
+    def _prune(self) -> None:
+        metas = sorted(self.root.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for stale in metas[MAX_CACHED_PACKS:]:
+            for path in (stale, stale.with_suffix(".md")):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+
+class PackPrefetcher:
+    """Builds context packs in daemon threads, at most one per key at a time.
+
+    Daemon threads never hold up process exit; an interrupted build leaves no
+    cache entry because the metadata file is written last.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, threading.Thread] = {}
+
+    def prefetch(self, project_root: Path, cfg: RepoPromptConfig, task: SelectedTask) -> bool:
+        """Start building task's pack unless it is cached or being built.
+
+        Returns:
+            True if a background build was started
+        """
+        key = pack_cache_key(project_root, cfg, task)
+        if key is None or ContextPackCache(project_root).get(key) is not None:
+            return False
+        with self._lock:
+            if key in self._inflight:
+                return False
+            thread = threading.Thread(
+                target=self._build,
+                args=(project_root, cfg, task, key),
+                name=f"ralph-pack-prefetch-{task.id}",
+                daemon=True,
+            )
+            self._inflight[key] = thread
+        thread.start()
+        logger.debug("Prefetching context pack for task %s (%s)", task.id, key)
+        return True
+
+    def _build(self, project_root: Path, cfg: RepoPromptConfig, task: SelectedTask, key: str) -> None:
+        cache = ContextPackCache(project_root)
+        out_path = cache.root / f"{key}.export.md"
+        try:
+            run, instructions = build_context_pack(
+                cfg=cfg,
+                task_id=task.id,
+                task_title=task.title,
+                acceptance=task.acceptance,
+                out_path=out_path,
+                cwd=project_root,
+            )
+            text = out_path.read_text(encoding="utf-8") if out_path.exists() else ""
+            if run.returncode == 0 and text.strip():
+                cache.put(
+                    key,
+                    text,
+                    {
+                        "task_id": task.id,
+                        "argv": run.argv,
+                        "instructions": instructions,
+                        "duration_seconds": run.duration_seconds,
+                        "prefetched": True,
+                    },
+                )
+        except (RepoPromptError, OSError) as e:
+            logger.debug("Context pack prefetch for %s failed: %s", task.id, e)
+        finally:
+            try:
+                out_path.unlink()
+            except OSError:
+                pass
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def wait(self, key: str, timeout: Optional[float]) -> None:
+        """Block until an in-flight build of key (if any) finishes or times out."""
+        with self._lock:
+            thread = self._inflight.get(key)
+        if thread is not None:
+            thread.join(timeout)
+
+    def lookup(self, project_root: Path, key: str, timeout: Optional[float] = None) -> Optional[CachedPack]:
+        """Cached pack for key, waiting for an in-flight prefetch of it first."""
+        self.wait(key, timeout)
+        return ContextPackCache(project_root).get(key)
+
+
+_DEFAULT_PREFETCHER = PackPrefetcher()
+
+
+def get_pack_prefetcher() -> PackPrefetcher:
+    """Process-wide prefetcher shared by loop iterations."""
+    return _DEFAULT_PREFETCHER
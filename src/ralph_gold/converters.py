@@ -1,14 +1,17 @@
-"""Converters for migrating PRD files to YAML format."""
+"""Converters for migrating PRD files between Markdown, JSON, YAML and SQLite."""
 
 from __future__ import annotations
 
+import json
 import re
 from pathlib import Path
 from typing import Any, Dict, List
 
 import yaml
 
-from .prd import _load_json_prd, _load_md_prd, is_markdown_prd
+from .atomic_file import atomic_write_text
+from .prd import _load_json_prd, _load_md_prd, _story_blocked, is_markdown_prd
+from .trackers.sqlite_tracker import SqliteTracker, is_sqlite_prd
 
 
 def _infer_group_from_title(title: str, index: int, total: int) -> str:
@@ -130,6 +133,10 @@ def convert_json_to_yaml(json_path: Path, infer_groups: bool = False) -> Dict[st
         if isinstance(acceptance, list) and acceptance:
             task["acceptance"] = [str(item) for item in acceptance if item]
 
+        depends_on = story.get("depends_on", [])
+        if isinstance(depends_on, list) and depends_on:
+            task["depends_on"] = [str(dep) for dep in depends_on if dep is not None]
+
         # Completion status
         completed = False
         if "passes" in story:
@@ -138,12 +145,18 @@ def convert_json_to_yaml(json_path: Path, infer_groups: bool = False) -> Dict[st
             status = str(story.get("status", "open")).lower()
             completed = status == "done"
         task["completed"] = completed
+        if not completed and _story_blocked(story):
+            task["blocked"] = True
+            if story.get("blocked_reason"):
+                task["blocked_reason"] = str(story["blocked_reason"])
 
-        # Infer group if requested
+        # Infer group if requested; otherwise keep an explicit one
         if infer_groups:
             task["group"] = _infer_group_from_title(
                 task["title"], len(tasks), len(stories)
             )
+        elif story.get("group"):
+            task["group"] = str(story["group"])
 
         tasks.append(task)
 
@@ -218,6 +231,8 @@ def convert_markdown_to_yaml(
         # Add acceptance criteria if present
         if md_task.acceptance:
             task["acceptance"] = md_task.acceptance
+        if md_task.depends_on:
+            task["depends_on"] = list(md_task.depends_on)
 
         # Infer group if requested
         if infer_groups:
@@ -277,10 +292,12 @@ def convert_to_yaml(
         yaml_data = convert_markdown_to_yaml(input_path, infer_groups=infer_groups)
     elif input_path.suffix.lower() == ".json":
         yaml_data = convert_json_to_yaml(input_path, infer_groups=infer_groups)
+    elif is_sqlite_prd(input_path):
+        yaml_data = convert_sqlite_to_yaml(input_path)
     else:
         raise ValueError(
             f"Unsupported input format: {input_path.suffix}. "
-            "Supported formats: .json, .md, .markdown"
+            "Supported formats: .json, .md, .markdown, .db, .sqlite"
         )
 
     # Validate the generated YAML by attempting to load it
@@ -293,3 +310,164 @@ def convert_to_yaml(
 
     # Save to output file
     save_yaml(yaml_data, output_path)
+
+
+def load_task_document(input_path: Path, infer_groups: bool = False) -> Dict[str, Any]:
+    """Load any supported PRD (Markdown, JSON, YAML, SQLite) as a YAML task document.
+
+    Args:
+        input_path: Path to the PRD
+        infer_groups: Whether to infer parallel groups (Markdown/JSON only)
+
+    Returns:
+        Dictionary with version, metadata and tasks
+
+    Raises:
+        FileNotFoundError: If the input file doesn't exist
+        ValueError: If the format is not recognized or invalid
+    """
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input file not found: {input_path}")
+
+    suffix = input_path.suffix.lower()
+    if is_markdown_prd(input_path):
+        return convert_markdown_to_yaml(input_path, infer_groups=infer_groups)
+    if suffix == ".json":
+        return convert_json_to_yaml(input_path, infer_groups=infer_groups)
+    if is_sqlite_prd(input_path):
+        return convert_sqlite_to_yaml(input_path)
+    if suffix in {".yaml", ".yml"}:
+        try:
+            data = yaml.safe_load(input_path.read_text(encoding="utf-8"))
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML syntax: {e}")
+        if not isinstance(data, dict) or not isinstance(data.get("tasks"), list):
+            raise ValueError(f"Invalid YAML task file: {input_path}")
+        return data
+    raise ValueError(
+        f"Unsupported input format: {input_path.suffix}. "
+        "Supported formats: .json, .md, .markdown, .yaml, .yml, .db, .sqlite"
+    )
+
+
+def convert_sqlite_to_yaml(db_path: Path) -> Dict[str, Any]:
+    """Export a SQLite task database as a YAML task document.
+
+    Args:
+        db_path: Path to the SQLite database
+
+    Returns:
+        Dictionary representing YAML structure
+    """
+    if not db_path.exists():
+        raise FileNotFoundError(f"Input file not found: {db_path}")
+    tracker = SqliteTracker(db_path)
+    try:
+        return tracker.export_tasks()
+    finally:
+        tracker.close()
+
+
+def convert_to_sqlite(
+    input_path: Path, output_path: Path, infer_groups: bool = False
+) -> int:
+    """Import a Markdown, JSON or YAML PRD into a SQLite task database.
+
+    Existing tasks in the database are replaced.
+
+    Args:
+        input_path: Path to input PRD
+        output_path: Path to the SQLite database (created if missing)
+        infer_groups: Whether to infer parallel groups from task titles
+
+    Returns:
+        Number of tasks imported
+    """
+    data = load_task_document(input_path, infer_groups=infer_groups)
+    tracker = SqliteTracker(output_path)
+    try:
+        metadata = data.get("metadata")
+        return tracker.import_tasks(
+            data.get("tasks", []),
+            metadata=metadata if isinstance(metadata, dict) else None,
+        )
+    finally:
+        tracker.close()
+
+
+def _task_doc_to_markdown(data: Dict[str, Any]) -> str:
+    metadata = data.get("metadata") or {}
+    title = metadata.get("project") or metadata.get("name") or "PRD"
+    lines = [f"# {title}", ""]
+    for key in ("branch", "description"):
+        if metadata.get(key):
+            lines.append(f"{key}: {metadata[key]}")
+    if lines[-1]:
+        lines.append("")
+    lines += ["## Tasks", ""]
+    for task in data.get("tasks", []):
+        mark = "x" if task.get("completed") else "-" if task.get("blocked") else " "
+        lines.append(f"- [{mark}] {task['title']}")
+        for item in task.get("acceptance", []) or []:
+            lines.append(f"  - {item}")
+        deps = task.get("depends_on") or []
+        if deps and not any(
+            str(item).lower().startswith("depends on") for item in task.get("acceptance", []) or []
+        ):
+            lines.append(f"  - Depends on: {', '.join(str(d) for d in deps)}")
+    return "\n".join(lines) + "\n"
+
+
+def _task_doc_to_json(data: Dict[str, Any]) -> str:
+    prd: Dict[str, Any] = dict(data.get("metadata") or {})
+    stories: List[Dict[str, Any]] = []
+    for task in data.get("tasks", []):
+        story: Dict[str, Any] = {"id": task["id"], "title": task["title"]}
+        for key in ("description", "priority", "acceptance", "depends_on", "group"):
+            if task.get(key) not in (None, [], ""):
+                story[key] = task[key]
+        if task.get("completed"):
+            story["status"] = "done"
+        elif task.get("blocked"):
+            story["status"] = "blocked"
+            if task.get("blocked_reason"):
+                story["blocked_reason"] = task["blocked_reason"]
+        else:
+            story["status"] = "open"
+        stories.append(story)
+    prd["stories"] = stories
+    return json.dumps(prd, indent=2, ensure_ascii=False) + "\n"
+
+
+def export_sqlite(db_path: Path, output_path: Path) -> int:
+    """Write a SQLite task database out as Markdown, JSON or YAML.
+
+    The output format follows the output file's suffix. Markdown PRDs number
+    tasks by position, so task ids are only preserved by JSON and YAML.
+
+    Args:
+        db_path: Path to the SQLite database
+        output_path: Path to the output PRD (.md, .json, .yaml, .yml)
+
+    Returns:
+        Number of tasks exported
+
+    Raises:
+        ValueError: If the output format is not supported
+    """
+    data = convert_sqlite_to_yaml(db_path)
+    suffix = output_path.suffix.lower()
+    if suffix in {".yaml", ".yml"}:
+        save_yaml(data, output_path)
+    elif suffix == ".json":
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(output_path, _task_doc_to_json(data))
+    elif is_markdown_prd(output_path):
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(output_path, _task_doc_to_markdown(data))
+    else:
+        raise ValueError(
+            f"Unsupported output format: {output_path.suffix}. "
+            "Supported formats: .json, .md, .markdown, .yaml, .yml"
+        )
+    return len(data.get("tasks", []))
@@ -6,8 +6,20 @@ dependencies, enabling ordered task execution and circular dependency detection.
 
 from __future__ import annotations
 
+import heapq
+import logging
+import math
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Set, Tuple
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .prd import SelectedTask
+
+logger = logging.getLogger(__name__)
+
+# Slack at or below this many seconds counts as zero (float rounding).
+_SLACK_EPSILON = 1e-6
 
 
 @dataclass
@@ -27,6 +39,281 @@ class DependencyGraph:
 
     nodes: Dict[str, TaskNode] = field(default_factory=dict)
     edges: List[Tuple[str, str]] = field(default_factory=list)
+    _compact: Optional["CompactGraph"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def compact(self) -> "CompactGraph":
+        """Integer-indexed view of the graph, rebuilt when nodes/edges change."""
+        key = (len(self.nodes), len(self.edges))
+        if self._compact is None or self._compact.key != key:
+            self._compact = CompactGraph.from_graph(self)
+        return self._compact
+
+
+@dataclass
+class CompactGraph:
+    """Integer-indexed adjacency lists for a DependencyGraph.
+
+    Node ``i`` is ``ids[i]`` (input order). ``deps[i]`` lists the distinct
+    in-graph dependencies of ``i`` and ``dependents[i]`` the reverse edges;
+    dependencies on IDs outside the graph are kept by name in ``external``.
+
+    Attributes:
+        ids: Task IDs by index
+        index: Task ID to index
+        deps: Distinct dependency indices per node
+        dependents: Distinct dependent indices per node
+        external: Missing dependency ID to the indices that depend on it
+        key: (node count, edge count) of the source graph, for invalidation
+    """
+
+    ids: List[str]
+    index: Dict[str, int]
+    deps: List[List[int]]
+    dependents: List[List[int]]
+    external: Dict[str, List[int]]
+    key: Tuple[int, int] = (0, 0)
+
+    @classmethod
+    def from_graph(cls, graph: DependencyGraph) -> "CompactGraph":
+        ids = list(graph.nodes)
+        index = {task_id: i for i, task_id in enumerate(ids)}
+        deps: List[List[int]] = [[] for _ in ids]
+        dependents: List[List[int]] = [[] for _ in ids]
+        external: Dict[str, List[int]] = {}
+        for i, task_id in enumerate(ids):
+            seen: Set[str] = set()
+            for dep_id in graph.nodes[task_id].depends_on:
+                if dep_id in seen:
+                    continue
+                seen.add(dep_id)
+                j = index.get(dep_id)
+                if j is None:
+                    external.setdefault(dep_id, []).append(i)
+                else:
+                    deps[i].append(j)
+                    dependents[j].append(i)
+        return cls(
+            ids=ids,
+            index=index,
+            deps=deps,
+            dependents=dependents,
+            external=external,
+            key=(len(graph.nodes), len(graph.edges)),
+        )
+
+    def topological_order(self) -> List[int]:
+        """Kahn's algorithm; ties are broken by input order via a heap.
+
+        Nodes on (or downstream of) a cycle are omitted.
+        """
+        in_degree = [len(d) for d in self.deps]
+        heap = [i for i, degree in enumerate(in_degree) if degree == 0]
+        heapq.heapify(heap)
+        order: List[int] = []
+        while heap:
+            current = heapq.heappop(heap)
+            order.append(current)
+            for nxt in self.dependents[current]:
+                in_degree[nxt] -= 1
+                if in_degree[nxt] == 0:
+                    heapq.heappush(heap, nxt)
+        return order
+
+    def strongly_connected_components(self) -> List[List[int]]:
+        """Tarjan's algorithm with an explicit stack (no recursion).
+
+        Follows dependency edges; components are returned in the order
+        Tarjan completes them (dependencies before dependents).
+        """
+        n = len(self.ids)
+        low = [0] * n
+        number = [-1] * n
+        on_stack = [False] * n
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(n):
+            if number[root] != -1:
+                continue
+            number[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work: List[Tuple[int, int]] = [(root, 0)]
+            while work:
+                v, child = work[-1]
+                edges = self.deps[v]
+                if child < len(edges):
+                    work[-1] = (v, child + 1)
+                    w = edges[child]
+                    if number[w] == -1:
+                        number[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append((w, 0))
+                    elif on_stack[w] and number[w] < low[v]:
+                        low[v] = number[w]
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+                if low[v] == number[v]:
+                    component: List[int] = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(component)
+        return components
+
+    def cycle_through(self, members: Sequence[int]) -> List[int]:
+        """One dependency cycle inside a strongly connected component.
+
+        Starts at the member with the lowest index and returns the walk
+        back to it, e.g. ``[a, b, a]``. A self-dependency yields ``[a, a]``.
+        """
+        inside = set(members)
+        start = min(members)
+        parent: Dict[int, int] = {}
+        queue = deque([start])
+        while queue:
+            v = queue.popleft()
+            for w in self.deps[v]:
+                if w == start:
+                    path = [start]
+                    while v != start:
+                        path.append(v)
+                        v = parent[v]
+                    path.append(start)
+                    # path runs backwards from start; flip the interior.
+                    return [start] + path[1:-1][::-1] + [start]
+                if w in inside and w not in parent:
+                    parent[w] = v
+                    queue.append(w)
+        return [start, start]
+
+
+class ReadySet:
+    """Incrementally maintained set of tasks whose dependencies are met.
+
+    Each task keeps a count of unmet dependencies (including dependencies on
+    IDs outside the graph). Marking a task done or reopening it touches only
+    its direct dependents, so status changes cost O(out-degree) instead of a
+    full graph scan.
+    """
+
+    def __init__(self, graph: DependencyGraph, completed: Iterable[str] = ()) -> None:
+        self.graph = graph.compact()
+        self.completed: Set[str] = set(completed)
+        g = self.graph
+        done = self.completed
+        self._done = [task_id in done for task_id in g.ids]
+        self._unmet = [
+            sum(1 for j in g.deps[i] if not self._done[j]) for i in range(len(g.ids))
+        ]
+        for dep_id, dependents in g.external.items():
+            if dep_id not in done:
+                for i in dependents:
+                    self._unmet[i] += 1
+
+    def is_ready(self, task_id: str) -> bool:
+        i = self.graph.index.get(task_id)
+        return i is not None and not self._done[i] and self._unmet[i] == 0
+
+    def ready(self) -> List[str]:
+        """Ready task IDs in graph (input) order."""
+        ids = self.graph.ids
+        return [ids[i] for i in range(len(ids)) if not self._done[i] and self._unmet[i] == 0]
+
+    def mark_done(self, task_id: str) -> List[str]:
+        """Record a completed task; returns tasks that became ready."""
+        if task_id in self.completed:
+            return []
+        self.completed.add(task_id)
+        return self._shift(task_id, done=True)
+
+    def mark_open(self, task_id: str) -> List[str]:
+        """Reopen a completed task; returns tasks that stopped being ready."""
+        if task_id not in self.completed:
+            return []
+        self.completed.discard(task_id)
+        return self._shift(task_id, done=False)
+
+    def _shift(self, task_id: str, done: bool) -> List[str]:
+        g = self.graph
+        i = g.index.get(task_id)
+        if i is None:
+            dependents = g.external.get(task_id, [])
+        else:
+            self._done[i] = done
+            dependents = g.dependents[i]
+        delta = -1 if done else 1
+        changed: List[str] = []
+        for j in dependents:
+            self._unmet[j] += delta
+            if not self._done[j] and self._unmet[j] == (0 if done else 1):
+                changed.append(g.ids[j])
+        return changed
+
+
+@dataclass
+class TaskSchedule:
+    """Earliest/latest timing of one task in a critical-path analysis.
+
+    All times are seconds from now, assuming unlimited parallelism.
+    """
+
+    task_id: str
+    duration: float
+    earliest_start: float = 0.0
+    earliest_finish: float = 0.0
+    latest_start: float = 0.0
+    latest_finish: float = 0.0
+
+    @property
+    def slack(self) -> float:
+        """How long the task can slip without delaying the whole backlog."""
+        return max(0.0, self.latest_start - self.earliest_start)
+
+    @property
+    def critical(self) -> bool:
+        return self.slack <= _SLACK_EPSILON
+
+
+@dataclass
+class CriticalPathAnalysis:
+    """Duration-weighted schedule of a dependency graph.
+
+    Attributes:
+        schedule: Timing per task (tasks on dependency cycles are omitted)
+        critical_path: One longest chain of tasks, in execution order
+        makespan: Length of the critical path in seconds
+    """
+
+    schedule: Dict[str, TaskSchedule] = field(default_factory=dict)
+    critical_path: List[str] = field(default_factory=list)
+    makespan: float = 0.0
+
+    def slack(self, task_id: str) -> float:
+        """Slack of a task; unknown tasks sort last (infinite slack)."""
+        entry = self.schedule.get(task_id)
+        return entry.slack if entry is not None else math.inf
+
+    def is_critical(self, task_id: str) -> bool:
+        entry = self.schedule.get(task_id)
+        return entry is not None and entry.critical
+
+    def order(self, task_ids: Iterable[str]) -> List[str]:
+        """Sort task IDs by slack (zero-slack first), keeping input order on ties."""
+        return sorted(task_ids, key=self.slack)
 
 
 def build_dependency_graph(tasks: List[Dict[str, Any]]) -> DependencyGraph:
@@ -94,24 +381,14 @@ def _calculate_depths(graph: DependencyGraph) -> None:
     Args:
         graph: The dependency graph to update with depth information
     """
-    # Find nodes with no dependencies (depth 0)
-    for node in graph.nodes.values():
-        if not node.depends_on:
-            node.depth = 0
-
-    # Process nodes in topological order
-    visited: Set[str] = set()
-    for task_id in _topological_sort(graph):
-        node = graph.nodes[task_id]
-        visited.add(task_id)
-
+    compact = graph.compact()
+    depths = [0] * len(compact.ids)
+    for i in compact.topological_order():
+        node = graph.nodes[compact.ids[i]]
         # Calculate depth as max(dependency depths) + 1
         if node.depends_on:
-            max_dep_depth = 0
-            for dep_id in node.depends_on:
-                if dep_id in graph.nodes:
-                    max_dep_depth = max(max_dep_depth, graph.nodes[dep_id].depth)
-            node.depth = max_dep_depth + 1
+            depths[i] = max((depths[j] for j in compact.deps[i]), default=0) + 1
+        node.depth = depths[i]
 
 
 def _topological_sort(graph: DependencyGraph) -> List[str]:
@@ -121,45 +398,28 @@ def _topological_sort(graph: DependencyGraph) -> List[str]:
         graph: The dependency graph to sort
 
     Returns:
-        List of task IDs in topological order (dependencies before dependents)
+        List of task IDs in topological order (dependencies before dependents,
+        input order among independent tasks)
 
     Note:
         If the graph has cycles, this will return a partial ordering.
     """
-    # Calculate in-degree for each node
-    in_degree: Dict[str, int] = {task_id: 0 for task_id in graph.nodes}
-    for _, to_task in graph.edges:
-        if to_task in in_degree:
-            in_degree[to_task] += 1
-
-    # Start with nodes that have no dependencies
-    queue: List[str] = [task_id for task_id, degree in in_degree.items() if degree == 0]
-    result: List[str] = []
-
-    while queue:
-        # Process node with no remaining dependencies
-        current = queue.pop(0)
-        result.append(current)
-
-        # Reduce in-degree for dependent nodes
-        for from_task, to_task in graph.edges:
-            if from_task == current and to_task in in_degree:
-                in_degree[to_task] -= 1
-                if in_degree[to_task] == 0:
-                    queue.append(to_task)
-
-    return result
+    compact = graph.compact()
+    return [compact.ids[i] for i in compact.topological_order()]
 
 
 def detect_circular_dependencies(graph: DependencyGraph) -> List[List[str]]:
-    """Detect circular dependencies using depth-first search.
+    """Detect circular dependencies using Tarjan's strongly connected components.
+
+    The search is iterative, so arbitrarily deep dependency chains are safe.
 
     Args:
         graph: The dependency graph to check for cycles
 
     Returns:
-        List of cycles found, where each cycle is a list of task IDs forming
-        the circular dependency. Empty list if no cycles found.
+        One cycle per strongly connected component that contains a cycle,
+        each a list of task IDs starting and ending at the same task. Empty
+        list if no cycles found.
 
     Example:
         >>> tasks = [
@@ -171,44 +431,13 @@ def detect_circular_dependencies(graph: DependencyGraph) -> List[List[str]]:
         >>> len(cycles) > 0
         True
     """
+    compact = graph.compact()
     cycles: List[List[str]] = []
-    visited: Set[str] = set()
-    rec_stack: Set[str] = set()
-    path: List[str] = []
-
-    def dfs(task_id: str) -> bool:
-        """DFS helper that returns True if a cycle is found."""
-        visited.add(task_id)
-        rec_stack.add(task_id)
-        path.append(task_id)
-
-        # Check all dependencies
-        node = graph.nodes.get(task_id)
-        if node:
-            for dep_id in node.depends_on:
-                if dep_id not in graph.nodes:
-                    # Dependency doesn't exist, skip
-                    continue
-
-                if dep_id not in visited:
-                    if dfs(dep_id):
-                        return True
-                elif dep_id in rec_stack:
-                    # Found a cycle - extract the cycle from path
-                    cycle_start = path.index(dep_id)
-                    cycle = path[cycle_start:] + [dep_id]
-                    cycles.append(cycle)
-                    return True
-
-        path.pop()
-        rec_stack.remove(task_id)
-        return False
-
-    # Run DFS from each unvisited node
-    for task_id in graph.nodes:
-        if task_id not in visited:
-            dfs(task_id)
-
+    for component in compact.strongly_connected_components():
+        if len(component) == 1 and component[0] not in compact.deps[component[0]]:
+            continue
+        cycles.append([compact.ids[i] for i in compact.cycle_through(component)])
+    cycles.sort(key=lambda cycle: compact.index[cycle[0]])
     return cycles
 
 
@@ -222,6 +451,9 @@ def get_ready_tasks(graph: DependencyGraph, completed: Set[str]) -> List[str]:
     Returns:
         List of task IDs that are ready to be executed (all dependencies met)
 
+    For repeated queries as tasks complete, keep a ReadySet and call
+    ReadySet.mark_done instead of rescanning the graph.
+
     Example:
         >>> tasks = [
         ...     {"id": "task-1", "depends_on": []},
@@ -234,26 +466,12 @@ def get_ready_tasks(graph: DependencyGraph, completed: Set[str]) -> List[str]:
         >>> "task-2" in ready
         False
     """
+    ready_set = ReadySet(graph, completed)
     ready: List[str] = []
-
     for task_id, node in graph.nodes.items():
-        # Skip if already completed
-        if task_id in completed:
-            continue
-
-        # Check if all dependencies are satisfied
-        all_deps_met = True
-        for dep_id in node.depends_on:
-            if dep_id not in completed:
-                all_deps_met = False
-                break
-
-        if all_deps_met:
-            node.ready = True
+        node.ready = ready_set.is_ready(task_id)
+        if node.ready:
             ready.append(task_id)
-        else:
-            node.ready = False
-
     return ready
 
 
@@ -336,3 +554,257 @@ def format_dependency_graph(graph: DependencyGraph) -> str:
     lines.append("=" * 60)
 
     return "\n".join(lines)
+
+
+def history_durations(history: Iterable[Any]) -> Dict[str, float]:
+    """Average iteration duration per task from `.ralph/state.json` history.
+
+    Args:
+        history: The state file's "history" list
+
+    Returns:
+        Mapping of task ID to mean duration in seconds (tasks with no timed
+        iterations are absent)
+    """
+    totals: Dict[str, Tuple[float, int]] = {}
+    for entry in history:
+        if not isinstance(entry, dict):
+            continue
+        task_id = entry.get("story_id")
+        duration = entry.get("duration_seconds")
+        if task_id is None or not isinstance(duration, (int, float)) or duration <= 0:
+            continue
+        total, count = totals.get(str(task_id), (0.0, 0))
+        totals[str(task_id)] = (total + float(duration), count + 1)
+    return {tid: total / count for tid, (total, count) in totals.items()}
+
+
+def estimate_task_durations(
+    tasks: Sequence[Dict[str, Any]],
+    history: Optional[Iterable[Any]] = None,
+) -> Dict[str, float]:
+    """Estimate how long each task will take, in seconds.
+
+    Tasks with recorded iterations use their historical average; the rest
+    use the base timeout of their `estimate_task_complexity` class. Done
+    tasks take no further time.
+
+    Args:
+        tasks: Task dicts (id, title, status, acceptance) as from get_all_tasks
+        history: Optional state history used for per-task averages
+
+    Returns:
+        Mapping of task ID to estimated duration
+    """
+    from .adaptive_timeout import estimate_task_complexity
+
+    averages = history_durations(history or [])
+    durations: Dict[str, float] = {}
+    for task in tasks:
+        task_id = str(task.get("id", ""))
+        if not task_id:
+            continue
+        if task.get("status") == "done":
+            durations[task_id] = 0.0
+        elif task_id in averages:
+            durations[task_id] = averages[task_id]
+        else:
+            acceptance = task.get("acceptance") or []
+            selected = SelectedTask(
+                id=task_id,
+                title=str(task.get("title", "")),
+                kind="json",
+                acceptance=[str(a) for a in acceptance] if isinstance(acceptance, list) else [],
+            )
+            durations[task_id] = float(estimate_task_complexity(selected).base_timeout_seconds)
+    return durations
+
+
+def compute_critical_path(
+    graph: DependencyGraph, durations: Dict[str, float]
+) -> CriticalPathAnalysis:
+    """Run a critical-path (CPM) analysis over the dependency graph.
+
+    A forward pass computes earliest start/finish, a backward pass latest
+    start/finish; slack is the difference. Dependencies outside the graph
+    are ignored and tasks on cycles are left out of the schedule.
+
+    Args:
+        graph: The dependency graph
+        durations: Estimated seconds per task (missing tasks count as 0)
+
+    Returns:
+        CriticalPathAnalysis with per-task timing and one critical path
+    """
+    order = _topological_sort(graph)
+    dependents: Dict[str, List[str]] = {task_id: [] for task_id in graph.nodes}
+    for from_task, to_task in graph.edges:
+        if from_task in dependents and to_task in graph.nodes:
+            dependents[from_task].append(to_task)
+
+    schedule: Dict[str, TaskSchedule] = {}
+    for task_id in order:
+        node = graph.nodes[task_id]
+        start = max(
+            (schedule[d].earliest_finish for d in node.blocked_by if d in schedule),
+            default=0.0,
+        )
+        duration = max(0.0, float(durations.get(task_id, 0.0)))
+        schedule[task_id] = TaskSchedule(
+            task_id=task_id,
+            duration=duration,
+            earliest_start=start,
+            earliest_finish=start + duration,
+        )
+
+    makespan = max((e.earliest_finish for e in schedule.values()), default=0.0)
+    for task_id in reversed(order):
+        entry = schedule[task_id]
+        entry.latest_finish = min(
+            (schedule[d].latest_start for d in dependents[task_id] if d in schedule),
+            default=makespan,
+        )
+        entry.latest_start = entry.latest_finish - entry.duration
+
+    # Walk back from a zero-slack task that ends last to recover one path.
+    path: List[str] = []
+    tail = next(
+        (
+            schedule[t]
+            for t in reversed(order)
+            if schedule[t].critical and abs(schedule[t].earliest_finish - makespan) <= _SLACK_EPSILON
+        ),
+        None,
+    )
+    while tail is not None:
+        path.append(tail.task_id)
+        current = tail
+        tail = next(
+            (
+                schedule[d]
+                for d in graph.nodes[current.task_id].blocked_by
+                if d in schedule
+                and schedule[d].critical
+                and abs(schedule[d].earliest_finish - current.earliest_start) <= _SLACK_EPSILON
+            ),
+            None,
+        )
+    path.reverse()
+
+    return CriticalPathAnalysis(schedule=schedule, critical_path=path, makespan=makespan)
+
+
+def analyze_critical_path(
+    tasks: Sequence[Dict[str, Any]],
+    history: Optional[Iterable[Any]] = None,
+) -> Tuple[DependencyGraph, CriticalPathAnalysis]:
+    """Build the graph for `tasks` and analyse it with estimated durations.
+
+    Args:
+        tasks: Task dicts as from get_all_tasks / graph_tasks_for_tracker
+        history: Optional state history for per-task duration averages
+
+    Returns:
+        (graph, analysis)
+    """
+    graph = build_dependency_graph(list(tasks))
+    return graph, compute_critical_path(graph, estimate_task_durations(tasks, history))
+
+
+def graph_tasks_for_tracker(tracker: Any, prd_path: Path) -> List[Dict[str, Any]]:
+    """Task dicts (id, title, status, depends_on, acceptance) for any tracker.
+
+    YAML and SQLite trackers are read through their loaded model; file PRDs
+    use `prd.get_all_tasks`.
+    """
+    export = getattr(tracker, "export_tasks", None)
+    data = export() if callable(export) else getattr(tracker, "data", None)
+    if isinstance(data, dict) and isinstance(data.get("tasks"), list):
+        tasks: List[Dict[str, Any]] = []
+        for raw in data["tasks"]:
+            if not isinstance(raw, dict) or "id" not in raw:
+                continue
+            status = "done" if raw.get("completed") else "blocked" if raw.get("blocked") else "open"
+            deps = raw.get("depends_on", [])
+            acceptance = raw.get("acceptance", [])
+            tasks.append(
+                {
+                    "id": str(raw["id"]),
+                    "title": str(raw.get("title", "")),
+                    "status": status,
+                    "depends_on": [str(d) for d in deps] if isinstance(deps, list) else [],
+                    "acceptance": acceptance if isinstance(acceptance, list) else [],
+                }
+            )
+        return tasks
+
+    from .prd import get_all_tasks
+
+    return get_all_tasks(prd_path) or []
+
+
+def tracker_critical_path(
+    tracker: Any, prd_path: Path, history: Optional[Iterable[Any]] = None
+) -> Optional[CriticalPathAnalysis]:
+    """Critical-path analysis of a tracker's tasks, or None if unavailable.
+
+    Failures (unreadable PRD, trackers without a task model) are logged and
+    reported as None so callers can keep their default ordering.
+    """
+    try:
+        tasks = graph_tasks_for_tracker(tracker, prd_path)
+    except Exception as e:
+        logger.debug("Cannot load tasks for critical path: %s", e)
+        return None
+    if not tasks:
+        return None
+    return analyze_critical_path(tasks, history)[1]
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 3600:
+        return f"{seconds / 3600:.1f}h"
+    if seconds >= 60:
+        return f"{seconds / 60:.0f}m"
+    return f"{seconds:.0f}s"
+
+
+def format_critical_path(analysis: CriticalPathAnalysis) -> str:
+    """Format a critical-path analysis as a text table.
+
+    Args:
+        analysis: Result of compute_critical_path
+
+    Returns:
+        String listing the critical path and each task's start and slack
+    """
+    if not analysis.schedule:
+        return "No schedulable tasks"
+
+    lines: List[str] = []
+    lines.append("=" * 60)
+    lines.append("Critical Path")
+    lines.append("=" * 60)
+    lines.append(
+        f"Estimated completion: {_format_seconds(analysis.makespan)} "
+        "(unlimited parallelism)"
+    )
+    if analysis.critical_path:
+        lines.append("Path: " + " → ".join(analysis.critical_path))
+    lines.append("")
+    lines.append(f"  {'task':<24} {'start':>7} {'dur':>7} {'slack':>7}")
+    entries = sorted(
+        analysis.schedule.values(), key=lambda e: (e.earliest_start, e.slack, e.task_id)
+    )
+    for entry in entries:
+        if entry.duration <= 0:
+            continue  # done tasks
+        marker = "*" if entry.critical else " "
+        lines.append(
+            f"{marker} {entry.task_id:<24} {_format_seconds(entry.earliest_start):>7} "
+            f"{_format_seconds(entry.duration):>7} {_format_seconds(entry.slack):>7}"
+        )
+    lines.append("")
+    lines.append("* = zero slack (on a critical path)")
+    lines.append("=" * 60)
+    return "\n".join(lines)
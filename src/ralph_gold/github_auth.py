@@ -14,9 +14,32 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import subprocess
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+
+GITHUB_API_URL = "https://api.github.com"
+
+# One API call for GitHubAuth.batch(): (method, endpoint, data).
+ApiCall = Tuple[str, str, Optional[Dict[str, Any]]]
+
+# Concurrent requests used by GitHubAuth.batch(); GitHub asks clients to keep
+# this small to avoid secondary rate limits.
+_BATCH_WORKERS = 4
+_POOL_SIZE = 8
+_MAX_RETRIES = 3
+_BACKOFF_SECONDS = 1.0
+_MAX_RETRY_WAIT = 60.0
+# Methods that can be repeated without a second side effect. A POST (e.g. a
+# comment) that timed out at the gateway may already have been applied.
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE", "PATCH"})
+
+_LINK_NEXT_RE = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
 
 
 class GitHubAuthError(Exception):
@@ -25,6 +48,50 @@ class GitHubAuthError(Exception):
     pass
 
 
+@dataclass
+class GitHubResponse:
+    """Status, body and (lower-cased) headers of a GitHub API response."""
+
+    status: int
+    data: Any
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("etag")
+
+    @property
+    def next_url(self) -> Optional[str]:
+        """URL of the next page from the `Link` header, if any."""
+        match = _LINK_NEXT_RE.search(self.headers.get("link", ""))
+        return match.group(1) if match else None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+def _same_origin(url: str, base_url: str) -> bool:
+    """True if url has the same scheme and host (and port) as base_url."""
+    target, base = urlsplit(url), urlsplit(base_url)
+    return (target.scheme, target.netloc.lower()) == (base.scheme, base.netloc.lower())
+
+
+def _split_http_response(raw: str) -> tuple[Optional[int], Dict[str, str], str]:
+    """Split `gh api --include` output into (status, headers, body)."""
+    head, sep, body = raw.replace("\r\n", "\n").partition("\n\n")
+    lines = head.split("\n")
+    match = re.match(r"^HTTP/\S+\s+(\d{3})", lines[0]) if lines else None
+    if not sep or not match:
+        return None, {}, raw
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        name, colon, value = line.partition(":")
+        if colon:
+            headers[name.strip().lower()] = value.strip()
+    return int(match.group(1)), headers, body
+
+
 class GitHubAuth(ABC):
     """Base protocol for GitHub authentication.
 
@@ -50,6 +117,15 @@ class GitHubAuth(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """Release pooled connections (nothing to release by default)."""
+
+    def __enter__(self) -> "GitHubAuth":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.close()
+
     @abstractmethod
     def validate(self) -> bool:
         """Validate that authentication is working.
@@ -59,6 +135,76 @@ class GitHubAuth(ABC):
         """
         pass
 
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> GitHubResponse:
+        """Make an API call and return status and headers along with the body.
+
+        `endpoint` may be a path or an absolute URL (as found in `Link`
+        headers). Extra `headers` such as `If-None-Match` are sent as-is; a
+        `304 Not Modified` answer is returned rather than raised.
+
+        The default implementation wraps `api_call()` and reports no headers,
+        so callers lose pagination and ETag support but keep working.
+
+        Raises:
+            GitHubAuthError: If authentication fails or API call fails
+        """
+        return GitHubResponse(status=200, data=self.api_call(method, endpoint, data))
+
+    def batch(
+        self,
+        calls: Sequence[ApiCall],
+        max_workers: int = _BATCH_WORKERS,
+        keys: Optional[Sequence[Hashable]] = None,
+    ) -> List[Union[Any, GitHubAuthError]]:
+        """Run several API calls concurrently.
+
+        Args:
+            calls: (method, endpoint, data) tuples
+            max_workers: Upper bound on requests in flight
+            keys: Optional ordering key per call. Calls that share a key
+                (e.g. the same issue) run one after another in the given
+                order; only calls with different keys run concurrently.
+
+        Returns:
+            One entry per call, in order: the response data, or the
+            GitHubAuthError that call raised
+        """
+
+        def _one(call: ApiCall) -> Union[Any, GitHubAuthError]:
+            method, endpoint, data = call
+            try:
+                return self.api_call(method, endpoint, data)
+            except GitHubAuthError as e:
+                return e
+
+        if keys is None:
+            groups = [[i] for i in range(len(calls))]
+        else:
+            by_key: Dict[Hashable, List[int]] = {}
+            for i, key in enumerate(keys):
+                by_key.setdefault(key, []).append(i)
+            groups = list(by_key.values())
+
+        results: List[Union[Any, GitHubAuthError]] = [None] * len(calls)
+
+        def _chain(indices: List[int]) -> None:
+            for i in indices:
+                results[i] = _one(calls[i])
+
+        if len(groups) <= 1 or max_workers <= 1:
+            for indices in groups:
+                _chain(indices)
+            return results
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as pool:
+            list(pool.map(_chain, groups))
+        return results
+
 
 class GhCliAuth(GitHubAuth):
     """GitHub authentication using gh CLI.
@@ -164,25 +310,81 @@ class GhCliAuth(GitHubAuth):
             raise GitHubAuthError(f"GitHub API call timed out: {method} {endpoint}")
         except subprocess.CalledProcessError as e:
             error_msg = e.stderr.strip() if e.stderr else "Unknown error"
+            raise self._error_for(error_msg, endpoint)
+        except json.JSONDecodeError as e:
+            raise GitHubAuthError(f"Failed to parse GitHub API response: {e}")
 
-            # Check for common errors
-            if (
-                "authentication" in error_msg.lower()
-                or "unauthorized" in error_msg.lower()
-            ):
-                raise GitHubAuthError(
-                    "GitHub authentication failed. Run 'gh auth login' to authenticate."
-                )
-            elif "not found" in error_msg.lower():
-                raise GitHubAuthError(f"GitHub API endpoint not found: {endpoint}")
-            elif "rate limit" in error_msg.lower():
-                raise GitHubAuthError(
-                    "GitHub API rate limit exceeded. Try again later."
-                )
-            else:
-                raise GitHubAuthError(f"GitHub API call failed: {error_msg}")
+    @staticmethod
+    def _error_for(error_msg: str, endpoint: str) -> GitHubAuthError:
+        """Map a gh error message onto a user-facing GitHubAuthError."""
+        lowered = error_msg.lower()
+        if "authentication" in lowered or "unauthorized" in lowered:
+            return GitHubAuthError(
+                "GitHub authentication failed. Run 'gh auth login' to authenticate."
+            )
+        if "not found" in lowered:
+            return GitHubAuthError(f"GitHub API endpoint not found: {endpoint}")
+        if "rate limit" in lowered:
+            return GitHubAuthError("GitHub API rate limit exceeded. Try again later.")
+        return GitHubAuthError(f"GitHub API call failed: {error_msg}")
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> GitHubResponse:
+        """Make an API call with `gh api --include` to capture status and headers.
+
+        Args:
+            method: HTTP method (GET, POST, PATCH, etc.)
+            endpoint: API path or absolute api.github.com URL
+            data: Optional request body for POST/PATCH requests
+            headers: Extra request headers (e.g. If-None-Match)
+
+        Returns:
+            GitHubResponse with status, parsed body and lower-cased headers
+
+        Raises:
+            GitHubAuthError: If API call fails
+        """
+        if endpoint.startswith(("http://", "https://")):
+            if not _same_origin(endpoint, GITHUB_API_URL):
+                raise GitHubAuthError(f"Refusing to follow a URL outside {GITHUB_API_URL}: {endpoint}")
+            # gh api expects a path; keep query string from Link URLs.
+            endpoint = "/" + endpoint.split("://", 1)[1].split("/", 1)[-1]
+
+        cmd = ["gh", "api", endpoint, "-X", method, "--include"]
+        for name, value in (headers or {}).items():
+            cmd.extend(["-H", f"{name}: {value}"])
+        stdin_data = None
+        if data is not None:
+            stdin_data = json.dumps(data)
+            cmd.extend(["--input", "-"])
+
+        try:
+            result = subprocess.run(
+                cmd,
+                input=stdin_data,
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=30,
+            )
+        except subprocess.TimeoutExpired:
+            raise GitHubAuthError(f"GitHub API call timed out: {method} {endpoint}")
+
+        status, resp_headers, body = _split_http_response(result.stdout or "")
+        if status is None or status >= 400 or (result.returncode != 0 and status != 304):
+            error_msg = (result.stderr or "").strip() or body.strip() or "Unknown error"
+            raise self._error_for(error_msg, endpoint)
+
+        try:
+            parsed = json.loads(body) if body.strip() else {}
         except json.JSONDecodeError as e:
             raise GitHubAuthError(f"Failed to parse GitHub API response: {e}")
+        return GitHubResponse(status=status, data=parsed, headers=resp_headers)
 
     def __repr__(self) -> str:
         """Safe representation that doesn't expose credentials."""
@@ -193,7 +395,8 @@ class TokenAuth(GitHubAuth):
     """GitHub authentication using personal access token.
 
     Reads token from environment variable (default: GITHUB_TOKEN).
-    Uses requests library for API calls.
+    Uses one pooled keep-alive `requests.Session` per instance and retries
+    secondary rate limits and transient server errors with backoff.
 
     Security measures:
     - Token never logged or printed
@@ -202,18 +405,26 @@ class TokenAuth(GitHubAuth):
     """
 
     def __init__(
-        self, token: Optional[str] = None, token_env: str = "GITHUB_TOKEN"
+        self,
+        token: Optional[str] = None,
+        token_env: str = "GITHUB_TOKEN",
+        base_url: str = GITHUB_API_URL,
     ) -> None:
         """Initialize token-based authentication.
 
         Args:
             token: GitHub personal access token (if None, reads from env)
             token_env: Environment variable name to read token from
+            base_url: API root (override for GitHub Enterprise or tests)
 
         Raises:
             GitHubAuthError: If token is not provided and not in environment
         """
         self._token = token or os.getenv(token_env)
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = _MAX_RETRIES
+        self._http: Any = None
+        self._sleep: Callable[[float], None] = time.sleep
 
         if not self._token:
             raise GitHubAuthError(
@@ -259,46 +470,84 @@ class TokenAuth(GitHubAuth):
         Raises:
             GitHubAuthError: If API call fails
         """
-        try:
-            import requests
-        except ImportError:
-            raise GitHubAuthError(
-                "requests library not installed. Install it with: uv add requests"
-            )
+        return self.request(method, endpoint, data).data
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> GitHubResponse:
+        """Make an authenticated API call and keep status and headers.
+
+        Args:
+            method: HTTP method (GET, POST, PATCH, etc.)
+            endpoint: API path or absolute URL (e.g. from a `Link` header)
+            data: Optional request body for POST/PATCH requests
+            headers: Extra request headers (e.g. If-None-Match)
+
+        Returns:
+            GitHubResponse with status, parsed body and lower-cased headers
 
-        # Build full URL
-        base_url = "https://api.github.com"
-        url = f"{base_url}{endpoint}"
+        Raises:
+            GitHubAuthError: If API call fails
+        """
+        if method not in {"GET", "POST", "PATCH", "PUT", "DELETE"}:
+            raise GitHubAuthError(f"Unsupported HTTP method: {method}")
 
-        # Build headers
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28",
-            "User-Agent": "ralph-gold/0.7.0",
-        }
+        requests = _import_requests()
 
+        # Build full URL. Absolute URLs (pagination links taken from a
+        # response) must point at the configured API host: the token is
+        # attached to every request.
+        if endpoint.startswith(("http://", "https://")):
+            if not _same_origin(endpoint, self.base_url):
+                raise GitHubAuthError(
+                    f"Refusing to send credentials to a URL outside {self.base_url}: {endpoint}"
+                )
+            url = endpoint
+        else:
+            url = f"{self.base_url}{endpoint}"
+
+        session = self._session()
         try:
-            # Make request
-            if method == "GET":
-                response = requests.get(url, headers=headers, timeout=30)
-            elif method == "POST":
-                response = requests.post(url, headers=headers, json=data, timeout=30)
-            elif method == "PATCH":
-                response = requests.patch(url, headers=headers, json=data, timeout=30)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=headers, timeout=30)
-            else:
-                raise GitHubAuthError(f"Unsupported HTTP method: {method}")
+            attempt = 0
+            while True:
+                try:
+                    response = session.request(
+                        method,
+                        url,
+                        headers={"Authorization": f"Bearer {self._token}", **(headers or {})},
+                        json=data if method in {"POST", "PATCH", "PUT"} else None,
+                        timeout=30,
+                    )
+                except requests.exceptions.ConnectionError as e:
+                    # A POST is only retried if it never reached the server.
+                    sent = not (
+                        isinstance(e, requests.exceptions.ConnectTimeout)
+                        or _is_connect_failure(e)
+                    )
+                    if attempt >= self.max_retries or (
+                        sent and method not in _IDEMPOTENT_METHODS
+                    ):
+                        raise
+                    delay: Optional[float] = _BACKOFF_SECONDS * (2**attempt)
+                else:
+                    delay = _retry_delay(response, attempt, method)
+                    if delay is None or attempt >= self.max_retries:
+                        break
+                self._sleep(delay)
+                attempt += 1
 
             # Check for errors
             if response.status_code == 401:
                 raise GitHubAuthError(
                     "GitHub authentication failed. Check your token and try again."
                 )
-            elif response.status_code == 403:
+            elif response.status_code in {403, 429}:
                 # Check if it's a rate limit error
-                if "rate limit" in response.text.lower():
+                if response.status_code == 429 or "rate limit" in response.text.lower():
                     raise GitHubAuthError(
                         "GitHub API rate limit exceeded. Try again later."
                     )
@@ -313,10 +562,14 @@ class TokenAuth(GitHubAuth):
                     f"GitHub API call failed with status {response.status_code}: {response.text}"
                 )
 
+            resp_headers = {k.lower(): v for k, v in response.headers.items()}
             # Parse response
-            if response.text.strip():
-                return response.json()
-            return {}
+            body: Any = {}
+            if response.status_code != 304 and response.text.strip():
+                body = response.json()
+            return GitHubResponse(
+                status=response.status_code, data=body, headers=resp_headers
+            )
 
         except requests.exceptions.Timeout:
             raise GitHubAuthError(f"GitHub API call timed out: {method} {endpoint}")
@@ -325,6 +578,32 @@ class TokenAuth(GitHubAuth):
         except json.JSONDecodeError as e:
             raise GitHubAuthError(f"Failed to parse GitHub API response: {e}")
 
+    def _session(self) -> Any:
+        """Return the shared keep-alive session, creating it on first use."""
+        if self._http is None:
+            requests = _import_requests()
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(
+                {
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                    "User-Agent": "ralph-gold/0.7.0",
+                }
+            )
+            self._http = session
+        return self._http
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        if getattr(self, "_http", None) is not None:
+            self._http.close()
+            self._http = None
+
     def __del__(self) -> None:
         """Clear token on cleanup."""
         if hasattr(self, "_token"):
@@ -335,6 +614,63 @@ class TokenAuth(GitHubAuth):
         return "TokenAuth(***)"
 
 
+def _import_requests() -> Any:
+    try:
+        import requests
+    except ImportError:
+        raise GitHubAuthError(
+            "requests library not installed. Install it with: uv add requests"
+        )
+    return requests
+
+
+def _is_connect_failure(error: Exception) -> bool:
+    """True if a requests ConnectionError happened before the request was sent."""
+    try:
+        from urllib3.exceptions import NewConnectionError
+    except ImportError:
+        return False
+    reason = error.args[0] if error.args else None
+    reason = getattr(reason, "reason", reason)
+    return isinstance(reason, NewConnectionError)
+
+
+def _retry_delay(response: Any, attempt: int, method: str = "GET") -> Optional[float]:
+    """Seconds to wait before retrying `response`, or None to not retry.
+
+    Retries secondary rate limits (403/429 with Retry-After or a "secondary
+    rate limit" message) and primary limits that reset within
+    `_MAX_RETRY_WAIT`; those requests were rejected, not applied. 502/503/504
+    answers are retried for idempotent methods only, since the request may
+    have been applied behind the gateway.
+    """
+    status = response.status_code
+    backoff = _BACKOFF_SECONDS * (2**attempt)
+    if status in {502, 503, 504}:
+        return backoff if method in _IDEMPOTENT_METHODS else None
+    if status not in {403, 429}:
+        return None
+
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            wait = float(retry_after)
+        except ValueError:
+            wait = backoff
+        return wait if wait <= _MAX_RETRY_WAIT else None
+
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            wait = float(response.headers.get("X-RateLimit-Reset", "")) - time.time()
+        except ValueError:
+            return None
+        return max(wait, 0.0) if wait <= _MAX_RETRY_WAIT else None
+
+    if status == 429 or "secondary rate limit" in response.text.lower():
+        return backoff
+    return None
+
+
 def create_auth(
     auth_method: str = "gh_cli", token_env: str = "GITHUB_TOKEN"
 ) -> GitHubAuth:
@@ -10,18 +10,32 @@ import time
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from .adaptive_timeout import calculate_adaptive_timeout
 from .agents import build_agent_invocation, get_runner_config
 from .atomic_file import atomic_write_json
 from .authorization import AuthorizationChecker, EnforcementMode, load_authorization_checker
+from .code_map import build_code_map
 from .config import AdaptiveConfig, Config, GatesConfig, LoopModeConfig, RunnerConfig, SyntaxCheckGateConfig, load_config
-from .context_manager import check_context_health, load_progress_window
+from .context_manager import check_context_health
+from .context_pack_cache import CachedPack, ContextPackCache, get_pack_prefetcher, pack_cache_key
 from .evidence import EvidenceReceipt
+from .pipeline import IterationPipeline, predict_next_task
 from .prd import SelectedTask, select_task_by_id, task_status_by_id
+from .prd_slice import build_prd_slice, build_prd_view
+from .prompt_cache import get_prompt_cache
 from .receipts import CommandReceipt, NoFilesWrittenReceipt, SmartGateSkipReceipt, hash_text, iso_utc, truncate_text, write_receipt
 from .repoprompt import RepoPromptError, build_context_pack, run_review
+from .runner_log import RunnerLogCapture
+from .spec_index import load_relevant_specs
+from .token_budget import (
+    allocate_budget,
+    fit_items,
+    get_tokenizer,
+    section_policies,
+    truncate_to_tokens,
+)
 from .spec_loader import load_specs_with_limits, SpecLoadResult
 from .state_validation import validate_state_against_prd
 from .stats import calculate_stats
@@ -38,7 +52,8 @@ from .subprocess_helper import (
     run_subprocess,
     run_subprocess_live,
 )
-from .trackers import make_tracker
+from .trackers import Tracker, make_tracker, swap_claimed_task, tracker_snapshot
+from .trackers.sqlite_tracker import is_sqlite_prd, sqlite_sidecar_paths
 
 logger = logging.getLogger(__name__)
 
@@ -531,11 +546,17 @@ def build_prompt(
     *,
     anchor_text: str = "",
     repoprompt_context: str = "",
+    agent: str = "",
 ) -> str:
-    """Build the per-iteration prompt."""
+    """Build the per-iteration prompt.
+
+    When a token budget applies to `agent` (``[prompt].token_budget`` or
+    ``[prompt.runner_token_budgets]``), sections are fitted to it.
+    """
 
+    cache = get_prompt_cache()
     prompt_path = _resolve_task_prompt(project_root, cfg, task)
-    base = _read_text_if_exists(prompt_path)
+    base = cache.text(prompt_path)
 
     agents_path = project_root / cfg.files.agents
     prd_path = project_root / cfg.files.prd
@@ -543,24 +564,46 @@ def build_prompt(
     feedback_path = project_root / cfg.files.feedback
     specs_dir = project_root / cfg.files.specs_dir
 
-    agents = _read_text_if_exists(agents_path)
-    prd = _read_text_if_exists(prd_path)
+    agents = cache.text(agents_path)
+    prd_slice: Optional[str] = None
+    if cfg.prompt.prd_mode == "slice" and task is not None:
+        prd_slice = build_prd_slice(prd_path, task, cfg.files.prd)
+    if prd_slice is not None:
+        prd = prd_slice
+    elif is_sqlite_prd(prd_path):
+        # Never embed the database file; render its tasks as text instead.
+        prd = build_prd_view(prd_path, cfg.files.prd)
+    else:
+        prd = cache.text(prd_path)
     # Use sliding window for progress to prevent context overflow
-    progress, entries_loaded, total_entries = load_progress_window(
+    progress, entries_loaded, total_entries = cache.progress_window(
         progress_path,
         max_lines=cfg.prompt.context_progress_max_lines,
         max_chars=cfg.prompt.context_progress_max_chars,
     )
-    feedback = _read_text_if_exists(feedback_path)
+    feedback = cache.text(feedback_path)
+
+    # Relevance mode: fill the spec budget with the index sections that
+    # best match the task; fall back to whole files when nothing matches.
+    specs: List[tuple[str, str]] = []
+    if cfg.prompt.specs_inclusion_order == "relevance" and task is not None:
+        specs = load_relevant_specs(
+            project_root,
+            specs_dir,
+            task,
+            max_chars=cfg.prompt.max_specs_chars,
+            max_section_chars=cfg.prompt.max_single_spec_chars,
+        )
 
     # Load specs with configurable limits and diagnostic warnings
-    spec_result: SpecLoadResult = load_specs_with_limits(
+    spec_result: SpecLoadResult = SpecLoadResult() if specs else load_specs_with_limits(
         specs_dir,
         max_specs_files=cfg.prompt.max_specs_files,
         max_specs_chars=cfg.prompt.max_specs_chars,
         max_single_spec_chars=cfg.prompt.max_single_spec_chars,
         truncate_long_specs=cfg.prompt.truncate_long_specs,
         specs_inclusion_order=cfg.prompt.specs_inclusion_order,
+        read_text=cache.read,
     )
 
     # Display spec warnings to user
@@ -569,11 +612,11 @@ def build_prompt(
         for warning in spec_result.warnings:
             logger.warning(f"  - {warning}")
 
-    # Read spec contents
-    specs: List[tuple[str, str]] = []
+    # Spec contents come from the cache populated while sizing them above;
+    # specs the loader truncated are cut to the size it accounted for.
+    truncated_to = {name: kept for name, _, kept in spec_result.truncated}
     for spec_name, _ in spec_result.included:
-        spec_path = specs_dir / spec_name
-        content = _read_text_if_exists(spec_path)
+        content = cache.spec(specs_dir / spec_name, truncated_to.get(spec_name))
         if content:
             specs.append((spec_name, content))
 
@@ -602,14 +645,142 @@ def build_prompt(
             f"({len(progress)} chars)"
         )
 
+    layout = _layout_classic
+    if cfg.prompt.layout == "cache_friendly":
+        specs.sort(key=lambda item: item[0])
+        layout = _layout_cache_friendly
+
+    def render(**sections: Any) -> str:
+        return layout(
+            cfg,
+            task,
+            iteration,
+            base=base,
+            prd_is_slice=prd_slice is not None,
+            **sections,
+        )
+
+    sections: Dict[str, Any] = {
+        "anchor_text": anchor_text,
+        "repoprompt_context": repoprompt_context,
+        "agents": agents,
+        "prd": prd,
+        "progress": progress,
+        "feedback": feedback,
+        "specs": specs,
+    }
+    target_tokens = cfg.prompt.runner_token_budgets.get(agent, cfg.prompt.token_budget)
+    if target_tokens > 0:
+        sections = _fit_token_budget(cfg, target_tokens, render, sections)
+    return render(**sections)
+
+
+# Budget section names for build_prompt's layout keyword arguments.
+_BUDGET_SECTION_NAMES = {
+    "anchor_text": "anchor",
+    "repoprompt_context": "repoprompt",
+    "agents": "agents",
+    "prd": "prd",
+    "progress": "progress",
+    "feedback": "feedback",
+    "specs": "specs",
+}
+
+
+def _fit_token_budget(
+    cfg: Config,
+    target_tokens: int,
+    render: Callable[..., str],
+    sections: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Truncate or drop prompt sections so the rendered prompt fits target_tokens.
+
+    Everything outside the budgeted sections (template, selected task, loop
+    rules) is fixed. Section headings are not budgeted, so if they push the
+    prompt over the target the allocation is redone with the overshoot
+    removed; the allocation is recorded on the tracked prompt stats.
+    """
+    tokenizer = get_tokenizer(cfg.prompt.tokenizer)
+    policies = section_policies(cfg.prompt.token_sections)
+    empty = {key: [] if key == "specs" else "" for key in sections}
+    fixed_tokens = tokenizer(render(**empty))
+
+    requested = [
+        (
+            _BUDGET_SECTION_NAMES[key],
+            "\n".join(text for _, text in value) if key == "specs" else value,
+        )
+        for key, value in sections.items()
+    ]
+    fitted = sections
+    overshoot = 0
+    for _ in range(3):
+        allocation = allocate_budget(
+            requested,
+            target_tokens - overshoot,
+            tokenizer,
+            fixed_tokens=fixed_tokens,
+            policies=policies,
+            tokenizer_name=cfg.prompt.tokenizer,
+        )
+        fitted = {}
+        for (key, value), decision in zip(sections.items(), allocation.sections):
+            keep = policies[decision.name].keep if decision.name in policies else "head"
+            if key == "specs":
+                fitted[key] = (
+                    value
+                    if decision.action == "kept"
+                    else fit_items(value, decision.granted, tokenizer, keep=keep)
+                )
+                decision.tokens = sum(tokenizer(text) for _, text in fitted[key])
+            else:
+                fitted[key] = (
+                    value
+                    if decision.action == "kept"
+                    else truncate_to_tokens(value, decision.granted, tokenizer, keep=keep)
+                )
+                decision.tokens = tokenizer(fitted[key])
+            if decision.action == "truncated" and not decision.tokens:
+                decision.action = "dropped"
+        allocation.total_tokens = tokenizer(render(**fitted))
+        if allocation.total_tokens <= target_tokens:
+            break
+        overshoot += allocation.total_tokens - target_tokens
+    allocation.target_tokens = target_tokens
+
+    get_prompt_cache().record_budget(allocation.to_notes())
+    if allocation.changed:
+        logger.info(
+            "Prompt token budget %d: %s",
+            target_tokens,
+            ", ".join(f"{s.name} {s.action}" for s in allocation.sections if s.action != "kept"),
+        )
+    if allocation.total_tokens > target_tokens:
+        logger.warning(
+            f"Prompt is {allocation.total_tokens} tokens, over the {target_tokens} token budget "
+            f"({allocation.fixed_tokens} tokens are not budgeted)"
+        )
+    return fitted
+
+
+def _layout_classic(
+    cfg: Config,
+    task: Optional[SelectedTask],
+    iteration: int,
+    *,
+    base: str,
+    anchor_text: str,
+    repoprompt_context: str,
+    agents: str,
+    prd: str,
+    progress: str,
+    feedback: str,
+    specs: List[tuple[str, str]],
+    prd_is_slice: bool = False,
+) -> str:
+    """Lay out a prompt in the original order (template, anchor, pack, addendum)."""
     parts: List[str] = []
-    if base.strip():
-        parts.append(base.rstrip())
-        parts.append("")
-    else:
-        parts.append("# Golden Ralph Loop")
-        parts.append("(missing prompt file; using fallback instructions)")
-        parts.append("")
+    _append_base_prompt(parts, base)
 
     if anchor_text.strip():
         parts.append("<ANCHOR>")
@@ -623,9 +794,42 @@ def build_prompt(
         parts.append("</REPOPROMPT_CONTEXT_PACK>")
         parts.append("")
 
-    parts.append("## Orchestrator Addendum (auto-generated)")
+    parts.append(PROMPT_ADDENDUM_HEADING)
     parts.append(f"Iteration: {iteration}")
     parts.append("")
+    _append_iteration_constraints(parts)
+    _append_selected_task(parts, task, sqlite_prd=is_sqlite_prd(Path(cfg.files.prd)))
+
+    parts.append("<PROJECT_MEMORY>")
+    _append_memory_section(parts, cfg.files.agents, agents)
+    _append_memory_section(parts, _prd_label(cfg, prd_is_slice), prd)
+    _append_memory_section(parts, cfg.files.progress, progress)
+    _append_memory_section(parts, cfg.files.feedback, feedback)
+    for name, text in specs:
+        _append_memory_section(parts, f"{cfg.files.specs_dir}/{name}", text)
+    parts.append("</PROJECT_MEMORY>")
+
+    _append_exit_protocol(parts)
+    return "\n".join(parts) + "\n"
+
+
+# Heading that opens the per-iteration part of a prompt. In the cache-friendly
+# layout everything before it is stable across iterations.
+PROMPT_ADDENDUM_HEADING = "## Orchestrator Addendum (auto-generated)"
+_VOLATILE_PROMPT_MARKERS = ("<ANCHOR>", "<REPOPROMPT_CONTEXT_PACK>", PROMPT_ADDENDUM_HEADING)
+
+
+def _append_base_prompt(parts: List[str], base: str) -> None:
+    if base.strip():
+        parts.append(base.rstrip())
+        parts.append("")
+    else:
+        parts.append("# Golden Ralph Loop")
+        parts.append("(missing prompt file; using fallback instructions)")
+        parts.append("")
+
+
+def _append_iteration_constraints(parts: List[str]) -> None:
     parts.append("Hard iteration constraints:")
     parts.append("- One task per iteration (one commit per iteration).")
     parts.append(
@@ -633,6 +837,10 @@ def build_prompt(
     )
     parts.append("")
 
+
+def _append_selected_task(
+    parts: List[str], task: Optional[SelectedTask], *, sqlite_prd: bool = False
+) -> None:
     if task is not None:
         parts.append("Selected task for this iteration:")
         parts.append(f"- id: {task.id}")
@@ -644,45 +852,119 @@ def build_prompt(
                 parts.append(f"  - {a}")
         parts.append("")
         parts.append("Do not work on any other task in this iteration.")
+        if sqlite_prd:
+            # The database cannot be edited like a Markdown/JSON PRD.
+            parts.append(
+                "The PRD is a SQLite database: when the task is complete, run "
+                f"`ralph task done {task.id}` instead of editing the file."
+            )
         parts.append("")
     else:
         parts.append("No task was selected (task file may be empty or malformed).")
         parts.append("If the task file is complete, confirm and prepare to exit.")
         parts.append("")
 
-    parts.append("<PROJECT_MEMORY>")
-    if agents.strip():
-        parts.append(f"## {cfg.files.agents}")
-        parts.append(agents)
-        parts.append("")
-    if prd.strip():
-        parts.append(f"## {cfg.files.prd}")
-        parts.append(prd)
-        parts.append("")
-    if progress.strip():
-        parts.append(f"## {cfg.files.progress}")
-        parts.append(progress)
-        parts.append("")
-    if feedback.strip():
-        parts.append(f"## {cfg.files.feedback}")
-        parts.append(feedback)
-        parts.append("")
-    for name, text in specs:
-        if not text.strip():
-            continue
-        parts.append(f"## {cfg.files.specs_dir}/{name}")
+
+def _append_memory_section(parts: List[str], label: str, text: str) -> None:
+    if text.strip():
+        parts.append(f"## {label}")
         parts.append(text)
         parts.append("")
-    parts.append("</PROJECT_MEMORY>")
 
+
+def _prd_label(cfg: Config, is_slice: bool) -> str:
+    return f"{cfg.files.prd} (slice)" if is_slice else cfg.files.prd
+
+
+def _append_exit_protocol(parts: List[str]) -> None:
     parts.append("")
     parts.append("Exit protocol (required):")
     parts.append("At the very end of your output, print exactly one line:")
     parts.append("EXIT_SIGNAL: true  OR  EXIT_SIGNAL: false")
     parts.append("")
+
+
+def _layout_cache_friendly(
+    cfg: Config,
+    task: Optional[SelectedTask],
+    iteration: int,
+    *,
+    base: str,
+    anchor_text: str,
+    repoprompt_context: str,
+    agents: str,
+    prd: str,
+    progress: str,
+    feedback: str,
+    specs: List[tuple[str, str]],
+    prd_is_slice: bool = False,
+) -> str:
+    """Lay out a prompt with stable sections first for provider prompt caching.
+
+    The prefix (prompt template, loop rules, AGENTS.md, specs, PRD) only
+    changes when those files change; the iteration number, selected task,
+    anchor, context pack, progress and feedback follow the addendum heading.
+    A task-scoped PRD slice is per-iteration too and goes after the task.
+    """
+    parts: List[str] = []
+    _append_base_prompt(parts, base)
+    _append_iteration_constraints(parts)
+
+    parts.append("<PROJECT_MEMORY>")
+    _append_memory_section(parts, cfg.files.agents, agents)
+    for name, text in specs:
+        _append_memory_section(parts, f"{cfg.files.specs_dir}/{name}", text)
+    # The PRD changes as tasks are checked off, so it closes the prefix.
+    if not prd_is_slice:
+        _append_memory_section(parts, cfg.files.prd, prd)
+    parts.append("</PROJECT_MEMORY>")
+    parts.append("")
+
+    parts.append(PROMPT_ADDENDUM_HEADING)
+    parts.append(f"Iteration: {iteration}")
+    parts.append("")
+    _append_selected_task(parts, task, sqlite_prd=is_sqlite_prd(Path(cfg.files.prd)))
+
+    if anchor_text.strip():
+        parts.append("<ANCHOR>")
+        parts.append(anchor_text.strip())
+        parts.append("</ANCHOR>")
+        parts.append("")
+
+    if repoprompt_context.strip():
+        parts.append("<REPOPROMPT_CONTEXT_PACK>")
+        parts.append(repoprompt_context.strip())
+        parts.append("</REPOPROMPT_CONTEXT_PACK>")
+        parts.append("")
+
+    if progress.strip() or feedback.strip() or prd_is_slice:
+        parts.append("<RECENT_MEMORY>")
+        if prd_is_slice:
+            _append_memory_section(parts, _prd_label(cfg, True), prd)
+        _append_memory_section(parts, cfg.files.progress, progress)
+        _append_memory_section(parts, cfg.files.feedback, feedback)
+        parts.append("</RECENT_MEMORY>")
+
+    _append_exit_protocol(parts)
     return "\n".join(parts) + "\n"
 
 
+def split_prompt_prefix(prompt_text: str) -> Tuple[str, str]:
+    """Split a built prompt into its cacheable prefix and per-iteration rest.
+
+    The prefix ends at the first line that opens a volatile section (anchor,
+    context pack or orchestrator addendum). With the cache-friendly layout
+    this is everything that stays byte-identical between iterations; with
+    the classic layout it is usually just the prompt template.
+    """
+    offset = 0
+    for line in prompt_text.splitlines(keepends=True):
+        if line.rstrip("\r\n") in _VOLATILE_PROMPT_MARKERS:
+            return prompt_text[:offset], prompt_text[offset:]
+        offset += len(line)
+    return prompt_text, ""
+
+
 def build_runner_invocation(
     agent: str, argv_template: List[str], prompt_text: str
 ) -> Tuple[List[str], Optional[str]]:
@@ -1652,12 +1934,7 @@ def build_judge_prompt(
     """Build the LLM-as-judge prompt."""
 
     prompt_path = project_root / cfg.gates.llm_judge.prompt
-    base = ""
-    if prompt_path.exists():
-        try:
-            base = prompt_path.read_text(encoding="utf-8")
-        except OSError as e:
-            logger.debug("File read failed: %s", e)
+    base = get_prompt_cache().read(prompt_path) or ""
 
     lines: List[str] = []
     if base.strip():
@@ -1795,6 +2072,108 @@ def _update_state_metrics(state: Dict[str, Any]) -> None:
         logger.debug(f"Failed to update metrics in state: {e}")
 
 
+def _prefer_critical_task(
+    project_root: Path,
+    cfg: Config,
+    tracker: Tracker,
+    task: SelectedTask,
+    state: Dict[str, Any],
+    exclude_ids: Set[str],
+) -> SelectedTask:
+    """Swap the selected task for the ready task with the least slack.
+
+    Ready tasks come from the tracker snapshot; slack comes from a
+    critical-path analysis weighted by history averages or complexity
+    estimates. Ties keep the tracker's own order. The swap goes through
+    `swap_claimed_task`, so a claim is moved atomically or not at all;
+    trackers that can't do that, and any failure, keep the originally
+    selected task.
+    """
+    from .dependencies import tracker_critical_path
+
+    history = state.get("history", [])
+    analysis = tracker_critical_path(
+        tracker, project_root / cfg.files.prd, history if isinstance(history, list) else []
+    )
+    if analysis is None:
+        return task
+    ready = [tid for tid in tracker_snapshot(tracker).ready_ids if tid not in exclude_ids]
+    if task.id not in ready:
+        ready.insert(0, task.id)
+    best = analysis.order(ready)[0]
+    if best == task.id or analysis.slack(best) >= analysis.slack(task.id):
+        return task
+    try:
+        preferred = swap_claimed_task(tracker, task.id, best)
+    except (OSError, ValueError, RuntimeError) as e:
+        logger.debug("Critical task swap failed: %s", e)
+        return task
+    if preferred is None:
+        return task
+    logger.debug("Critical path: preferring %s over %s", best, task.id)
+    return preferred
+
+
+def _prefetch_next_context_pack(
+    project_root: Path,
+    cfg: Config,
+    tracker: Tracker,
+    exclude_ids: Set[str],
+) -> None:
+    """Start a background rp-cli build for the task likely to run next."""
+    if not (
+        cfg.repoprompt.enabled
+        and cfg.repoprompt.prefetch
+        and cfg.repoprompt.context_backend != "builtin"
+    ):
+        return
+    try:
+        next_task = predict_next_task(tracker, exclude_ids)
+    except (OSError, ValueError, RuntimeError) as e:
+        logger.debug("Context pack prefetch: cannot predict next task: %s", e)
+        return
+    if next_task is not None:
+        get_pack_prefetcher().prefetch(project_root, cfg.repoprompt, next_task)
+
+
+def _build_builtin_context_pack(
+    project_root: Path,
+    cfg: Config,
+    task: SelectedTask,
+    context_dir: Path,
+    receipts_dir: Path,
+) -> str:
+    """Render the built-in code map context pack and write its receipt."""
+    started = time.time()
+    out_path = context_dir / "code_map.md"
+    try:
+        code_map = build_code_map(
+            project_root,
+            task,
+            max_files=cfg.repoprompt.map_max_files,
+            max_chars=cfg.repoprompt.map_max_chars,
+        )
+    except (OSError, ValueError, RecursionError) as e:
+        # Like rp-cli failures with fail_open: the iteration runs without a pack.
+        logger.warning("Built-in context pack failed: %s", e)
+        return ""
+    out_path.write_text(code_map.text, encoding="utf-8")
+    write_receipt(
+        receipts_dir / "repoprompt_context.json",
+        CommandReceipt(
+            name="repoprompt_context",
+            argv=["builtin:code_map"],
+            returncode=0,
+            started_at=iso_utc(started),
+            ended_at=iso_utc(),
+            duration_seconds=time.time() - started,
+            stdout_path=str(out_path.relative_to(project_root)),
+            notes=code_map.to_notes(),
+        ),
+    )
+    return code_map.text
+
+
 def run_iteration(
     project_root: Path,
     agent: str,
@@ -1807,6 +2186,7 @@ def run_iteration(
     reopen_if_needed: bool = False,
     stream: bool = False,
     skip_gates: bool = False,
+    pipeline: Optional[IterationPipeline] = None,
 ) -> IterationResult:
     cfg = cfg or load_config(project_root)
     cfg, resolved_mode = _resolve_loop_mode(cfg)
@@ -2015,12 +2395,20 @@ def run_iteration(
                     task_err = str(e)
                     break
 
+            if task is not None and cfg.loop.critical_path_first:
+                task = _prefer_critical_task(
+                    project_root, cfg, tracker, task, state, blocked_ids
+                )
+
     except (OSError, ValueError, RuntimeError) as e:
         task = None
         task_err = str(e)
 
     story_id: Optional[str] = task.id if task is not None else None
     task_title = task.title if task is not None else "No remaining tasks"
+    # Pipelined loop: settle the speculation made while the previous
+    # iteration's gates ran against the task actually selected.
+    speculation_notes: Dict[str, Any] = pipeline.take(story_id) if pipeline is not None else {}
 
     # CRITICAL: Exit cleanly when no task is available
     if task is None:
@@ -2174,80 +2562,143 @@ def run_iteration(
         )
 
     rp_context_text = ""
-    if cfg.repoprompt.enabled and task is not None:
+    if cfg.repoprompt.enabled and task is not None and cfg.repoprompt.context_backend == "builtin":
+        rp_context_text = _build_builtin_context_pack(
+            project_root, cfg, task, context_dir, receipts_dir
+        )
+    elif cfg.repoprompt.enabled and task is not None:
         out_path = context_dir / "repoprompt_prompt.md"
-        try:
-            rp_run, rp_instructions = build_context_pack(
-                cfg=cfg.repoprompt,
-                task_id=task.id,
-                task_title=task.title,
-                acceptance=task.acceptance,
-                out_path=out_path,
-                cwd=project_root,
-                anchor_path=anchor_path,
+        pack_key: Optional[str] = None
+        cached_pack: Optional[CachedPack] = None
+        if cfg.repoprompt.pack_cache or cfg.repoprompt.prefetch or cfg.loop.pipeline:
+            pack_key = pack_cache_key(project_root, cfg.repoprompt, task)
+        if pack_key is not None:
+            # Waits for an in-flight prefetch of this pack instead of
+            # starting a second rp-cli build.
+            cached_pack = get_pack_prefetcher().lookup(
+                project_root, pack_key, timeout=cfg.repoprompt.timeout_seconds
             )
-            rp_context_text = _read_text_if_exists(out_path, limit_chars=400_000)
+        if cached_pack is not None:
+            rp_context_text = cached_pack.text
+            out_path.write_text(rp_context_text, encoding="utf-8")
             write_receipt(
                 receipts_dir / "repoprompt_context.json",
                 CommandReceipt(
                     name="repoprompt_context",
-                    argv=rp_run.argv,
-                    returncode=rp_run.returncode,
-                    started_at=iso_utc(time.time() - rp_run.duration_seconds),
+                    argv=list(cached_pack.meta.get("argv") or [cfg.repoprompt.cli]),
+                    returncode=0,
+                    started_at=iso_utc(),
                     ended_at=iso_utc(),
-                    duration_seconds=rp_run.duration_seconds,
+                    duration_seconds=0.0,
                     stdout_path=str(out_path.relative_to(project_root)),
-                    stderr_path=str(
-                        (receipts_dir / "repoprompt_context.stderr.txt").relative_to(
-                            project_root
-                        )
-                    )
-                    if rp_run.stderr
-                    else None,
                     notes={
-                        "instructions": rp_instructions,
-                        "stdout_tail": truncate_text(rp_run.stdout),
-                        "stderr_tail": truncate_text(rp_run.stderr),
+                        "cache": "hit",
+                        "cache_key": pack_key,
+                        "prefetched": bool(cached_pack.meta.get("prefetched")),
+                        "build_duration_seconds": cached_pack.meta.get("duration_seconds"),
+                        "instructions": cached_pack.meta.get("instructions", ""),
                     },
                 ),
             )
-            if rp_run.stderr:
-                (receipts_dir / "repoprompt_context.stderr.txt").write_text(
-                    rp_run.stderr, encoding="utf-8"
+        else:
+            try:
+                rp_run, rp_instructions = build_context_pack(
+                    cfg=cfg.repoprompt,
+                    task_id=task.id,
+                    task_title=task.title,
+                    acceptance=task.acceptance,
+                    out_path=out_path,
+                    cwd=project_root,
+                    anchor_path=anchor_path,
                 )
-        except RepoPromptError as e:
-            if cfg.repoprompt.required and not cfg.repoprompt.fail_open:
-                raise
-            write_receipt(
-                receipts_dir / "repoprompt_context.json",
-                CommandReceipt(
-                    name="repoprompt_context",
-                    argv=[cfg.repoprompt.cli],
-                    returncode=127,
-                    started_at=iso_utc(),
-                    ended_at=iso_utc(),
-                    duration_seconds=0.0,
-                    stderr_path=str(
-                        (receipts_dir / "repoprompt_context.error.txt").relative_to(
-                            project_root
+                rp_context_text = _read_text_if_exists(out_path, limit_chars=400_000)
+                if pack_key is not None and rp_run.returncode == 0 and rp_context_text.strip():
+                    ContextPackCache(project_root).put(
+                        pack_key,
+                        rp_context_text,
+                        {
+                            "task_id": task.id,
+                            "argv": rp_run.argv,
+                            "instructions": rp_instructions,
+                            "duration_seconds": rp_run.duration_seconds,
+                            "prefetched": False,
+                        },
+                    )
+                write_receipt(
+                    receipts_dir / "repoprompt_context.json",
+                    CommandReceipt(
+                        name="repoprompt_context",
+                        argv=rp_run.argv,
+                        returncode=rp_run.returncode,
+                        started_at=iso_utc(time.time() - rp_run.duration_seconds),
+                        ended_at=iso_utc(),
+                        duration_seconds=rp_run.duration_seconds,
+                        stdout_path=str(out_path.relative_to(project_root)),
+                        stderr_path=str(
+                            (receipts_dir / "repoprompt_context.stderr.txt").relative_to(
+                                project_root
+                            )
                         )
+                        if rp_run.stderr
+                        else None,
+                        notes={
+                            "instructions": rp_instructions,
+                            **({"cache": "miss", "cache_key": pack_key} if pack_key else {}),
+                            "stdout_tail": truncate_text(rp_run.stdout),
+                            "stderr_tail": truncate_text(rp_run.stderr),
+                        },
                     ),
-                    notes={"error": str(e)},
-                ),
-            )
-            (receipts_dir / "repoprompt_context.error.txt").write_text(
-                str(e) + "\n", encoding="utf-8"
-            )
+                )
+                if rp_run.stderr:
+                    (receipts_dir / "repoprompt_context.stderr.txt").write_text(
+                        rp_run.stderr, encoding="utf-8"
+                    )
+            except RepoPromptError as e:
+                if cfg.repoprompt.required and not cfg.repoprompt.fail_open:
+                    raise
+                write_receipt(
+                    receipts_dir / "repoprompt_context.json",
+                    CommandReceipt(
+                        name="repoprompt_context",
+                        argv=[cfg.repoprompt.cli],
+                        returncode=127,
+                        started_at=iso_utc(),
+                        ended_at=iso_utc(),
+                        duration_seconds=0.0,
+                        stderr_path=str(
+                            (receipts_dir / "repoprompt_context.error.txt").relative_to(
+                                project_root
+                            )
+                        ),
+                        notes={"error": str(e)},
+                    ),
+                )
+                (receipts_dir / "repoprompt_context.error.txt").write_text(
+                    str(e) + "\n", encoding="utf-8"
+                )
 
-    prompt_text = build_prompt(
-        project_root,
-        cfg,
-        task,
-        iteration,
-        anchor_text=anchor_text,
-        repoprompt_context=rp_context_text,
-    )
+    prompt_cache = get_prompt_cache()
+    with prompt_cache.track() as prompt_stats:
+        prompt_text = build_prompt(
+            project_root,
+            cfg,
+            task,
+            iteration,
+            anchor_text=anchor_text,
+            repoprompt_context=rp_context_text,
+            agent=agent,
+        )
     prompt_hash = hash_text(prompt_text)
+    prompt_prefix, _ = split_prompt_prefix(prompt_text)
+    prompt_prefix_hash = hash_text(prompt_prefix)
+    previous_prefix_hash = next(
+        (
+            h.get("prompt_prefix_hash")
+            for h in reversed(state.get("history", []) or [])
+            if isinstance(h, dict) and h.get("prompt_prefix_hash")
+        ),
+        None,
+    )
 
     # Prompt snapshots are debug artifacts; keep them under .ralph/logs/.
     prompt_file = logs_dir / f"prompt-iter{iteration:04d}.txt"
@@ -2282,11 +2733,43 @@ def run_iteration(
             mode_timeout=base_timeout,
         )
 
-    # Run agent
+    # Streaming capture: output goes to the log as it is produced and only
+    # a bounded tail stays in memory.
+    log_capture: Optional[RunnerLogCapture] = None
+    if cfg.loop.runner_capture == "stream":
+        log_capture = RunnerLogCapture(log_path, cfg.loop.runner_tail_chars)
+        log_capture.start(
+            f"# ralph-gold log\n"
+            f"timestamp_utc: {ts}\n"
+            f"iteration: {iteration}\n"
+            f"agent: {agent}\n"
+            f"story_id: {story_id}\n"
+            f"task_title: {task_title}\n"
+            f"attempt_id: {attempt_id}\n"
+            f"prompt_hash: {prompt_hash}\n"
+            f"cmd: {json.dumps(argv)}\n"
+            f"timeout_seconds: {timeout}\n"
+            f"runner_capture: stream\n"
+        )
+
+    # Run agent (in its own process group, so a timeout or Ctrl-C stops
+    # everything it spawned)
     start = time.time()
     timed_out = False
     try:
-        if stream:
+        if log_capture is not None:
+            result = run_subprocess_live(
+                argv,
+                cwd=project_root,
+                timeout=timeout,
+                capture_output=False,
+                input_text=stdin_text,
+                forward_output=stream and get_output_config().format != "json",
+                on_stdout=log_capture.on_stdout,
+                on_stderr=log_capture.on_stderr,
+                new_session=True,
+            )
+        elif stream:
             output_cfg = get_output_config()
             forward_output = output_cfg.format != "json"
             result = run_subprocess_live(
@@ -2295,6 +2778,7 @@ def run_iteration(
                 timeout=timeout,
                 input_text=stdin_text,
                 forward_output=forward_output,
+                new_session=True,
             )
         else:
             result = run_subprocess(
@@ -2302,6 +2786,7 @@ def run_iteration(
                 cwd=project_root,
                 timeout=timeout,
                 stdin_text=stdin_text,
+                new_session=True,
             )
         runner_ok = result.success
         duration_s = time.time() - start
@@ -2320,6 +2805,14 @@ def run_iteration(
             timed_out=timed_out,
         )
 
+    capture_notes: Dict[str, Any] = {}
+    if log_capture is not None:
+        log_capture.finish_output()
+        capture_notes = log_capture.to_notes()
+        result.stdout = log_capture.stdout_text()
+        stderr_tail = log_capture.stderr_text()
+        result.stderr = f"{stderr_tail}\n{result.stderr}".strip() if result.stderr else stderr_tail
+
     write_receipt(
         receipts_dir / "runner.json",
         CommandReceipt(
@@ -2332,12 +2825,34 @@ def run_iteration(
             stdout_path=str(log_path.relative_to(project_root)),
             notes={
                 "prompt_hash": prompt_hash,
+                "prompt_layout": cfg.prompt.layout,
+                "prompt_prefix_hash": prompt_prefix_hash,
+                "prompt_prefix_chars": len(prompt_prefix),
+                "prompt_chars": len(prompt_text),
+                "prompt_prefix_reused": (
+                    previous_prefix_hash == prompt_prefix_hash
+                    if previous_prefix_hash is not None
+                    else None
+                ),
+                **prompt_stats.to_notes(project_root),
+                **capture_notes,
                 "stdout_tail": truncate_text(result.stdout),
                 "stderr_tail": truncate_text(result.stderr),
             },
         ),
     )
 
+    # Build the likely next task's context pack while gates, judge and review
+    # run (after review instead when review itself talks to Repo Prompt).
+    review_uses_rp = (
+        cfg.gates.review.enabled
+        and cfg.gates.review.backend.strip().lower() == "repoprompt"
+    )
+    if not review_uses_rp:
+        _prefetch_next_context_pack(project_root, cfg, tracker, blocked_ids | {story_id or ""})
+        if pipeline is not None:
+            pipeline.start(tracker, blocked_ids | {story_id or ""})
+
     # Phase 2: Post-agent validation
     gate_cmds = cfg.gates.commands if cfg.gates.commands else []
     gates_ok: Optional[bool] = None
@@ -2539,14 +3054,15 @@ def run_iteration(
                 head_after=head_after_agent,
                 max_chars=int(judge_cfg.max_diff_chars),
             )
-            judge_prompt = build_judge_prompt(
-                project_root,
-                cfg,
-                task=task,
-                diff_text=diff_text,
-                gates_ok=gates_ok,
-                gate_results=gate_results,
-            )
+            with prompt_cache.track() as judge_prompt_stats:
+                judge_prompt = build_judge_prompt(
+                    project_root,
+                    cfg,
+                    task=task,
+                    diff_text=diff_text,
+                    gates_ok=gates_ok,
+                    gate_results=gate_results,
+                )
 
             try:
                 jr_runner = _get_runner(cfg, judge_cfg.agent)
@@ -2611,6 +3127,25 @@ def run_iteration(
                     )
                     judge_ok = False
 
+            if judge_result is not None:
+                write_receipt(
+                    receipts_dir / "judge.json",
+                    CommandReceipt(
+                        name="judge",
+                        argv=[str(judge_cfg.agent)],
+                        returncode=judge_result.return_code,
+                        started_at=iso_utc(time.time() - judge_result.duration_seconds),
+                        ended_at=iso_utc(),
+                        duration_seconds=judge_result.duration_seconds,
+                        notes={
+                            "judge_signal_raw": judge_result.judge_signal_raw,
+                            **judge_prompt_stats.to_notes(project_root),
+                            "stdout_tail": truncate_text(judge_result.stdout),
+                            "stderr_tail": truncate_text(judge_result.stderr),
+                        },
+                    ),
+                )
+
             if judge_ok is False and story_id is not None:
                 try:
                     tracker.force_task_open(story_id)
@@ -2625,19 +3160,21 @@ def run_iteration(
     if review_cfg.enabled and gates_ok is not False:
         # Collect diff for review
         diff_for_review = diff_text
-        review_prompt = _read_text_if_exists(project_root / review_cfg.prompt)
-        if not review_prompt:
-            review_prompt = (
-                "You are a strict cross-model reviewer. Review the diff and gate results.\n"
-                "Return your decision on the final line only: SHIP or BLOCK."
+        with prompt_cache.track() as review_prompt_stats:
+            review_prompt = prompt_cache.text(project_root / review_cfg.prompt)
+            if not review_prompt:
+                review_prompt = (
+                    "You are a strict cross-model reviewer. Review the diff and gate results.\n"
+                    "Return your decision on the final line only: SHIP or BLOCK."
+                )
+            message = (
+                review_prompt
+                + "\n\nGate summary:\n"
+                + "\n".join(gate_summaries)
+                + "\n\nDiff:\n"
+                + diff_for_review
             )
-        message = (
-            review_prompt
-            + "\n\nGate summary:\n"
-            + "\n".join(gate_summaries)
-            + "\n\nDiff:\n"
-            + diff_for_review
-        )
+        review_prompt_notes = review_prompt_stats.to_notes(project_root)
         if review_cfg.backend.strip().lower() == "repoprompt":
             try:
                 rp = run_review(message=message, cfg=cfg.repoprompt, cwd=project_root)
@@ -2658,6 +3195,7 @@ def run_iteration(
                         duration_seconds=rp.duration_seconds,
                         notes={
                             "required_token": review_cfg.required_token,
+                            **review_prompt_notes,
                             "stdout_tail": truncate_text(rp.stdout),
                             "stderr_tail": truncate_text(rp.stderr),
                         },
@@ -2726,6 +3264,7 @@ def run_iteration(
                             duration_seconds=r_dur,
                             notes={
                                 "required_token": review_cfg.required_token,
+                                **review_prompt_notes,
                                 "stdout_tail": truncate_text(r_out),
                                 "stderr_tail": truncate_text(r_err),
                             },
@@ -2753,6 +3292,12 @@ def run_iteration(
             except OSError as e:
                 logger.debug("File read failed: %s", e)
 
+    if review_uses_rp:
+        # Deferred until the rp-cli review is done with the workspace.
+        _prefetch_next_context_pack(project_root, cfg, tracker, blocked_ids | {story_id or ""})
+        if pipeline is not None:
+            pipeline.start(tracker, blocked_ids | {story_id or ""})
+
     # Append orchestrator entry to progress.md (append-only)
 
     task_done_now = False
@@ -2800,6 +3345,11 @@ def run_iteration(
     with progress_path.open("a", encoding="utf-8") as f:
         f.write(progress_line + "\n")
 
+    # Settle the speculative warm-up first so its cache writes don't race
+    # the commit's `git add -A`.
+    if pipeline is not None and cfg.git.auto_commit:
+        pipeline.stop()
+
     # Auto-commit / amend (best-effort)
     commit_action: Optional[str] = None
     # These are logged unconditionally below; ensure they're always defined even
@@ -2813,6 +3363,11 @@ def run_iteration(
         and (judge_ok is not False)
         and (review_ok is not False)
     ):
+        # Fold a SQLite PRD's write-ahead log into the database file so the
+        # commit records the current tasks.
+        checkpoint = getattr(tracker, "checkpoint", None)
+        if callable(checkpoint):
+            checkpoint()
         # If the agent already committed but left a dirty tree, prefer amend.
         dirty = not git_is_clean(project_root)
         if dirty:
@@ -2833,6 +3388,17 @@ def run_iteration(
                     cwd=project_root,
                     check=False,
                 )
+                run_subprocess(
+                    ["git", "reset", "--quiet", "--", ".ralph/cache/"],
+                    cwd=project_root,
+                    check=False,
+                )
+                if is_sqlite_prd(prd_path):
+                    run_subprocess(
+                        ["git", "reset", "--quiet", "--", *sqlite_sidecar_paths(cfg.files.prd)],
+                        cwd=project_root,
+                        check=False,
+                    )
 
                 # Nothing staged? Don't create empty commits.
                 staged_result = run_subprocess(
@@ -2964,7 +3530,11 @@ def run_iteration(
                 attempt_id=attempt_id,
                 timestamp=iso_utc(),
                 citations=citations,
-                raw_output_hash=hash_text(combined_output),
+                raw_output_hash=(
+                    log_capture.output_hash
+                    if log_capture is not None and log_capture.output_hash
+                    else hash_text(combined_output)
+                ),
                 metadata={
                     "iteration": iteration,
                     "agent": agent,
@@ -3033,7 +3603,7 @@ def run_iteration(
         )
 
     stdin_flag = "true" if stdin_text is not None else "false"
-    log_path.write_text(
+    log_fields = (
         f"# ralph-gold log\n"
         f"timestamp_utc: {ts}\n"
         f"iteration: {iteration}\n"
@@ -3061,14 +3631,24 @@ def run_iteration(
         f"exit_signal_effective: {exit_signal}\n"
         f"commit_action: {commit_action}\n"
         f"commit_return_code: {commit_rc}\n"
-        f"\n--- stdout ---\n{stdout_text}\n"
-        f"\n--- stderr ---\n{stderr_text}\n"
+    )
+    log_sections = (
         f"\n--- gates ---\n{_format_gate_results(gates_ok, gate_results, cfg.gates.output_mode, cfg.gates.max_output_lines)}"
         f"\n--- llm_judge ---\n{judge_section}"
         f"\n--- review ---\n{review_section}"
-        f"\n--- git_commit ---\n{commit_out}\n{commit_err}\n",
-        encoding="utf-8",
+        f"\n--- git_commit ---\n{commit_out}\n{commit_err}\n"
     )
+    if log_capture is not None:
+        # stdout/stderr are already in the log; append the summary.
+        log_capture.close(f"\n--- summary ---\n{log_fields}{log_sections}")
+    else:
+        log_path.write_text(
+            f"{log_fields}"
+            f"\n--- stdout ---\n{stdout_text}\n"
+            f"\n--- stderr ---\n{stderr_text}\n"
+            f"{log_sections}",
+            encoding="utf-8",
+        )
 
     # Update state + rate limit
     invocations = state.get("invocations", [])
@@ -3150,6 +3730,8 @@ def run_iteration(
                 for r in gate_results
             ],
             "log": str(log_path.name),
+            "prompt_prefix_hash": prompt_prefix_hash,
+            **speculation_notes,
         }
     )
     state["history"] = history[-200:]
@@ -3982,6 +4564,8 @@ def run_loop(
         hasattr(cfg, "quick") and getattr(cfg.quick, "enabled", False)
     )
 
+    pipeline = IterationPipeline(project_root, cfg) if cfg.loop.pipeline else None
+
     for offset in range(limit):
         i = start_iter + offset
 
@@ -4022,6 +4606,7 @@ def run_loop(
             stream=stream,
             skip_gates=skip_gates,
             target_task_id=target_task_id,
+            pipeline=pipeline,
         )
         results.append(res)
 
@@ -4057,4 +4642,9 @@ def run_loop(
         if cfg.loop.sleep_seconds_between_iters > 0:
             time.sleep(cfg.loop.sleep_seconds_between_iters)
 
+    if pipeline is not None and (pipeline.used or pipeline.discarded):
+        logger.info(
+            f"Pipeline: {pipeline.used} speculative preparation(s) used, "
+            f"{pipeline.discarded} discarded"
+        )
     return results
@@ -14,7 +14,8 @@ from pathlib import Path
 from typing import List, Optional
 
 from .config import Config
-from .loop import IterationResult, run_iteration
+from .dependencies import CriticalPathAnalysis, tracker_critical_path
+from .loop import IterationResult, load_state, run_iteration
 from .prd import SelectedTask
 from .trackers import Tracker
 from .worktree import WorktreeManager
@@ -102,11 +103,17 @@ class ParallelExecutor:
         # Get parallel groups from tracker
         groups = tracker.get_parallel_groups()
 
+        analysis = (
+            self._critical_path(tracker)
+            if self.cfg.parallel.critical_path_first
+            else None
+        )
+
         # Schedule tasks based on strategy
         if self.cfg.parallel.strategy == "queue":
-            tasks = self._flatten_groups(groups)
+            tasks = self._flatten_groups(groups, analysis)
         else:  # "group"
-            tasks = self._schedule_by_groups(groups)
+            tasks = self._schedule_by_groups(groups, analysis)
 
         # Apply max_tasks cap
         if self.max_tasks is not None and len(tasks) > self.max_tasks:
@@ -197,13 +204,35 @@ class ParallelExecutor:
         finally:
             worker.completed_at = time.time()
 
+    def _critical_path(self, tracker: Tracker) -> Optional[CriticalPathAnalysis]:
+        """Slack analysis of the tracker's tasks, weighted by loop history."""
+        history = load_state(self.project_root / ".ralph" / "state.json").get("history", [])
+        return tracker_critical_path(
+            tracker,
+            self.project_root / self.cfg.files.prd,
+            history if isinstance(history, list) else [],
+        )
+
+    @staticmethod
+    def _by_slack(
+        tasks: List[SelectedTask], analysis: Optional[CriticalPathAnalysis]
+    ) -> List[SelectedTask]:
+        """Stable-sort tasks by slack (critical first) when analysis is given."""
+        if analysis is None:
+            return tasks
+        return sorted(tasks, key=lambda t: analysis.slack(t.id))
+
     def _flatten_groups(
-        self, groups: dict[str, List[SelectedTask]]
+        self,
+        groups: dict[str, List[SelectedTask]],
+        analysis: Optional[CriticalPathAnalysis] = None,
     ) -> List[SelectedTask]:
         """Flatten all groups into a single FIFO queue.
 
         Args:
             groups: Dictionary mapping group names to task lists
+            analysis: Optional critical-path analysis; when given the whole
+                queue is ordered by slack so critical tasks start first
 
         Returns:
             Flattened list of all tasks
@@ -211,10 +240,12 @@ class ParallelExecutor:
         tasks: List[SelectedTask] = []
         for group_name in sorted(groups.keys()):
             tasks.extend(groups[group_name])
-        return tasks
+        return self._by_slack(tasks, analysis)
 
     def _schedule_by_groups(
-        self, groups: dict[str, List[SelectedTask]]
+        self,
+        groups: dict[str, List[SelectedTask]],
+        analysis: Optional[CriticalPathAnalysis] = None,
     ) -> List[SelectedTask]:
         """Schedule tasks by groups (groups run sequentially, tasks within parallel).
 
@@ -223,6 +254,8 @@ class ParallelExecutor:
 
         Args:
             groups: Dictionary mapping group names to task lists
+            analysis: Optional critical-path analysis; when given tasks are
+                ordered by slack within each group
 
         Returns:
             List of tasks ordered by group
@@ -231,7 +264,7 @@ class ParallelExecutor:
         # Full implementation would run groups sequentially with parallel tasks within
         tasks: List[SelectedTask] = []
         for group_name in sorted(groups.keys()):
-            tasks.extend(groups[group_name])
+            tasks.extend(self._by_slack(groups[group_name], analysis))
         return tasks
 
     def _failure_result(
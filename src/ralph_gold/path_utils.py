@@ -136,3 +136,23 @@ def safe_join(project_root: Path, *paths: Union[str, Path]) -> Path:
         joined = joined / p
 
     return validate_project_path(project_root, joined)
+
+
+def ralph_cache_dir(path: Path) -> Path:
+    """The ``.ralph/cache`` directory of the project that owns path.
+
+    Walks up from path to the nearest ``.ralph`` directory (path inside it,
+    or a project root containing it). Falls back to ``.ralph/cache`` next to
+    path when no project is found.
+
+    Example:
+        >>> ralph_cache_dir(Path("/my/project/.ralph/prd.json"))
+        PosixPath('/my/project/.ralph/cache')
+    """
+    start = path.parent
+    for ancestor in (start, *start.parents):
+        if ancestor.name == ".ralph":
+            return ancestor / "cache"
+        if (ancestor / ".ralph").is_dir():
+            return ancestor / ".ralph" / "cache"
+    return start / ".ralph" / "cache"
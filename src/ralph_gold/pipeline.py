@@ -0,0 +1,246 @@
+"""Speculative preparation of the next loop iteration.
+
+``run_loop`` is strictly sequential: iteration N+1 only starts selecting its
+task and reading prompt sources after N's gates, judge, review, commit and
+state save are done. With ``[loop].pipeline`` enabled, the preparation
+for N+1 runs in a background thread as soon as N's agent
+finishes, overlapping N's post-agent work:
+
+- predict the next task (the tracker's pick, excluding N's task and blocked
+  tasks);
+- warm the prompt source cache (AGENTS, PRD or PRD slice, progress window,
+  feedback), the spec index and the spec files;
+- update the built-in code map index, or prefetch the RepoPrompt pack.
+
+The warm-up reads project files and writes only under ``.ralph/cache``:
+the spec and code map indexes here, and context packs from the pack
+prefetcher's own thread. Auto-commits leave that directory out, and
+before N commits the loop stops the warm-up at the next step boundary and
+waits for the current step, so no index write is in flight while
+``git add -A`` runs. Every cache involved is keyed by
+file version or tree content, so when N's outcome changes the files or the
+prediction, stale warm-ups simply miss. The next iteration compares its
+selected task with the prediction and records whether the speculation was
+used or discarded.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from .code_map import build_code_map
+from .config import Config
+from .context_pack_cache import get_pack_prefetcher
+from .prd import SelectedTask
+from .prd_slice import build_prd_slice
+from .prompt_cache import get_prompt_cache
+from .spec_index import load_relevant_specs
+from .spec_loader import load_specs_with_limits
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long the loop waits for unfinished warm-up, before
+# committing or building the next prompt. A warm-up still running after
+# that is left alone: the code map index serializes its own updates.
+JOIN_TIMEOUT_SECONDS = 30.0
+
+
+@dataclass
+class Speculation:
+    """Preparation done ahead of time for a predicted task."""
+
+    task_id: str
+    started_at: float
+    finished_at: Optional[float] = None
+    prepared: List[str] = field(default_factory=list)
+    error: str = ""
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.time()
+        return round((end - self.started_at) * 1000, 2)
+
+
+def predict_next_task(tracker: Any, exclude_ids: Set[str]) -> Optional[SelectedTask]:
+    """The task the tracker would hand out next, without claiming it."""
+    if hasattr(tracker, "select_next_task"):
+        return tracker.select_next_task(exclude_ids={i for i in exclude_ids if i})
+    return tracker.peek_next_task()
+
+
+def warm_iteration_sources(
+    project_root: Path,
+    cfg: Config,
+    task: SelectedTask,
+    prepared: List[str],
+    stop: Optional[threading.Event] = None,
+) -> None:
+    """Read everything build_prompt will read for task, filling the caches.
+
+    Appends the name of each warmed source to prepared. When stop is set,
+    returns at the next step boundary.
+    """
+
+    def stopped() -> bool:
+        return stop is not None and stop.is_set()
+
+    cache = get_prompt_cache()
+    files = cfg.files
+    for name in ("agents", "feedback"):
+        cache.text(project_root / getattr(files, name))
+        prepared.append(name)
+
+    prd_path = project_root / files.prd
+    if stopped():
+        return
+    if cfg.prompt.prd_mode == "slice":
+        build_prd_slice(prd_path, task, files.prd)
+        prepared.append("prd_slice")
+    cache.text(prd_path)
+    prepared.append("prd")
+
+    cache.progress_window(
+        project_root / files.progress,
+        max_lines=cfg.prompt.context_progress_max_lines,
+        max_chars=cfg.prompt.context_progress_max_chars,
+    )
+    prepared.append("progress")
+
+    if stopped():
+        return
+    specs_dir = project_root / files.specs_dir
+    if cfg.prompt.specs_inclusion_order == "relevance":
+        load_relevant_specs(
+            project_root,
+            specs_dir,
+            task,
+            max_chars=cfg.prompt.max_specs_chars,
+            max_section_chars=cfg.prompt.max_single_spec_chars,
+        )
+        prepared.append("spec_index")
+    if stopped():
+        return
+    load_specs_with_limits(
+        specs_dir,
+        max_specs_files=cfg.prompt.max_specs_files,
+        max_specs_chars=cfg.prompt.max_specs_chars,
+        max_single_spec_chars=cfg.prompt.max_single_spec_chars,
+        truncate_long_specs=cfg.prompt.truncate_long_specs,
+        specs_inclusion_order=cfg.prompt.specs_inclusion_order,
+        read_text=cache.read,
+    )
+    prepared.append("specs")
+
+    if stopped():
+        return
+    if cfg.repoprompt.enabled:
+        if cfg.repoprompt.context_backend == "builtin":
+            build_code_map(
+                project_root,
+                task,
+                max_files=cfg.repoprompt.map_max_files,
+                max_chars=cfg.repoprompt.map_max_chars,
+            )
+            prepared.append("code_map")
+        elif get_pack_prefetcher().prefetch(project_root, cfg.repoprompt, task):
+            prepared.append("context_pack")
+
+
+class IterationPipeline:
+    """Runs one speculative preparation at a time for run_loop."""
+
+    def __init__(self, project_root: Path, cfg: Config) -> None:
+        self.project_root = project_root
+        self.cfg = cfg
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._speculation: Optional[Speculation] = None
+        self.used = 0
+        self.discarded = 0
+
+    def start(self, tracker: Any, exclude_ids: Set[str]) -> Optional[str]:
+        """Predict the next task and start warming its sources.
+
+        Returns:
+            The predicted task id, or None if nothing was started
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return None
+        try:
+            task = predict_next_task(tracker, exclude_ids)
+        except (OSError, ValueError, RuntimeError) as e:
+            logger.debug("Pipeline: cannot predict next task: %s", e)
+            return None
+        if task is None:
+            return None
+        speculation = Speculation(task_id=str(task.id), started_at=time.time())
+        self._speculation = speculation
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(task, speculation, self._stop),
+            name=f"ralph-pipeline-{task.id}",
+            daemon=True,
+        )
+        self._thread.start()
+        return speculation.task_id
+
+    def _run(self, task: SelectedTask, speculation: Speculation, stop: threading.Event) -> None:
+        try:
+            warm_iteration_sources(self.project_root, self.cfg, task, speculation.prepared, stop)
+        except Exception as e:  # speculative work must never break the loop
+            speculation.error = str(e)
+            logger.debug("Pipeline warm-up for %s failed: %s", task.id, e)
+        finally:
+            speculation.finished_at = time.time()
+
+    def stop(self, timeout: float = JOIN_TIMEOUT_SECONDS) -> bool:
+        """Stop the warm-up at its next step and wait for the current step.
+
+        Called before the iteration commits, so no speculative cache write
+        overlaps ``git add -A``. Steps finished so far stay warm.
+
+        Returns:
+            True if no warm-up is running any more
+        """
+        thread = self._thread
+        if thread is None:
+            return True
+        self._stop.set()
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.debug("Pipeline warm-up still running after %.0fs", timeout)
+            return False
+        return True
+
+    def take(self, task_id: Optional[str]) -> Dict[str, Any]:
+        """Settle the pending speculation against the task actually selected.
+
+        Waits briefly for an unfinished warm-up so it does not race the
+        prompt build, then reports whether it matched.
+
+        Returns:
+            Receipt/history notes (empty when nothing was speculated)
+        """
+        speculation, self._speculation = self._speculation, None
+        if speculation is None:
+            return {}
+        if self._thread is not None:
+            self._thread.join(JOIN_TIMEOUT_SECONDS)
+            self._thread = None
+        used = task_id is not None and str(task_id) == speculation.task_id and not speculation.error
+        if used:
+            self.used += 1
+        else:
+            self.discarded += 1
+        return {
+            "speculation": "used" if used else "discarded",
+            "speculated_task_id": speculation.task_id,
+            "speculation_ms": speculation.duration_ms,
+            "speculation_prepared": list(speculation.prepared),
+        }
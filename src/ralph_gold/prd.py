@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import codecs
 import json
 import logging
 import re
+from array import array
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Literal, Optional, Set, Tuple
+
+from .atomic_file import atomic_write_bytes, atomic_write_text
+from .path_utils import ralph_cache_dir
 
 logger = logging.getLogger(__name__)
 
-PrdKind = Literal["json", "md", "beads", "web_analysis", "yaml", "github_issues"]
+PrdKind = Literal["json", "md", "beads", "web_analysis", "yaml", "github_issues", "sqlite"]
 
 
 TaskId = str
@@ -149,58 +154,6 @@ def _story_priority(story: Dict[str, Any]) -> int:
         return 10_000
 
 
-def _select_next_story(
-    prd: Dict[str, Any],
-    exclude_ids: Optional[Set[str]] = None,
-) -> Optional[Dict[str, Any]]:
-    stories = prd.get("stories", [])
-    if not isinstance(stories, list):
-        return None
-    exclude = exclude_ids or set()
-
-    done_ids: Set[str] = set()
-    for s in stories:
-        if not isinstance(s, dict):
-            continue
-        sid = s.get("id", s.get("story_id", s.get("key")))
-        if sid is None:
-            continue
-        sid_str = str(sid)
-        if _story_done(s) or _story_blocked(s):
-            done_ids.add(sid_str)
-
-    remaining: List[Dict[str, Any]] = []
-    for s in stories:
-        if not isinstance(s, dict):
-            continue
-        sid = s.get("id", s.get("story_id", s.get("key")))
-        if sid is None:
-            continue
-        sid_str = str(sid)
-        if sid_str in exclude:
-            continue
-        if _story_done(s) or _story_blocked(s):
-            continue
-        deps = _story_depends(s)
-        if deps and not _deps_satisfied(deps, done_ids):
-            continue
-        remaining.append(s)
-
-    if not remaining:
-        return None
-    remaining.sort(key=_story_priority)
-    return remaining[0]
-
-
-def _json_all_done(prd: Dict[str, Any]) -> bool:
-    stories = prd.get("stories", [])
-    if not isinstance(stories, list):
-        return False  # Invalid structure is not "done"
-    if not stories:
-        return False  # Empty PRD is not "done"
-    return all((not isinstance(s, dict)) or _story_done(s) for s in stories)
-
-
 def _json_force_story_open(prd: Dict[str, Any], story_id: str) -> bool:
     """Force a JSON PRD story back to not-done.
 
@@ -233,6 +186,27 @@ def _json_force_story_open(prd: Dict[str, Any], story_id: str) -> bool:
     return False
 
 
+def _json_block_story(prd: Dict[str, Any], story_id: str, reason: str) -> bool:
+    """Mark a JSON PRD story as blocked, recording the first block reason."""
+
+    stories = prd.get("stories", [])
+    if not isinstance(stories, list):
+        return False
+    for s in stories:
+        if not isinstance(s, dict):
+            continue
+        sid = s.get("id", s.get("story_id", s.get("key")))
+        if sid is None or str(sid) != str(story_id):
+            continue
+        s["blocked"] = True
+        if "status" in s:
+            s["status"] = "blocked"
+        if reason:
+            s.setdefault("blocked_reason", reason)
+        return True
+    return False
+
+
 def _parse_md_prd(text: str) -> MdPrd:
     lines = text.splitlines()
 
@@ -353,17 +327,647 @@ def _md_all_done(prd: MdPrd) -> bool:
     return all(t.status == "done" for t in prd.tasks)
 
 
-def _md_force_task_open(prd: MdPrd, task_id: str) -> bool:
-    for t in prd.tasks:
-        if t.id != task_id:
-            continue
-        if t.status == "open":
+# ---------------------------------------------------------------------------
+# Minimal-edit PRD writes
+# ---------------------------------------------------------------------------
+
+_JSON_WS_RE = re.compile(r"[ \t\n\r]*")
+
+
+@dataclass
+class _BytePatch:
+    offset: int
+    old: bytes
+    new: bytes
+
+
+def _apply_byte_patches(path: Path, raw: bytes, patches: List[_BytePatch]) -> bool:
+    """Commit byte patches computed against `raw` with a single atomic write.
+
+    The patches are spliced into `raw` in memory and the result replaces the
+    file via temp file + rename, so readers (and a crash) see either the
+    whole batch or none of it.
+
+    Returns False without writing if the file changed since `raw` was read.
+    """
+
+    if not patches:
+        return False
+    ordered = sorted(patches, key=lambda p: p.offset)
+
+    try:
+        current = path.read_bytes()
+    except OSError as e:
+        logger.debug("Failed to re-read PRD before patching: %s", e)
+        return False
+    if current != raw:
+        logger.debug("PRD changed on disk before patching: %s", path)
+        return False
+
+    out = bytearray()
+    cursor = 0
+    for p in ordered:
+        out += raw[cursor : p.offset]
+        out += p.new
+        cursor = p.offset + len(p.old)
+    out += raw[cursor:]
+    atomic_write_bytes(path, bytes(out))
+    return True
+
+
+def _json_skip_ws(text: str, idx: int) -> int:
+    return _JSON_WS_RE.match(text, idx).end()
+
+
+def _json_story_spans(text: str) -> Optional[List[Tuple[int, int]]]:
+    """Return the (start, end) character span of every item in `stories`.
+
+    Only the top-level object is walked; values other than `stories` are
+    skipped with the C decoder. Returns None when the document is not an
+    object with a `stories` array.
+    """
+
+    decoder = json.JSONDecoder()
+    try:
+        idx = _json_skip_ws(text, 0)
+        if text[idx : idx + 1] != "{":
+            return None
+        idx = _json_skip_ws(text, idx + 1)
+        if text[idx : idx + 1] == "}":
+            return None
+        while True:
+            key, idx = decoder.raw_decode(text, idx)
+            idx = _json_skip_ws(text, idx)
+            if text[idx : idx + 1] != ":":
+                return None
+            idx = _json_skip_ws(text, idx + 1)
+            if key == "stories":
+                if text[idx : idx + 1] != "[":
+                    return None
+                spans: List[Tuple[int, int]] = []
+                idx = _json_skip_ws(text, idx + 1)
+                if text[idx : idx + 1] == "]":
+                    return spans
+                while True:
+                    _, end = decoder.raw_decode(text, idx)
+                    spans.append((idx, end))
+                    idx = _json_skip_ws(text, end)
+                    ch = text[idx : idx + 1]
+                    if ch == "]":
+                        return spans
+                    if ch != ",":
+                        return None
+                    idx = _json_skip_ws(text, idx + 1)
+            _, idx = decoder.raw_decode(text, idx)
+            idx = _json_skip_ws(text, idx)
+            ch = text[idx : idx + 1]
+            if ch != ",":
+                return None
+            idx = _json_skip_ws(text, idx + 1)
+    except (json.JSONDecodeError, ValueError) as e:
+        logger.debug("Failed to locate PRD stories: %s", e)
+        return None
+
+
+def _json_fragment(value: Any, text: str, start: int, end: int) -> str:
+    """Serialise `value` in the same layout as the span it replaces."""
+
+    original = text[start:end]
+    if "\n" not in original:
+        return json.dumps(value)
+
+    line_start = text.rfind("\n", 0, start) + 1
+    prefix = text[line_start:start]
+    if prefix.strip():
+        prefix = ""
+    first_break = original.index("\n") + 1
+    inner = original[first_break:]
+    step = len(inner) - len(inner.lstrip(" ")) - len(prefix)
+    dumped = json.dumps(value, indent=step if step > 0 else 2)
+    return dumped.replace("\n", "\n" + prefix)
+
+
+class PrdEditBatch:
+    """Collect task status edits and commit them with one PRD write.
+
+    Markdown edits become in-place patches of the checkbox marker byte.
+    JSON edits re-serialise only the touched stories and splice them into the
+    original text, so unrelated formatting (and git diffs) stay untouched.
+
+    Usage:
+        with PrdEditBatch(prd_path) as batch:
+            batch.force_open("3")
+            batch.block("7", reason="timeout")
+        print(batch.changed)
+    """
+
+    def __init__(self, prd_path: Path) -> None:
+        self.prd_path = prd_path
+        self.changed: List[str] = []
+        self._edits: List[Tuple[str, str, str]] = []
+
+    def force_open(self, task_id: TaskId) -> None:
+        self._edits.append((str(task_id), "open", ""))
+
+    def block(self, task_id: TaskId, reason: str = "") -> None:
+        self._edits.append((str(task_id), "blocked", reason))
+
+    def __enter__(self) -> "PrdEditBatch":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.commit()
+
+    def commit(self) -> List[str]:
+        """Apply all queued edits and return the ids whose status changed."""
+
+        edits, self._edits = self._edits, []
+        if not edits:
+            return []
+        if is_markdown_prd(self.prd_path):
+            changed = self._commit_md(edits)
+        else:
+            changed = self._commit_json(edits)
+        for tid in changed:
+            if tid not in self.changed:
+                self.changed.append(tid)
+        return changed
+
+    def _commit_md(self, edits: List[Tuple[str, str, str]]) -> List[str]:
+        if not self.prd_path.exists():
+            raise FileNotFoundError(f"Missing PRD file: {self.prd_path}")
+        raw = self.prd_path.read_bytes()
+        text = raw.decode("utf-8")
+        prd = _parse_md_prd(text)
+        by_id = {t.id: t for t in prd.tasks}
+
+        line_starts: List[int] = []
+        pos = 0
+        for line in text.splitlines(keepends=True):
+            line_starts.append(pos)
+            pos += len(line)
+        ascii_only = text.isascii()
+
+        patches: Dict[int, _BytePatch] = {}
+        changed: List[str] = []
+        for tid, target, _reason in edits:
+            t = by_id.get(tid)
+            if t is None or t.status == target:
+                continue
+            m = _MD_CHECKBOX_RE.match(prd.lines[t.line_index])
+            if not m:
+                continue
+            char_off = line_starts[t.line_index] + m.start(2)
+            offset = char_off if ascii_only else len(text[:char_off].encode("utf-8"))
+            new = _status_to_marker(target).encode("utf-8")
+            patch = patches.get(offset)
+            if patch is None:
+                patches[offset] = _BytePatch(offset, m.group(2).encode("utf-8"), new)
+            else:
+                patch.new = new
+            t.status = target
+            if tid not in changed:
+                changed.append(tid)
+
+        effective = [p for p in patches.values() if p.old != p.new]
+        if not effective:
+            return []
+        if not _apply_byte_patches(self.prd_path, raw, effective):
+            return []
+        return changed
+
+    def _commit_json(self, edits: List[Tuple[str, str, str]]) -> List[str]:
+        if not self.prd_path.exists():
+            raise FileNotFoundError(f"Missing PRD file: {self.prd_path}")
+        try:
+            text = self.prd_path.read_text(encoding="utf-8")
+            prd = json.loads(text)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.debug("Failed to load PRD: %s", e)
+            return []
+        if not isinstance(prd, dict):
+            return []
+        stories = prd.get("stories", [])
+        if not isinstance(stories, list):
+            return []
+
+        index: Dict[str, int] = {}
+        for i, s in enumerate(stories):
+            if not isinstance(s, dict):
+                continue
+            sid = s.get("id", s.get("story_id", s.get("key")))
+            if sid is not None:
+                index.setdefault(str(sid), i)
+
+        touched: Set[int] = set()
+        changed: List[str] = []
+        for tid, target, reason in edits:
+            if tid not in index:
+                continue
+            if target == "open":
+                did = _json_force_story_open(prd, tid)
+            else:
+                did = _json_block_story(prd, tid, reason)
+            if did:
+                touched.add(index[tid])
+                if tid not in changed:
+                    changed.append(tid)
+        if not touched:
+            return []
+
+        _invalidate_json_prd_index(self.prd_path)
+        spans = _json_story_spans(text)
+        if spans is None or len(spans) != len(stories):
+            _save_json_prd(self.prd_path, prd)
+            return changed
+
+        parts: List[str] = []
+        cursor = 0
+        for i in sorted(touched):
+            start, end = spans[i]
+            parts.append(text[cursor:start])
+            parts.append(_json_fragment(stories[i], text, start, end))
+            cursor = end
+        parts.append(text[cursor:])
+        atomic_write_text(self.prd_path, "".join(parts))
+        return changed
+
+
+# ---------------------------------------------------------------------------
+# Streaming JSON PRD access
+# ---------------------------------------------------------------------------
+
+_STREAM_CHUNK_BYTES = 1 << 16
+# Below this size a streamed scan is cheap enough that no index is persisted.
+_INDEX_MIN_BYTES = 1 << 20
+_INDEX_VERSION = 1
+
+_FLAG_DONE = 1
+_FLAG_BLOCKED = 2
+_FLAG_STATUS_BLOCKED = 4
+
+
+class _JsonStoryStream:
+    """Incrementally tokenise a JSON PRD, yielding one story at a time.
+
+    Only the current story (plus one read chunk) is held in memory. Structural
+    problems raise `json.JSONDecodeError` so callers can treat the stream like
+    `json.loads`.
+    """
+
+    def __init__(self, fh: BinaryIO, chunk_size: int = _STREAM_CHUNK_BYTES) -> None:
+        self._fh = fh
+        self._chunk_size = chunk_size
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        # Byte offset of character `_mark_char` in `_buf` (tracked lazily).
+        self._mark_char = 0
+        self._mark_byte = 0
+
+    def _fill(self) -> bool:
+        if self._eof:
             return False
-        line = prd.lines[t.line_index]
-        prd.lines[t.line_index] = re.sub(r"\[[^\]]\]", "[ ]", line, count=1)
-        t.status = "open"
+        data = self._fh.read(self._chunk_size)
+        if not data:
+            self._eof = True
+            self._buf += self._utf8.decode(b"", final=True)
+            return False
+        if self._pos:
+            self._byte_at(self._pos)
+            self._buf = self._buf[self._pos :]
+            self._mark_char = 0
+            self._pos = 0
+        self._buf += self._utf8.decode(data)
         return True
-    return False
+
+    def _byte_at(self, pos: int) -> int:
+        self._mark_byte += len(self._buf[self._mark_char : pos].encode("utf-8"))
+        self._mark_char = pos
+        return self._mark_byte
+
+    def _error(self, msg: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(msg, self._buf, self._pos)
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at EOF)."""
+        while True:
+            self._pos = _JSON_WS_RE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _value(self) -> Tuple[Any, int, int]:
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number or literal ending exactly at the buffer edge may be cut.
+            if end >= len(self._buf) and self._fill():
+                continue
+            start = self._pos
+            self._pos = end
+            return value, start, end
+
+    def _expect(self, ch: str) -> None:
+        if self._peek() != ch:
+            raise self._error(f"Expecting '{ch}'")
+        self._pos += 1
+
+    def stories(self) -> Iterator[Tuple[Any, int, int]]:
+        """Yield `(story, byte_offset, byte_length)` for each item of `stories`."""
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+        else:
+            while True:
+                if self._peek() != '"':
+                    raise self._error("Expecting property name")
+                key, _, _ = self._value()
+                self._expect(":")
+                if key == "stories" and self._peek() == "[":
+                    self._pos += 1
+                    if self._peek() == "]":
+                        self._pos += 1
+                    else:
+                        while True:
+                            self._peek()
+                            story, start, end = self._value()
+                            offset = self._byte_at(start)
+                            yield story, offset, self._byte_at(end) - offset
+                            ch = self._peek()
+                            self._pos += 1
+                            if ch == "]":
+                                break
+                            if ch != ",":
+                                raise self._error("Expecting ',' delimiter")
+                else:
+                    self._peek()
+                    self._value()
+                ch = self._peek()
+                self._pos += 1
+                if ch == "}":
+                    break
+                if ch != ",":
+                    raise self._error("Expecting ',' delimiter")
+        if self._peek():
+            raise self._error("Extra data")
+
+
+def iter_json_stories(prd_path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream the dict stories of a JSON PRD without loading the whole file.
+
+    Raises:
+        FileNotFoundError: If the PRD does not exist
+        json.JSONDecodeError: If the document is malformed
+    """
+
+    if not prd_path.exists():
+        raise FileNotFoundError(f"Missing PRD file: {prd_path}")
+    with prd_path.open("rb") as fh:
+        for story, _, _ in _JsonStoryStream(fh).stories():
+            if isinstance(story, dict):
+                yield story
+
+
+def _story_flags(story: Dict[str, Any]) -> int:
+    flags = 0
+    if _story_done(story):
+        flags |= _FLAG_DONE
+    if _story_blocked(story):
+        flags |= _FLAG_BLOCKED
+    if story.get("status") == "blocked":
+        flags |= _FLAG_STATUS_BLOCKED
+    return flags
+
+
+@dataclass
+class JsonPrdIndex:
+    """Compact columnar view of the stories in a JSON PRD.
+
+    One row per dict story, in document order. Status is packed into `flags`,
+    and `offsets`/`lengths` locate each story's raw bytes so a single story can
+    be decoded on demand instead of loading the whole document.
+    """
+
+    path: Path
+    signature: Tuple[int, int, int]
+    ids: List[Optional[str]] = field(default_factory=list)
+    flags: bytearray = field(default_factory=bytearray)
+    priorities: List[int] = field(default_factory=list)
+    depends: List[Tuple[str, ...]] = field(default_factory=list)
+    offsets: "array[int]" = field(default_factory=lambda: array("q"))
+    lengths: "array[int]" = field(default_factory=lambda: array("q"))
+    _by_id: Optional[Dict[str, int]] = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, story: Dict[str, Any], offset: int, length: int) -> None:
+        sid = story.get("id", story.get("story_id", story.get("key")))
+        self.ids.append(None if sid is None else str(sid))
+        self.flags.append(_story_flags(story))
+        self.priorities.append(_story_priority(story))
+        self.depends.append(tuple(_story_depends(story)))
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self._by_id = None
+
+    def position(self, task_id: TaskId) -> Optional[int]:
+        if self._by_id is None:
+            by_id: Dict[str, int] = {}
+            for i, sid in enumerate(self.ids):
+                if sid is not None:
+                    by_id.setdefault(sid, i)
+            self._by_id = by_id
+        return self._by_id.get(str(task_id))
+
+    def status_counts(self) -> Tuple[int, int, int, int]:
+        total = len(self.flags)
+        done = sum(1 for f in self.flags if f & _FLAG_DONE)
+        blocked = sum(1 for f in self.flags if f & _FLAG_BLOCKED)
+        return done, blocked, total - done - blocked, total
+
+    def status(self, task_id: TaskId) -> str:
+        i = self.position(task_id)
+        if i is None:
+            return "missing"
+        if self.flags[i] & _FLAG_DONE:
+            return "done"
+        if self.flags[i] & _FLAG_BLOCKED:
+            return "blocked"
+        return "open"
+
+    def all_done(self) -> bool:
+        return bool(self.flags) and all(f & _FLAG_DONE for f in self.flags)
+
+    def all_blocked(self) -> bool:
+        remaining = [f for f in self.flags if not f & _FLAG_DONE]
+        return bool(remaining) and all(f & _FLAG_STATUS_BLOCKED for f in remaining)
+
+    def ready_rows(self, exclude_ids: Optional[Set[str]] = None) -> List[int]:
+        """Return rows of open stories whose dependencies are all finished."""
+        exclude = exclude_ids or set()
+        finished = {
+            sid
+            for sid, f in zip(self.ids, self.flags)
+            if sid is not None and f & (_FLAG_DONE | _FLAG_BLOCKED)
+        }
+        rows: List[int] = []
+        for i, sid in enumerate(self.ids):
+            if sid is None or sid in exclude:
+                continue
+            if self.flags[i] & (_FLAG_DONE | _FLAG_BLOCKED):
+                continue
+            deps = self.depends[i]
+            if deps and not all(d in finished for d in deps):
+                continue
+            rows.append(i)
+        return rows
+
+    def next_ready(self, exclude_ids: Optional[Set[str]] = None) -> Optional[int]:
+        """Return the row of the next ready story (same rules as selection)."""
+        rows = self.ready_rows(exclude_ids)
+        if not rows:
+            return None
+        return min(rows, key=lambda i: self.priorities[i])
+
+    def load_story(self, row: int) -> Optional[Dict[str, Any]]:
+        """Decode a single story straight from its byte range."""
+        with self.path.open("rb") as fh:
+            fh.seek(self.offsets[row])
+            raw = fh.read(self.lengths[row])
+        try:
+            story = json.loads(raw.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.debug("Failed to decode indexed story: %s", e)
+            return None
+        return story if isinstance(story, dict) else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": _INDEX_VERSION,
+            "signature": list(self.signature),
+            "ids": self.ids,
+            "flags": "".join(str(f) for f in self.flags),
+            "priorities": self.priorities,
+            "depends": [list(d) for d in self.depends],
+            "offsets": self.offsets.tolist(),
+            "lengths": self.lengths.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, path: Path, data: Dict[str, Any]) -> "JsonPrdIndex":
+        return cls(
+            path=path,
+            signature=tuple(data["signature"]),  # type: ignore[arg-type]
+            ids=[None if x is None else str(x) for x in data["ids"]],
+            flags=bytearray(int(c) for c in data["flags"]),
+            priorities=[int(x) for x in data["priorities"]],
+            depends=[tuple(str(x) for x in d) for d in data["depends"]],
+            offsets=array("q", data["offsets"]),
+            lengths=array("q", data["lengths"]),
+        )
+
+
+_INDEX_CACHE: Dict[Path, JsonPrdIndex] = {}
+
+
+def _index_sidecar_path(prd_path: Path) -> Path:
+    # Under .ralph/cache so the loop's auto-commit never stages it.
+    return ralph_cache_dir(prd_path) / f"{prd_path.name}.index.json"
+
+
+def _file_signature(path: Path) -> Tuple[int, int, int]:
+    st = path.stat()
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+def _invalidate_json_prd_index(prd_path: Path) -> None:
+    _INDEX_CACHE.pop(prd_path.resolve(), None)
+    sidecar = _index_sidecar_path(prd_path)
+    try:
+        sidecar.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug("Failed to remove PRD index: %s", e)
+
+
+def _read_index_sidecar(
+    prd_path: Path, signature: Tuple[int, int, int]
+) -> Optional[JsonPrdIndex]:
+    sidecar = _index_sidecar_path(prd_path)
+    if not sidecar.exists():
+        return None
+    try:
+        data = json.loads(sidecar.read_text(encoding="utf-8"))
+        if data.get("version") != _INDEX_VERSION:
+            return None
+        if tuple(data.get("signature", ())) != signature:
+            return None
+        return JsonPrdIndex.from_dict(prd_path, data)
+    except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError) as e:
+        logger.debug("Ignoring unreadable PRD index %s: %s", sidecar, e)
+        return None
+
+
+def load_json_prd_index(prd_path: Path) -> Optional[JsonPrdIndex]:
+    """Return a columnar index of a JSON PRD, streaming the file if needed.
+
+    Large PRDs keep the index in memory and in a sidecar under the
+    project's ``.ralph/cache``, keyed by (size, mtime_ns, inode), so repeat queries skip the scan.
+
+    Returns:
+        The index, or None when the PRD is not valid JSON.
+
+    Raises:
+        FileNotFoundError: If the PRD does not exist
+    """
+
+    if not prd_path.exists():
+        raise FileNotFoundError(f"Missing PRD file: {prd_path}")
+    signature = _file_signature(prd_path)
+    persist = signature[0] >= _INDEX_MIN_BYTES
+    key = prd_path.resolve()
+
+    if persist:
+        cached = _INDEX_CACHE.get(key)
+        if cached is not None and cached.signature == signature:
+            return cached
+        index = _read_index_sidecar(prd_path, signature)
+        if index is not None:
+            _INDEX_CACHE[key] = index
+            return index
+
+    index = JsonPrdIndex(path=prd_path, signature=signature)
+    try:
+        with prd_path.open("rb") as fh:
+            for story, offset, length in _JsonStoryStream(fh).stories():
+                if isinstance(story, dict):
+                    index.add(story, offset, length)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+        logger.debug("Failed to load PRD: %s", e)
+        return None
+
+    if persist:
+        _INDEX_CACHE[key] = index
+        try:
+            _index_sidecar_path(prd_path).parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(
+                _index_sidecar_path(prd_path),
+                json.dumps(index.to_dict(), separators=(",", ":")),
+            )
+        except OSError as e:
+            logger.debug("Failed to persist PRD index: %s", e)
+    return index
 
 
 def detect_task_complexity(title: str, acceptance: List[str]) -> Dict[str, Any]:
@@ -477,6 +1081,21 @@ def validate_prd(prd_path: Path) -> List[str]:
     return warnings
 
 
+def _story_to_selected(story: Dict[str, Any], sid: str) -> SelectedTask:
+    title = str(story.get("title", "")).strip() or f"Story {sid}"
+    acc = story.get("acceptance", [])
+    if not isinstance(acc, list):
+        acc = []
+    return SelectedTask(
+        id=sid,
+        title=title,
+        kind="json",
+        acceptance=[str(x).strip() for x in acc if str(x).strip()],
+        depends_on=_story_depends(story),
+        is_quick="[QUICK]" in title.upper(),
+    )
+
+
 def select_next_task(
     prd_path: Path, exclude_ids: Optional[Set[str]] = None
 ) -> Optional[SelectedTask]:
@@ -506,31 +1125,17 @@ def select_next_task(
             )
         return None
 
-    json_prd = _load_json_prd(prd_path)
-    if json_prd is None:
+    index = load_json_prd_index(prd_path)
+    if index is None:
         return None
-    story = _select_next_story(json_prd, exclude_ids=exclude_ids)
-    if not story:
+    row = index.next_ready(exclude_ids=exclude_ids)
+    if row is None:
         return None
-    sid = story.get("id", story.get("story_id", story.get("key")))
-    if sid is None:
+    story = index.load_story(row)
+    sid = index.ids[row]
+    if story is None or sid is None:
         return None
-    sid_str = str(sid)
-    title = str(story.get("title", "")).strip() or f"Story {sid_str}"
-    is_quick = "[QUICK]" in title.upper()
-    acc = story.get("acceptance", [])
-    if not isinstance(acc, list):
-        acc = []
-    acceptance = [str(x).strip() for x in acc if str(x).strip()]
-    depends = _story_depends(story)
-    return SelectedTask(
-        id=sid_str,
-        title=title,
-        kind="json",
-        acceptance=acceptance,
-        depends_on=depends,
-        is_quick=is_quick,
-    )
+    return _story_to_selected(story, sid)
 
 
 def select_task_by_id(prd_path: Path, task_id: TaskId) -> Optional[SelectedTask]:
@@ -552,34 +1157,16 @@ def select_task_by_id(prd_path: Path, task_id: TaskId) -> Optional[SelectedTask]
             )
         return None
 
-    json_prd = _load_json_prd(prd_path)
-    if json_prd is None:
+    index = load_json_prd_index(prd_path)
+    if index is None:
         return None
-    stories = json_prd.get("stories", [])
-    if not isinstance(stories, list):
+    row = index.position(tid)
+    if row is None:
         return None
-    for story in stories:
-        if not isinstance(story, dict):
-            continue
-        sid = story.get("id", story.get("story_id", story.get("key")))
-        if sid is None or str(sid) != tid:
-            continue
-        title = str(story.get("title", "")).strip() or f"Story {tid}"
-        is_quick = "[QUICK]" in title.upper()
-        acc = story.get("acceptance", [])
-        if not isinstance(acc, list):
-            acc = []
-        acceptance = [str(x).strip() for x in acc if str(x).strip()]
-        depends = _story_depends(story)
-        return SelectedTask(
-            id=tid,
-            title=title,
-            kind="json",
-            acceptance=acceptance,
-            depends_on=depends,
-            is_quick=is_quick,
-        )
-    return None
+    story = index.load_story(row)
+    if story is None:
+        return None
+    return _story_to_selected(story, tid)
 
 
 def task_status_by_id(prd_path: Path, task_id: TaskId) -> str:
@@ -598,24 +1185,10 @@ def task_status_by_id(prd_path: Path, task_id: TaskId) -> str:
             return "open"
         return "missing"
 
-    prd = _load_json_prd(prd_path)
-    if prd is None:
-        return "missing"
-    stories = prd.get("stories", [])
-    if not isinstance(stories, list):
+    index = load_json_prd_index(prd_path)
+    if index is None:
         return "missing"
-    for story in stories:
-        if not isinstance(story, dict):
-            continue
-        sid = story.get("id", story.get("story_id", story.get("key")))
-        if sid is None or str(sid) != tid:
-            continue
-        if _story_done(story):
-            return "done"
-        if _story_blocked(story):
-            return "blocked"
-        return "open"
-    return "missing"
+    return index.status(tid)
 
 
 def task_counts(prd_path: Path) -> Tuple[int, int]:
@@ -627,14 +1200,10 @@ def task_counts(prd_path: Path) -> Tuple[int, int]:
         done = sum(1 for t in prd.tasks if t.status == "done")
         return done, total
 
-    prd = _load_json_prd(prd_path)
-    if prd is None:
-        return 0, 0
-    stories = prd.get("stories", [])
-    if not isinstance(stories, list):
+    index = load_json_prd_index(prd_path)
+    if index is None:
         return 0, 0
-    total = sum(1 for s in stories if isinstance(s, dict))
-    done = sum(1 for s in stories if isinstance(s, dict) and _story_done(s))
+    done, _, _, total = index.status_counts()
     return done, total
 
 
@@ -655,27 +1224,19 @@ def status_counts(prd_path: Path) -> Tuple[int, int, int, int]:
         open_count = sum(1 for t in prd.tasks if t.status == "open")
         return done, blocked, open_count, total
 
-    prd = _load_json_prd(prd_path)
-    if prd is None:
+    index = load_json_prd_index(prd_path)
+    if index is None:
         return 0, 0, 0, 0
-    stories = prd.get("stories", [])
-    if not isinstance(stories, list):
-        return 0, 0, 0, 0
-    total = sum(1 for s in stories if isinstance(s, dict))
-    done = sum(1 for s in stories if isinstance(s, dict) and _story_done(s))
-    blocked = sum(1 for s in stories if isinstance(s, dict) and _story_blocked(s))
-    # Open = total - done - blocked
-    open_count = total - done - blocked
-    return done, blocked, open_count, total
+    return index.status_counts()
 
 
 def all_done(prd_path: Path) -> bool:
     if is_markdown_prd(prd_path):
         return _md_all_done(_load_md_prd(prd_path))
-    prd = _load_json_prd(prd_path)
-    if prd is None:
+    index = load_json_prd_index(prd_path)
+    if index is None:
         return False
-    return _json_all_done(prd)
+    return index.all_done()
 
 
 def all_blocked(prd_path: Path) -> bool:
@@ -687,10 +1248,10 @@ def all_blocked(prd_path: Path) -> bool:
     """
     if is_markdown_prd(prd_path):
         return _md_all_blocked(_load_md_prd(prd_path))
-    prd = _load_json_prd(prd_path)
-    if prd is None:
+    index = load_json_prd_index(prd_path)
+    if index is None:
         return False
-    return _json_all_blocked(prd)
+    return index.all_blocked()
 
 
 def _md_all_blocked(prd: MdPrd) -> bool:
@@ -706,39 +1267,23 @@ def _md_all_blocked(prd: MdPrd) -> bool:
     return all(t.status == "blocked" for t in remaining)
 
 
-def _json_all_blocked(prd: Dict[str, Any]) -> bool:
-    """Check if all remaining JSON stories are blocked.
+def force_task_open(prd_path: Path, task_id: TaskId) -> bool:
+    """Force a task/story back to unfinished (used when gates fail)."""
 
-    Returns:
-        True if all remaining stories have status "blocked", False otherwise.
-        Returns False if there are no remaining stories (all done).
-    """
-    stories = prd.get("stories", [])
-    if not isinstance(stories, list):
-        return False
-    remaining = [s for s in stories if isinstance(s, dict) and not _story_done(s)]
-    if not remaining:
-        return False  # All done, not blocked
-    return all(s.get("status") == "blocked" for s in remaining if isinstance(s, dict))
+    return bool(force_tasks_open(prd_path, [task_id]))
 
 
-def force_task_open(prd_path: Path, task_id: TaskId) -> bool:
-    """Force a task/story back to unfinished (used when gates fail)."""
+def force_tasks_open(prd_path: Path, task_ids: List[TaskId]) -> List[str]:
+    """Force several tasks back to unfinished with a single PRD write.
 
-    if is_markdown_prd(prd_path):
-        prd = _load_md_prd(prd_path)
-        changed = _md_force_task_open(prd, str(task_id))
-        if changed:
-            _save_md_prd(prd_path, prd)
-        return changed
+    Returns:
+        The ids whose status actually changed.
+    """
 
-    prd = _load_json_prd(prd_path)
-    if prd is None:
-        return False
-    changed = _json_force_story_open(prd, str(task_id))
-    if changed:
-        _save_json_prd(prd_path, prd)
-    return changed
+    batch = PrdEditBatch(prd_path)
+    for tid in task_ids:
+        batch.force_open(tid)
+    return batch.commit()
 
 
 def is_task_done(prd_path: Path, task_id: TaskId) -> bool:
@@ -751,67 +1296,84 @@ def is_task_done(prd_path: Path, task_id: TaskId) -> bool:
                 return bool(t.status == "done")
         return False
 
-    prd = _load_json_prd(prd_path)
-    if prd is None:
-        return False
-    stories = prd.get("stories", [])
-    if not isinstance(stories, list):
+    index = load_json_prd_index(prd_path)
+    if index is None:
         return False
-    for s in stories:
-        if not isinstance(s, dict):
-            continue
-        sid = s.get("id", s.get("story_id", s.get("key")))
-        if sid is None:
-            continue
-        if str(sid) != str(task_id):
-            continue
-        return _story_done(s)
-    return False
+    return index.status(task_id) == "done"
 
 
-def block_task(prd_path: Path, task_id: TaskId, reason: str) -> bool:
-    """Mark a task/story as blocked (best effort)."""
+def task_snapshot(prd_path: Path) -> Dict[str, Any]:
+    """Summarise a PRD from a single read.
+
+    Returns:
+        Dictionary with `status_counts` (status -> count), `ready_ids`,
+        `next_task`, `all_done` and `all_blocked`, matching the answers of the
+        individual query functions.
+    """
 
     if is_markdown_prd(prd_path):
         prd = _load_md_prd(prd_path)
-        changed = False
+        statuses: Dict[str, int] = {}
         for t in prd.tasks:
-            if t.id != str(task_id):
-                continue
-            if t.status == "blocked":
-                return False
-            line = prd.lines[t.line_index]
-            prd.lines[t.line_index] = re.sub(r"\[[^\]]\]", "[-]", line, count=1)
-            t.status = "blocked"
-            changed = True
-            break
-        if changed:
-            _save_md_prd(prd_path, prd)
-        return changed
+            statuses[t.status] = statuses.get(t.status, 0) + 1
+        finished = {t.id for t in prd.tasks if t.status in {"done", "blocked"}}
+        ready = [
+            t
+            for t in prd.tasks
+            if t.status == "open" and _deps_satisfied(t.depends_on, finished)
+        ]
+        next_task = None
+        if ready:
+            t = ready[0]
+            next_task = SelectedTask(
+                id=str(t.id),
+                title=t.title,
+                kind="md",
+                acceptance=list(t.acceptance),
+                depends_on=list(t.depends_on),
+                is_quick=t.is_quick,
+            )
+        return {
+            "status_counts": statuses,
+            "ready_ids": [t.id for t in ready],
+            "next_task": next_task,
+            "all_done": _md_all_done(prd),
+            "all_blocked": _md_all_blocked(prd),
+        }
+
+    index = load_json_prd_index(prd_path)
+    if index is None:
+        return {
+            "status_counts": {},
+            "ready_ids": [],
+            "next_task": None,
+            "all_done": False,
+            "all_blocked": False,
+        }
+    done, blocked, open_count, _ = index.status_counts()
+    rows = index.ready_rows()
+    next_task = None
+    if rows:
+        row = min(rows, key=lambda i: index.priorities[i])
+        story = index.load_story(row)
+        sid = index.ids[row]
+        if story is not None and sid is not None:
+            next_task = _story_to_selected(story, sid)
+    return {
+        "status_counts": {"done": done, "blocked": blocked, "open": open_count},
+        "ready_ids": [index.ids[i] for i in rows],
+        "next_task": next_task,
+        "all_done": index.all_done(),
+        "all_blocked": index.all_blocked(),
+    }
 
-    prd = _load_json_prd(prd_path)
-    if prd is None:
-        return False
-    stories = prd.get("stories", [])
-    if not isinstance(stories, list):
-        return False
-    changed = False
-    for s in stories:
-        if not isinstance(s, dict):
-            continue
-        sid = s.get("id", s.get("story_id", s.get("key")))
-        if sid is None or str(sid) != str(task_id):
-            continue
-        s["blocked"] = True
-        if "status" in s:
-            s["status"] = "blocked"
-        if reason:
-            s.setdefault("blocked_reason", reason)
-        changed = True
-        break
-    if changed:
-        _save_json_prd(prd_path, prd)
-    return changed
+
+def block_task(prd_path: Path, task_id: TaskId, reason: str) -> bool:
+    """Mark a task/story as blocked (best effort)."""
+
+    batch = PrdEditBatch(prd_path)
+    batch.block(task_id, reason=reason)
+    return bool(batch.commit())
 
 
 def get_prd_branch_name(prd_path: Path) -> Optional[str]:
@@ -878,39 +1440,37 @@ def get_all_tasks(prd_path: Path) -> List[Dict[str, Any]]:
                     }
                 )
         else:
-            prd = _load_json_prd(prd_path)
-            if prd is None:
+            try:
+                stories = list(iter_json_stories(prd_path))
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.debug("Failed to load PRD: %s", e)
                 return tasks
-            stories = prd.get("stories", [])
-            if isinstance(stories, list):
-                for s in stories:
-                    if not isinstance(s, dict):
-                        continue
-                    sid = s.get("id", s.get("story_id", s.get("key")))
-                    if sid is None:
-                        continue
-                    title = str(s.get("title", "")).strip() or f"Story {sid}"
-                    is_quick = "[QUICK]" in title.upper()
-                    status = (
-                        "done"
-                        if _story_done(s)
-                        else ("blocked" if _story_blocked(s) else "open")
-                    )
-                    depends = _story_depends(s)
-                    acc = s.get("acceptance", [])
-                    if not isinstance(acc, list):
-                        acc = []
-                    acceptance = [str(x).strip() for x in acc if str(x).strip()]
-                    tasks.append(
-                        {
-                            "id": str(sid),
-                            "title": title,
-                            "status": status,
-                            "depends_on": depends,
-                            "is_quick": is_quick,
-                            "acceptance": acceptance,
-                        }
-                    )
+            for s in stories:
+                sid = s.get("id", s.get("story_id", s.get("key")))
+                if sid is None:
+                    continue
+                title = str(s.get("title", "")).strip() or f"Story {sid}"
+                is_quick = "[QUICK]" in title.upper()
+                status = (
+                    "done"
+                    if _story_done(s)
+                    else ("blocked" if _story_blocked(s) else "open")
+                )
+                depends = _story_depends(s)
+                acc = s.get("acceptance", [])
+                if not isinstance(acc, list):
+                    acc = []
+                acceptance = [str(x).strip() for x in acc if str(x).strip()]
+                tasks.append(
+                    {
+                        "id": str(sid),
+                        "title": title,
+                        "status": status,
+                        "depends_on": depends,
+                        "is_quick": is_quick,
+                        "acceptance": acceptance,
+                    }
+                )
     except (json.JSONDecodeError, OSError) as e:
         logger.debug("Failed to load JSON PRD: %s", e)
         return None
@@ -0,0 +1,182 @@
+"""Task-scoped PRD slices for prompts.
+
+Embedding a large PRD in every prompt spends most of the context budget on
+tasks the agent must not touch. A slice keeps what matters for the selected
+task: the task and its acceptance criteria, its direct dependencies and
+dependents, other tasks in its group, and a per-status count of the rest.
+The full PRD stays on disk for agents that need it.
+
+Used when ``[prompt].prd_mode = "slice"``. SQLite PRDs are always shown
+through the text views here, never as the raw database file.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .prd import SelectedTask
+from .prompt_cache import get_prompt_cache
+from .trackers.sqlite_tracker import is_sqlite_prd
+
+logger = logging.getLogger(__name__)
+
+# Cap on listed group siblings; a group can be most of a large PRD.
+MAX_SIBLINGS = 20
+
+
+def _task_status(raw: Dict[str, Any]) -> str:
+    if raw.get("completed"):
+        return "done"
+    if raw.get("blocked"):
+        return "blocked"
+    return "open"
+
+
+def _load_tasks(prd_path: Path) -> List[Dict[str, Any]]:
+    from .converters import load_task_document
+
+    try:
+        doc = load_task_document(prd_path)
+    except (OSError, ValueError) as e:
+        logger.debug("PRD slice: cannot parse %s: %s", prd_path, e)
+        return []
+    tasks: List[Dict[str, Any]] = []
+    for raw in doc.get("tasks", []):
+        if not isinstance(raw, dict) or raw.get("id") is None:
+            continue
+        deps = raw.get("depends_on") or []
+        acceptance = raw.get("acceptance") or []
+        tasks.append(
+            {
+                "id": str(raw["id"]),
+                "title": str(raw.get("title", "")),
+                "status": _task_status(raw),
+                "group": str(raw.get("group") or "default"),
+                "depends_on": [str(d) for d in deps] if isinstance(deps, list) else [],
+                "acceptance": [str(a) for a in acceptance] if isinstance(acceptance, list) else [],
+            }
+        )
+    return tasks
+
+
+def load_prd_tasks(prd_path: Path) -> List[Dict[str, Any]]:
+    """Parsed tasks of any PRD format, memoized per PRD file version.
+
+    SQLite PRDs are read directly each time: WAL writes can change the
+    data without touching the database file's size or mtime.
+    """
+    if is_sqlite_prd(prd_path):
+        return _load_tasks(prd_path)
+    return get_prompt_cache().derive(prd_path, "prd_tasks", lambda _text: _load_tasks(prd_path), [])
+
+
+_MARKERS = {"done": "[x]", "blocked": "[-]", "open": "[ ]"}
+
+
+def _task_line(task: Dict[str, Any]) -> str:
+    return f"- {_MARKERS.get(task['status'], '[ ]')} {task['id']}: {task['title']}"
+
+
+def _status_summary(tasks: List[Dict[str, Any]]) -> str:
+    counts = Counter(t["status"] for t in tasks)
+    return ", ".join(f"{counts[s]} {s}" for s in ("done", "open", "blocked") if counts[s])
+
+
+def _full_prd_note(prd_path: Path, prd_label: str) -> Optional[str]:
+    if not is_sqlite_prd(prd_path):
+        return None
+    return (
+        f"The full PRD is the SQLite database {prd_label}; list it with"
+        " `ralph task list` rather than reading the file."
+    )
+
+
+def format_prd_slice(
+    tasks: List[Dict[str, Any]],
+    selected: SelectedTask,
+    prd_label: str,
+    max_siblings: int = MAX_SIBLINGS,
+    full_prd_note: Optional[str] = None,
+) -> Optional[str]:
+    """Render the slice of `tasks` relevant to `selected`.
+
+    Args:
+        full_prd_note: Line telling the agent where the full PRD is
+            (default: a pointer to `prd_label`)
+
+    Returns:
+        Markdown text, or None when the selected task is not in `tasks`
+        (callers then fall back to the full PRD)
+    """
+    by_id = {t["id"]: t for t in tasks}
+    current = by_id.get(str(selected.id))
+    if current is None:
+        return None
+
+    if full_prd_note is None:
+        full_prd_note = f"The full PRD is at {prd_label}; read it only if this slice is not enough."
+
+    lines: List[str] = [
+        f"PRD slice for task {current['id']} ({len(tasks)} tasks: {_status_summary(tasks)}).",
+        full_prd_note,
+        "",
+        "### Selected task",
+        _task_line(current),
+    ]
+    for criterion in current["acceptance"]:
+        lines.append(f"  - {criterion}")
+
+    deps = [by_id[d] for d in current["depends_on"] if d in by_id]
+    missing = [d for d in current["depends_on"] if d not in by_id]
+    if deps or missing:
+        lines += ["", "### Depends on"]
+        lines += [_task_line(t) for t in deps]
+        lines += [f"- [?] {d}: (not in PRD)" for d in missing]
+
+    dependents = [t for t in tasks if current["id"] in t["depends_on"]]
+    if dependents:
+        lines += ["", "### Depended on by"]
+        lines += [_task_line(t) for t in dependents]
+
+    group = current["group"]
+    if group != "default":
+        related = {current["id"], *current["depends_on"], *(t["id"] for t in dependents)}
+        siblings = [t for t in tasks if t["group"] == group and t["id"] not in related]
+        if siblings:
+            lines += ["", f"### Group {group!r}"]
+            lines += [_task_line(t) for t in siblings[:max_siblings]]
+            if len(siblings) > max_siblings:
+                lines.append(f"- ... {len(siblings) - max_siblings} more in this group")
+
+    return "\n".join(lines) + "\n"
+
+
+def build_prd_slice(prd_path: Path, selected: SelectedTask, prd_label: str) -> Optional[str]:
+    """Slice of the PRD at prd_path for the selected task, or None."""
+    return format_prd_slice(
+        load_prd_tasks(prd_path),
+        selected,
+        prd_label,
+        full_prd_note=_full_prd_note(prd_path, prd_label),
+    )
+
+
+def format_prd_tasks(tasks: List[Dict[str, Any]], prd_label: str) -> str:
+    """Render every task as a Markdown checklist (the full-PRD text view)."""
+    lines: List[str] = [f"Tasks in {prd_label} ({len(tasks)} tasks: {_status_summary(tasks)})."]
+    lines.append("")
+    for task in tasks:
+        lines.append(_task_line(task))
+        if task["depends_on"]:
+            lines.append(f"  - depends on: {', '.join(task['depends_on'])}")
+        for criterion in task["acceptance"]:
+            lines.append(f"  - {criterion}")
+    return "\n".join(lines) + "\n"
+
+
+def build_prd_view(prd_path: Path, prd_label: str) -> str:
+    """Text view of a PRD that cannot be embedded as-is (a SQLite database)."""
+    return format_prd_tasks(load_prd_tasks(prd_path), prd_label)
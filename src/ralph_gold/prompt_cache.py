@@ -0,0 +1,256 @@
+"""Memoized prompt sources shared by the runner, judge and review prompts.
+
+Every iteration re-reads AGENTS.md, the PRD, progress, feedback and specs even
+though most of them have not changed since the previous iteration. This
+module keeps each source's decoded text, plus artefacts derived from it
+(truncations, the progress window), keyed by
+``(path, size, mtime_ns)``. A ``stat`` per source decides whether the cached
+entry is still valid; only changed files are re-read and re-processed.
+
+Builds can be wrapped in ``track()`` to record which sources were served from
+the cache and how long the prompt took to assemble, for receipts.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+from .context_manager import load_progress_window
+
+logger = logging.getLogger(__name__)
+
+TRUNCATION_MARKER = "\n...<truncated>...\n"
+
+
+@dataclass
+class _Entry:
+    key: Tuple[int, int]  # (size, mtime_ns)
+    text: Optional[str]  # None until a caller needs the decoded text
+    derived: Dict[Hashable, Any] = field(default_factory=dict)
+
+
+@dataclass
+class PromptBuildStats:
+    """Cache outcome of one prompt build.
+
+    Attributes:
+        sections: Source path to "hit", "miss" or "missing"
+        build_ms: Wall time spent inside the tracked block
+        budget: Token budget allocation, when a budget applied
+    """
+
+    sections: Dict[str, str] = field(default_factory=dict)
+    build_ms: float = 0.0
+    budget: Optional[Dict[str, Any]] = None
+
+    @property
+    def hits(self) -> int:
+        return sum(1 for v in self.sections.values() if v == "hit")
+
+    @property
+    def misses(self) -> int:
+        return sum(1 for v in self.sections.values() if v == "miss")
+
+    def to_notes(self, project_root: Optional[Path] = None) -> Dict[str, Any]:
+        """Receipt-friendly summary with paths relative to project_root."""
+        sections: Dict[str, str] = {}
+        for path, outcome in self.sections.items():
+            label = path
+            if project_root is not None:
+                try:
+                    label = str(Path(path).relative_to(project_root))
+                except ValueError:
+                    pass
+            sections[label] = outcome
+        notes: Dict[str, Any] = {
+            "prompt_build_ms": round(self.build_ms, 2),
+            "prompt_cache_hits": self.hits,
+            "prompt_cache_misses": self.misses,
+            "prompt_sections": sections,
+        }
+        if self.budget is not None:
+            notes["prompt_budget"] = self.budget
+        return notes
+
+
+class PromptSectionCache:
+    """LRU cache of prompt source files keyed by (path, size, mtime_ns).
+
+    Thread-safe: parallel workers share one cache (their worktree paths
+    differ, so entries do not collide).
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # -- tracking -----------------------------------------------------------
+
+    @contextmanager
+    def track(self) -> Iterator[PromptBuildStats]:
+        """Record per-source hit/miss and build time for the enclosed build."""
+        stats = PromptBuildStats()
+        previous = getattr(self._local, "stats", None)
+        self._local.stats = stats
+        start = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            stats.build_ms = (time.perf_counter() - start) * 1000
+            self._local.stats = previous
+
+    def _record(self, path: str, outcome: str) -> None:
+        stats: Optional[PromptBuildStats] = getattr(self._local, "stats", None)
+        if stats is not None and path not in stats.sections:
+            stats.sections[path] = outcome
+
+    def record_budget(self, notes: Dict[str, Any]) -> None:
+        """Attach a token budget allocation to the tracked build, if any."""
+        stats: Optional[PromptBuildStats] = getattr(self._local, "stats", None)
+        if stats is not None:
+            stats.budget = notes
+
+    # -- sources ------------------------------------------------------------
+
+    def _entry(self, path: Path, need_text: bool = True) -> Optional[_Entry]:
+        """Current entry for path, re-reading it if size or mtime changed.
+
+        With need_text=False the file is only stat-ed; its text is read the
+        first time a text-based caller asks for it.
+        """
+        key_path = str(path)
+        try:
+            st = path.stat()
+        except OSError:
+            self._record(key_path, "missing")
+            with self._lock:
+                self._entries.pop(key_path, None)
+            return None
+        if not path.is_file():
+            self._record(key_path, "missing")
+            return None
+        key = (st.st_size, st.st_mtime_ns)
+
+        with self._lock:
+            entry = self._entries.get(key_path)
+            if entry is not None and entry.key == key:
+                self._entries.move_to_end(key_path)
+                if entry.text is not None or not need_text:
+                    self._record(key_path, "hit")
+                    return entry
+
+        text: Optional[str] = None
+        if need_text:
+            try:
+                text = path.read_text(encoding="utf-8", errors="replace")
+            except OSError as e:
+                logger.debug("Prompt source read failed for %s: %s", path, e)
+                self._record(key_path, "missing")
+                return None
+
+        if entry is not None and entry.key == key:
+            # Stat-only entry gaining its text: keep the derived values.
+            entry.text = text
+        else:
+            entry = _Entry(key=key, text=text)
+        with self._lock:
+            self._entries[key_path] = entry
+            self._entries.move_to_end(key_path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self._record(key_path, "miss")
+        return entry
+
+    def derive(self, path: Path, name: Hashable, fn: Callable[[str], Any], default: Any = None) -> Any:
+        """Value of fn(text) for path, computed once per file version.
+
+        Args:
+            path: Source file
+            name: Hashable identifying fn and its parameters
+            fn: Pure function of the file's decoded text
+            default: Returned when the file is missing or unreadable
+        """
+        entry = self._entry(path)
+        if entry is None:
+            return default
+        with self._lock:
+            if name in entry.derived:
+                return entry.derived[name]
+        value = fn(entry.text or "")
+        with self._lock:
+            entry.derived[name] = value
+        return value
+
+    def derive_file(self, path: Path, name: Hashable, fn: Callable[[Path], Any], default: Any = None) -> Any:
+        """Like derive, but fn reads path itself (e.g. seeking to its tail).
+
+        The file version is checked with a stat only, so large files whose
+        full text is never needed are not read into the cache.
+        """
+        entry = self._entry(path, need_text=False)
+        if entry is None:
+            return default
+        with self._lock:
+            if name in entry.derived:
+                return entry.derived[name]
+        value = fn(path)
+        with self._lock:
+            entry.derived[name] = value
+        return value
+
+    def read(self, path: Path) -> Optional[str]:
+        """Full decoded text of path, or None if it does not exist."""
+        entry = self._entry(path)
+        return entry.text if entry is not None else None
+
+    def text(self, path: Path, limit_chars: int = 200_000) -> str:
+        """Text of path capped at limit_chars ("" when missing)."""
+
+        def cap(text: str) -> str:
+            if len(text) > limit_chars:
+                return text[:limit_chars] + TRUNCATION_MARKER
+            return text
+
+        return self.derive(path, ("text", limit_chars), cap, "")
+
+    def spec(self, path: Path, max_chars: Optional[int] = None) -> str:
+        """Spec content, truncated to max_chars when given."""
+        if max_chars is None:
+            return self.text(path)
+
+        def truncate(text: str) -> str:
+            return text[:max_chars] + TRUNCATION_MARKER if len(text) > max_chars else text
+
+        return self.derive(path, ("spec", max_chars), truncate, "")
+
+    def progress_window(
+        self, path: Path, max_lines: int = 100, max_chars: int = 10000
+    ) -> Tuple[str, int, int]:
+        """Cached equivalent of context_manager.load_progress_window."""
+        return self.derive_file(
+            path,
+            ("progress_window", max_lines, max_chars),
+            lambda p: load_progress_window(p, max_lines, max_chars),
+            ("", 0, 0),
+        )
+
+
+_DEFAULT_CACHE = PromptSectionCache()
+
+
+def get_prompt_cache() -> PromptSectionCache:
+    """Process-wide cache shared by every prompt builder."""
+    return _DEFAULT_CACHE
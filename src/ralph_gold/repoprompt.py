@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import subprocess
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -13,6 +14,11 @@ class RepoPromptError(RuntimeError):
     pass
 
 
+# A Repo Prompt window works on one command chain at a time; background
+# context pack prefetches and foreground calls take turns.
+_RP_CLI_LOCK = threading.Lock()
+
+
 @dataclass(frozen=True)
 class RepoPromptRun:
     argv: List[str]
@@ -47,13 +53,14 @@ def run_exec(
     argv = _base_args(cfg) + ["-e", commands]
     t0 = time.time()
     try:
-        proc = subprocess.run(
-            argv,
-            cwd=str(cwd),
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
+        with _RP_CLI_LOCK:
+            proc = subprocess.run(
+                argv,
+                cwd=str(cwd),
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
     except FileNotFoundError as e:
         raise RepoPromptError(f"rp-cli not found: {cfg.cli}") from e
     except subprocess.TimeoutExpired as e:
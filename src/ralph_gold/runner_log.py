@@ -0,0 +1,161 @@
+"""Streaming capture of runner output into the iteration log.
+
+By default the runner's whole stdout/stderr is held in memory until the
+iteration log is written at the end of ``run_iteration``. Agents that print
+megabytes of tool traces make that expensive, especially with parallel
+workers. In streaming mode:
+
+- stdout is appended to the iteration log as it arrives, under a header
+  written before the runner starts;
+- stderr is spooled to ``<log>.stderr`` next to it and moved into the log
+  when the runner exits;
+- only the last ``tail_chars`` of each stream stay in memory, for
+  EXIT_SIGNAL parsing, evidence extraction and receipts;
+- the SHA-256 of ``stdout + "\\n" + stderr`` (the classic combined-output
+  hash) is computed incrementally.
+
+Every chunk is flushed, so a crash mid-run leaves the log with the output
+produced so far (plus the stderr spool).
+
+Used when ``[loop].runner_capture = "stream"``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections import deque
+from pathlib import Path
+from typing import BinaryIO, Deque, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bytes copied per read when moving the stderr spool into the log.
+_COPY_CHUNK_BYTES = 64 * 1024
+
+
+class OutputTail:
+    """The last max_chars characters of a stream, plus a running count."""
+
+    def __init__(self, max_chars: int) -> None:
+        self.max_chars = max(0, max_chars)
+        self.total_chars = 0
+        self._chunks: Deque[str] = deque()
+        self._kept = 0
+
+    def append(self, chunk: str) -> None:
+        self.total_chars += len(chunk)
+        self._chunks.append(chunk)
+        self._kept += len(chunk)
+        while self._chunks and self._kept - len(self._chunks[0]) >= self.max_chars:
+            self._kept -= len(self._chunks.popleft())
+
+    @property
+    def dropped_chars(self) -> int:
+        return self.total_chars - min(self._kept, self.max_chars)
+
+    def text(self, log_name: str = "") -> str:
+        """The kept tail, prefixed with a marker if anything was dropped."""
+        kept = "".join(self._chunks)
+        if self.max_chars == 0:
+            kept = ""
+        elif len(kept) > self.max_chars:
+            kept = kept[-self.max_chars :]
+        dropped = self.dropped_chars
+        if not dropped:
+            return kept
+        where = f"; full output in {log_name}" if log_name else ""
+        return f"... [{dropped} earlier chars not kept in memory{where}] ...\n{kept}"
+
+
+class RunnerLogCapture:
+    """Writes runner output to the iteration log while the runner runs.
+
+    ``on_stdout``/``on_stderr`` are called from the subprocess engine's
+    event loop thread, one chunk at a time.
+    """
+
+    def __init__(self, log_path: Path, tail_chars: int = 65536) -> None:
+        self.log_path = log_path
+        self.spool_path = log_path.with_name(log_path.name + ".stderr")
+        self.stdout_tail = OutputTail(tail_chars)
+        self.stderr_tail = OutputTail(tail_chars)
+        self._hash = hashlib.sha256()
+        self._log: Optional[BinaryIO] = None
+        self._spool: Optional[BinaryIO] = None
+        self.output_hash: Optional[str] = None
+
+    def start(self, header: str) -> None:
+        """Create the log with header and open the stderr spool."""
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._log = open(self.log_path, "wb")
+        self._spool = open(self.spool_path, "wb")
+        self._write_log(header + "\n--- stdout ---\n")
+
+    def _write_log(self, text: str) -> bytes:
+        data = text.encode("utf-8", errors="replace")
+        if self._log is not None:
+            self._log.write(data)
+            self._log.flush()
+        return data
+
+    def on_stdout(self, chunk: str) -> None:
+        self._hash.update(self._write_log(chunk))
+        self.stdout_tail.append(chunk)
+
+    def on_stderr(self, chunk: str) -> None:
+        if self._spool is not None:
+            self._spool.write(chunk.encode("utf-8", errors="replace"))
+            self._spool.flush()
+        self.stderr_tail.append(chunk)
+
+    def finish_output(self) -> str:
+        """Move the stderr spool into the log once the runner has exited.
+
+        Returns:
+            Hex SHA-256 of ``stdout + "\\n" + stderr``
+        """
+        if self.output_hash is not None:
+            return self.output_hash
+        self._hash.update(b"\n")
+        self._write_log("\n\n--- stderr ---\n")
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+            try:
+                with open(self.spool_path, "rb") as spool:
+                    while True:
+                        data = spool.read(_COPY_CHUNK_BYTES)
+                        if not data:
+                            break
+                        self._hash.update(data)
+                        if self._log is not None:
+                            self._log.write(data)
+                self.spool_path.unlink()
+            except OSError as e:
+                logger.warning("Failed to move runner stderr into %s: %s", self.log_path, e)
+        self._write_log("\n")
+        self.output_hash = self._hash.hexdigest()
+        return self.output_hash
+
+    def close(self, trailer: str = "") -> None:
+        """Append trailer (iteration summary) and close the log."""
+        self.finish_output()
+        if self._log is not None:
+            self._write_log(trailer)
+            self._log.close()
+            self._log = None
+
+    def stdout_text(self) -> str:
+        return self.stdout_tail.text(self.log_path.name)
+
+    def stderr_text(self) -> str:
+        return self.stderr_tail.text(self.log_path.name)
+
+    def to_notes(self) -> dict:
+        return {
+            "runner_capture": "stream",
+            "stdout_chars": self.stdout_tail.total_chars,
+            "stderr_chars": self.stderr_tail.total_chars,
+            "output_sha256": self.output_hash,
+        }
@@ -117,6 +117,8 @@ def init_project(
         (ralph_template, ".ralph/ralph.toml"),
         # Authorization artifacts
         (".ralph/permissions.json", ".ralph/permissions.json"),
+        # Keeps SQLite scratch files out of commits.
+        (".ralph/.gitignore", ".ralph/.gitignore"),
     ]
 
     # Add task tracker files based on format
@@ -0,0 +1,302 @@
+"""Task-relevant spec retrieval over a persistent BM25 section index.
+
+`load_specs_with_limits` fills the spec budget in filename or recency order,
+so the specs that matter for the selected task are often cut. This module
+splits every ``*.md`` under the specs directory into heading-delimited
+sections, keeps per-section term frequencies in ``.ralph/cache/spec_index.json``
+(re-tokenizing only files whose size or mtime changed), and ranks sections
+against the task title and acceptance criteria with Okapi BM25.
+
+Used when ``[prompt].specs_inclusion_order = "relevance"``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .atomic_file import atomic_write_json
+from .prd import SelectedTask
+from .prompt_cache import TRUNCATION_MARKER, get_prompt_cache
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+_HEADING_RE = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$", re.MULTILINE)
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9_]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by can for from has have in into is it its not of on or "
+    "should that the their then there these this to was were will with must when "
+    "which while all any each if do does".split()
+)
+
+# Okapi BM25 parameters (standard defaults).
+_K1 = 1.2
+_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords (identifiers stay whole)."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def bm25_scores(
+    terms: Iterable[str],
+    docs: Sequence[Tuple[int, Mapping[str, int]]],
+    df: Optional[Mapping[str, int]] = None,
+) -> List[float]:
+    """Okapi BM25 score of each (length, term frequencies) document.
+
+    Document frequencies are counted for the query terms only unless a
+    precomputed df is passed.
+    """
+    terms = set(terms)
+    n = len(docs)
+    if not terms or not n:
+        return [0.0] * n
+    if df is None:
+        df = {t: sum(1 for _, tf in docs if t in tf) for t in terms}
+    avgdl = sum(length for length, _ in docs) / n or 1.0
+    idf = {
+        t: math.log(1 + (n - df[t] + 0.5) / (df[t] + 0.5))
+        for t in terms
+        if df.get(t)
+    }
+    scores: List[float] = []
+    for length, tf in docs:
+        score = 0.0
+        norm = _K1 * (1 - _B + _B * length / avgdl)
+        for term, weight in idf.items():
+            f = tf.get(term)
+            if f:
+                score += weight * f * (_K1 + 1) / (f + norm)
+        scores.append(score)
+    return scores
+
+
+def split_sections(text: str) -> List[Tuple[str, int, int]]:
+    """Split markdown into (heading, start, end) character ranges.
+
+    Text before the first heading becomes a section with an empty heading.
+    Each section runs up to the next heading of any level.
+    """
+    starts = [m.start() for m in _HEADING_RE.finditer(text)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    bounds = starts + [len(text)]
+    sections: List[Tuple[str, int, int]] = []
+    for start, end in zip(bounds, bounds[1:]):
+        if not text[start:end].strip():
+            continue
+        match = _HEADING_RE.match(text, start)
+        heading = match.group(1) if match and match.start() == start else ""
+        sections.append((heading, start, end))
+    return sections
+
+
+@dataclass
+class SpecSection:
+    """One indexed section of a spec file."""
+
+    path: str  # relative to the specs directory
+    heading: str
+    start: int
+    end: int
+    length: int  # token count
+    tf: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class SpecMatch:
+    """A ranked section with its (possibly truncated) text."""
+
+    section: SpecSection
+    score: float
+    text: str
+
+
+class SpecIndex:
+    """Persistent section-level BM25 index over a specs directory."""
+
+    def __init__(self, specs_dir: Path, index_path: Path) -> None:
+        self.specs_dir = specs_dir
+        self.index_path = index_path
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.sections: List[SpecSection] = []
+        self._df: Counter = Counter()
+        self._load()
+
+    # -- persistence --------------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(raw, dict) or raw.get("version") != INDEX_VERSION:
+            return
+        files = raw.get("files")
+        if isinstance(files, dict):
+            self.files = files
+
+    def _save(self) -> None:
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_json(self.index_path, {"version": INDEX_VERSION, "files": self.files})
+        except OSError as e:
+            logger.debug("Failed to save spec index: %s", e)
+
+    # -- maintenance --------------------------------------------------------
+
+    def update(self) -> int:
+        """Re-index changed spec files and drop deleted ones.
+
+        Returns:
+            Number of files (re)indexed
+        """
+        seen: Dict[str, Tuple[int, int]] = {}
+        if self.specs_dir.is_dir():
+            for path in sorted(self.specs_dir.rglob("*.md")):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                seen[path.relative_to(self.specs_dir).as_posix()] = (st.st_size, st.st_mtime_ns)
+
+        changed = 0
+        for rel in list(self.files):
+            if rel not in seen:
+                del self.files[rel]
+                changed += 1
+        reindexed = 0
+        cache = get_prompt_cache()
+        for rel, (size, mtime_ns) in seen.items():
+            entry = self.files.get(rel)
+            if entry and entry.get("size") == size and entry.get("mtime_ns") == mtime_ns:
+                continue
+            text = cache.read(self.specs_dir / rel)
+            if text is None:
+                continue
+            sections = []
+            for heading, start, end in split_sections(text):
+                tokens = tokenize(text[start:end])
+                # Headings and file names are strong topical signals.
+                tokens += tokenize(heading) + tokenize(Path(rel).stem.replace("-", " "))
+                sections.append(
+                    {
+                        "heading": heading,
+                        "start": start,
+                        "end": end,
+                        "length": len(tokens),
+                        "tf": dict(Counter(tokens)),
+                    }
+                )
+            self.files[rel] = {"size": size, "mtime_ns": mtime_ns, "sections": sections}
+            reindexed += 1
+
+        if changed or reindexed or not self.index_path.exists():
+            self._save()
+        self._rebuild_views()
+        return reindexed
+
+    def _rebuild_views(self) -> None:
+        self.sections = []
+        self._df = Counter()
+        for rel in sorted(self.files):
+            for raw in self.files[rel].get("sections", []):
+                section = SpecSection(
+                    path=rel,
+                    heading=str(raw.get("heading", "")),
+                    start=int(raw.get("start", 0)),
+                    end=int(raw.get("end", 0)),
+                    length=int(raw.get("length", 0)),
+                    tf={str(k): int(v) for k, v in (raw.get("tf") or {}).items()},
+                )
+                self.sections.append(section)
+                self._df.update(section.tf.keys())
+
+    # -- querying -----------------------------------------------------------
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[SpecSection, float]]:
+        """Sections ranked by BM25 score against query (score > 0 only)."""
+        scores = bm25_scores(set(tokenize(query)), [(s.length, s.tf) for s in self.sections], self._df)
+        scored = [(section, score) for section, score in zip(self.sections, scores) if score > 0]
+        scored.sort(key=lambda item: (-item[1], item[0].path, item[0].start))
+        return scored[:limit] if limit is not None else scored
+
+    def section_text(self, section: SpecSection) -> str:
+        text = get_prompt_cache().read(self.specs_dir / section.path) or ""
+        return text[section.start : section.end]
+
+
+def task_query(task: SelectedTask) -> str:
+    """Retrieval query for a task: its title and acceptance criteria."""
+    return "\n".join([task.title, *task.acceptance])
+
+
+def retrieve_spec_sections(
+    index: SpecIndex,
+    query: str,
+    max_chars: int,
+    max_section_chars: int,
+) -> List[SpecMatch]:
+    """Greedily fill a character budget with the best-scoring sections.
+
+    Sections longer than max_section_chars are truncated; a section that
+    no longer fits is skipped so smaller relevant ones can still be used.
+    """
+    picked: List[SpecMatch] = []
+    used = 0
+    for section, score in index.search(query):
+        text = index.section_text(section)
+        if len(text) > max_section_chars:
+            text = text[:max_section_chars] + TRUNCATION_MARKER
+        if used + len(text) > max_chars:
+            continue
+        picked.append(SpecMatch(section=section, score=score, text=text))
+        used += len(text)
+    return picked
+
+
+def group_matches_by_file(matches: Iterable[SpecMatch]) -> List[Tuple[str, str]]:
+    """(spec name, content) pairs with each file's sections in document order."""
+    by_file: Dict[str, List[SpecMatch]] = {}
+    for match in matches:
+        by_file.setdefault(match.section.path, []).append(match)
+    ordered = sorted(by_file.items(), key=lambda item: -max(m.score for m in item[1]))
+    specs: List[Tuple[str, str]] = []
+    for rel, file_matches in ordered:
+        file_matches.sort(key=lambda m: m.section.start)
+        content = "\n".join(m.text.rstrip("\n") + "\n" for m in file_matches)
+        specs.append((rel, content))
+    return specs
+
+
+def load_relevant_specs(
+    project_root: Path,
+    specs_dir: Path,
+    task: SelectedTask,
+    max_chars: int,
+    max_section_chars: int,
+) -> List[Tuple[str, str]]:
+    """Spec excerpts most relevant to task, within max_chars.
+
+    Returns an empty list when nothing matches, so callers can fall back
+    to whole-file inclusion.
+    """
+    index = SpecIndex(specs_dir, project_root / ".ralph" / "cache" / "spec_index.json")
+    index.update()
+    matches = retrieve_spec_sections(index, task_query(task), max_chars, max_section_chars)
+    logger.debug(
+        "Spec retrieval for %s: %d sections, %d chars",
+        task.id,
+        len(matches),
+        sum(len(m.text) for m in matches),
+    )
+    return group_matches_by_file(matches)
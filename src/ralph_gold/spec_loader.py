@@ -9,7 +9,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +54,7 @@ def load_specs_with_limits(
     max_single_spec_chars: int = 10000,
     truncate_long_specs: bool = True,
     specs_inclusion_order: str = "sorted",
+    read_text: Optional[Callable[[Path], Optional[str]]] = None,
 ) -> SpecLoadResult:
     """Load spec files with configurable limits and diagnostic warnings.
 
@@ -64,6 +65,8 @@ def load_specs_with_limits(
         max_single_spec_chars: Maximum characters for a single spec
         truncate_long_specs: If True, truncate oversized specs; if False, exclude them
         specs_inclusion_order: How to order specs - "sorted" or "recency"
+        read_text: Optional reader returning a spec's text (None if unreadable),
+            e.g. PromptSectionCache.read so content is not read twice
 
     Returns:
         SpecLoadResult with included/excluded specs and any warnings
@@ -93,12 +96,19 @@ def load_specs_with_limits(
     # Load specs with limits
     total_chars = 0
     for spec_path in all_specs[:max_specs_files]:
-        try:
-            content = spec_path.read_text(encoding="utf-8")
+        if read_text is not None:
+            content = read_text(spec_path)
+            if content is None:
+                logger.warning(f"Failed to read {spec_path}")
+                continue
             char_count = len(content)
-        except Exception as e:
-            logger.warning(f"Failed to read {spec_path}: {e}")
-            continue
+        else:
+            try:
+                content = spec_path.read_text(encoding="utf-8")
+                char_count = len(content)
+            except Exception as e:
+                logger.warning(f"Failed to read {spec_path}: {e}")
+                continue
 
         # Check single spec size
         if char_count > max_single_spec_chars:
@@ -13,17 +13,37 @@ Benefits:
 - Timeout support to prevent hangs
 - Standardized result capture
 - Better error messages for debugging
+
+Execution engine:
+One asyncio event loop, running in a daemon thread, drives every child
+process: output is read as it arrives (no reader thread per stream), each
+process has its own timeout, and several processes can be awaited together
+(``run_subprocess_many``). On a timeout, a cancellation (Ctrl-C in the
+caller) or interpreter exit a child is sent SIGTERM and, after a grace
+period, SIGKILL.
+
+Children started with ``new_session=True`` (agent runners) get their own
+session, so they lead a process group and the whole group is stopped:
+agent CLIs cannot leave grandchildren behind. Everything else (git, ssh,
+editors) stays in the caller's session, keeping the controlling terminal
+for ``/dev/tty`` prompts such as credentials and passphrases. The
+functions below are the synchronous facade.
 """
 
 from __future__ import annotations
 
-import subprocess
+import asyncio
+import atexit
+import codecs
+import concurrent.futures
+import io
+import os
+import signal
 import sys
 import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import IO, Union
-from typing import List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
 
 
 @dataclass
@@ -55,32 +75,314 @@ class SubprocessResult:
         return self.returncode != 0
 
 
-def _coerce_input_payload(raw: str | bytes, text: bool) -> str | bytes:
-    """Normalize input payload for subprocess APIs.
+# Seconds between SIGTERM and SIGKILL when a process group is stopped.
+KILL_GRACE_SECONDS = 2.0
+
+# Bytes requested per read from a child's stdout/stderr pipe.
+READ_CHUNK_BYTES = 64 * 1024
+
+_POSIX = os.name == "posix"
+
+# Pids of running children, for the exit hook; the value says whether the
+# pid leads its own process group.
+_live_children: Dict[int, bool] = {}
+_live_lock = threading.Lock()
+
+OutputCallback = Callable[[str], None]
+
+
+def _signal_process(proc: asyncio.subprocess.Process, sig: int, group: bool) -> None:
+    """Send sig to proc's process group when it leads one, else to proc itself."""
+    try:
+        if _POSIX and group:
+            os.killpg(proc.pid, sig)
+        elif proc.returncode is None:
+            if _POSIX:
+                proc.send_signal(sig)
+            else:
+                proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def _terminate(proc: asyncio.subprocess.Process, grace: float, group: bool) -> None:
+    """Stop proc (and its group if it leads one), escalating to SIGKILL after grace."""
+    if not _POSIX:
+        _signal_process(proc, signal.SIGTERM, group)
+        await proc.wait()
+        return
+    _signal_process(proc, signal.SIGTERM, group)
+    try:
+        await asyncio.wait_for(proc.wait(), grace)
+    except asyncio.TimeoutError:
+        pass
+    # Grandchildren may outlive the leader; the group id stays valid while
+    # any member is alive.
+    if group or proc.returncode is None:
+        _signal_process(proc, signal.SIGKILL, group)
+    await proc.wait()
+
+
+async def _pump(
+    stream: asyncio.StreamReader,
+    sink: Optional[List[str]],
+    callback: Optional[OutputCallback],
+    translate_newlines: bool,
+) -> None:
+    """Decode stream incrementally into sink and/or callback until EOF."""
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=translate_newlines
+    )
+    while True:
+        chunk = await stream.read(READ_CHUNK_BYTES)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            if sink is not None:
+                sink.append(text)
+            if callback is not None:
+                callback(text)
+        if not chunk:
+            return
+
+
+async def _feed_stdin(proc: asyncio.subprocess.Process, data: bytes) -> None:
+    assert proc.stdin is not None
+    try:
+        proc.stdin.write(data)
+        await proc.stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # The child exited without reading its input; its exit code says why.
+        pass
+    finally:
+        proc.stdin.close()
+
+
+async def run_process(
+    argv: Sequence[str],
+    *,
+    cwd: Optional[Path] = None,
+    env: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    stdin: Optional[bytes] = None,
+    inherit_stdin: bool = False,
+    capture_output: bool = True,
+    discard_output: bool = False,
+    on_stdout: Optional[OutputCallback] = None,
+    on_stderr: Optional[OutputCallback] = None,
+    text: bool = True,
+    kill_grace: float = KILL_GRACE_SECONDS,
+    new_session: bool = False,
+) -> SubprocessResult:
+    """Run one child process on the current event loop.
 
     Args:
-        raw: Input payload to pass into subprocess stdin
-        text: Whether subprocess text mode is enabled
+        argv: Command and arguments
+        cwd: Working directory
+        env: Environment for the child (inherits ours when None)
+        timeout: Seconds before the process group is stopped (None = no limit)
+        stdin: Bytes written to the child's stdin, which is then closed
+        inherit_stdin: Without stdin data, share our stdin instead of /dev/null
+        capture_output: Keep stdout/stderr in the result
+        discard_output: Streams that are neither captured nor passed to a
+            callback go to /dev/null instead of our stdout/stderr
+        on_stdout: Called with each decoded stdout chunk as it arrives
+        on_stderr: Called with each decoded stderr chunk as it arrives
+        text: Translate ``\\r\\n`` and ``\\r`` to ``\\n`` like text-mode pipes
+        kill_grace: Seconds between SIGTERM and SIGKILL when stopping
+        new_session: Start the child in its own session (POSIX) so it leads
+            a process group that is stopped as a whole. The child loses the
+            controlling terminal, so use it only for agent runners, never
+            for commands that may prompt on /dev/tty
 
     Returns:
-        A payload type compatible with subprocess stdin/input handling.
+        SubprocessResult; ``timed_out`` is set (and output is partial) when
+        the timeout fired
+
+    Raises:
+        FileNotFoundError: If argv[0] cannot be found
+        asyncio.CancelledError: If cancelled; the child (or its group) is
+            stopped first
     """
-    if text:
-        if isinstance(raw, (bytes, bytearray)):
-            return raw.decode("utf-8", errors="replace")
-        return str(raw)
+    cmd_str = " ".join(argv)
+
+    def stream_mode(callback: Optional[OutputCallback]) -> Optional[int]:
+        if capture_output or callback is not None:
+            return asyncio.subprocess.PIPE
+        return asyncio.subprocess.DEVNULL if discard_output else None
+
+    if stdin is not None:
+        stdin_mode: Optional[int] = asyncio.subprocess.PIPE
+    else:
+        stdin_mode = None if inherit_stdin else asyncio.subprocess.DEVNULL
+
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        cwd=str(cwd) if cwd is not None else None,
+        env=env,
+        stdin=stdin_mode,
+        stdout=stream_mode(on_stdout),
+        stderr=stream_mode(on_stderr),
+        start_new_session=_POSIX and new_session,
+    )
+    group = _POSIX and new_session
+    with _live_lock:
+        _live_children[proc.pid] = group
+
+    stdout_parts: List[str] = []
+    stderr_parts: List[str] = []
+    io_tasks: List[Awaitable[Any]] = []
+    if stdin is not None:
+        io_tasks.append(_feed_stdin(proc, stdin))
+    if proc.stdout is not None:
+        io_tasks.append(_pump(proc.stdout, stdout_parts if capture_output else None, on_stdout, text))
+    if proc.stderr is not None:
+        io_tasks.append(_pump(proc.stderr, stderr_parts if capture_output else None, on_stderr, text))
+
+    async def communicate() -> None:
+        await asyncio.gather(*io_tasks)
+        await proc.wait()
+
+    timed_out = False
+    try:
+        await asyncio.wait_for(communicate(), timeout)
+    except asyncio.TimeoutError:
+        timed_out = True
+        await _terminate(proc, kill_grace, group)
+    except BaseException:
+        # Cancelled (or failed): never leave the child running.
+        await asyncio.shield(_terminate(proc, kill_grace, group))
+        raise
+    finally:
+        with _live_lock:
+            _live_children.pop(proc.pid, None)
+
+    return SubprocessResult(
+        returncode=proc.returncode if proc.returncode is not None else -1,
+        stdout="".join(stdout_parts),
+        stderr="".join(stderr_parts),
+        timed_out=timed_out,
+        cmd_str=cmd_str,
+    )
+
+
+class SubprocessEngine:
+    """Owns the event loop thread and runs coroutines on it for sync callers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid = 0
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            # A forked child inherits the loop object but not its thread.
+            if (
+                self._loop is None
+                or self._pid != os.getpid()
+                or self._thread is None
+                or not self._thread.is_alive()
+            ):
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="ralph-subprocess-engine", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread, self._pid = loop, thread, os.getpid()
+            return self._loop
+
+    def submit(self, coro: Awaitable[Any]) -> concurrent.futures.Future:
+        """Schedule coro on the engine loop from any other thread."""
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Synchronous subprocess call from the subprocess engine loop")
+        return asyncio.run_coroutine_threadsafe(coro, loop)  # type: ignore[arg-type]
+
+    def _wait(self, coro: Awaitable[Any], grace: float) -> Any:
+        finished = threading.Event()
+
+        async def tracked() -> Any:
+            try:
+                return await coro
+            finally:
+                finished.set()
+
+        future = self.submit(tracked())
+        try:
+            return future.result()
+        except BaseException:
+            # KeyboardInterrupt and friends: cancel, and give the engine time
+            # to stop the process groups before the caller unwinds.
+            if not future.done():
+                future.cancel()
+                finished.wait(grace + 1.0)
+            raise
+
+    def run(self, argv: Sequence[str], **kwargs: Any) -> SubprocessResult:
+        """Run one process to completion; kwargs are those of run_process."""
+        grace = kwargs.get("kill_grace", KILL_GRACE_SECONDS)
+        return self._wait(run_process(argv, **kwargs), grace)
+
+    def run_many(self, commands: Sequence[Sequence[str]], **kwargs: Any) -> List[SubprocessResult]:
+        """Run several processes concurrently with shared options.
+
+        Results are in the order of commands. If one command cannot be
+        started, the others are stopped and the error is raised.
+        """
+        grace = kwargs.get("kill_grace", KILL_GRACE_SECONDS)
+
+        async def run_all() -> List[SubprocessResult]:
+            tasks = [asyncio.ensure_future(run_process(argv, **kwargs)) for argv in commands]
+            try:
+                return list(await asyncio.gather(*tasks))
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+        return self._wait(run_all(), grace)
+
+
+def kill_live_process_groups() -> None:
+    """SIGKILL all children still running, and their groups (exit hook)."""
+    if not _POSIX:
+        return
+    with _live_lock:
+        children = list(_live_children.items())
+        _live_children.clear()
+    for pid, group in children:
+        try:
+            if group:
+                os.killpg(pid, signal.SIGKILL)
+            else:
+                os.kill(pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+
+atexit.register(kill_live_process_groups)
+
+_DEFAULT_ENGINE = SubprocessEngine()
+
+
+def get_subprocess_engine() -> SubprocessEngine:
+    """Process-wide engine shared by all subprocess helpers."""
+    return _DEFAULT_ENGINE
+
+
+def _coerce_input_payload(raw: str | bytes) -> bytes:
+    """Normalize a stdin payload (text or bytes) to bytes for the child."""
     if isinstance(raw, (bytes, bytearray)):
         return bytes(raw)
     return str(raw).encode("utf-8")
 
 
-def _coerce_output_payload(raw: str | bytes | None) -> str:
-    """Normalize subprocess output to text."""
-    if raw is None:
-        return ""
-    if isinstance(raw, (bytes, bytearray)):
-        return bytes(raw).decode("utf-8", errors="replace")
-    return str(raw)
+def _command_not_found(argv: List[str]) -> RuntimeError:
+    return RuntimeError(
+        f"Command not found: {argv[0]}\n"
+        f"Ensure the command is installed and available in PATH."
+    )
 
 
 def run_subprocess(
@@ -93,12 +395,13 @@ def run_subprocess(
     text: bool = True,
     env: Optional[dict] | None = None,
     stdin_text: Optional[str] = None,
+    new_session: bool = False,
 ) -> SubprocessResult:
     """Run subprocess with unified error handling.
 
-    This function provides a consistent interface to subprocess.run() with:
+    Runs the command on the shared subprocess engine with:
     - Standardized error handling
-    - Timeout support (converts TimeoutExpired to RuntimeError)
+    - Timeout support (stops the command, raises RuntimeError)
     - Command not found detection
     - Structured result object
 
@@ -106,13 +409,16 @@ def run_subprocess(
         argv: Command and arguments as a list (e.g., ["git", "status"])
         cwd: Working directory for the command
         check: If True, raise RuntimeError on non-zero exit
-        timeout: Maximum seconds to wait before raising TimeoutExpired
+        timeout: Maximum seconds to wait before stopping the command
         capture_output: If True, capture stdout and stderr
         input_text: Optional bytes or text passed to process stdin
-        text: If True, subprocess is run in text mode. Output is normalized
-            to text for callers in either case.
+            (stdin_text takes precedence)
+        text: If True, translate newlines as text-mode pipes do. Output is
+            normalized to text for callers in either case.
         env: Environment variables to pass to the subprocess
         stdin_text: Optional text to send to process stdin
+        new_session: Run the command as its own process group (agent
+            runners only; see run_process)
 
     Returns:
         SubprocessResult with returncode, stdout, stderr
@@ -131,57 +437,37 @@ def run_subprocess(
         >>> print(result.stdout)
     """
     cmd_str = " ".join(argv)
-
-    kwargs: dict = {
-        "capture_output": capture_output,
-        "text": text,
-    }
-
-    if cwd is not None:
-        kwargs["cwd"] = str(cwd)
-    if timeout is not None:
-        kwargs["timeout"] = timeout
-    if env is not None:
-        kwargs["env"] = env
-    if stdin_text is not None:
-        kwargs["input"] = stdin_text
+    payload = stdin_text if stdin_text is not None else input_text
 
     try:
-        cp = subprocess.run(argv, **kwargs)
-        result = SubprocessResult(
-            returncode=cp.returncode,
-            stdout=_coerce_output_payload(cp.stdout) if capture_output else "",
-            stderr=_coerce_output_payload(cp.stderr) if capture_output else "",
-            cmd_str=cmd_str,
+        result = get_subprocess_engine().run(
+            argv,
+            cwd=cwd,
+            env=env,
+            timeout=timeout,
+            stdin=_coerce_input_payload(payload) if payload is not None else None,
+            inherit_stdin=True,
+            capture_output=capture_output,
+            text=text,
+            new_session=new_session,
         )
+    except FileNotFoundError:
+        raise _command_not_found(argv)
 
-        if check and result.failed:
-            raise RuntimeError(
-                f"Command failed with exit code {result.returncode}: {cmd_str}\n"
-                f"stderr: {result.stderr}"
-            )
-
-        return result
-
-    except subprocess.TimeoutExpired as e:
-        # Provide more helpful timeout error
-        if e.stderr is None:
-            stderr = ""
-        elif isinstance(e.stderr, (bytes, bytearray)):
-            stderr = e.stderr.decode("utf-8", errors="replace")
-        else:
-            stderr = str(e.stderr)
+    if result.timed_out:
         raise RuntimeError(
             f"Command timed out after {timeout}s: {cmd_str}\n"
-            f"Partial output:\n{stderr[:500]}"
-        ) from e
+            f"Partial output:\n{result.stderr[:500]}"
+        )
 
-    except FileNotFoundError:
+    if check and result.failed:
         raise RuntimeError(
-            f"Command not found: {argv[0]}\n"
-            f"Ensure the command is installed and available in PATH."
+            f"Command failed with exit code {result.returncode}: {cmd_str}\n"
+            f"stderr: {result.stderr}"
         )
 
+    return result
+
 
 def run_subprocess_live(
     argv: List[str],
@@ -192,6 +478,9 @@ def run_subprocess_live(
     forward_output: bool = True,
     text: bool = True,
     env: Optional[dict] | None = None,
+    on_stdout: Optional[OutputCallback] = None,
+    on_stderr: Optional[OutputCallback] = None,
+    new_session: bool = False,
 ) -> SubprocessResult:
     """Run subprocess with live output and optional capture.
 
@@ -207,6 +496,11 @@ def run_subprocess_live(
         forward_output: If True, write streaming output to terminal in real time
         text: If True, handle output as text
         env: Environment variables
+        on_stdout: Called with each stdout chunk as it arrives (e.g. to write
+            it to a log instead of capturing it)
+        on_stderr: Called with each stderr chunk as it arrives
+        new_session: Run the command as its own process group (agent
+            runners only; see run_process)
 
     Returns:
         SubprocessResult with captured output
@@ -220,126 +514,81 @@ def run_subprocess_live(
     """
     cmd_str = " ".join(argv)
 
-    def _coerce_stream_line(line: Union[str, bytes]) -> str:
-        if isinstance(line, (bytes, bytearray)):
-            return line.decode("utf-8", errors="replace")
-        return str(line)
+    def forward(file: Any, sink: Optional[OutputCallback]) -> Optional[OutputCallback]:
+        if not forward_output:
+            return sink
 
-    kwargs: dict = {
-        "stdin": subprocess.PIPE if input_text is not None else subprocess.DEVNULL,
-        "text": text,
-    }
+        def write(chunk: str) -> None:
+            if sink is not None:
+                sink(chunk)
+            print(chunk, end="", flush=True, file=file)
 
-    stream_enabled = capture_output or forward_output
-    if stream_enabled:
-        kwargs["stdout"] = subprocess.PIPE
-        kwargs["stderr"] = subprocess.PIPE
-    else:
-        kwargs["stdout"] = subprocess.DEVNULL
-        kwargs["stderr"] = subprocess.DEVNULL
+        return write
 
-    if cwd is not None:
-        kwargs["cwd"] = str(cwd)
-    if env is not None:
-        kwargs["env"] = env
+    try:
+        result = get_subprocess_engine().run(
+            argv,
+            cwd=cwd,
+            env=env,
+            timeout=timeout,
+            stdin=_coerce_input_payload(input_text) if input_text is not None else None,
+            capture_output=capture_output,
+            discard_output=True,
+            on_stdout=forward(sys.stdout, on_stdout),
+            on_stderr=forward(sys.stderr, on_stderr),
+            text=text,
+            new_session=new_session,
+        )
+    except FileNotFoundError:
+        raise _command_not_found(argv)
 
-    timeout_seconds: Optional[int] = timeout
-    timed_out = False
+    if result.timed_out:
+        raise RuntimeError(
+            f"Command timed out after {timeout}s: {cmd_str}\n"
+            f"Partial stdout:\n{result.stdout[:500]}\n"
+            f"Partial stderr:\n{result.stderr[:500]}"
+        )
 
-    stdout_lines: list[str] = []
-    stderr_lines: list[str] = []
-
-    def _stream_reader(
-        stream: IO[str] | IO[bytes],
-        sink: list[str],
-        forward_to_stderr: bool = False,
-    ) -> None:
-        sentinel = "" if text else b""
-        reader = stream.readline
-        while True:
-            line = reader()
-            if line == sentinel:
-                break
-
-            text_line = _coerce_stream_line(line)
-            if forward_output:
-                print(
-                    text_line,
-                    end="",
-                    flush=True,
-                    file=sys.stderr if forward_to_stderr else sys.stdout,
-                )
-            if capture_output:
-                sink.append(text_line)
+    return result
 
-    try:
-        with subprocess.Popen(**{**kwargs, "args": argv}) as proc:
-            if input_text is not None and proc.stdin is not None:
-                try:
-                    payload = _coerce_input_payload(input_text, text)
-                    proc.stdin.write(payload)  # type: ignore[arg-type]
-                    proc.stdin.flush()
-                except OSError:
-                    # If the subprocess exits before consuming stdin, continue.
-                    # The final return code will still reflect subprocess state.
-                    pass
-                finally:
-                    proc.stdin.close()
-
-            readers: list[threading.Thread] = []
-            if proc.stdout is not None:
-                stdout_reader = threading.Thread(
-                    target=_stream_reader,
-                    args=(proc.stdout, stdout_lines, False),
-                    daemon=True,
-                )
-                stdout_reader.start()
-                readers.append(stdout_reader)
-
-            if proc.stderr is not None and proc.stderr is not proc.stdout:
-                stderr_reader = threading.Thread(
-                    target=_stream_reader,
-                    args=(proc.stderr, stderr_lines, True),
-                    daemon=True,
-                )
-                stderr_reader.start()
-                readers.append(stderr_reader)
 
-            try:
-                proc.wait(timeout=timeout_seconds)
-            except subprocess.TimeoutExpired as e:
-                timed_out = True
-                proc.kill()
-                try:
-                    proc.wait(timeout=1)
-                except subprocess.TimeoutExpired:
-                    pass
-
-                for reader in readers:
-                    reader.join(timeout=1.0)
-
-                partial_stdout = "".join(stdout_lines)
-                partial_stderr = "".join(stderr_lines)
-                raise RuntimeError(
-                    f"Command timed out after {timeout_seconds}s: {cmd_str}\n"
-                    f"Partial stdout:\n{partial_stdout[:500]}\n"
-                    f"Partial stderr:\n{partial_stderr[:500]}"
-                ) from e
-
-            for reader in readers:
-                reader.join()
-
-            return SubprocessResult(
-                returncode=proc.returncode if proc.returncode is not None else -1,
-                stdout="".join(stdout_lines) if capture_output else "",
-                stderr="".join(stderr_lines) if capture_output else "",
-                timed_out=timed_out,
-                cmd_str=cmd_str,
-            )
+def run_subprocess_many(
+    commands: Sequence[List[str]],
+    cwd: Optional[Path] = None,
+    timeout: Optional[int] = None,
+    env: Optional[dict] | None = None,
+    new_session: bool = False,
+) -> List[SubprocessResult]:
+    """Run several commands concurrently and capture their output.
 
-    except FileNotFoundError:
+    All commands share one event loop instead of a thread each. A command
+    that exceeds timeout is stopped and reported with ``timed_out=True``
+    rather than raising, so the other results are still returned.
+
+    Args:
+        commands: Commands and arguments, one list per command
+        cwd: Working directory for every command
+        timeout: Maximum seconds per command
+        env: Environment variables for every command
+        new_session: Run each command as its own process group (see
+            run_process)
+
+    Returns:
+        One SubprocessResult per command, in order
+
+    Raises:
+        RuntimeError: If a command is not found (the others are stopped)
+
+    Examples:
+        >>> lint, unit = run_subprocess_many([["ruff", "check", "."], ["pytest", "-q"]])
+    """
+    try:
+        return get_subprocess_engine().run_many(
+            commands, cwd=cwd, env=env, timeout=timeout, new_session=new_session
+        )
+    except FileNotFoundError as e:
         raise RuntimeError(
-            f"Command not found: {argv[0]}\n"
+            f"Command not found: {e.filename}\n"
             f"Ensure the command is installed and available in PATH."
         )
 
@@ -17,7 +17,7 @@ from typing import Optional, Sequence
 from .config import Config
 from .notify import default_title, send_notification
 from .output import get_output_config, print_json_output, print_output
-from .trackers import make_tracker
+from .trackers import make_tracker, tracker_snapshot
 
 # Reuse internal helpers from loop to keep behavior consistent.
 from .loop import (  # noqa: PLC0415 (intentional local import style)
@@ -111,10 +111,7 @@ def run_supervisor(
     title = default_title(repo_name)
 
     def _heartbeat() -> None:
-        try:
-            done, total = tracker.counts()
-        except Exception:
-            done, total = 0, 0
+        done, total = tracker_snapshot(tracker).counts()
         msg = f"supervise: {done}/{total} done • {_format_last(last_res)}"
         print_output(msg, level="normal")
 
@@ -215,18 +212,10 @@ def run_supervisor(
                 last_log_path=str(getattr(last_res, "log_path", "") or "") or None,
             )
 
-        # Stop conditions
-        try:
-            done = tracker.all_done()
-        except Exception:
-            done = False
-
-        all_blocked = False
-        try:
-            if hasattr(tracker, "all_blocked"):
-                all_blocked = bool(tracker.all_blocked())
-        except Exception:
-            all_blocked = False
+        # Stop conditions (single tracker read)
+        snap = tracker_snapshot(tracker)
+        done = snap.all_done
+        all_blocked = snap.all_blocked
 
         # Completion
         if (done or (last_res.story_id is None and last_res.return_code == 0)) and (
@@ -0,0 +1,326 @@
+"""Token budget allocation across prompt sections.
+
+The character limits in ``[prompt]`` bound individual sources (progress,
+specs) but nothing bounds the assembled prompt, and ``check_context_health``
+only warns. This module estimates tokens with a pluggable local tokenizer
+and splits a per-runner token target between prompt sections by priority,
+with min/max shares, truncating or dropping the lowest-priority content
+deterministically until the prompt fits.
+
+Allocation runs in three passes over sections ordered by priority (highest
+first, ties in declaration order):
+
+1. every section gets its minimum share (capped at what it asked for);
+2. sections grow up to their maximum share;
+3. budget still left over is handed out in priority order regardless of
+   max share, so caps only bind when sections compete for space.
+
+Used when ``[prompt].token_budget`` (or a ``[prompt.runner_token_budgets]``
+entry for the runner) is greater than zero.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .prompt_cache import TRUNCATION_MARKER
+
+logger = logging.getLogger(__name__)
+
+Tokenizer = Callable[[str], int]
+
+# Word pieces, short digit runs and single punctuation characters; BPE
+# vocabularies split text at roughly these boundaries.
+_PIECE_RE = re.compile(r"[A-Za-z]+|\d{1,3}|[^\sA-Za-z\d]")
+
+
+def count_tokens_chars(text: str) -> int:
+    """Classic estimate: one token per four characters."""
+    return math.ceil(len(text) / 4)
+
+
+def count_tokens_approx(text: str) -> int:
+    """Local BPE approximation.
+
+    Letters are counted in chunks of four, digits in groups of three and
+    every punctuation character as one token; whitespace is free. Within a
+    few percent of cl100k-style tokenizers on English prose and code.
+    """
+    return sum(
+        math.ceil(len(piece) / 4) if piece[0].isalpha() else 1
+        for piece in _PIECE_RE.findall(text)
+    )
+
+
+def _import_tiktoken() -> Any:
+    try:
+        import tiktoken  # type: ignore
+
+        return tiktoken
+    except ImportError:
+        return None
+
+
+def _tiktoken_counter() -> Optional[Tokenizer]:
+    tiktoken = _import_tiktoken()
+    if tiktoken is None:
+        return None
+    encoding = tiktoken.get_encoding("cl100k_base")
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+_TOKENIZERS: Dict[str, Tokenizer] = {
+    "chars": count_tokens_chars,
+    "approx": count_tokens_approx,
+}
+
+
+def register_tokenizer(name: str, tokenizer: Tokenizer) -> None:
+    """Make a tokenizer available to ``[prompt].tokenizer``."""
+    _TOKENIZERS[name.strip().lower()] = tokenizer
+
+
+def get_tokenizer(name: str) -> Tokenizer:
+    """Tokenizer registered as name.
+
+    "tiktoken" uses the optional tiktoken package when installed. Unknown
+    names and a missing tiktoken fall back to "approx" with a warning.
+    """
+    key = (name or "approx").strip().lower()
+    if key not in _TOKENIZERS and key == "tiktoken":
+        counter = _tiktoken_counter()
+        if counter is not None:
+            _TOKENIZERS[key] = counter
+    tokenizer = _TOKENIZERS.get(key)
+    if tokenizer is None:
+        logger.warning("Unknown or unavailable tokenizer %r; using 'approx'", name)
+        return count_tokens_approx
+    return tokenizer
+
+
+@dataclass(frozen=True)
+class SectionPolicy:
+    """How a prompt section competes for the token budget.
+
+    Attributes:
+        priority: Higher priorities are funded first
+        min_share: Fraction of the section budget reserved for this section
+        max_share: Fraction of the section budget it may claim before
+            lower-priority sections are funded
+        keep: "head" keeps the start of truncated text, "tail" the end
+    """
+
+    priority: int
+    min_share: float = 0.0
+    max_share: float = 1.0
+    keep: str = "head"
+
+
+DEFAULT_SECTION_POLICIES: Dict[str, SectionPolicy] = {
+    "anchor": SectionPolicy(priority=90, max_share=0.10),
+    "agents": SectionPolicy(priority=80, min_share=0.05, max_share=0.15),
+    "prd": SectionPolicy(priority=70, min_share=0.05, max_share=0.25),
+    "specs": SectionPolicy(priority=60, min_share=0.10, max_share=0.40),
+    "repoprompt": SectionPolicy(priority=50, max_share=0.30),
+    # Progress and feedback are appended to; the newest lines are at the end.
+    "progress": SectionPolicy(priority=40, min_share=0.02, max_share=0.20, keep="tail"),
+    "feedback": SectionPolicy(priority=30, max_share=0.10, keep="tail"),
+}
+
+
+def section_policies(overrides: Optional[Mapping[str, Mapping[str, Any]]] = None) -> Dict[str, SectionPolicy]:
+    """Default policies with ``[prompt.token_sections.<name>]`` overrides applied."""
+    policies = dict(DEFAULT_SECTION_POLICIES)
+    for name, raw in (overrides or {}).items():
+        base = policies.get(name, SectionPolicy(priority=0))
+        try:
+            policies[name] = SectionPolicy(
+                priority=int(raw.get("priority", base.priority)),
+                min_share=float(raw.get("min_share", base.min_share)),
+                max_share=float(raw.get("max_share", base.max_share)),
+                keep=str(raw.get("keep", base.keep)),
+            )
+        except (TypeError, ValueError) as e:
+            logger.warning("Ignoring invalid token section policy for %s: %s", name, e)
+    return policies
+
+
+@dataclass
+class SectionAllocation:
+    """Budget decision for one section."""
+
+    name: str
+    priority: int
+    requested: int
+    granted: int = 0
+    tokens: int = 0  # after truncation
+    action: str = "kept"  # kept|truncated|dropped
+
+
+@dataclass
+class BudgetAllocation:
+    """Outcome of fitting a prompt's sections into a token target."""
+
+    target_tokens: int
+    tokenizer: str
+    fixed_tokens: int
+    sections: List[SectionAllocation] = field(default_factory=list)
+    total_tokens: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return any(s.action != "kept" for s in self.sections)
+
+    def to_notes(self) -> Dict[str, Any]:
+        """Receipt-friendly summary."""
+        return {
+            "target_tokens": self.target_tokens,
+            "tokenizer": self.tokenizer,
+            "fixed_tokens": self.fixed_tokens,
+            "total_tokens": self.total_tokens,
+            "sections": {
+                s.name: {
+                    "priority": s.priority,
+                    "requested": s.requested,
+                    "granted": s.granted,
+                    "tokens": s.tokens,
+                    "action": s.action,
+                }
+                for s in self.sections
+            },
+        }
+
+
+def truncate_to_tokens(text: str, max_tokens: int, tokenizer: Tokenizer, keep: str = "head") -> str:
+    """Longest prefix (or suffix) of text within max_tokens, plus a marker.
+
+    The cut is moved back to a line boundary when that keeps at least half
+    of the text. Returns "" when not even the marker fits.
+    """
+    if tokenizer(text) <= max_tokens:
+        return text
+    budget = max_tokens - tokenizer(TRUNCATION_MARKER)
+    if budget <= 0:
+        return ""
+
+    def piece(n: int) -> str:
+        return text[:n] if keep == "head" else text[len(text) - n :]
+
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if tokenizer(piece(mid)) <= budget:
+            lo = mid
+        else:
+            hi = mid - 1
+    if lo == 0:
+        return ""
+    kept = piece(lo)
+    if keep == "head":
+        cut = kept.rfind("\n")
+        if cut >= lo // 2:
+            kept = kept[: cut + 1]
+        return kept + TRUNCATION_MARKER
+    cut = kept.find("\n")
+    if 0 <= cut <= lo // 2:
+        kept = kept[cut + 1 :]
+    return TRUNCATION_MARKER + kept
+
+
+def allocate_budget(
+    sections: Sequence[Tuple[str, str]],
+    target_tokens: int,
+    tokenizer: Tokenizer,
+    *,
+    fixed_tokens: int = 0,
+    policies: Optional[Mapping[str, SectionPolicy]] = None,
+    tokenizer_name: str = "",
+) -> BudgetAllocation:
+    """Decide how many tokens each (name, text) section may use.
+
+    Args:
+        sections: Budgeted sections in prompt order
+        target_tokens: Token target for the whole prompt
+        tokenizer: Token counter
+        fixed_tokens: Tokens used by content that is never cut (template,
+            selected task, loop rules)
+        policies: Section policies by name (defaults when omitted)
+        tokenizer_name: Recorded in the allocation for receipts
+    """
+    policies = policies if policies is not None else DEFAULT_SECTION_POLICIES
+    available = max(0, target_tokens - fixed_tokens)
+    allocation = BudgetAllocation(
+        target_tokens=target_tokens, tokenizer=tokenizer_name, fixed_tokens=fixed_tokens
+    )
+    for name, text in sections:
+        policy = policies.get(name, SectionPolicy(priority=0))
+        allocation.sections.append(
+            SectionAllocation(name=name, priority=policy.priority, requested=tokenizer(text))
+        )
+
+    order = sorted(
+        range(len(allocation.sections)),
+        key=lambda i: (-allocation.sections[i].priority, i),
+    )
+    remaining = available
+    if sum(s.requested for s in allocation.sections) <= available:
+        for s in allocation.sections:
+            s.granted = s.requested
+        remaining = 0
+
+    def grow(limit: Callable[[int], int]) -> None:
+        nonlocal remaining
+        for i in order:
+            s = allocation.sections[i]
+            extra = min(max(0, limit(i) - s.granted), remaining)
+            s.granted += extra
+            remaining -= extra
+
+    def share(i: int, fraction: float) -> int:
+        return min(allocation.sections[i].requested, int(fraction * available))
+
+    def policy_of(i: int) -> SectionPolicy:
+        return policies.get(allocation.sections[i].name, SectionPolicy(priority=0))
+
+    grow(lambda i: share(i, policy_of(i).min_share))
+    grow(lambda i: share(i, policy_of(i).max_share))
+    grow(lambda i: allocation.sections[i].requested)
+
+    for s in allocation.sections:
+        if s.granted >= s.requested:
+            s.action = "kept"
+        elif s.granted == 0:
+            s.action = "dropped"
+        else:
+            s.action = "truncated"
+    return allocation
+
+
+def fit_items(
+    items: Sequence[Tuple[str, str]],
+    max_tokens: int,
+    tokenizer: Tokenizer,
+    keep: str = "head",
+) -> List[Tuple[str, str]]:
+    """Fill max_tokens with (name, text) items in order.
+
+    The first item that does not fit is truncated to the remaining budget;
+    items after it are dropped.
+    """
+    fitted: List[Tuple[str, str]] = []
+    remaining = max_tokens
+    for name, text in items:
+        tokens = tokenizer(text)
+        if tokens <= remaining:
+            fitted.append((name, text))
+            remaining -= tokens
+            continue
+        cut = truncate_to_tokens(text, remaining, tokenizer, keep=keep)
+        if cut:
+            fitted.append((name, cut))
+        break
+    return fitted
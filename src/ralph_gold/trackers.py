@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 import importlib
 import json
 import logging
 import re
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Protocol, Set, Tuple
 
@@ -17,12 +18,14 @@ from .prd import (
     get_quick_batch as prd_get_quick_batch,
     is_markdown_prd,
     select_task_by_id as prd_select_by_id,
+    task_snapshot as prd_task_snapshot,
     task_status_by_id as prd_task_status_by_id,
 )
 from .prd import all_blocked as prd_all_blocked
 from .prd import all_done as prd_all_done
 from .prd import block_task as prd_block_task
 from .prd import force_task_open as prd_force_open
+from .prd import force_tasks_open as prd_force_many_open
 from .prd import is_task_done as prd_is_done
 from .prd import select_next_task as prd_select_next
 from .prd import task_counts as prd_counts
@@ -30,6 +33,128 @@ from .prd import task_counts as prd_counts
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class TrackerSnapshot:
+    """Point-in-time view of a tracker, built from one backend read.
+
+    Attributes:
+        done: Number of completed tasks
+        total: Total number of tasks
+        status_counts: Task count per status (open/done/blocked/...)
+        ready_ids: IDs of open tasks whose dependencies are satisfied
+        next_task: The task `peek_next_task()` would return
+        all_done: Same answer as `all_done()`
+        all_blocked: Same answer as `all_blocked()`
+    """
+
+    done: int = 0
+    total: int = 0
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    ready_ids: List[str] = field(default_factory=list)
+    next_task: Optional[SelectedTask] = None
+    all_done: bool = False
+    all_blocked: bool = False
+
+    def counts(self) -> Tuple[int, int]:
+        return self.done, self.total
+
+
+def _status_counts_of(tracker: Any, done: int, total: int) -> Dict[str, int]:
+    """Status breakdown from `tracker.status_counts()` when it has one.
+
+    Accepts a status -> count mapping or the PRD-style
+    (done, blocked, open, total) tuple. Without it, every unfinished task
+    counts as open.
+    """
+    fn = getattr(tracker, "status_counts", None)
+    if callable(fn):
+        try:
+            raw = fn()
+            if isinstance(raw, dict):
+                return {str(k): int(v) for k, v in raw.items()}
+            if isinstance(raw, (tuple, list)) and len(raw) == 4:
+                done_n, blocked_n, open_n, _total = (int(x) for x in raw)
+                return {"done": done_n, "blocked": blocked_n, "open": open_n}
+        except Exception as e:
+            logger.debug("Tracker status_counts failed: %s", e)
+    return {"done": done, "blocked": 0, "open": max(0, total - done)}
+
+
+def default_snapshot(tracker: Any) -> TrackerSnapshot:
+    """Build a snapshot from the individual Tracker queries.
+
+    Used for trackers (including plugins) that do not implement `snapshot()`.
+    Each query is best effort so a partially implemented tracker still
+    yields a usable snapshot.
+    """
+
+    snap = TrackerSnapshot()
+    try:
+        done, total = tracker.counts()
+        snap.done, snap.total = int(done), int(total)
+    except Exception as e:
+        logger.debug("Tracker counts failed: %s", e)
+    snap.status_counts = _status_counts_of(tracker, snap.done, snap.total)
+    try:
+        snap.next_task = tracker.peek_next_task()
+    except Exception as e:
+        logger.debug("Next task lookup failed: %s", e)
+    if not isinstance(snap.next_task, SelectedTask):
+        snap.next_task = None
+    if snap.next_task is not None:
+        snap.ready_ids = [snap.next_task.id]
+    try:
+        snap.all_done = tracker.all_done() is True
+    except Exception as e:
+        logger.debug("Tracker all_done failed: %s", e)
+    try:
+        snap.all_blocked = tracker.all_blocked() is True
+    except Exception as e:
+        logger.debug("Tracker all_blocked failed: %s", e)
+    return snap
+
+
+# Trackers whose claim_next_task() records nothing: there is no claim to
+# move, so swapping the selected task is just picking another one.
+_CLAIMLESS_KINDS = frozenset({"md", "json", "yaml", "github_issues", "web_analysis"})
+
+
+def swap_claimed_task(
+    tracker: Any, release_id: TaskId, claim_id: TaskId
+) -> Optional[SelectedTask]:
+    """Trade the claimed task `release_id` for `claim_id`.
+
+    Uses `tracker.swap_claim()` when the tracker has one (claiming the new
+    task and releasing the old one atomically). Trackers without claims
+    just look the new task up. Anything else (e.g. Beads, which marks a
+    claim in_progress but cannot undo it) is left alone.
+
+    Returns:
+        The task now held, or None to keep `release_id`
+    """
+    swap = getattr(tracker, "swap_claim", None)
+    if callable(swap):
+        return swap(release_id, claim_id)
+    if getattr(tracker, "kind", None) in _CLAIMLESS_KINDS:
+        return tracker.get_task_by_id(claim_id)
+    return None
+
+
+def tracker_snapshot(tracker: Any) -> TrackerSnapshot:
+    """Return `tracker.snapshot()`, falling back to `default_snapshot`."""
+
+    fn = getattr(tracker, "snapshot", None)
+    if callable(fn):
+        try:
+            snap = fn()
+        except Exception as e:
+            logger.debug("Tracker snapshot failed: %s", e)
+            snap = None
+        if isinstance(snap, TrackerSnapshot):
+            return snap
+    return default_snapshot(tracker)
+
+
 class Tracker(Protocol):
     """Abstraction over different task tracking backends.
 
@@ -38,6 +163,7 @@ class Tracker(Protocol):
     - GitHub Issues tracker (kind="github_issues")
     - Web Analysis tracker (kind="web_analysis")
     - YAML tracker (kind="yaml")
+    - SQLite tracker (kind="sqlite")
     """
 
     kind: str
@@ -78,6 +204,14 @@ class Tracker(Protocol):
         """
         ...
 
+    def snapshot(self) -> TrackerSnapshot:
+        """Return counts, status breakdown, ready tasks and next task at once.
+
+        Trackers without a native implementation are served by
+        `default_snapshot()` via `tracker_snapshot()`.
+        """
+        ...
+
 
 @dataclass
 class FileTracker:
@@ -111,6 +245,10 @@ class FileTracker:
     def force_task_open(self, task_id: TaskId) -> bool:
         return prd_force_open(self.prd_path, task_id)
 
+    def force_tasks_open(self, task_ids: List[TaskId]) -> List[str]:
+        """Reopen several tasks with a single PRD write."""
+        return prd_force_many_open(self.prd_path, task_ids)
+
     def block_task(self, task_id: TaskId, reason: str) -> bool:
         return prd_block_task(self.prd_path, task_id, reason=reason)
 
@@ -126,6 +264,20 @@ class FileTracker:
     def get_quick_batch(self, limit: int = 3) -> Optional[List[SelectedTask]]:
         return prd_get_quick_batch(self.prd_path, limit=limit)
 
+    def snapshot(self) -> TrackerSnapshot:
+        data = prd_task_snapshot(self.prd_path)
+        statuses: Dict[str, int] = data["status_counts"]
+        done = statuses.get("done", 0)
+        return TrackerSnapshot(
+            done=done,
+            total=sum(statuses.values()),
+            status_counts=statuses,
+            ready_ids=[str(x) for x in data["ready_ids"]],
+            next_task=data["next_task"],
+            all_done=data["all_done"],
+            all_blocked=data["all_blocked"],
+        )
+
     def get_parallel_groups(self) -> Dict[str, List[SelectedTask]]:
         """Return all tasks in default group (sequential execution)."""
         # File-based trackers don't support parallel grouping
@@ -141,21 +293,75 @@ class FileTracker:
         return {"default": tasks}
 
 
+_BEADS_DONE_STATUSES = {"done", "closed", "complete", "completed"}
+
+
+def _beads_status(issue: Dict[str, Any]) -> str:
+    """Map a Beads issue status onto the tracker status vocabulary."""
+
+    status = str(issue.get("status", "")).strip().lower()
+    if status in _BEADS_DONE_STATUSES:
+        return "done"
+    if status == "blocked":
+        return "blocked"
+    if status:
+        return "open"
+    return "missing"
+
+
+def _beads_blockers(issue: Dict[str, Any]) -> Optional[List[str]]:
+    """Return the IDs blocking an issue, or None when `bd list` omitted them."""
+
+    deps = issue.get("dependencies")
+    if deps is None:
+        try:
+            count = int(issue.get("dependency_count") or 0)
+        except (TypeError, ValueError):
+            count = 0
+        return None if count else []
+    if not isinstance(deps, list):
+        return None
+    blockers: List[str] = []
+    for dep in deps:
+        if isinstance(dep, dict):
+            if str(dep.get("type") or "blocks") != "blocks":
+                continue
+            target = dep.get("depends_on_id") or dep.get("id")
+        else:
+            target = dep
+        if target:
+            blockers.append(str(target))
+    return blockers
+
+
 @dataclass
 class BeadsTracker:
     """A tracker backed by Beads (steveyegge/beads) via the `bd` CLI.
 
     This is intentionally lightweight: it relies on `bd ready --json`,
-    `bd update <id> --status in_progress`, and `bd close <id>`.
+    `bd list --json`, `bd update <id> --status ...`, and `bd close <id>`.
+
+    Both the ready list and the full issue list are fetched at most once per
+    iteration and cached until the next write (or `refresh()`, which the
+    tracker registry calls at the start of every iteration).
 
     If the repo does not use Beads, do not enable this tracker.
     """
 
     project_root: Path
     ready_args: List[str]
+    list_args: List[str] = field(default_factory=lambda: ["list", "--json"])
 
     kind: str = "beads"
 
+    _ready_cache: Optional[List[Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _list_cache: Optional[List[Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _list_loaded: bool = field(default=False, init=False, repr=False, compare=False)
+
     def _run(self, argv: List[str]) -> subprocess.CompletedProcess[str]:
         return subprocess.run(
             argv,
@@ -165,6 +371,12 @@ class BeadsTracker:
             check=False,
         )
 
+    def refresh(self) -> None:
+        """Drop cached `bd` output so the next query sees current state."""
+        self._ready_cache = None
+        self._list_cache = None
+        self._list_loaded = False
+
     def _ready_json(self) -> Optional[List[Dict[str, Any]]]:
         cp = self._run(["bd", *self.ready_args])
         out = (cp.stdout or "").strip()
@@ -211,23 +423,87 @@ class BeadsTracker:
             issues.append(current)
         return issues
 
-    def _select_next_issue(self) -> Optional[Dict[str, Any]]:
-        issues = self._ready_json()
+    def _ready_issues(self) -> List[Dict[str, Any]]:
+        """Return `bd ready` output, running the CLI at most once per refresh."""
+        if self._ready_cache is None:
+            issues = self._ready_json()
+            if issues is None:
+                issues = self._ready_text()
+            self._ready_cache = issues
+        return self._ready_cache
+
+    def _list_issues(self) -> Optional[List[Dict[str, Any]]]:
+        """Return `bd list --json` output (cached), or None if unavailable."""
+        if not self._list_loaded:
+            self._list_loaded = True
+            self._list_cache = None
+            try:
+                cp = self._run(["bd", *self.list_args])
+            except (OSError, subprocess.SubprocessError) as e:
+                logger.debug("Subprocess failed: %s", e)
+                return None
+            if cp.returncode == 0:
+                try:
+                    obj = json.loads((cp.stdout or "").strip())
+                except json.JSONDecodeError as e:
+                    logger.debug("Failed to parse bd list output: %s", e)
+                    obj = None
+                if isinstance(obj, list):
+                    self._list_cache = [x for x in obj if isinstance(x, dict)]
+        return self._list_cache
+
+    def _listed_issue(self, task_id: TaskId) -> Optional[Dict[str, Any]]:
+        issues = self._list_issues()
         if issues is None:
-            issues = self._ready_text()
+            return None
+        tid = str(task_id)
+        for issue in issues:
+            if str(issue.get("id") or "").strip() == tid:
+                return issue
+        return None
 
-        if not issues:
+    def _show(self, task_id: TaskId) -> Optional[Dict[str, Any]]:
+        cp = self._run(["bd", "show", str(task_id), "--json"])
+        if cp.returncode != 0:
             return None
-        # Heuristic: choose the first issue returned by bd ready (it is already
-        # sorted by priority/age per beads defaults).
-        return issues[0]
+        try:
+            obj = json.loads((cp.stdout or "").strip())
+        except json.JSONDecodeError:
+            return None
+        if isinstance(obj, list) and len(obj) == 1:
+            obj = obj[0]
+        return obj if isinstance(obj, dict) else None
+
+    def _ready_from_list(
+        self, issues: List[Dict[str, Any]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Derive the ready set from `bd list`, or None if dependencies are unknown."""
+        status_by_id = {str(i.get("id") or ""): _beads_status(i) for i in issues}
+        ready: List[Dict[str, Any]] = []
+        for issue in issues:
+            if str(issue.get("status", "")).strip().lower() != "open":
+                continue
+            blockers = _beads_blockers(issue)
+            if blockers is None:
+                return None
+            if all(status_by_id.get(b, "done") == "done" for b in blockers):
+                ready.append(issue)
+
+        def _priority(issue: Dict[str, Any]) -> int:
+            try:
+                return int(issue.get("priority"))
+            except (TypeError, ValueError):
+                return 2
+
+        ready.sort(key=_priority)
+        return ready
 
     def _select_issue(
         self, exclude_ids: Optional[Set[str]] = None
     ) -> Optional[Dict[str, Any]]:
-        issues = self._ready_json()
-        if issues is None:
-            issues = self._ready_text()
+        # Heuristic: choose the first issue returned by bd ready (it is already
+        # sorted by priority/age per beads defaults).
+        issues = self._ready_issues()
         if not issues:
             return None
         exclude = exclude_ids or set()
@@ -261,49 +537,78 @@ class BeadsTracker:
         if task is None:
             return None
         # Mark as in progress (best-effort; ignore errors).
-        self._run(["bd", "update", task.id, "--status", "in_progress", "--json"])
+        self.update_statuses({task.id: "in_progress"})
         return task
 
-    def counts(self) -> Tuple[int, int]:
-        # Beads doesn't have a single "counts" API; keep this lightweight.
-        # Users can rely on `bd stats` for deeper insights.
+    def update_statuses(self, updates: Dict[TaskId, str]) -> List[str]:
+        """Apply status changes with one `bd update` per distinct status.
+
+        Falls back to per-issue updates if the batched call is rejected.
+
+        Args:
+            updates: Mapping of issue ID to new Beads status
+
+        Returns:
+            IDs whose update succeeded
+        """
+        by_status: Dict[str, List[str]] = {}
+        for task_id, status in updates.items():
+            by_status.setdefault(status, []).append(str(task_id))
+
+        updated: List[str] = []
         try:
+            for status, ids in by_status.items():
+                cp = self._run(["bd", "update", *ids, "--status", status, "--json"])
+                if cp.returncode == 0:
+                    updated.extend(ids)
+                    continue
+                if len(ids) == 1:
+                    continue
+                for tid in ids:
+                    cp = self._run(["bd", "update", tid, "--status", status, "--json"])
+                    if cp.returncode == 0:
+                        updated.append(tid)
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug("Subprocess failed: %s", e)
+        finally:
+            self.refresh()
+        return updated
+
+    def counts(self) -> Tuple[int, int]:
+        issues = self._list_issues()
+        if issues is None:
             return 0, 0
-        except (AttributeError, NotImplementedError, OSError) as e:
-            logger.debug("Tracker counts failed: %s", e)
-            return 0, 0
+        done = sum(1 for i in issues if _beads_status(i) == "done")
+        return done, len(issues)
 
     def all_done(self) -> bool:
-        # Unknown without a project-level query.
-        return False
+        issues = self._list_issues()
+        if not issues:
+            # Unknown without a project-level query.
+            return False
+        return all(_beads_status(i) == "done" for i in issues)
 
     def all_blocked(self) -> bool:
-        # Conservative: Beads API doesn't support this query efficiently.
-        return False
+        issues = self._list_issues()
+        if not issues:
+            return False
+        remaining = [i for i in issues if _beads_status(i) != "done"]
+        return bool(remaining) and all(_beads_status(i) == "blocked" for i in remaining)
 
     def is_task_done(self, task_id: TaskId) -> bool:
-        # Best-effort: bd show --json and check status.
-        cp = self._run(["bd", "show", str(task_id), "--json"])
-        if cp.returncode != 0:
-            return False
-        try:
-            obj = json.loads((cp.stdout or "").strip())
-            if isinstance(obj, dict):
-                status = str(obj.get("status", "")).lower()
-                return status in {"done", "closed", "complete", "completed"}
-        except (json.JSONDecodeError, OSError) as e:
-            logger.debug("Tracker operation failed: %s", e)
-            return False
+        return self.get_task_status(task_id) == "done"
 
     def force_task_open(self, task_id: TaskId) -> bool:
         # No direct equivalent. We attempt to reopen.
-        cp = self._run(["bd", "update", str(task_id), "--status", "open", "--json"])
-        return cp.returncode == 0
+        return bool(self.update_statuses({task_id: "open"}))
+
+    def force_tasks_open(self, task_ids: List[TaskId]) -> List[str]:
+        """Reopen several issues with a single `bd update` call."""
+        return self.update_statuses({tid: "open" for tid in task_ids})
 
     def block_task(self, task_id: TaskId, reason: str) -> bool:
         try:
-            cp = self._run(["bd", "update", str(task_id), "--status", "blocked", "--json"])
-            if cp.returncode != 0:
+            if not self.update_statuses({task_id: "blocked"}):
                 return False
             self._run(["bd", "comment", str(task_id), reason])
             return True
@@ -312,35 +617,45 @@ class BeadsTracker:
             return False
 
     def get_task_by_id(self, task_id: TaskId) -> Optional[SelectedTask]:
-        cp = self._run(["bd", "show", str(task_id), "--json"])
-        if cp.returncode != 0:
-            return None
-        try:
-            obj = json.loads((cp.stdout or "").strip())
-        except json.JSONDecodeError:
-            return None
-        if not isinstance(obj, dict):
+        obj = self._listed_issue(task_id) or self._show(task_id)
+        if obj is None:
             return None
         return self._issue_to_task(obj)
 
     def get_task_status(self, task_id: TaskId) -> str:
-        cp = self._run(["bd", "show", str(task_id), "--json"])
-        if cp.returncode != 0:
+        # Issues missing from `bd list` (e.g. filtered or paged out) fall back
+        # to a direct `bd show`.
+        obj = self._listed_issue(task_id) or self._show(task_id)
+        if obj is None:
             return "missing"
-        try:
-            obj = json.loads((cp.stdout or "").strip())
-        except json.JSONDecodeError:
-            return "missing"
-        if not isinstance(obj, dict):
-            return "missing"
-        status = str(obj.get("status", "")).strip().lower()
-        if status in {"done", "closed", "complete", "completed"}:
-            return "done"
-        if status == "blocked":
-            return "blocked"
-        if status:
-            return "open"
-        return "missing"
+        return _beads_status(obj)
+
+    def snapshot(self) -> TrackerSnapshot:
+        issues = self._list_issues()
+        if issues is None:
+            return default_snapshot(self)
+
+        statuses: Dict[str, int] = {}
+        for issue in issues:
+            status = _beads_status(issue)
+            statuses[status] = statuses.get(status, 0) + 1
+
+        ready = self._ready_from_list(issues)
+        if ready is None:
+            ready = self._ready_issues()
+        ready_tasks = [t for t in (self._issue_to_task(i) for i in ready) if t]
+
+        done = statuses.get("done", 0)
+        remaining = len(issues) - done
+        return TrackerSnapshot(
+            done=done,
+            total=len(issues),
+            status_counts=statuses,
+            ready_ids=[t.id for t in ready_tasks],
+            next_task=ready_tasks[0] if ready_tasks else None,
+            all_done=bool(issues) and remaining == 0,
+            all_blocked=remaining > 0 and statuses.get("blocked", 0) == remaining,
+        )
 
     def branch_name(self) -> Optional[str]:
         return None
@@ -353,17 +668,31 @@ class BeadsTracker:
         return None
 
     def get_parallel_groups(self) -> Dict[str, List[SelectedTask]]:
-        """Return all tasks in default group (sequential execution)."""
-        # Beads tracker doesn't support parallel grouping
-        # Return all ready tasks in a single "default" group
-        tasks: List[SelectedTask] = []
+        """Return ready issues grouped by their "group:*" label.
+
+        Issues without a group label go to the "default" group.
+        """
+        groups: Dict[str, List[SelectedTask]] = {}
         try:
-            task = self.peek_next_task()
-            if task:
-                tasks.append(task)
+            issues = self._list_issues()
+            ready = self._ready_from_list(issues) if issues is not None else None
+            if ready is None:
+                ready = self._ready_issues()
         except (OSError, subprocess.SubprocessError) as e:
             logger.debug("Subprocess failed: %s", e)
-        return {"default": tasks}
+            return {"default": []}
+
+        for issue in ready:
+            task = self._issue_to_task(issue)
+            if task is None:
+                continue
+            group = "default"
+            for label in issue.get("labels") or []:
+                if isinstance(label, str) and label.startswith("group:"):
+                    group = label.split(":", 1)[1].strip() or "default"
+                    break
+            groups.setdefault(group, []).append(task)
+        return groups or {"default": []}
 
 
 def _load_plugin(path: str, cfg: Config, project_root: Path) -> Tracker:
@@ -386,12 +715,56 @@ def _load_plugin(path: str, cfg: Config, project_root: Path) -> Tracker:
     return tracker  # type: ignore[return-value]
 
 
-def make_tracker(project_root: Path, cfg: Config) -> Tracker:
-    """Instantiate the configured tracker."""
+# Built-in tracker instances keyed by (project root, tracker config hash).
+_TRACKER_REGISTRY: Dict[Tuple[str, str], Tracker] = {}
+
+
+def _registry_key(project_root: Path, cfg: Config) -> Tuple[str, str]:
+    material = repr((cfg.tracker, cfg.files.prd))
+    digest = hashlib.sha256(material.encode("utf-8")).hexdigest()
+    return str(project_root.resolve()), digest
+
+
+def clear_tracker_registry() -> None:
+    """Forget all reusable tracker instances, closing those that hold connections."""
+    trackers = list(_TRACKER_REGISTRY.values())
+    _TRACKER_REGISTRY.clear()
+    for tracker in trackers:
+        close = getattr(tracker, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logger.debug("Tracker close failed: %s", e)
+
+
+def make_tracker(project_root: Path, cfg: Config, reuse: bool = True) -> Tracker:
+    """Instantiate the configured tracker.
+
+    Built-in trackers are reused per (project root, tracker config); a cached
+    instance is refreshed (if it has a `refresh()` method) instead of being
+    rebuilt. Plugin trackers are always constructed fresh because their
+    internal state is unknown.
+    """
 
     if cfg.tracker.plugin:
         return _load_plugin(cfg.tracker.plugin, cfg=cfg, project_root=project_root)
 
+    key = _registry_key(project_root, cfg)
+    if reuse:
+        cached = _TRACKER_REGISTRY.get(key)
+        if cached is not None:
+            refresh = getattr(cached, "refresh", None)
+            if callable(refresh):
+                refresh()
+            return cached
+
+    tracker = _build_tracker(project_root, cfg)
+    _TRACKER_REGISTRY[key] = tracker
+    return tracker
+
+
+def _build_tracker(project_root: Path, cfg: Config) -> Tracker:
     kind = (cfg.tracker.kind or "auto").strip().lower()
     prd_path = (project_root / cfg.files.prd).resolve()
 
@@ -399,6 +772,8 @@ def make_tracker(project_root: Path, cfg: Config) -> Tracker:
         # Auto-detect based on file extension
         if prd_path.suffix in {".yaml", ".yml"}:
             kind = "yaml"
+        elif prd_path.suffix.lower() in {".db", ".sqlite", ".sqlite3"}:
+            kind = "sqlite"
         elif is_markdown_prd(prd_path):
             kind = "markdown"
         else:
@@ -413,6 +788,11 @@ def make_tracker(project_root: Path, cfg: Config) -> Tracker:
 
         return YamlTracker(prd_path=prd_path)
 
+    if kind in {"sqlite", "sqlite3"}:
+        from .trackers.sqlite_tracker import SqliteTracker
+
+        return SqliteTracker(prd_path=prd_path)
+
     if kind in {"beads", "bd"}:
         # Prefer JSON output to avoid parsing.
         return BeadsTracker(project_root=project_root, ready_args=["ready", "--json"])
@@ -458,6 +838,8 @@ def make_tracker(project_root: Path, cfg: Config) -> Tracker:
                 normalize_hashes=web_cfg.normalize_hashes,
                 headless_nav=web_cfg.headless_nav,
                 cache_ttl_seconds=web_cfg.cache_ttl_seconds,
+                max_concurrency=web_cfg.max_concurrency,
+                headless_pages=web_cfg.headless_pages,
                 output_path=web_cfg.output_path,
             )
         else:
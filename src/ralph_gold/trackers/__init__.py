@@ -6,6 +6,7 @@ backends for task tracking:
 - FileTracker: File-based tracker for Markdown/JSON PRDs (legacy)
 - BeadsTracker: Tracker backed by Beads CLI
 - YamlTracker: YAML-based tracker with native parallel grouping support
+- SqliteTracker: SQLite-backed tracker for large, concurrently-accessed backlogs
 - GitHubIssuesTracker: GitHub Issues-based tracker
 - WebTracker: Web Analysis tracker for discovering web-related tasks
 
@@ -40,17 +41,29 @@ def _load_trackers_module() -> ModuleType:
 
 if TYPE_CHECKING:
     from ralph_gold.trackers import BeadsTracker, FileTracker, Tracker
-    from ralph_gold.trackers import make_tracker
+    from ralph_gold.trackers import TrackerSnapshot, default_snapshot, tracker_snapshot
+    from ralph_gold.trackers import swap_claimed_task
+    from ralph_gold.trackers import clear_tracker_registry, make_tracker
 else:
     _mod = _load_trackers_module()
     Tracker = _mod.Tracker
+    TrackerSnapshot = _mod.TrackerSnapshot
     FileTracker = _mod.FileTracker
     BeadsTracker = _mod.BeadsTracker
+    default_snapshot = _mod.default_snapshot
+    tracker_snapshot = _mod.tracker_snapshot
+    swap_claimed_task = _mod.swap_claimed_task
     make_tracker = _mod.make_tracker
+    clear_tracker_registry = _mod.clear_tracker_registry
 
 __all__: list[str] = [
     "Tracker",
+    "TrackerSnapshot",
     "FileTracker",
     "BeadsTracker",
+    "default_snapshot",
+    "tracker_snapshot",
+    "swap_claimed_task",
     "make_tracker",
+    "clear_tracker_registry",
 ]
@@ -4,6 +4,7 @@ This tracker fetches issues from a GitHub repository and uses them as tasks.
 It supports:
 - Label-based filtering (include/exclude)
 - Local caching with TTL to reduce API calls
+- Incremental sync: `Link` pagination, `since=` deltas and ETag revalidation
 - Rate limit detection and handling
 - Priority sorting (milestone, then created_at)
 - Parallel grouping via "group:*" labels
@@ -14,16 +15,110 @@ from __future__ import annotations
 import json
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlencode
 
-from ..github_auth import GitHubAuth, GitHubAuthError, create_auth
+from ..atomic_file import atomic_write_json
+from ..github_auth import GitHubAuth, GitHubAuthError, GitHubResponse, create_auth
 from ..prd import SelectedTask, TaskId
 
 logger = logging.getLogger(__name__)
 
+_CACHE_VERSION = 2
+_PER_PAGE = 100
+# Safety valve against a server that keeps returning `rel="next"`.
+_MAX_PAGES = 1000
+
+
+@dataclass
+class _CacheEntry:
+    """Parsed cache file plus an issue-number index, keyed by file signature."""
+
+    signature: Tuple[int, int, int]
+    data: Dict[str, Any]
+    index: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class _Mutation:
+    """One issue mutation plus the messages logged around it."""
+
+    issue_number: str
+    method: str
+    endpoint: str
+    data: Optional[Dict[str, Any]]
+    start: str
+    success: str
+    failure: str
+
+
+# Parsed caches shared by every tracker instance in this process.
+_CACHE_MEMO: Dict[Path, _CacheEntry] = {}
+
+
+def _cache_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+def _make_entry(signature: Tuple[int, int, int], data: Dict[str, Any]) -> _CacheEntry:
+    issues = data.get("issues", [])
+    index = {
+        str(issue.get("number")): issue
+        for issue in (issues if isinstance(issues, list) else [])
+        if isinstance(issue, dict)
+    }
+    return _CacheEntry(signature=signature, data=data, index=index)
+
+
+def _load_cache_entry(path: Path) -> Optional[_CacheEntry]:
+    """Return the parsed cache at `path`, re-reading only when it changed."""
+    signature = _cache_signature(path)
+    if signature is None:
+        _CACHE_MEMO.pop(path, None)
+        return None
+    entry = _CACHE_MEMO.get(path)
+    if entry is not None and entry.signature == signature:
+        return entry
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.debug("Failed to read GitHub cache %s: %s", path, e)
+        _CACHE_MEMO.pop(path, None)
+        return None
+    if not isinstance(data, dict):
+        return None
+    entry = _make_entry(signature, data)
+    _CACHE_MEMO[path] = entry
+    return entry
+
+
+def _store_cache_entry(path: Path, data: Dict[str, Any]) -> None:
+    atomic_write_json(path, data)
+    signature = _cache_signature(path)
+    if signature is not None:
+        _CACHE_MEMO[path] = _make_entry(signature, data)
+
+
+def _http_date_to_iso(value: Optional[str]) -> str:
+    """Convert an HTTP `Date` header to the ISO form `since=` expects."""
+    when: Optional[datetime] = None
+    if value:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            when = None
+    if when is None:
+        when = datetime.now(timezone.utc)
+    return when.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
 
 @dataclass
 class GitHubIssuesTracker:
@@ -99,19 +194,30 @@ class GitHubIssuesTracker:
         """Return tracker kind identifier."""
         return "github_issues"
 
+    def close(self) -> None:
+        """Close the auth's pooled connections (reopened on next use)."""
+        self.auth.close()
+
+    def _cache_state(self) -> Optional[Dict[str, Any]]:
+        """Return the parsed cache file, parsing it at most once per change.
+
+        Returns:
+            Cache dictionary, or None if missing or unreadable
+        """
+        entry = _load_cache_entry(self.cache_path)
+        return entry.data if entry is not None else None
+
     def _cache_is_fresh(self) -> bool:
         """Check if cache is fresh (within TTL).
 
         Returns:
             True if cache exists and is fresh, False otherwise
         """
-        if not self.cache_path.exists():
+        cache_data = self._cache_state()
+        if cache_data is None:
             return False
 
         try:
-            with open(self.cache_path, "r") as f:
-                cache_data = json.load(f)
-
             cached_at = cache_data.get("cached_at")
             if not cached_at:
                 return False
@@ -122,7 +228,7 @@ class GitHubIssuesTracker:
 
             return age.total_seconds() < self.cache_ttl_seconds
 
-        except (json.JSONDecodeError, ValueError, KeyError):
+        except (AttributeError, TypeError, ValueError):
             return False
 
     def _load_cache(self) -> List[Dict[str, Any]]:
@@ -131,81 +237,87 @@ class GitHubIssuesTracker:
         Returns:
             List of cached issue dictionaries
         """
-        if not self.cache_path.exists():
+        cache_data = self._cache_state()
+        if cache_data is None:
             return []
+        issues = cache_data.get("issues", [])
+        return issues if isinstance(issues, list) else []
 
-        try:
-            with open(self.cache_path, "r") as f:
-                cache_data = json.load(f)
-            return cache_data.get("issues", [])
-        except (json.JSONDecodeError, ValueError):
-            return []
-
-    def _save_cache(self, issues: List[Dict[str, Any]]) -> None:
+    def _save_cache(
+        self,
+        issues: List[Dict[str, Any]],
+        since: Optional[str] = None,
+        etags: Optional[Dict[str, str]] = None,
+    ) -> None:
         """Save issues to cache.
 
         Args:
             issues: List of issue dictionaries to cache
+            since: High-water mark (`updated_at`) for the next delta sync
+            etags: ETags of delta queries, keyed by request URL
         """
-        cache_data = {
+        cache_data: Dict[str, Any] = {
+            "version": _CACHE_VERSION,
             "cached_at": datetime.now().isoformat(),
             "repo": self.repo,
+            "query": self._query_key(),
+            "since": since,
+            "etags": etags or {},
             "issues": issues,
         }
+        _store_cache_entry(self.cache_path, cache_data)
 
-        with open(self.cache_path, "w") as f:
-            json.dump(cache_data, f, indent=2)
+    def _query_key(self) -> Dict[str, Any]:
+        """Describe the issue filter so a config change forces a full sync."""
+        return {
+            "repo": self.repo,
+            "labels": self.label_filter,
+            "exclude": sorted(self.exclude_labels),
+        }
+
+    def _keep_issue(self, issue: Dict[str, Any], require_labels: bool) -> bool:
+        """Apply the tracker's filters to one issue from the API.
+
+        Args:
+            issue: Issue dictionary from GitHub API
+            require_labels: Check `label_filter` locally (delta queries are
+                not label-filtered server-side)
+        """
+        # Skip pull requests (they appear as issues in the API)
+        if "pull_request" in issue:
+            return False
+        issue_labels = [
+            label["name"] if isinstance(label, dict) else str(label)
+            for label in issue.get("labels", [])
+        ]
+        if any(excluded in issue_labels for excluded in self.exclude_labels):
+            return False
+        if require_labels and self.label_filter:
+            wanted = [x.strip() for x in self.label_filter.split(",") if x.strip()]
+            if not all(label in issue_labels for label in wanted):
+                return False
+        return True
 
     def _sync_cache(self) -> None:
         """Fetch issues from GitHub and update cache.
 
         Only fetches if cache is stale. Handles rate limits gracefully.
+
+        With a full `GitHubAuth` implementation the sync is incremental:
+        the first sync walks every page (`Link` headers), later syncs only
+        ask for issues updated since the last one and send `If-None-Match`
+        so an unchanged result costs a `304` and no rate limit. Auth
+        objects that only provide `api_call()` get a single-page fetch.
         """
         # Check if cache is fresh
         if self._cache_is_fresh():
             return
 
         try:
-            # Fetch issues from GitHub
-            endpoint = f"/repos/{self.repo}/issues"
-
-            # Build query parameters
-            params = []
-            if self.label_filter:
-                params.append(f"labels={self.label_filter}")
-            params.append("state=open")
-            params.append("per_page=100")  # Fetch up to 100 issues
-
-            if params:
-                endpoint += "?" + "&".join(params)
-
-            # Make API call
-            issues = self.auth.api_call("GET", endpoint)
-
-            # Ensure we got a list
-            if not isinstance(issues, list):
-                issues = []
-
-            # Filter out excluded labels
-            filtered_issues = []
-            for issue in issues:
-                # Skip pull requests (they appear as issues in the API)
-                if "pull_request" in issue:
-                    continue
-
-                # Check for excluded labels
-                issue_labels = [
-                    label["name"] if isinstance(label, dict) else str(label)
-                    for label in issue.get("labels", [])
-                ]
-
-                if any(excluded in issue_labels for excluded in self.exclude_labels):
-                    continue
-
-                filtered_issues.append(issue)
-
-            # Save to cache
-            self._save_cache(filtered_issues)
+            if isinstance(self.auth, GitHubAuth):
+                self._sync_incremental()
+            else:
+                self._sync_single_page()
 
         except GitHubAuthError:
             # If sync fails, use cached data if available
@@ -217,6 +329,114 @@ class GitHubIssuesTracker:
                 # No cache available, re-raise error
                 raise
 
+    def _sync_single_page(self) -> None:
+        """Fetch the first 100 matching open issues with `api_call()`."""
+        params: Dict[str, Any] = {}
+        if self.label_filter:
+            params["labels"] = self.label_filter
+        params["state"] = "open"
+        params["per_page"] = _PER_PAGE
+
+        issues = self.auth.api_call(
+            "GET", f"/repos/{self.repo}/issues?{urlencode(params, safe=',:')}"
+        )
+
+        # Ensure we got a list
+        if not isinstance(issues, list):
+            issues = []
+
+        self._save_cache(
+            [i for i in issues if isinstance(i, dict) and self._keep_issue(i, False)]
+        )
+
+    def _sync_incremental(self) -> None:
+        """Full paginated sync on first use, `since=` delta syncs afterwards."""
+        state = self._cache_state()
+        if (
+            state is None
+            or state.get("version") != _CACHE_VERSION
+            or state.get("query") != self._query_key()
+            or not state.get("since")
+        ):
+            self._sync_full()
+            return
+
+        since = str(state["since"])
+        etags: Dict[str, str] = dict(state.get("etags") or {})
+        params = {
+            "state": "all",
+            "since": since,
+            "sort": "updated",
+            "direction": "desc",
+            "per_page": _PER_PAGE,
+        }
+        first_url = f"/repos/{self.repo}/issues?{urlencode(params, safe=',:')}"
+
+        # Newest updates come first, so an unchanged first page means nothing
+        # changed since the last sync.
+        headers = {"If-None-Match": etags[first_url]} if first_url in etags else None
+        response = self.auth.request("GET", first_url, headers=headers)
+        if response.not_modified:
+            self._log_api_call("INFO", "Issue delta unchanged (304)")
+            self._save_cache(self._load_cache(), since=since, etags=etags)
+            return
+
+        by_number: Dict[str, Dict[str, Any]] = {
+            str(issue.get("number")): issue for issue in self._load_cache()
+        }
+        new_since = since
+        for page in self._iter_pages(response):
+            for issue in page:
+                number = str(issue.get("number"))
+                by_number.pop(number, None)
+                updated_at = str(issue.get("updated_at") or "")
+                if updated_at > new_since:
+                    new_since = updated_at
+                if str(issue.get("state", "open")).lower() != "open":
+                    continue
+                if self._keep_issue(issue, require_labels=True):
+                    by_number[number] = issue
+
+        new_etags: Dict[str, str] = {}
+        if response.etag and new_since == since:
+            new_etags[first_url] = response.etag
+        self._save_cache(list(by_number.values()), since=new_since, etags=new_etags)
+
+    def _sync_full(self) -> None:
+        """Fetch every matching open issue, following `Link` pagination."""
+        params: Dict[str, Any] = {}
+        if self.label_filter:
+            params["labels"] = self.label_filter
+        params["state"] = "open"
+        params["per_page"] = _PER_PAGE
+
+        response = self.auth.request(
+            "GET", f"/repos/{self.repo}/issues?{urlencode(params, safe=',:')}"
+        )
+        issues: List[Dict[str, Any]] = []
+        since = ""
+        for page in self._iter_pages(response):
+            for issue in page:
+                since = max(since, str(issue.get("updated_at") or ""))
+                if self._keep_issue(issue, require_labels=False):
+                    issues.append(issue)
+
+        if not since:
+            since = _http_date_to_iso(response.headers.get("date"))
+        self._save_cache(issues, since=since)
+
+    def _iter_pages(self, response: GitHubResponse) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the issues of `response` and every following page."""
+        pages = 0
+        while True:
+            data = response.data
+            yield [i for i in data if isinstance(i, dict)] if isinstance(data, list) else []
+            pages += 1
+            next_url = response.next_url
+            if not next_url or pages >= _MAX_PAGES:
+                return
+            response = self.auth.request("GET", next_url)
+
     def _extract_group_from_labels(self, labels: List[Any]) -> str:
         """Extract parallel group from issue labels.
 
@@ -377,6 +597,22 @@ class GitHubIssuesTracker:
         issues = self._load_cache()
         return (0, len(issues))
 
+    def status_counts(self) -> Dict[str, int]:
+        """Return open issues split by the "blocked" label.
+
+        Closed issues are not cached, so "done" is always 0 (as in counts()).
+        """
+        self._sync_cache()
+        blocked = 0
+        issues = self._load_cache()
+        for issue in issues:
+            labels = issue.get("labels", [])
+            if isinstance(labels, list) and any(
+                isinstance(lbl, dict) and lbl.get("name") == "blocked" for lbl in labels
+            ):
+                blocked += 1
+        return {"done": 0, "blocked": blocked, "open": len(issues) - blocked}
+
     def all_done(self) -> bool:
         """Check if all tasks are completed.
 
@@ -419,15 +655,8 @@ class GitHubIssuesTracker:
         Returns:
             True if issue is closed (not in cache)
         """
-        self._sync_cache()
-        issues = self._load_cache()
-
         # If issue is not in cache, it's either closed or doesn't exist
-        for issue in issues:
-            if str(issue.get("number")) == str(task_id):
-                return False  # Issue is open
-
-        return True  # Issue not found in open issues
+        return self._find_open_issue(task_id) is None
 
     def force_task_open(self, task_id: TaskId) -> bool:
         """Force a task to be marked as open.
@@ -456,12 +685,10 @@ class GitHubIssuesTracker:
     def _find_open_issue(self, task_id: TaskId) -> Optional[Dict[str, Any]]:
         """Find an issue in the current open-issues cache."""
         self._sync_cache()
-        issues = self._load_cache()
-        tid = str(task_id)
-        for issue in issues:
-            if str(issue.get("number")) == tid:
-                return issue
-        return None
+        entry = _load_cache_entry(self.cache_path)
+        if entry is None:
+            return None
+        return entry.index.get(str(task_id))
 
     def _fetch_issue(self, task_id: TaskId) -> Optional[Dict[str, Any]]:
         """Fetch issue (open or closed) directly from GitHub API."""
@@ -581,35 +808,68 @@ class GitHubIssuesTracker:
         Returns:
             True if all operations succeeded, False if any failed
         """
-        success = True
-        issue_number = str(task_id)
+        results = self.mark_tasks_done(
+            [task_id],
+            close_issue=close_issue,
+            add_comment=add_comment,
+            comment_body=comment_body,
+            add_labels=add_labels,
+            remove_labels=remove_labels,
+            commit_sha=commit_sha,
+        )
+        return results.get(str(task_id), False)
 
-        try:
-            # Close the issue if requested
-            if close_issue:
-                success = success and self._close_issue(issue_number)
+    def mark_tasks_done(
+        self,
+        task_ids: List[TaskId],
+        close_issue: bool = True,
+        add_comment: bool = True,
+        comment_body: Optional[str] = None,
+        add_labels: Optional[List[str]] = None,
+        remove_labels: Optional[List[str]] = None,
+        commit_sha: Optional[str] = None,
+    ) -> Dict[str, bool]:
+        """Mark several tasks done, sending all side effects as one batch.
 
-            # Add completion comment if requested
-            if add_comment:
-                if comment_body is None:
-                    comment_body = self._generate_completion_comment(commit_sha)
-                success = success and self._add_comment(issue_number, comment_body)
+        Takes the same options as `mark_task_done()`. All mutations go
+        through `GitHubAuth.batch()`: each issue's mutations are sent in
+        order, while different issues run concurrently over the auth's
+        connection pool instead of one round trip at a time.
 
-            # Manage labels
+        Returns:
+            Mapping of issue number to whether all of its operations succeeded
+        """
+        if add_comment and comment_body is None:
+            comment_body = self._generate_completion_comment(commit_sha)
+
+        mutations: List[_Mutation] = []
+        for task_id in task_ids:
+            issue_number = str(task_id)
+            if close_issue:
+                mutations.append(self._close_mutation(issue_number))
+            if add_comment:
+                mutations.append(self._comment_mutation(issue_number, comment_body or ""))
             if add_labels:
-                success = success and self._add_labels(issue_number, add_labels)
-            if remove_labels:
-                success = success and self._remove_labels(issue_number, remove_labels)
+                mutations.append(self._add_labels_mutation(issue_number, add_labels))
+            for label in remove_labels or []:
+                mutations.append(self._remove_label_mutation(issue_number, label))
 
-            # Invalidate cache to force refresh on next sync
-            if success:
-                self._invalidate_cache()
+        results = {str(task_id): True for task_id in task_ids}
+        try:
+            outcomes = self._run_mutations(mutations)
+        except (GitHubAuthError, json.JSONDecodeError, OSError, RuntimeError) as e:
+            logger.error("Failed to mark tasks %s as done: %s", list(results), e)
+            return {tid: False for tid in results}
 
-            return success
+        for mutation, ok in zip(mutations, outcomes):
+            if not ok:
+                results[mutation.issue_number] = False
 
-        except (GitHubAuthError, json.JSONDecodeError, OSError, RuntimeError) as e:
-            logger.error("Failed to mark task %s as done: %s", task_id, e)
-            return False
+        # Invalidate cache to force refresh on next sync
+        if any(results.values()):
+            self._invalidate_cache()
+
+        return results
 
     def _log_api_call(self, level: str, message: str) -> None:
         """Log an API call to a file for debugging."""
@@ -626,6 +886,91 @@ class GitHubIssuesTracker:
         except OSError as e:
             logger.debug("Failed to write API call log: %s", e)
 
+    def _run_mutations(self, mutations: List[_Mutation]) -> List[bool]:
+        """Send mutations and log each outcome.
+
+        Uses `GitHubAuth.batch()` when available; auth objects that only
+        implement `api_call()` get the calls one at a time.
+
+        Returns:
+            Success flag per mutation, in order
+        """
+        if not mutations:
+            return []
+        for m in mutations:
+            self._log_api_call("INFO", m.start)
+
+        calls = [(m.method, m.endpoint, m.data) for m in mutations]
+        outcomes: List[Any]
+        if isinstance(self.auth, GitHubAuth):
+            # Same-issue mutations stay in order (close before label edits,
+            # comment before its follow-ups); distinct issues run concurrently.
+            outcomes = self.auth.batch(calls, keys=[m.issue_number for m in mutations])
+        else:
+            outcomes = []
+            for method, endpoint, data in calls:
+                try:
+                    if data is None:
+                        outcomes.append(self.auth.api_call(method, endpoint))
+                    else:
+                        outcomes.append(self.auth.api_call(method, endpoint, data))
+                except GitHubAuthError as e:
+                    outcomes.append(e)
+
+        flags: List[bool] = []
+        for m, outcome in zip(mutations, outcomes):
+            if isinstance(outcome, GitHubAuthError):
+                self._log_api_call("ERROR", f"{m.failure}: {outcome}")
+                flags.append(False)
+            else:
+                self._log_api_call("INFO", m.success)
+                flags.append(True)
+        return flags
+
+    def _close_mutation(self, issue_number: str) -> _Mutation:
+        return _Mutation(
+            issue_number=issue_number,
+            method="PATCH",
+            endpoint=f"/repos/{self.repo}/issues/{issue_number}",
+            data={"state": "closed"},
+            start=f"Closing issue #{issue_number}",
+            success=f"Successfully closed issue #{issue_number}",
+            failure=f"Failed to close issue #{issue_number}",
+        )
+
+    def _comment_mutation(self, issue_number: str, body: str) -> _Mutation:
+        return _Mutation(
+            issue_number=issue_number,
+            method="POST",
+            endpoint=f"/repos/{self.repo}/issues/{issue_number}/comments",
+            data={"body": body},
+            start=f"Adding comment to issue #{issue_number}",
+            success=f"Successfully added comment to issue #{issue_number}",
+            failure=f"Failed to add comment to issue #{issue_number}",
+        )
+
+    def _add_labels_mutation(self, issue_number: str, labels: List[str]) -> _Mutation:
+        return _Mutation(
+            issue_number=issue_number,
+            method="POST",
+            endpoint=f"/repos/{self.repo}/issues/{issue_number}/labels",
+            data={"labels": labels},
+            start=f"Adding labels {labels} to issue #{issue_number}",
+            success=f"Successfully added labels to issue #{issue_number}",
+            failure=f"Failed to add labels to issue #{issue_number}",
+        )
+
+    def _remove_label_mutation(self, issue_number: str, label: str) -> _Mutation:
+        return _Mutation(
+            issue_number=issue_number,
+            method="DELETE",
+            endpoint=f"/repos/{self.repo}/issues/{issue_number}/labels/{label}",
+            data=None,
+            start=f"Removing label '{label}' from issue #{issue_number}",
+            success=f"Successfully removed label '{label}' from issue #{issue_number}",
+            failure=f"Failed to remove label '{label}' from issue #{issue_number}",
+        )
+
     def _close_issue(self, issue_number: str) -> bool:
         """Close a GitHub issue.
 
@@ -635,19 +980,7 @@ class GitHubIssuesTracker:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            endpoint = f"/repos/{self.repo}/issues/{issue_number}"
-            data = {"state": "closed"}
-
-            self._log_api_call("INFO", f"Closing issue #{issue_number}")
-            self.auth.api_call("PATCH", endpoint, data)
-            self._log_api_call("INFO", f"Successfully closed issue #{issue_number}")
-
-            return True
-
-        except GitHubAuthError as e:
-            self._log_api_call("ERROR", f"Failed to close issue #{issue_number}: {e}")
-            return False
+        return self._run_mutations([self._close_mutation(issue_number)])[0]
 
     def _add_comment(self, issue_number: str, body: str) -> bool:
         """Add a comment to a GitHub issue.
@@ -659,23 +992,7 @@ class GitHubIssuesTracker:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            endpoint = f"/repos/{self.repo}/issues/{issue_number}/comments"
-            data = {"body": body}
-
-            self._log_api_call("INFO", f"Adding comment to issue #{issue_number}")
-            self.auth.api_call("POST", endpoint, data)
-            self._log_api_call(
-                "INFO", f"Successfully added comment to issue #{issue_number}"
-            )
-
-            return True
-
-        except GitHubAuthError as e:
-            self._log_api_call(
-                "ERROR", f"Failed to add comment to issue #{issue_number}: {e}"
-            )
-            return False
+        return self._run_mutations([self._comment_mutation(issue_number, body)])[0]
 
     def _add_labels(self, issue_number: str, labels: List[str]) -> bool:
         """Add labels to a GitHub issue.
@@ -687,25 +1004,7 @@ class GitHubIssuesTracker:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            endpoint = f"/repos/{self.repo}/issues/{issue_number}/labels"
-            data = {"labels": labels}
-
-            self._log_api_call(
-                "INFO", f"Adding labels {labels} to issue #{issue_number}"
-            )
-            self.auth.api_call("POST", endpoint, data)
-            self._log_api_call(
-                "INFO", f"Successfully added labels to issue #{issue_number}"
-            )
-
-            return True
-
-        except GitHubAuthError as e:
-            self._log_api_call(
-                "ERROR", f"Failed to add labels to issue #{issue_number}: {e}"
-            )
-            return False
+        return self._run_mutations([self._add_labels_mutation(issue_number, labels)])[0]
 
     def _remove_labels(self, issue_number: str, labels: List[str]) -> bool:
         """Remove labels from a GitHub issue.
@@ -717,29 +1016,8 @@ class GitHubIssuesTracker:
         Returns:
             True if all removals successful, False if any failed
         """
-        success = True
-
-        for label in labels:
-            try:
-                endpoint = f"/repos/{self.repo}/issues/{issue_number}/labels/{label}"
-
-                self._log_api_call(
-                    "INFO", f"Removing label '{label}' from issue #{issue_number}"
-                )
-                self.auth.api_call("DELETE", endpoint)
-                self._log_api_call(
-                    "INFO",
-                    f"Successfully removed label '{label}' from issue #{issue_number}",
-                )
-
-            except GitHubAuthError as e:
-                self._log_api_call(
-                    "ERROR",
-                    f"Failed to remove label '{label}' from issue #{issue_number}: {e}",
-                )
-                success = False
-
-        return success
+        mutations = [self._remove_label_mutation(issue_number, label) for label in labels]
+        return all(self._run_mutations(mutations))
 
     def _generate_completion_comment(self, commit_sha: Optional[str] = None) -> str:
         """Generate a default completion comment.
@@ -763,18 +1041,18 @@ class GitHubIssuesTracker:
         return "\n".join(lines)
 
     def _invalidate_cache(self) -> None:
-        """Invalidate the cache to force refresh on next sync."""
-        if self.cache_path.exists():
-            try:
-                # Set cached_at to a very old timestamp
-                with open(self.cache_path, "r") as f:
-                    cache_data = json.load(f)
-
-                cache_data["cached_at"] = "2000-01-01T00:00:00"
+        """Invalidate the cache to force refresh on next sync.
 
-                with open(self.cache_path, "w") as f:
-                    json.dump(cache_data, f, indent=2)
-
-            except (json.JSONDecodeError, ValueError, KeyError):
-                # If cache is corrupted, just delete it
-                self.cache_path.unlink()
+        Sync state (high-water mark, ETags) is kept so the refresh is a
+        delta query rather than a full re-download.
+        """
+        cache_data = self._cache_state()
+        if cache_data is not None:
+            cache_data = dict(cache_data)
+            # Set cached_at to a very old timestamp
+            cache_data["cached_at"] = "2000-01-01T00:00:00"
+            _store_cache_entry(self.cache_path, cache_data)
+        elif self.cache_path.exists():
+            # If cache is corrupted, just delete it
+            self.cache_path.unlink()
+            _CACHE_MEMO.pop(self.cache_path, None)
@@ -0,0 +1,607 @@
+"""SQLite-backed task tracker for large, concurrently-accessed backlogs."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..prd import SelectedTask, TaskId
+from . import TrackerSnapshot
+
+logger = logging.getLogger(__name__)
+
+SQLITE_SUFFIXES = frozenset({".db", ".sqlite", ".sqlite3"})
+
+SCHEMA_VERSION = 1
+
+# Tasks default to this priority, matching JSON PRD stories.
+_DEFAULT_PRIORITY = 10_000
+
+# Separator for group_concat'ed dependency lists (ASCII unit separator).
+_SEP = "\x1f"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS groups (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'open'
+        CHECK (status IN ('open', 'done', 'blocked')),
+    group_id INTEGER NOT NULL REFERENCES groups(id),
+    priority INTEGER NOT NULL DEFAULT 10000,
+    is_quick INTEGER NOT NULL DEFAULT 0,
+    description TEXT,
+    acceptance TEXT NOT NULL DEFAULT '[]',
+    blocked_reason TEXT,
+    claimed_by TEXT,
+    claimed_at REAL,
+    completed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_ready ON tasks (status, priority, seq);
+CREATE INDEX IF NOT EXISTS idx_tasks_group ON tasks (group_id, status);
+CREATE TABLE IF NOT EXISTS deps (
+    task_seq INTEGER NOT NULL REFERENCES tasks(seq) ON DELETE CASCADE,
+    depends_on TEXT NOT NULL,
+    PRIMARY KEY (task_seq, depends_on)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_deps_depends_on ON deps (depends_on);
+"""
+
+_TASK_COLUMNS = """
+    t.id, t.title, g.name, t.is_quick, t.acceptance,
+    (SELECT group_concat(d.depends_on, char(31)) FROM deps d WHERE d.task_seq = t.seq)
+"""
+
+# Open tasks whose dependencies are all finished (done or blocked) and
+# that are not leased to another worker.
+_READY_WHERE = """
+    t.status = 'open'
+    AND (t.claimed_by IS NULL OR t.claimed_by = :owner OR t.claimed_at < :stale)
+    AND NOT EXISTS (
+        SELECT 1 FROM deps d
+        LEFT JOIN tasks p ON p.id = d.depends_on
+        WHERE d.task_seq = t.seq
+          AND (p.seq IS NULL OR p.status = 'open')
+    )
+"""
+
+_READY_SQL = f"""
+SELECT {_TASK_COLUMNS}
+FROM tasks t JOIN groups g ON g.id = t.group_id
+WHERE {_READY_WHERE}
+"""
+
+
+def is_sqlite_prd(path: Path) -> bool:
+    """Return True if `path` names a SQLite task database."""
+    return path.suffix.lower() in SQLITE_SUFFIXES
+
+
+def sqlite_sidecar_paths(prd: str) -> List[str]:
+    """Paths of the WAL, shared-memory and journal files SQLite keeps next to `prd`.
+
+    These are per-connection scratch state and must never be committed.
+    """
+    return [f"{prd}-wal", f"{prd}-shm", f"{prd}-journal"]
+
+
+def _default_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _task_status(task: Dict[str, Any]) -> str:
+    if task.get("completed", False):
+        return "done"
+    if task.get("blocked", False):
+        return "blocked"
+    return "open"
+
+
+def _as_list(value: Any) -> List[str]:
+    if not isinstance(value, list):
+        return []
+    return [str(item) for item in value if item is not None]
+
+
+class SqliteTracker:
+    """Task tracker stored in a SQLite database.
+
+    Tasks, dependencies and groups live in indexed tables, so selection,
+    counts and status changes are single queries instead of whole-file
+    rewrites. The database runs in WAL mode: several loop processes can
+    read concurrently, and claims and status changes are serialized by
+    `BEGIN IMMEDIATE` transactions.
+
+    A claim leases a task to `owner` for `claim_ttl_seconds`; other owners
+    skip leased tasks until the lease expires or the task is completed.
+    Dependencies are satisfied by tasks that are done or blocked, like the
+    file trackers.
+    """
+
+    def __init__(
+        self,
+        prd_path: Path,
+        owner: Optional[str] = None,
+        claim_ttl_seconds: int = 3600,
+        busy_timeout_ms: int = 5000,
+    ):
+        """Open (creating if needed) the task database.
+
+        Args:
+            prd_path: Path to the SQLite database file
+            owner: Claim owner identifier (default: "<hostname>:<pid>")
+            claim_ttl_seconds: How long a claim is honoured by other owners
+            busy_timeout_ms: How long to wait for another writer's lock
+
+        Raises:
+            ValueError: If the file is not a ralph-gold task database
+        """
+        self.prd_path = prd_path
+        self.owner = owner or _default_owner()
+        self.claim_ttl_seconds = claim_ttl_seconds
+        self.busy_timeout_ms = busy_timeout_ms
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._connect()
+
+    @property
+    def kind(self) -> str:
+        """Return tracker kind identifier."""
+        return "sqlite"
+
+    # ------------------------------------------------------------------
+    # Connection and transactions
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        self.prd_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(self.prd_path),
+            timeout=self.busy_timeout_ms / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        try:
+            conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.executescript(_SCHEMA)
+            version = conn.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone()
+            if version is None:
+                conn.execute(
+                    "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+            elif int(version[0]) != SCHEMA_VERSION:
+                raise ValueError(
+                    f"Unsupported task database schema: {version[0]} (expected {SCHEMA_VERSION})"
+                )
+        except sqlite3.DatabaseError as e:
+            conn.close()
+            raise ValueError(f"Invalid task database {self.prd_path}: {e}") from e
+        except ValueError:
+            conn.close()
+            raise
+        self._conn = conn
+        return conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one IMMEDIATE transaction (rolled back on error)."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: Any = ()) -> List[Tuple[Any, ...]]:
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def checkpoint(self) -> bool:
+        """Copy the write-ahead log into the database file and truncate it.
+
+        Run before committing the database to git, so the committed file
+        holds every finished transaction. Best-effort: returns False if
+        another connection's readers kept the checkpoint from completing.
+        """
+        try:
+            busy = self._query("PRAGMA wal_checkpoint(TRUNCATE)")[0][0]
+        except sqlite3.Error as e:
+            logger.debug("WAL checkpoint of %s failed: %s", self.prd_path, e)
+            return False
+        return not busy
+
+    def refresh(self) -> None:
+        """No-op: every query reads the live database."""
+
+    def _ready_params(self) -> Dict[str, Any]:
+        return {"owner": self.owner, "stale": time.time() - self.claim_ttl_seconds}
+
+    # ------------------------------------------------------------------
+    # Row conversion
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _task_from_row(row: Tuple[Any, ...]) -> SelectedTask:
+        task_id, title, group, is_quick, acceptance, deps = row[:6]
+        try:
+            criteria = json.loads(acceptance or "[]")
+        except json.JSONDecodeError:
+            criteria = []
+        return SelectedTask(
+            id=str(task_id),
+            title=str(title),
+            kind="sqlite",
+            acceptance=_as_list(criteria),
+            depends_on=deps.split(_SEP) if deps else [],
+            group=str(group),
+            is_quick=bool(is_quick) or "[QUICK]" in str(title).upper(),
+        )
+
+    # ------------------------------------------------------------------
+    # Import / export
+    # ------------------------------------------------------------------
+
+    def import_tasks(
+        self,
+        tasks: Iterable[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None,
+        replace: bool = True,
+    ) -> int:
+        """Load tasks in the YAML task format (see converters) in one transaction.
+
+        Args:
+            tasks: Task dicts with id, title and optional completed, blocked,
+                group, priority, acceptance, depends_on, description, is_quick
+            metadata: Document metadata (branch, project, ...)
+            replace: Delete existing tasks first
+
+        Returns:
+            Number of tasks written
+
+        Raises:
+            ValueError: If a task lacks an id or title, or ids repeat
+        """
+        count = 0
+        with self._write() as conn:
+            if replace:
+                conn.execute("DELETE FROM deps")
+                conn.execute("DELETE FROM tasks")
+                conn.execute("DELETE FROM groups")
+                conn.execute("DELETE FROM meta WHERE key LIKE 'metadata.%'")
+            if metadata:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [(f"metadata.{k}", json.dumps(v)) for k, v in metadata.items()],
+                )
+            group_ids: Dict[str, int] = {
+                name: gid for gid, name in conn.execute("SELECT id, name FROM groups")
+            }
+            for i, task in enumerate(tasks):
+                if "id" not in task or "title" not in task:
+                    raise ValueError(f"Task at index {i} needs 'id' and 'title'")
+                group = str(task.get("group") or "default")
+                if group not in group_ids:
+                    cur = conn.execute("INSERT INTO groups (name) VALUES (?)", (group,))
+                    group_ids[group] = int(cur.lastrowid or 0)
+                try:
+                    priority = int(task.get("priority", _DEFAULT_PRIORITY))
+                except (TypeError, ValueError):
+                    priority = _DEFAULT_PRIORITY
+                try:
+                    cur = conn.execute(
+                        "INSERT INTO tasks (id, title, status, group_id, priority, is_quick,"
+                        " description, acceptance, blocked_reason)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            str(task["id"]),
+                            str(task["title"]),
+                            _task_status(task),
+                            group_ids[group],
+                            priority,
+                            int(bool(task.get("is_quick", False))),
+                            task.get("description"),
+                            json.dumps(_as_list(task.get("acceptance"))),
+                            task.get("blocked_reason"),
+                        ),
+                    )
+                except sqlite3.IntegrityError as e:
+                    raise ValueError(f"Duplicate task id: {task['id']}") from e
+                conn.executemany(
+                    "INSERT OR IGNORE INTO deps (task_seq, depends_on) VALUES (?, ?)",
+                    [(cur.lastrowid, dep) for dep in _as_list(task.get("depends_on"))],
+                )
+                count += 1
+        return count
+
+    def export_tasks(self) -> Dict[str, Any]:
+        """Return the database as a YAML task document (version/metadata/tasks)."""
+        metadata: Dict[str, Any] = {}
+        for key, value in self._query("SELECT key, value FROM meta WHERE key LIKE 'metadata.%'"):
+            try:
+                metadata[key[len("metadata."):]] = json.loads(value)
+            except json.JSONDecodeError:
+                metadata[key[len("metadata."):]] = value
+
+        rows = self._query(
+            f"SELECT {_TASK_COLUMNS}, t.status, t.priority, t.description, t.blocked_reason"
+            " FROM tasks t JOIN groups g ON g.id = t.group_id ORDER BY t.seq"
+        )
+        tasks: List[Dict[str, Any]] = []
+        for row in rows:
+            selected = self._task_from_row(row)
+            status, priority, description, blocked_reason = row[6:]
+            task: Dict[str, Any] = {"id": selected.id, "title": selected.title}
+            if description:
+                task["description"] = description
+            if priority != _DEFAULT_PRIORITY:
+                task["priority"] = priority
+            if selected.acceptance:
+                task["acceptance"] = selected.acceptance
+            if selected.depends_on:
+                task["depends_on"] = selected.depends_on
+            if selected.group != "default":
+                task["group"] = selected.group
+            task["completed"] = status == "done"
+            if status == "blocked":
+                task["blocked"] = True
+                if blocked_reason:
+                    task["blocked_reason"] = blocked_reason
+            task["is_quick"] = bool(row[3])
+            tasks.append(task)
+        return {"version": 1, "metadata": metadata, "tasks": tasks}
+
+    # ------------------------------------------------------------------
+    # Selection
+    # ------------------------------------------------------------------
+
+    def _ready_tasks(
+        self, exclude_ids: Optional[Set[str]] = None, limit: Optional[int] = None, quick: bool = False
+    ) -> List[SelectedTask]:
+        sql = _READY_SQL
+        if quick:
+            sql += " AND (t.is_quick = 1 OR upper(t.title) LIKE '%[QUICK]%')"
+        sql += " ORDER BY t.priority, t.seq"
+        exclude = exclude_ids or set()
+        out: List[SelectedTask] = []
+        with self._lock:
+            for row in self._connect().execute(sql, self._ready_params()):
+                if str(row[0]) in exclude:
+                    continue
+                out.append(self._task_from_row(row))
+                if limit is not None and len(out) >= limit:
+                    break
+        return out
+
+    def select_next_task(
+        self, exclude_ids: Optional[Set[str]] = None
+    ) -> Optional[SelectedTask]:
+        """Return the highest-priority ready task without claiming it."""
+        ready = self._ready_tasks(exclude_ids, limit=1)
+        return ready[0] if ready else None
+
+    def peek_next_task(self) -> Optional[SelectedTask]:
+        return self.select_next_task()
+
+    def claim_next_task(self) -> Optional[SelectedTask]:
+        """Atomically lease the next ready task to this tracker's owner.
+
+        Selection and claim run in one IMMEDIATE transaction, so two
+        processes never claim the same task.
+
+        Returns:
+            The claimed task, or None if nothing is ready
+        """
+        sql = _READY_SQL + " ORDER BY t.priority, t.seq LIMIT 1"
+        with self._write() as conn:
+            row = conn.execute(sql, self._ready_params()).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE tasks SET claimed_by = ?, claimed_at = ? WHERE id = ?",
+                (self.owner, time.time(), row[0]),
+            )
+        return self._task_from_row(row)
+
+    def release_task(self, task_id: TaskId) -> bool:
+        """Drop this owner's claim on a task so others can pick it up."""
+        with self._write() as conn:
+            cur = conn.execute(
+                "UPDATE tasks SET claimed_by = NULL, claimed_at = NULL"
+                " WHERE id = ? AND claimed_by = ?",
+                (str(task_id), self.owner),
+            )
+        return cur.rowcount > 0
+
+    def swap_claim(self, release_id: TaskId, claim_id: TaskId) -> Optional[SelectedTask]:
+        """Move this owner's claim from one task to another ready task.
+
+        The new claim and the release of the old one run in one IMMEDIATE
+        transaction, so no other process can claim `claim_id` in between
+        and the old task is never left unclaimed without the new one held.
+
+        Returns:
+            The newly claimed task, or None (old claim kept) if `claim_id`
+            is no longer ready for this owner
+        """
+        sql = _READY_SQL + " AND t.id = :task_id"
+        with self._write() as conn:
+            row = conn.execute(
+                sql, {**self._ready_params(), "task_id": str(claim_id)}
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE tasks SET claimed_by = ?, claimed_at = ? WHERE id = ?",
+                (self.owner, time.time(), row[0]),
+            )
+            conn.execute(
+                "UPDATE tasks SET claimed_by = NULL, claimed_at = NULL"
+                " WHERE id = ? AND claimed_by = ?",
+                (str(release_id), self.owner),
+            )
+        return self._task_from_row(row)
+
+    def get_quick_batch(self, limit: int = 3) -> Optional[List[SelectedTask]]:
+        """Return up to `limit` quick tasks that are ready."""
+        batch = self._ready_tasks(limit=limit, quick=True)
+        return batch or None
+
+    def get_parallel_groups(self) -> Dict[str, List[SelectedTask]]:
+        """Return ready tasks grouped by parallel group, from a single query.
+
+        Returns:
+            Dictionary mapping group names to ready tasks in priority order
+        """
+        sql = _READY_SQL + " ORDER BY g.name, t.priority, t.seq"
+        groups: Dict[str, List[SelectedTask]] = {}
+        for row in self._query(sql, self._ready_params()):
+            task = self._task_from_row(row)
+            groups.setdefault(task.group, []).append(task)
+        return groups
+
+    # ------------------------------------------------------------------
+    # Status queries
+    # ------------------------------------------------------------------
+
+    def _status_counts(self) -> Dict[str, int]:
+        counts = {"done": 0, "blocked": 0, "open": 0}
+        for status, n in self._query("SELECT status, count(*) FROM tasks GROUP BY status"):
+            counts[str(status)] = int(n)
+        return counts
+
+    def counts(self) -> Tuple[int, int]:
+        """Return (completed_count, total_count) for tasks."""
+        counts = self._status_counts()
+        return counts["done"], sum(counts.values())
+
+    def all_done(self) -> bool:
+        """True if there are tasks and every one is done."""
+        counts = self._status_counts()
+        total = sum(counts.values())
+        return total > 0 and counts["done"] == total
+
+    def all_blocked(self) -> bool:
+        """True if there are remaining tasks and every one is blocked."""
+        counts = self._status_counts()
+        return counts["blocked"] > 0 and counts["open"] == 0
+
+    def get_task_status(self, task_id: TaskId) -> str:
+        """Return task status by ID: open|done|blocked|missing."""
+        rows = self._query("SELECT status FROM tasks WHERE id = ?", (str(task_id),))
+        return str(rows[0][0]) if rows else "missing"
+
+    def is_task_done(self, task_id: TaskId) -> bool:
+        return self.get_task_status(task_id) == "done"
+
+    def get_task_by_id(self, task_id: TaskId) -> Optional[SelectedTask]:
+        """Return task by ID if present."""
+        rows = self._query(
+            f"SELECT {_TASK_COLUMNS} FROM tasks t JOIN groups g ON g.id = t.group_id"
+            " WHERE t.id = ?",
+            (str(task_id),),
+        )
+        return self._task_from_row(rows[0]) if rows else None
+
+    def branch_name(self) -> Optional[str]:
+        """Return the branch name from metadata, if specified."""
+        rows = self._query("SELECT value FROM meta WHERE key = 'metadata.branch'")
+        if not rows:
+            return None
+        try:
+            branch = json.loads(rows[0][0])
+        except json.JSONDecodeError:
+            branch = rows[0][0]
+        return str(branch) if branch else None
+
+    def snapshot(self) -> TrackerSnapshot:
+        """Return counts, status breakdown and ready tasks from two queries."""
+        counts = self._status_counts()
+        total = sum(counts.values())
+        ready = self._ready_tasks()
+        return TrackerSnapshot(
+            done=counts["done"],
+            total=total,
+            status_counts=counts,
+            ready_ids=[t.id for t in ready],
+            next_task=ready[0] if ready else None,
+            all_done=total > 0 and counts["done"] == total,
+            all_blocked=counts["blocked"] > 0 and counts["open"] == 0,
+        )
+
+    # ------------------------------------------------------------------
+    # Status changes
+    # ------------------------------------------------------------------
+
+    def _set_status(self, task_ids: Iterable[TaskId], status: str, **fields: Any) -> List[str]:
+        ids = [str(t) for t in task_ids]
+        assignments = ", ".join(f"{name} = :{name}" for name in fields)
+        sql = (
+            f"UPDATE tasks SET status = :status, claimed_by = NULL, claimed_at = NULL"
+            f"{', ' + assignments if assignments else ''}"
+            " WHERE id = :id AND status != :status"
+        )
+        changed: List[str] = []
+        with self._write() as conn:
+            for task_id in ids:
+                cur = conn.execute(sql, {"status": status, "id": task_id, **fields})
+                if cur.rowcount:
+                    changed.append(task_id)
+        return changed
+
+    def mark_task_done(self, task_id: TaskId) -> bool:
+        """Mark a task done (and release its claim)."""
+        return self.mark_tasks_done([task_id]) == [str(task_id)]
+
+    def mark_tasks_done(self, task_ids: Iterable[TaskId]) -> List[str]:
+        """Mark several tasks done in one transaction; return those changed."""
+        now = datetime.now(timezone.utc).isoformat()
+        return self._set_status(task_ids, "done", completed_at=now, blocked_reason=None)
+
+    def force_task_open(self, task_id: TaskId) -> bool:
+        """Force a task back to open; False if missing or already open."""
+        return self.force_tasks_open([task_id]) == [str(task_id)]
+
+    def force_tasks_open(self, task_ids: Iterable[TaskId]) -> List[str]:
+        """Reopen several tasks in one transaction; return those changed."""
+        return self._set_status(task_ids, "open", completed_at=None, blocked_reason=None)
+
+    def block_task(self, task_id: TaskId, reason: str) -> bool:
+        """Mark a task blocked with an optional reason."""
+        return self._set_status([task_id], "blocked", blocked_reason=reason or None) == [
+            str(task_id)
+        ]
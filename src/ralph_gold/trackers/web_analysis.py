@@ -19,23 +19,43 @@ Example .ralph/config.toml configuration:
     headless_nav = false
     cache_ttl_seconds = 3600
     output_path = ".ralph/web_analysis.json"
+    max_concurrency = 16  # parallel page fetches
+    headless_pages = 4  # browser pages crawling in parallel (headless_nav)
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
 import re
+import threading
+import time
 import xml.etree.ElementTree as ET
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
-from urllib.parse import urljoin, urlparse
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+from urllib.parse import urldefrag, urljoin, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from ..atomic_file import atomic_write_json
 from ..config import WebTrackerConfig
 from ..prd import SelectedTask, TaskId
 
@@ -148,6 +168,517 @@ class WebAnalysisResult:
         }
 
 
+@dataclass
+class PageContent:
+    """A fetched page as seen by the analyzers."""
+
+    url: str
+    status: int = 0
+    text: str = ""
+    content_type: str = ""
+    etag: str = ""
+    last_modified: str = ""
+    error: str = ""
+    elapsed_ms: float = 0.0
+    content_hash: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.error and 200 <= self.status < 300
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+@dataclass
+class PageRecord:
+    """Per-page validators and analyzer findings kept between scans."""
+
+    url: str
+    etag: str = ""
+    last_modified: str = ""
+    content_hash: str = ""
+    api_urls: List[str] = field(default_factory=list)
+    script_urls: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "content_hash": self.content_hash,
+            "api_urls": self.api_urls,
+            "script_urls": self.script_urls,
+        }
+
+    @classmethod
+    def from_dict(cls, url: str, data: Mapping[str, Any]) -> "PageRecord":
+        return cls(
+            url=url,
+            etag=str(data.get("etag", "")),
+            last_modified=str(data.get("last_modified", "")),
+            content_hash=str(data.get("content_hash", "")),
+            api_urls=[str(u) for u in data.get("api_urls", [])],
+            script_urls=[str(u) for u in data.get("script_urls", [])],
+        )
+
+
+@dataclass
+class _PreviousScan:
+    """What the last scan left in the cache, for incremental re-analysis."""
+
+    result: WebAnalysisResult
+    pages: Dict[str, PageRecord] = field(default_factory=dict)
+    bundle_sizes: Dict[str, int] = field(default_factory=dict)
+    task_keys: Dict[str, str] = field(default_factory=dict)
+    # Highest task sequence number ever handed out (IDs are never reused).
+    task_seq: int = 0
+
+
+def make_session(max_connections: int) -> requests.Session:
+    """Create a keep-alive session whose pool fits `max_connections` workers."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4, pool_maxsize=max(1, max_connections)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = "ralph-gold-web-analysis"
+    return session
+
+
+class PageStore:
+    """Fetch each URL once, concurrently, and keep the content for analyzers.
+
+    All requests share one pooled `requests.Session`; at most `max_workers`
+    are in flight at a time.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        max_workers: int = 16,
+        timeout: float = 30,
+    ) -> None:
+        self.session = session
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.pages: Dict[str, PageContent] = {}
+
+    def _map(self, fn: Any, items: List[Any]) -> List[Any]:
+        if len(items) <= 1 or self.max_workers == 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as pool:
+            return list(pool.map(fn, items))
+
+    def _get(self, url: str, validator: Optional[PageRecord] = None) -> PageContent:
+        headers: Dict[str, str] = {}
+        if validator is not None:
+            if validator.etag:
+                headers["If-None-Match"] = validator.etag
+            if validator.last_modified:
+                headers["If-Modified-Since"] = validator.last_modified
+        started = time.perf_counter()
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if response.status_code == 304 and validator is not None:
+                return PageContent(
+                    url=url,
+                    status=304,
+                    etag=response.headers.get("etag", validator.etag),
+                    last_modified=response.headers.get(
+                        "last-modified", validator.last_modified
+                    ),
+                    elapsed_ms=elapsed_ms,
+                    content_hash=validator.content_hash,
+                )
+            response.raise_for_status()
+            return PageContent(
+                url=url,
+                status=response.status_code,
+                text=response.text,
+                content_type=response.headers.get("content-type", ""),
+                etag=response.headers.get("etag", ""),
+                last_modified=response.headers.get("last-modified", ""),
+                elapsed_ms=elapsed_ms,
+                content_hash=hashlib.sha256(response.content).hexdigest(),
+            )
+        except requests.RequestException as e:
+            logger.debug("Failed to fetch page %s: %s", url, e)
+            return PageContent(
+                url=url, error=str(e), elapsed_ms=(time.perf_counter() - started) * 1000
+            )
+
+    def fetch_all(
+        self,
+        urls: Iterable[str],
+        validators: Optional[Mapping[str, PageRecord]] = None,
+    ) -> Dict[str, PageContent]:
+        """Fetch every URL not already in the store.
+
+        Args:
+            urls: Page URLs to fetch
+            validators: Records from the previous scan; their ETag and
+                Last-Modified values make the request conditional, and an
+                unchanged page comes back as a `304` with no body
+
+        Returns:
+            Content for each requested URL (including earlier fetches)
+        """
+        wanted = list(dict.fromkeys(urls))
+        missing = [u for u in wanted if u not in self.pages]
+        known = validators or {}
+        for content in self._map(lambda u: self._get(u, known.get(u)), missing):
+            self.pages[content.url] = content
+        return {u: self.pages[u] for u in wanted}
+
+    def head_sizes(self, urls: Iterable[str]) -> Dict[str, int]:
+        """Return Content-Length per URL from concurrent HEAD requests (0 if unknown)."""
+
+        def _size(url: str) -> Tuple[str, int]:
+            try:
+                response = self.session.head(url, timeout=10)
+                if response.status_code == 200:
+                    return url, int(response.headers.get("content-length", 0))
+            except (requests.RequestException, ValueError) as e:
+                logger.debug("HEAD failed for %s: %s", url, e)
+            return url, 0
+
+        return dict(self._map(_size, list(dict.fromkeys(urls))))
+
+
+# Sitemap indexes may nest; deeper levels are ignored.
+_SITEMAP_MAX_DEPTH = 3
+_GZIP_MAGIC = b"\x1f\x8b"
+_SITEMAP_CHUNK_BYTES = 64 * 1024
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from an element tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_sitemap_entries(chunks: Iterable[bytes]) -> Iterator[Tuple[str, str]]:
+    """Stream `(kind, loc)` pairs from a sitemap or sitemap index.
+
+    `kind` is "url" for `<urlset>` entries and "sitemap" for `<sitemapindex>`
+    children. The document is parsed incrementally as chunks arrive and
+    elements are discarded as soon as they are read, so memory stays flat
+    however large the document is. Gzip-compressed input is detected by
+    its magic bytes and decompressed on the fly.
+
+    Args:
+        chunks: Raw document bytes, in order (e.g. `response.iter_content()`)
+
+    Yields:
+        (kind, loc) for each entry with a non-empty <loc>
+
+    Raises:
+        ET.ParseError: If the XML is malformed
+        zlib.error: If gzip-compressed input is corrupt
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    root: Optional[ET.Element] = None
+    head: Optional[bytes] = b""
+    decompressor: Any = None
+
+    def drain() -> Iterator[Tuple[str, str]]:
+        nonlocal root
+        for event, elem in parser.read_events():
+            if event == "start":
+                if root is None:
+                    root = elem
+                continue
+            kind = _local_name(elem.tag)
+            if kind not in ("url", "sitemap"):
+                continue
+            loc = next(
+                (child.text for child in elem if _local_name(child.tag) == "loc"), None
+            )
+            if loc and loc.strip():
+                yield kind, loc.strip()
+            if root is not None:
+                root.clear()
+
+    for chunk in chunks:
+        if head is not None:
+            # Sniff the first bytes before deciding how to decode.
+            head += chunk
+            if len(head) < len(_GZIP_MAGIC):
+                continue
+            chunk, head = head, None
+            if chunk.startswith(_GZIP_MAGIC):
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        parser.feed(decompressor.decompress(chunk) if decompressor else chunk)
+        yield from drain()
+
+    if head:
+        parser.feed(head)
+    if decompressor is not None:
+        parser.feed(decompressor.flush())
+    parser.close()
+    yield from drain()
+
+
+class SitemapReader:
+    """Collect page URLs from a sitemap, following sitemap indexes.
+
+    Child sitemaps are streamed concurrently over one pooled session. A
+    single page budget is shared by all of them: once `max_pages` unique
+    URLs (deduplicated with `normalize_url`) are accepted, in-flight
+    downloads stop and no further children are requested.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        max_pages: int,
+        max_workers: int = 16,
+        timeout: float = 30,
+        accept: Optional[Callable[[str], bool]] = None,
+    ) -> None:
+        self.session = session
+        self.max_pages = max(0, max_pages)
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.accept = accept or (lambda url: True)
+        self._lock = threading.Lock()
+        self._seen: Set[str] = set()
+
+    def _full(self) -> bool:
+        return len(self._seen) >= self.max_pages
+
+    def _claim(self, url: str) -> bool:
+        key = normalize_url(url)
+        with self._lock:
+            if self._full() or key in self._seen:
+                return False
+            self._seen.add(key)
+            return True
+
+    def _read_one(self, sitemap_url: str) -> Tuple[List[str], List[str]]:
+        """Stream one sitemap; return (accepted page URLs, child sitemaps)."""
+        pages: List[str] = []
+        children: List[str] = []
+        if self._full():
+            return pages, children
+        with self.session.get(sitemap_url, stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            for kind, loc in iter_sitemap_entries(
+                response.iter_content(chunk_size=_SITEMAP_CHUNK_BYTES)
+            ):
+                if kind == "sitemap":
+                    children.append(urljoin(sitemap_url, loc))
+                elif self.accept(loc) and self._claim(loc):
+                    pages.append(loc)
+                if self._full():
+                    break
+        return pages, children
+
+    def _read_child(self, sitemap_url: str) -> Tuple[List[str], List[str]]:
+        try:
+            return self._read_one(sitemap_url)
+        except (requests.RequestException, ET.ParseError, zlib.error) as e:
+            logger.debug("Skipping child sitemap %s: %s", sitemap_url, e)
+            return [], []
+
+    def read(self, sitemap_url: str) -> List[str]:
+        """Return up to `max_pages` unique page URLs reachable from `sitemap_url`.
+
+        Pages are returned in sitemap order (index children in the order
+        they are listed). Failures of child sitemaps are logged and skipped.
+
+        Raises:
+            requests.RequestException: If the root sitemap cannot be fetched
+            ET.ParseError: If the root sitemap is malformed
+            zlib.error: If the root sitemap is corrupt gzip
+        """
+        self._seen = set()
+        pages, level = self._read_one(sitemap_url)
+        visited = {sitemap_url}
+
+        for _ in range(_SITEMAP_MAX_DEPTH):
+            level = [u for u in dict.fromkeys(level) if u not in visited]
+            if not level or self._full():
+                break
+            visited.update(level)
+            workers = min(self.max_workers, len(level))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self._read_child, level))
+            level = []
+            for child_pages, grandchildren in results:
+                pages.extend(child_pages)
+                level.extend(grandchildren)
+
+        return pages
+
+
+# Resource types not needed for discovery; aborted to save bandwidth.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_SKIP_LINK_SUFFIXES = (".pdf", ".zip", ".jpg", ".png", ".gif", ".svg")
+
+
+class HeadlessCrawler:
+    """Breadth-first crawl with a fixed pool of pages in one browser.
+
+    One browser context is shared by `pool_size` pages, each driven by its
+    own worker pulling `(url, depth)` items from a frontier queue. Links
+    are followed until `crawl_depth` and at most `max_pages` URLs are
+    visited. Images, fonts and media are aborted at the network layer, and
+    fetch/XHR requests are recorded as API endpoints.
+
+    Works with any object exposing the async Playwright `Browser` API.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_pages: int,
+        crawl_depth: int,
+        pool_size: int = 4,
+        normalize_hashes: bool = True,
+        timeout_ms: int = 15000,
+    ) -> None:
+        self.base_url = base_url
+        self.max_pages = max(0, max_pages)
+        self.crawl_depth = max(0, crawl_depth)
+        self.pool_size = max(1, pool_size)
+        self.normalize_hashes = normalize_hashes
+        self.timeout_ms = timeout_ms
+        self.pages: List[str] = []
+        self.api_urls: Set[str] = set()
+        self.timings: List[Dict[str, Any]] = []
+        self.blocked_requests = 0
+        self.total_ms = 0.0
+        self._seen: Set[str] = set()
+
+    def _link_target(self, href: str) -> Optional[str]:
+        """Absolute, fragment-free URL for an in-scope page link, else None."""
+        url = urldefrag(urljoin(self.base_url + "/", href.strip()))[0]
+        if not url.startswith(self.base_url):
+            return None
+        if url.lower().endswith(_SKIP_LINK_SUFFIXES):
+            return None
+        return url
+
+    def _enqueue(self, frontier: "asyncio.Queue[Tuple[str, int]]", url: str, depth: int) -> None:
+        key = normalize_url(url)
+        if key in self._seen or len(self._seen) >= self.max_pages:
+            return
+        self._seen.add(key)
+        frontier.put_nowait((url, depth))
+
+    async def _route(self, route: Any) -> None:
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            self.blocked_requests += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _on_request(self, request: Any) -> None:
+        url = request.url
+        if request.resource_type in ("fetch", "xhr") or "api" in url.lower():
+            self.api_urls.add(normalize_url(url) if self.normalize_hashes else url)
+
+    async def _visit(self, page: Any, url: str, depth: int) -> List[str]:
+        """Load one page, record its timing and return in-scope links."""
+        started = time.perf_counter()
+        timing: Dict[str, Any] = {"url": url, "depth": depth}
+        links: List[str] = []
+        try:
+            timeout = self.timeout_ms * 2 if depth == 0 else self.timeout_ms
+            response = await page.goto(url, wait_until="networkidle", timeout=timeout)
+            timing["status"] = getattr(response, "status", None)
+            timing["load_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            self.pages.append(url)
+            if depth < self.crawl_depth:
+                hrefs = await page.eval_on_selector_all(
+                    "a[href]", "els => els.map(e => e.getAttribute('href'))"
+                )
+                links = [t for t in (self._link_target(h) for h in hrefs if h) if t]
+        except Exception as e:
+            logger.debug("Headless navigation to %s failed: %s", url, e)
+            timing["error"] = str(e)
+        timing["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        timing["links"] = len(links)
+        self.timings.append(timing)
+        return links
+
+    async def _worker(self, page: Any, frontier: "asyncio.Queue[Tuple[str, int]]") -> None:
+        while True:
+            url, depth = await frontier.get()
+            try:
+                for link in await self._visit(page, url, depth):
+                    self._enqueue(frontier, link, depth + 1)
+            finally:
+                frontier.task_done()
+
+    async def crawl(self, browser: Any) -> List[str]:
+        """Crawl from `base_url`; return visited page URLs in load order.
+
+        Args:
+            browser: Launched Playwright browser (async API)
+
+        Returns:
+            URLs of pages that loaded successfully
+        """
+        started = time.perf_counter()
+        context = await browser.new_context()
+        try:
+            await context.route("**/*", self._route)
+            context.on("request", self._on_request)
+            frontier: "asyncio.Queue[Tuple[str, int]]" = asyncio.Queue()
+            self._enqueue(frontier, self.base_url, 0)
+            pool = [await context.new_page() for _ in range(self.pool_size)]
+            workers = [asyncio.create_task(self._worker(page, frontier)) for page in pool]
+            try:
+                await frontier.join()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+        finally:
+            await context.close()
+        self.total_ms = round((time.perf_counter() - started) * 1000, 1)
+        return self.pages
+
+    def metrics(self) -> Dict[str, Any]:
+        """Timing summary for `WebAnalysisResult.metadata["headless"]`."""
+        loads = [t["load_ms"] for t in self.timings if "load_ms" in t]
+        return {
+            "pool_size": self.pool_size,
+            "pages_visited": len(self.timings),
+            "pages_failed": sum(1 for t in self.timings if "error" in t),
+            "blocked_requests": self.blocked_requests,
+            "total_ms": self.total_ms,
+            "avg_load_ms": round(sum(loads) / len(loads), 1) if loads else 0.0,
+            "max_load_ms": max(loads, default=0.0),
+            "pages": self.timings,
+        }
+
+
+# API path patterns to look for
+_API_PATTERNS = [
+    re.compile(r'["\'](/api/[^"\']+)["\']'),
+    re.compile(r'["\'](/v\d+/[^"\']+)["\']'),
+    re.compile(r'fetch\(["\']([^"\']+)["\']'),
+    re.compile(r'\.get\(["\']([^"\']+)["\']'),
+    re.compile(r'\.post\(["\']([^"\']+)["\']'),
+    re.compile(r'axios\.(get|post|put|delete)\(["\']([^"\']+)["\']'),
+]
+
+# Script patterns
+_SCRIPT_PATTERNS = [
+    re.compile(r'<script[^>]+src=["\']([^"\']+)["\']'),
+    re.compile(r'"bundle":\s*"([^"]+\.js)"'),
+    re.compile(r'"chunk":\s*"([^"]+\.js)"'),
+]
+
+# Trailing sequence number of generated task IDs ("api-review-12")
+_TASK_SEQ_RE = re.compile(r"-(\d+)$")
+
+
 # URL normalization patterns
 _CACHE_HASH_RE = re.compile(r"\.[a-f0-9]{8,}\.(js|css|png|jpg|jpeg|gif|svg|webp)", re.IGNORECASE)
 _QUERY_PARAMS_TO_STRIP = re.compile(r"[?&](fbclid|gclid|utm_source|utm_medium|utm_campaign|utm_term|utm_content)=[^&]*", re.IGNORECASE)
@@ -245,6 +776,8 @@ class WebTracker:
         headless_nav: bool = False,
         cache_ttl_seconds: int = 3600,
         output_path: str = ".ralph/web_analysis.json",
+        max_concurrency: int = 16,
+        headless_pages: int = 4,
     ):
         """Initialize Web Analysis tracker.
 
@@ -260,6 +793,8 @@ class WebTracker:
             headless_nav: Enable headless browser navigation (default: false)
             cache_ttl_seconds: Cache duration (default: 3600)
             output_path: Where to save analysis results (default: ".ralph/web_analysis.json")
+            max_concurrency: Parallel page fetches (default: 16)
+            headless_pages: Browser pages crawling in parallel (default: 4)
         """
         self.project_root = project_root
 
@@ -275,7 +810,15 @@ class WebTracker:
             headless_nav=headless_nav,
             cache_ttl_seconds=cache_ttl_seconds,
             output_path=output_path,
+            max_concurrency=max_concurrency,
+            headless_pages=headless_pages,
         )
+        self._http: Optional[requests.Session] = None
+        self._page_records: Dict[str, PageRecord] = {}
+        self._bundle_sizes: Dict[str, int] = {}
+        self._task_keys: Dict[str, str] = {}
+        self._task_seq = 0
+        self._headless_metrics: Dict[str, Any] = {}
 
         # Setup paths
         ralph_dir = project_root / ".ralph"
@@ -297,15 +840,33 @@ class WebTracker:
         """Return tracker kind identifier."""
         return "web_analysis"
 
+    def _session(self) -> requests.Session:
+        """Return the pooled session shared by every fetch of this tracker."""
+        if self._http is None:
+            self._http = make_session(self.config.max_concurrency)
+        return self._http
+
+    def _page_store(self) -> PageStore:
+        return PageStore(self._session(), max_workers=self.config.max_concurrency)
+
+    def _read_cache_data(self) -> Optional[Dict[str, Any]]:
+        if not self.cache_path.exists():
+            return None
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug("Failed to read cache: %s", e)
+            return None
+        return data if isinstance(data, dict) else None
+
     def _cache_is_fresh(self) -> bool:
         """Check if cache is fresh (within TTL)."""
-        if not self.cache_path.exists():
+        cache_data = self._read_cache_data()
+        if cache_data is None:
             return False
 
         try:
-            with open(self.cache_path, "r") as f:
-                cache_data = json.load(f)
-
             cached_at = cache_data.get("scanned_at")
             if not cached_at:
                 return False
@@ -315,18 +876,18 @@ class WebTracker:
 
             return age.total_seconds() < self.config.cache_ttl_seconds
 
-        except (json.JSONDecodeError, ValueError, KeyError):
+        except (TypeError, ValueError):
             return False
 
     def _load_cache(self) -> Optional[WebAnalysisResult]:
         """Load analysis from cache."""
-        if not self.cache_path.exists():
+        data = self._read_cache_data()
+        if data is None:
             return None
+        return self._result_from_dict(data)
 
+    def _result_from_dict(self, data: Dict[str, Any]) -> Optional[WebAnalysisResult]:
         try:
-            with open(self.cache_path, "r") as f:
-                data = json.load(f)
-
             # Reconstruct endpoints
             endpoints = [
                 WebEndpoint(
@@ -396,24 +957,58 @@ class WebTracker:
                 metadata=data.get("metadata", {}),
             )
 
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
+        except (TypeError, ValueError, KeyError) as e:
             logger.debug("Failed to load cache: %s", e)
             return None
 
+    def _load_previous_scan(self) -> Optional[_PreviousScan]:
+        """Load the last scan's result and per-page state, if it matches this site."""
+        data = self._read_cache_data()
+        if data is None or data.get("base_url") != self.base_url:
+            return None
+        result = self._result_from_dict(data)
+        if result is None:
+            return None
+        state = data.get("incremental") or {}
+        if not isinstance(state, dict) or state.get("analyzer") != self._analyzer_key():
+            state = {}
+        try:
+            pages = {
+                url: PageRecord.from_dict(url, rec)
+                for url, rec in (state.get("pages") or {}).items()
+                if isinstance(rec, dict)
+            }
+            sizes = {str(k): int(v) for k, v in (state.get("bundle_sizes") or {}).items()}
+            keys = {str(k): str(v) for k, v in (state.get("task_keys") or {}).items()}
+            task_seq = int(state.get("task_seq") or 0)
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.debug("Ignoring incremental web cache state: %s", e)
+            pages, sizes, keys, task_seq = {}, {}, {}, 0
+        return _PreviousScan(
+            result=result, pages=pages, bundle_sizes=sizes, task_keys=keys, task_seq=task_seq
+        )
+
     def _save_cache(self, result: WebAnalysisResult) -> None:
-        """Save analysis to cache."""
-        with open(self.cache_path, "w") as f:
-            json.dump(result.to_dict(), f, indent=2)
+        """Save analysis (plus per-page state for the next incremental scan)."""
+        data = result.to_dict()
+        data["incremental"] = {
+            "analyzer": self._analyzer_key(),
+            "pages": {url: rec.to_dict() for url, rec in self._page_records.items()},
+            "bundle_sizes": self._bundle_sizes,
+            "task_keys": self._task_keys,
+            "task_seq": self._task_seq,
+        }
+        atomic_write_json(self.cache_path, data)
 
     def _load_or_analyze(self) -> WebAnalysisResult:
-        """Load from cache or perform fresh analysis."""
+        """Load from cache or perform an (incremental) analysis."""
         if self._cache_is_fresh():
             cached = self._load_cache()
             if cached:
                 return cached
 
-        # Perform fresh analysis
-        result = self._analyze()
+        # Re-analyze, reusing per-page results for pages that did not change
+        result = self._analyze(self._load_previous_scan())
 
         # Save to cache
         self._save_cache(result)
@@ -425,9 +1020,14 @@ class WebTracker:
 
         return result
 
-    def _analyze(self) -> WebAnalysisResult:
+    def _analyze(self, previous: Optional[_PreviousScan] = None) -> WebAnalysisResult:
         """Perform web analysis.
 
+        Args:
+            previous: Last scan's state. Pages are then fetched with
+                conditional requests, analyzers only re-run on pages whose
+                content changed, and existing tasks keep their IDs.
+
         Returns:
             WebAnalysisResult with discovered endpoints and generated tasks
         """
@@ -438,6 +1038,7 @@ class WebTracker:
 
         # Step 1: Discover pages from sitemap (or headless if enabled)
         headless_discovered: List[WebEndpoint] = []
+        self._headless_metrics = {}
         if self.config.headless_nav and PLAYWRIGHT_AVAILABLE:
             discovered = self._discover_with_headless()
             # Separate pages from API endpoints discovered during headless navigation
@@ -453,32 +1054,45 @@ class WebTracker:
             pages = self._discover_from_sitemap()
         result.pages = pages
 
-        # Step 2: Discover API endpoints from pages
+        # Step 2: Fetch every page once; all analyzers share the results.
+        actual_pages = [p for p in pages if p.metadata.get("source") != "headless-network"]
+        records: Dict[str, PageRecord] = {}
+        crawl_stats: Dict[str, Any] = {}
+        if self.config.api_discovery or self.config.js_analysis:
+            records, crawl_stats = self._crawl_pages(
+                actual_pages, previous.pages if previous else {}
+            )
+        self._page_records = records
+
+        # Step 3: Discover API endpoints from pages
         api_endpoints: List[WebEndpoint] = []
         if self.config.api_discovery:
             # Only scan actual pages, not headless-discovered API endpoints
-            actual_pages = [p for p in pages if p.metadata.get("source") != "headless-network"]
-            api_endpoints = self._discover_api_endpoints(actual_pages)
+            api_endpoints = self._discover_api_endpoints(actual_pages, records)
 
         # Merge with headless-discovered API endpoints
         api_endpoints.extend(headless_discovered)
         result.api_endpoints = api_endpoints
 
-        # Step 3: Analyze JavaScript bundles
+        # Step 4: Analyze JavaScript bundles
+        self._bundle_sizes = {}
         if self.config.js_analysis:
-            js_bundles = self._analyze_js_bundles(pages)
+            js_bundles = self._analyze_js_bundles(
+                pages, records, self._reusable_bundle_sizes(previous, records)
+            )
             result.js_bundles = js_bundles
 
-        # Step 4: Compile all endpoints
+        # Step 5: Compile all endpoints
         all_endpoints: List[WebEndpoint] = []
         all_endpoints.extend(result.pages)
         all_endpoints.extend(result.api_endpoints)
         all_endpoints.extend(result.js_bundles)
         result.endpoints = all_endpoints
 
-        # Step 5: Generate tasks from findings
-        tasks = self._generate_tasks(result)
-        result.tasks = tasks
+        # Step 6: Generate tasks from findings; keep IDs of tasks that
+        # already existed so only new findings produce new tasks.
+        keyed = self._generate_keyed_tasks(result)
+        result.tasks, self._task_keys, new_tasks = self._merge_tasks(keyed, previous)
 
         # Add metadata
         result.metadata = {
@@ -496,66 +1110,61 @@ class WebTracker:
                 "js_analysis": self.config.js_analysis,
                 "normalize_hashes": self.config.normalize_hashes,
                 "headless_nav": self.config.headless_nav,
+                "max_concurrency": self.config.max_concurrency,
+                "headless_pages": self.config.headless_pages,
             },
+            **crawl_stats,
+            "new_tasks": new_tasks,
         }
+        if self._headless_metrics:
+            result.metadata["headless"] = self._headless_metrics
 
         return result
 
     def _discover_from_sitemap(self) -> List[WebEndpoint]:
         """Discover pages from sitemap.xml.
 
+        The sitemap is streamed (gzip is handled transparently) and sitemap
+        indexes are followed concurrently until `max_pages` unique URLs
+        under `base_url` are found.
+
         Returns:
             List of WebEndpoint for discovered pages
         """
-        pages: List[WebEndpoint] = []
-        seen_urls: Set[str] = set()
-
+        reader = SitemapReader(
+            self._session(),
+            max_pages=self.config.max_pages,
+            max_workers=self.config.max_concurrency,
+            accept=lambda url: url.startswith(self.base_url),
+        )
         try:
-            response = requests.get(self.sitemap_url, timeout=30)
-            response.raise_for_status()
-
-            root = ET.fromstring(response.content)
-
-            # Handle standard sitemap format
-            namespaces = {"ns": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-            urls = root.findall(".//ns:url", namespaces) or root.findall(".//url")
-
-            for url_elem in urls[: self.config.max_pages]:
-                loc_elem = url_elem.find("loc") or url_elem.find(
-                    "{http://www.sitemaps.org/schemas/sitemap/0.9}loc"
-                )
-                if loc_elem is not None and loc_elem.text:
-                    url = loc_elem.text.strip()
-                    # Only include URLs under base_url
-                    if url.startswith(self.base_url):
-                        if url not in seen_urls:
-                            seen_urls.add(url)
-                            pages.append(
-                                WebEndpoint(
-                                    url=url,
-                                    group=extract_url_group(url),
-                                    metadata={"source": "sitemap"},
-                                )
-                            )
-
-        except (requests.RequestException, ET.ParseError) as e:
+            urls = reader.read(self.sitemap_url)
+        except (requests.RequestException, ET.ParseError, zlib.error) as e:
             logger.debug("Sitemap discovery failed: %s", e)
             # Fallback: add base URL as single page
-            pages.append(
+            return [
                 WebEndpoint(
                     url=self.base_url,
                     group=extract_url_group(self.base_url),
                     metadata={"source": "fallback"},
                 )
-            )
+            ]
 
-        return pages
+        return [
+            WebEndpoint(
+                url=url,
+                group=extract_url_group(url),
+                metadata={"source": "sitemap"},
+            )
+            for url in urls
+        ]
 
     async def _discover_with_headless_async(self) -> List[WebEndpoint]:
         """Discover pages using Playwright headless browser.
 
-        Uses async Playwright API for efficient concurrent page discovery.
-        Captures network requests for API endpoint discovery.
+        Crawls with a `HeadlessCrawler` (a pool of `headless_pages` pages on
+        one browser) and captures network requests for API endpoint
+        discovery. Per-page timings are kept for the result metadata.
 
         Returns:
             List of WebEndpoint for discovered pages
@@ -567,106 +1176,49 @@ class WebTracker:
         # Import here to avoid type errors when Playwright is not installed
         from playwright.async_api import async_playwright
 
-        pages: List[WebEndpoint] = []
-        seen_urls: Set[str] = set()
-
+        crawler = HeadlessCrawler(
+            self.base_url,
+            max_pages=self.config.max_pages,
+            crawl_depth=self.config.crawl_depth,
+            pool_size=self.config.headless_pages,
+            normalize_hashes=self.config.normalize_hashes,
+        )
         try:
             async with async_playwright() as p:
                 browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
-
-                # Track discovered URLs and API endpoints
-                discovered_urls: Set[str] = set()
-                api_endpoints: Set[str] = set()
-
-                async def handle_request(request):
-                    """Capture network requests for API discovery."""
-                    url = request.url
-                    resource_type = request.resource_type
-
-                    # Track API endpoints
-                    if resource_type in ("fetch", "xhr") or "api" in url.lower():
-                        if self.config.normalize_hashes:
-                            url = normalize_url(url)
-                        api_endpoints.add(url)
-
-                page.on("request", handle_request)
-
-                # Start at base URL
-                await page.goto(self.base_url, wait_until="networkidle", timeout=30000)
-                discovered_urls.add(self.base_url)
-
-                # Find all links on the page
-                links = await page.locator("a[href]").all()
-                max_pages = min(len(links), self.config.max_pages)
-
-                for link in links[:max_pages]:
-                    try:
-                        href = await link.get_attribute("href")
-                        if not href:
-                            continue
-
-                        # Build absolute URL
-                        if href.startswith("/"):
-                            full_url = urljoin(self.base_url, href)
-                        elif href.startswith(("http://", "https://")):
-                            full_url = href
-                        else:
-                            full_url = urljoin(self.base_url, href)
-
-                        # Only include URLs under base_url
-                        if not full_url.startswith(self.base_url):
-                            continue
-
-                        # Skip common non-page URLs
-                        if any(
-                            skip in full_url.lower()
-                            for skip in (".pdf", ".zip", ".jpg", ".png", ".gif", ".svg")
-                        ):
-                            continue
-
-                        if full_url not in seen_urls:
-                            seen_urls.add(full_url)
-                            discovered_urls.add(full_url)
-
-                            # Navigate to discover more resources
-                            await page.goto(full_url, wait_until="networkidle", timeout=15000)
-
-                    except Exception as e:
-                        logger.debug("Failed to navigate to link: %s", e)
-                        continue
-
-                await browser.close()
-
-                # Convert discovered URLs to WebEndpoint objects
-                for url in discovered_urls:
-                    pages.append(
-                        WebEndpoint(
-                            url=url,
-                            group=extract_url_group(url),
-                            metadata={"source": "headless"},
-                        )
-                    )
-
-                # Also capture API endpoints discovered during navigation
-                # These will be merged with api_endpoints in the main analysis
-                if api_endpoints:
-                    for api_url in api_endpoints:
-                        pages.append(
-                            WebEndpoint(
-                                url=api_url,
-                                method="GET",
-                                content_type="application/json",
-                                group=extract_url_group(api_url),
-                                metadata={"source": "headless-network"},
-                            )
-                        )
-
+                try:
+                    urls = await crawler.crawl(browser)
+                finally:
+                    await browser.close()
         except Exception as e:
             logger.warning("Headless navigation failed: %s", e)
             # Fallback to sitemap discovery
             return self._discover_from_sitemap()
 
+        self._headless_metrics = crawler.metrics()
+        if not urls:
+            logger.warning("Headless navigation found no pages; using sitemap")
+            return self._discover_from_sitemap()
+        return self._headless_endpoints(urls, crawler.api_urls)
+
+    @staticmethod
+    def _headless_endpoints(urls: List[str], api_urls: Set[str]) -> List[WebEndpoint]:
+        """Pages plus the API endpoints captured while navigating them."""
+        pages = [
+            WebEndpoint(url=url, group=extract_url_group(url), metadata={"source": "headless"})
+            for url in urls
+        ]
+        # These will be merged with api_endpoints in the main analysis
+        pages.extend(
+            WebEndpoint(
+                url=api_url,
+                method="GET",
+                content_type="application/json",
+                group=extract_url_group(api_url),
+                metadata={"source": "headless-network"},
+            )
+            for api_url in sorted(api_urls)
+        )
         return pages
 
     def _discover_with_headless(self) -> List[WebEndpoint]:
@@ -693,150 +1245,249 @@ class WebTracker:
             # Fallback to sitemap discovery
             return self._discover_from_sitemap()
 
-    def _discover_api_endpoints(self, pages: List[WebEndpoint]) -> List[WebEndpoint]:
+    def _analyzer_key(self) -> str:
+        """Settings that change analyzer output; stale findings are discarded."""
+        return f"{self.base_url}|normalize_hashes={self.config.normalize_hashes}"
+
+    def _crawl_pages(
+        self,
+        pages: List[WebEndpoint],
+        previous: Mapping[str, PageRecord],
+    ) -> Tuple[Dict[str, PageRecord], Dict[str, Any]]:
+        """Fetch pages and run the analyzers on those whose content changed.
+
+        Args:
+            pages: Pages to fetch (capped at `max_pages`)
+            previous: Records from the last scan, used as validators and to
+                reuse findings for unchanged pages
+
+        Returns:
+            (records by URL for pages fetched successfully, crawl statistics)
+        """
+        urls = [p.url for p in pages[: self.config.max_pages]]
+        contents = self._page_store().fetch_all(urls, validators=previous)
+
+        records: Dict[str, PageRecord] = {}
+        changed = unchanged = failed = 0
+        for url in urls:
+            content = contents[url]
+            prev = previous.get(url)
+            if prev is not None and (
+                content.not_modified
+                or (content.ok and content.content_hash == prev.content_hash)
+            ):
+                records[url] = PageRecord(
+                    url=url,
+                    etag=content.etag,
+                    last_modified=content.last_modified,
+                    content_hash=prev.content_hash,
+                    api_urls=prev.api_urls,
+                    script_urls=prev.script_urls,
+                )
+                unchanged += 1
+            elif content.ok:
+                records[url] = PageRecord(
+                    url=url,
+                    etag=content.etag,
+                    last_modified=content.last_modified,
+                    content_hash=content.content_hash,
+                    api_urls=[e.url for e in self._extract_api_endpoints(url, content.text)],
+                    script_urls=self._extract_script_urls(url, content.text),
+                )
+                changed += 1
+            else:
+                failed += 1
+
+        stats = {
+            "fetched_pages": len(urls),
+            "changed_pages": changed,
+            "unchanged_pages": unchanged,
+            "failed_pages": failed,
+            "fetch_ms": round(sum(c.elapsed_ms for c in contents.values()), 1),
+        }
+        return records, stats
+
+    def _discover_api_endpoints(
+        self,
+        pages: List[WebEndpoint],
+        records: Optional[Dict[str, PageRecord]] = None,
+    ) -> List[WebEndpoint]:
         """Discover API endpoints from page content.
 
         This looks for common API patterns in JavaScript, HTML, etc.
 
         Args:
             pages: List of discovered pages
+            records: Per-page analyzer results (pages are crawled if omitted)
 
         Returns:
             List of WebEndpoint for API endpoints
         """
+        if records is None:
+            records, _ = self._crawl_pages(pages, {})
         api_endpoints: List[WebEndpoint] = []
         seen_urls: Set[str] = set()
 
-        # API path patterns to look for
-        api_patterns = [
-            re.compile(r'["\'](/api/[^"\']+)["\']'),
-            re.compile(r'["\'](/v\d+/[^"\']+)["\']'),
-            re.compile(r'fetch\(["\']([^"\']+)["\']'),
-            re.compile(r'\.get\(["\']([^"\']+)["\']'),
-            re.compile(r'\.post\(["\']([^"\']+)["\']'),
-            re.compile(r'axios\.(get|post|put|delete)\(["\']([^"\']+)["\']'),
-        ]
-
         for page in pages[: self.config.max_pages]:
-            try:
-                response = requests.get(page.url, timeout=30)
-                response.raise_for_status()
-
-                content = response.text
-
-                # Extract potential API endpoints
-                for pattern in api_patterns:
-                    for match in pattern.finditer(content):
-                        api_path = match.group(1) if match.lastindex >= 1 else match.group(0)
-
-                        # Build full URL
-                        if api_path.startswith("/"):
-                            full_url = urljoin(self.base_url, api_path)
-                        else:
-                            full_url = api_path
-
-                        # Only include URLs under base_url domain
-                        if not full_url.startswith(self.base_url):
-                            continue
-
-                        # Normalize if configured
-                        if self.config.normalize_hashes:
-                            full_url = normalize_url(full_url)
-
-                        if full_url not in seen_urls:
-                            seen_urls.add(full_url)
-                            api_endpoints.append(
-                                WebEndpoint(
-                                    url=full_url,
-                                    method="GET",
-                                    content_type="application/json",
-                                    group=extract_url_group(full_url),
-                                    metadata={"source": "discovered", "source_page": page.url},
-                                )
-                            )
-
-            except requests.RequestException as e:
-                logger.debug("Failed to fetch page %s: %s", page.url, e)
+            record = records.get(page.url)
+            if record is None:
+                continue
+            for full_url in record.api_urls:
+                if full_url not in seen_urls:
+                    seen_urls.add(full_url)
+                    api_endpoints.append(
+                        WebEndpoint(
+                            url=full_url,
+                            method="GET",
+                            content_type="application/json",
+                            group=extract_url_group(full_url),
+                            metadata={"source": "discovered", "source_page": page.url},
+                        )
+                    )
 
         return api_endpoints
 
-    def _analyze_js_bundles(self, pages: List[WebEndpoint]) -> List[WebEndpoint]:
+    def _extract_api_endpoints(self, page_url: str, text: str) -> List[WebEndpoint]:
+        """Run the API regexes over one page's content."""
+        found: List[WebEndpoint] = []
+        seen_urls: Set[str] = set()
+        for pattern in _API_PATTERNS:
+            for match in pattern.finditer(text):
+                api_path = match.group(match.lastindex or 0)
+
+                # Build full URL
+                if api_path.startswith("/"):
+                    full_url = urljoin(self.base_url, api_path)
+                else:
+                    full_url = api_path
+
+                # Only include URLs under base_url domain
+                if not full_url.startswith(self.base_url):
+                    continue
+
+                # Normalize if configured
+                if self.config.normalize_hashes:
+                    full_url = normalize_url(full_url)
+
+                if full_url not in seen_urls:
+                    seen_urls.add(full_url)
+                    found.append(
+                        WebEndpoint(
+                            url=full_url,
+                            method="GET",
+                            content_type="application/json",
+                            group=extract_url_group(full_url),
+                            metadata={"source": "discovered", "source_page": page_url},
+                        )
+                    )
+        return found
+
+    def _extract_script_urls(self, page_url: str, text: str) -> List[str]:
+        """Return absolute JS URLs referenced by one page."""
+        scripts: List[str] = []
+        for pattern in _SCRIPT_PATTERNS:
+            for match in pattern.finditer(text):
+                script_url = match.group(1)
+
+                # Build full URL if relative
+                if script_url.startswith("/"):
+                    full_url = urljoin(self.base_url, script_url)
+                elif script_url.startswith(("http://", "https://")):
+                    full_url = script_url
+                else:
+                    full_url = urljoin(page_url, script_url)
+
+                # Only include JS files
+                if any(ext in full_url.lower() for ext in (".js", ".mjs")):
+                    scripts.append(full_url)
+        return scripts
+
+    @staticmethod
+    def _reusable_bundle_sizes(
+        previous: Optional[_PreviousScan], records: Mapping[str, PageRecord]
+    ) -> Dict[str, int]:
+        """Previous bundle sizes that can be trusted without a new HEAD request.
+
+        A size is reused when the bundle URL carries a content hash (same URL,
+        same bytes), or when every page that references it is unchanged since
+        the last scan. Failed lookups (size 0) are always retried.
+        """
+        if previous is None:
+            return {}
+        changed_pages = {
+            url
+            for url, record in records.items()
+            if url not in previous.pages or previous.pages[url].content_hash != record.content_hash
+        }
+        stale: Set[str] = set()
+        for url in changed_pages:
+            stale.update(records[url].script_urls)
+        return {
+            url: size
+            for url, size in previous.bundle_sizes.items()
+            if size > 0
+            and (normalize_url(url) != normalize_url(url, strip_hash=False) or url not in stale)
+        }
+
+    def _analyze_js_bundles(
+        self,
+        pages: List[WebEndpoint],
+        records: Optional[Dict[str, PageRecord]] = None,
+        known_sizes: Optional[Mapping[str, int]] = None,
+    ) -> List[WebEndpoint]:
         """Analyze JavaScript bundles for framework/component info.
 
+        Script sizes are read with concurrent HEAD requests, one per
+        distinct bundle not in known_sizes.
+
         Args:
             pages: List of discovered pages
+            records: Per-page analyzer results (pages are crawled if omitted)
+            known_sizes: Bundle sizes that are still valid, by URL (see
+                `_reusable_bundle_sizes`)
 
         Returns:
             List of WebEndpoint for JS bundles
         """
+        if records is None:
+            records, _ = self._crawl_pages(pages, {})
         js_bundles: List[WebEndpoint] = []
         seen_urls: Set[str] = set()
 
-        # Script patterns
-        script_patterns = [
-            re.compile(r'<script[^>]+src=["\']([^"\']+)["\']'),
-            re.compile(r'"bundle":\s*"([^"]+\.js)"'),
-            re.compile(r'"chunk":\s*"([^"]+\.js)"'),
-        ]
-
         for page in pages[: self.config.max_pages]:
-            try:
-                response = requests.get(page.url, timeout=30)
-                response.raise_for_status()
-
-                content = response.text
-
-                # Extract script sources
-                for pattern in script_patterns:
-                    for match in pattern.finditer(content):
-                        script_url = match.group(1)
-
-                        # Build full URL if relative
-                        if script_url.startswith("/"):
-                            full_url = urljoin(self.base_url, script_url)
-                        elif script_url.startswith(("http://", "https://")):
-                            full_url = script_url
-                        else:
-                            full_url = urljoin(page.url, script_url)
-
-                        # Only include JS files
-                        if not any(ext in full_url.lower() for ext in (".js", ".mjs")):
-                            continue
-
-                        # Normalize if configured
-                        normalized = full_url
-                        if self.config.normalize_hashes:
-                            normalized = normalize_url(full_url)
-
-                        # Use normalized URL for deduplication
-                        dedup_key = normalized if self.config.normalize_hashes else full_url
-                        if dedup_key not in seen_urls:
-                            seen_urls.add(dedup_key)
-
-                            # Get bundle size if possible
-                            size_bytes = 0
-                            try:
-                                head_response = requests.head(full_url, timeout=10)
-                                if head_response.status_code == 200:
-                                    size_bytes = int(head_response.headers.get("content-length", 0))
-                            except requests.RequestException:
-                                pass
-
-                            js_bundles.append(
-                                WebEndpoint(
-                                    url=full_url,
-                                    group=extract_url_group(full_url),
-                                    normalized_url=normalized,
-                                    metadata={
-                                        "source": "discovered",
-                                        "source_page": page.url,
-                                        "size_bytes": size_bytes,
-                                    },
-                                )
-                            )
-
-            except requests.RequestException as e:
-                logger.debug("Failed to fetch page %s: %s", page.url, e)
+            record = records.get(page.url)
+            if record is None:
+                continue
+            for full_url in record.script_urls:
+                # Normalize if configured
+                normalized = full_url
+                if self.config.normalize_hashes:
+                    normalized = normalize_url(full_url)
+
+                # Use normalized URL for deduplication
+                dedup_key = normalized if self.config.normalize_hashes else full_url
+                if dedup_key not in seen_urls:
+                    seen_urls.add(dedup_key)
+                    js_bundles.append(
+                        WebEndpoint(
+                            url=full_url,
+                            group=extract_url_group(full_url),
+                            normalized_url=normalized,
+                            metadata={
+                                "source": "discovered",
+                                "source_page": page.url,
+                                "size_bytes": 0,
+                            },
+                        )
+                    )
+
+        # Get bundle sizes where possible
+        sizes = dict(known_sizes or {})
+        unknown = [b.url for b in js_bundles if b.url not in sizes]
+        sizes.update(self._page_store().head_sizes(unknown))
+        for bundle in js_bundles:
+            bundle.metadata["size_bytes"] = sizes.get(bundle.url, 0)
+        self._bundle_sizes = {b.url: sizes.get(b.url, 0) for b in js_bundles}
 
         return js_bundles
 
@@ -849,7 +1500,23 @@ class WebTracker:
         Returns:
             List of SelectedTask generated from findings
         """
-        tasks: List[SelectedTask] = []
+        return [task for _, task in self._generate_keyed_tasks(result)]
+
+    def _generate_keyed_tasks(
+        self, result: WebAnalysisResult
+    ) -> List[Tuple[str, SelectedTask]]:
+        """Generate tasks paired with a stable key for the finding behind them.
+
+        Keys identify the finding (bundle, API, section, page) rather than the
+        task's position, so they survive re-scans that add or drop findings.
+
+        Args:
+            result: Web analysis results
+
+        Returns:
+            List of (key, SelectedTask) in generation order
+        """
+        tasks: List[Tuple[str, SelectedTask]] = []
         task_id = 0
 
         # Group endpoints by category for task generation
@@ -866,7 +1533,8 @@ class WebTracker:
             if size > 500_000:  # 500KB
                 task_id += 1
                 size_mb = size / (1024 * 1024)
-                tasks.append(
+                tasks.append((
+                    f"bundle:{bundle.normalized_url}",
                     SelectedTask(
                         id=f"bundle-optimize-{task_id}",
                         title=f"Optimize large bundle: {bundle.normalized_url} ({size_mb:.1f}MB)",
@@ -879,14 +1547,15 @@ class WebTracker:
                             f"Target: reduce size below 500KB (currently {size_mb:.1f}MB)",
                         ],
                         group="performance",
-                    )
-                )
+                    ),
+                ))
 
         # Generate tasks for unauthenticated API endpoints
         for api in result.api_endpoints:
             if "auth" not in api.group and "admin" not in api.group:
                 task_id += 1
-                tasks.append(
+                tasks.append((
+                    f"api:{api.normalized_url}",
                     SelectedTask(
                         id=f"api-review-{task_id}",
                         title=f"Review API endpoint security: {api.normalized_url}",
@@ -898,14 +1567,15 @@ class WebTracker:
                             "Validate input sanitization",
                         ],
                         group="security",
-                    )
-                )
+                    ),
+                ))
 
         # Generate tasks for each section with many endpoints
         for group, endpoints in by_group.items():
             if len(endpoints) > 10:
                 task_id += 1
-                tasks.append(
+                tasks.append((
+                    f"section:{group}",
                     SelectedTask(
                         id=f"section-audit-{group}-{task_id}",
                         title=f"Audit {group} section: {len(endpoints)} endpoints discovered",
@@ -918,12 +1588,13 @@ class WebTracker:
                             "Consider API versioning strategy",
                         ],
                         group="architecture",
-                    )
-                )
+                    ),
+                ))
 
         # Generate general discovery tasks
         task_id += 1
-        tasks.append(
+        tasks.append((
+            "inventory",
             SelectedTask(
                 id=f"web-inventory-{task_id}",
                 title=f"Complete web application inventory: {len(result.pages)} pages, {len(result.api_endpoints)} API endpoints",
@@ -936,14 +1607,15 @@ class WebTracker:
                     "Map page dependencies and data flow",
                 ],
                 group="documentation",
-            )
-        )
+            ),
+        ))
 
         # Generate accessibility tasks for pages
         for page in result.pages[:5]:  # Limit to first 5 pages
             task_id += 1
             path = urlparse(page.url).path or "home"
-            tasks.append(
+            tasks.append((
+                f"a11y:{page.url}",
                 SelectedTask(
                     id=f"a11y-{path.replace('/', '-')}-{task_id}",
                     title=f"Review accessibility on /{path} page",
@@ -956,11 +1628,63 @@ class WebTracker:
                         "Verify color contrast ratios",
                     ],
                     group="accessibility",
-                )
-            )
+                ),
+            ))
 
         return tasks
 
+    def _merge_tasks(
+        self,
+        keyed: List[Tuple[str, SelectedTask]],
+        previous: Optional[_PreviousScan],
+    ) -> Tuple[List[SelectedTask], Dict[str, str], int]:
+        """Give re-discovered findings their previous task IDs.
+
+        Tasks whose key was seen in the previous scan keep its ID (title and
+        acceptance criteria are refreshed). New findings get IDs numbered
+        after every ID handed out so far, so IDs are never reused: the
+        highest number is persisted with the scan state (`_task_seq`), so it
+        survives the finding that held it being resolved.
+
+        Args:
+            keyed: Output of `_generate_keyed_tasks`
+            previous: Last scan's state, if any
+
+        Returns:
+            (tasks, task ID by key, number of new tasks)
+        """
+        known = previous.task_keys if previous else {}
+        high_water = previous.task_seq if previous else 0
+        seq = max(
+            [high_water]
+            + [int(m.group(1)) for m in map(_TASK_SEQ_RE.search, known.values()) if m]
+        )
+        renumber = bool(known) or seq > 0
+
+        tasks: List[SelectedTask] = []
+        keys: Dict[str, str] = {}
+        occurrences: Dict[str, int] = {}
+        new_tasks = 0
+        for key, task in keyed:
+            # Repeats of a key are numbered by occurrence (#2, #3, ...), so
+            # their identity doesn't shift when unrelated findings come and go.
+            occurrences[key] = occurrences.get(key, 0) + 1
+            if occurrences[key] > 1:
+                key = f"{key}#{occurrences[key]}"
+            if key in known:
+                task.id = known[key]
+            else:
+                new_tasks += 1
+                if renumber:
+                    seq += 1
+                    task.id = _TASK_SEQ_RE.sub(f"-{seq}", task.id)
+            keys[key] = task.id
+            tasks.append(task)
+        self._task_seq = max(
+            [seq] + [int(m.group(1)) for m in map(_TASK_SEQ_RE.search, keys.values()) if m]
+        )
+        return tasks, keys, new_tasks
+
     def select_next_task(
         self, exclude_ids: Optional[Set[str]] = None
     ) -> Optional[SelectedTask]:
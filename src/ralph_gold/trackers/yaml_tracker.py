@@ -2,13 +2,43 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
+import logging
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 
+from ..atomic_file import atomic_write_text
 from ..prd import SelectedTask, TaskId
+from . import TrackerSnapshot
+
+logger = logging.getLogger(__name__)
+
+# libyaml is an order of magnitude faster than the pure-Python loader.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Validated documents keyed by resolved path -> (content digest, data).
+# Loads of unchanged bytes skip the parse; each caller gets its own deep copy
+# because trackers mutate their model in place.
+_YAML_CACHE: Dict[Path, Tuple[str, Dict[str, Any]]] = {}
+
+
+def _digest(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _yaml_scalar(value: Any) -> str:
+    """Render a bool/str as a YAML flow scalar (JSON is valid YAML here)."""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def clear_yaml_cache() -> None:
+    """Drop all cached YAML task documents."""
+    _YAML_CACHE.clear()
 
 
 @dataclass
@@ -40,6 +70,10 @@ class YamlTracker:
         """Return tracker kind identifier."""
         return "yaml"
 
+    def refresh(self) -> None:
+        """Reload the task file if its content changed (cheap when unchanged)."""
+        self.data = self._load_and_validate()
+
     def _load_and_validate(self) -> Dict[str, Any]:
         """Load YAML and validate against schema.
 
@@ -53,9 +87,15 @@ class YamlTracker:
         if not self.prd_path.exists():
             raise FileNotFoundError(f"YAML file not found: {self.prd_path}")
 
+        raw = self.prd_path.read_bytes()
+        digest = _digest(raw)
+        key = self.prd_path.resolve()
+        cached = _YAML_CACHE.get(key)
+        if cached is not None and cached[0] == digest:
+            return copy.deepcopy(cached[1])
+
         try:
-            with open(self.prd_path, "r") as f:
-                data = yaml.safe_load(f)
+            data = yaml.load(raw, Loader=_SafeLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML syntax: {e}")
 
@@ -85,8 +125,34 @@ class YamlTracker:
             if "title" not in task:
                 raise ValueError(f"Task at index {i} missing required 'title' field")
 
+        _YAML_CACHE[key] = (digest, copy.deepcopy(data))
         return data
 
+    def _write_task_fields(self, index: int, updates: Dict[str, Any]) -> None:
+        """Persist field updates for the task at `index`.
+
+        Edits are applied in place on the YAML text so comments, key order and
+        formatting survive. Documents the editor cannot patch safely (flow
+        mappings, aliases, block scalars being replaced) fall back to a full
+        dump.
+        """
+        text = self.prd_path.read_text(encoding="utf-8")
+        patched = _patch_task_fields(text, index, updates)
+        if patched is None:
+            patched = yaml.safe_dump(
+                self.data, default_flow_style=False, sort_keys=False
+            )
+        if patched != text:
+            try:
+                atomic_write_text(self.prd_path, patched)
+            except OSError:
+                _YAML_CACHE.pop(self.prd_path.resolve(), None)
+                raise
+        _YAML_CACHE[self.prd_path.resolve()] = (
+            _digest(patched.encode("utf-8")),
+            copy.deepcopy(self.data),
+        )
+
     def _task_from_data(self, task_data: Dict[str, Any]) -> SelectedTask:
         """Convert YAML task data to SelectedTask.
 
@@ -245,33 +311,23 @@ class YamlTracker:
         Returns:
             True if task was found and reopened, False otherwise
         """
-        found = False
-        for task in self.data.get("tasks", []):
+        for i, task in enumerate(self.data.get("tasks", [])):
             if str(task.get("id")) == str(task_id):
                 task["completed"] = False
-                found = True
-                break
-
-        if found:
-            # Write updated data back to file
-            with open(self.prd_path, "w") as f:
-                yaml.safe_dump(self.data, f, default_flow_style=False, sort_keys=False)
-
-        return found
+                self._write_task_fields(i, {"completed": False})
+                return True
+        return False
 
     def block_task(self, task_id: TaskId, reason: str) -> bool:
-        found = False
-        for task in self.data.get("tasks", []):
+        for i, task in enumerate(self.data.get("tasks", [])):
             if str(task.get("id")) == str(task_id):
-                task["blocked"] = True
+                updates: Dict[str, Any] = {"blocked": True}
                 if reason:
-                    task["blocked_reason"] = reason
-                found = True
-                break
-        if found:
-            with open(self.prd_path, "w") as f:
-                yaml.safe_dump(self.data, f, default_flow_style=False, sort_keys=False)
-        return found
+                    updates["blocked_reason"] = reason
+                task.update(updates)
+                self._write_task_fields(i, updates)
+                return True
+        return False
 
     def get_task_by_id(self, task_id: TaskId) -> Optional[SelectedTask]:
         """Return task by ID if present."""
@@ -377,3 +433,114 @@ class YamlTracker:
             groups[group].append(task)
 
         return groups
+
+    def snapshot(self) -> TrackerSnapshot:
+        """Return counts, status breakdown and ready tasks from the loaded model."""
+        tasks = self.data.get("tasks", [])
+        statuses: Dict[str, int] = {"done": 0, "blocked": 0, "open": 0}
+        finished: Set[str] = set()
+        for task_data in tasks:
+            if task_data.get("completed", False):
+                statuses["done"] += 1
+            elif task_data.get("blocked", False):
+                statuses["blocked"] += 1
+            else:
+                statuses["open"] += 1
+            if task_data.get("completed", False) or task_data.get("blocked", False):
+                finished.add(str(task_data.get("id")))
+
+        ready_ids: List[str] = []
+        for task_data in tasks:
+            if task_data.get("completed", False) or task_data.get("blocked", False):
+                continue
+            depends_on = task_data.get("depends_on", [])
+            if not isinstance(depends_on, list):
+                depends_on = []
+            if all(str(dep) in finished for dep in depends_on):
+                ready_ids.append(str(task_data.get("id")))
+
+        return TrackerSnapshot(
+            done=statuses["done"],
+            total=len(tasks),
+            status_counts=statuses,
+            ready_ids=ready_ids,
+            next_task=self.get_task_by_id(ready_ids[0]) if ready_ids else None,
+            all_done=self.all_done(),
+            all_blocked=self.all_blocked(),
+        )
+
+
+def _patch_task_fields(text: str, index: int, updates: Dict[str, Any]) -> Optional[str]:
+    """Set scalar fields on one task via targeted text edits.
+
+    Returns the patched text, or None when the document layout is not one the
+    editor can modify without risking a semantic change.
+    """
+    try:
+        root = yaml.compose(text, Loader=_SafeLoader)
+    except yaml.YAMLError as e:
+        logger.debug("Cannot compose YAML for patching: %s", e)
+        return None
+    if not isinstance(root, yaml.MappingNode):
+        return None
+
+    tasks_node = None
+    for key_node, value_node in root.value:
+        if isinstance(key_node, yaml.ScalarNode) and key_node.value == "tasks":
+            tasks_node = value_node
+    if not isinstance(tasks_node, yaml.SequenceNode) or index >= len(tasks_node.value):
+        return None
+    task_node = tasks_node.value[index]
+    if not isinstance(task_node, yaml.MappingNode) or task_node.flow_style:
+        return None
+    if not task_node.value:
+        return None
+
+    # (start, end, replacement) edits against the original text.
+    edits: List[Tuple[int, int, str]] = []
+    existing: Dict[str, yaml.Node] = {}
+    for key_node, value_node in task_node.value:
+        if not isinstance(key_node, yaml.ScalarNode) or key_node.value == "<<":
+            return None
+        existing[key_node.value] = value_node
+
+    missing: List[str] = []
+    for field_name, value in updates.items():
+        node = existing.get(field_name)
+        if node is None:
+            missing.append(f"{field_name}: {_yaml_scalar(value)}")
+            continue
+        if not isinstance(node, yaml.ScalarNode) or node.style in {"|", ">"}:
+            return None
+        start, end = node.start_mark.index, node.end_mark.index
+        replacement = _yaml_scalar(value)
+        if start == end and (start == 0 or text[start - 1] not in " \t"):
+            # Empty value (`key:`): the span sits right after the colon.
+            replacement = " " + replacement
+        if text[start:end] != replacement:
+            edits.append((start, end, replacement))
+
+    if missing:
+        first_key = task_node.value[0][0]
+        indent = " " * first_key.start_mark.column
+        # Block collections end at the next token, so anchor on the deepest
+        # trailing node and insert after the line it ends on.
+        last: yaml.Node = task_node.value[-1][1]
+        while isinstance(last, (yaml.MappingNode, yaml.SequenceNode)):
+            if last.flow_style or not last.value:
+                break
+            tail = last.value[-1]
+            last = tail[1] if isinstance(last, yaml.MappingNode) else tail
+        pos = last.end_mark.index
+        if pos == 0 or text[pos - 1] != "\n":
+            newline = text.find("\n", pos)
+            pos = len(text) if newline == -1 else newline + 1
+        block = "".join(f"{indent}{line}\n" for line in missing)
+        if pos == len(text) and not text.endswith("\n"):
+            block = "\n" + block
+        edits.append((pos, pos, block))
+
+    out = text
+    for start, end, replacement in sorted(edits, key=lambda e: e[0], reverse=True):
+        out = out[:start] + replacement + out[end:]
+    return out
@@ -10,7 +10,7 @@ from typing import Optional
 
 from .config import load_config
 from .loop import IterationResult, _resolve_loop_mode, next_iteration_number, run_iteration
-from .trackers import make_tracker
+from .trackers import make_tracker, tracker_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -110,16 +110,9 @@ def run_tui(project_root: Path) -> int:
         while True:
             # Refresh data
             tracker = make_tracker(project_root, cfg)
-            try:
-                done, total = tracker.counts()
-            except (OSError, ValueError) as e:
-                logger.debug("Failed to get tracker counts: %s", e)
-                done, total = 0, 0
-            try:
-                next_task = tracker.select_next_task()
-            except (OSError, ValueError) as e:
-                logger.debug("Failed to select next task: %s", e)
-                next_task = None
+            snap = tracker_snapshot(tracker)
+            done, total = snap.counts()
+            next_task = snap.next_task
 
             last_hist = _read_last_history(project_root)
             last_log_path = None
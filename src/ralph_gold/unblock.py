@@ -284,6 +284,7 @@ class BlockedTaskManager:
         task_id: str,
         reason: str,
         new_timeout: Optional[int] = None,
+        update_tracker: bool = True,
     ) -> UnblockResult:
         """Unblock a task for retry with optional new timeout.
 
@@ -296,6 +297,8 @@ class BlockedTaskManager:
             task_id: The task ID to unblock
             reason: Human-readable reason for unblocking
             new_timeout: Optional new timeout for retry (seconds)
+            update_tracker: Reopen the task in the tracker (False when the
+                caller already reopened it as part of a batch)
 
         Returns:
             UnblockResult with success status and details
@@ -354,16 +357,17 @@ class BlockedTaskManager:
             self.tracker = make_tracker(self.project_root, cfg)
 
         # Unblock in tracker
-        try:
-            self.tracker.force_task_open(task_id_effective)
-        except Exception as e:
-            return UnblockResult(
-                success=False,
-                task_id=task_id,
-                previous_attempts=previous_attempts,
-                new_timeout=new_timeout or 0,
-                message=f"Failed to unblock in tracker: {e}",
-            )
+        if update_tracker:
+            try:
+                self.tracker.force_task_open(task_id_effective)
+            except Exception as e:
+                return UnblockResult(
+                    success=False,
+                    task_id=task_id,
+                    previous_attempts=previous_attempts,
+                    new_timeout=new_timeout or 0,
+                    message=f"Failed to unblock in tracker: {e}",
+                )
 
         # Update state: remove from blocked_tasks
         del state_data["blocked_tasks"][task_id_effective]
@@ -429,6 +433,7 @@ class BlockedTaskManager:
         blocked = self.list_blocked_tasks()
         results: List[UnblockResult] = []
 
+        selected: List[BlockedTaskInfo] = []
         for task_info in blocked:
             # Apply filters
             if filter_reason and task_info.reason != filter_reason:
@@ -440,6 +445,19 @@ class BlockedTaskManager:
             if min_attempts and task_info.attempts < min_attempts:
                 continue
 
+            selected.append(task_info)
+
+        # Reopen everything in one PRD write when the tracker supports it.
+        tracker_updated = False
+        force_many = getattr(self.tracker, "force_tasks_open", None)
+        if selected and callable(force_many):
+            try:
+                force_many([t.task_id for t in selected])
+                tracker_updated = True
+            except Exception as e:
+                logger.debug("Batch reopen failed, falling back per task: %s", e)
+
+        for task_info in selected:
             # Calculate new timeout
             new_timeout = int(task_info.suggested_timeout * new_timeout_multiplier)
 
@@ -448,6 +466,7 @@ class BlockedTaskManager:
                 task_id=task_info.task_id,
                 reason=f"Batch unblock ({task_info.reason}, {task_info.attempts} attempts)",
                 new_timeout=new_timeout,
+                update_tracker=not tracker_updated,
             )
             results.append(result)
 
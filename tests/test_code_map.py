@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from ralph_gold.code_map import (
+    CodeIndex,
+    build_code_map,
+    extract_python_symbols,
+    extract_regex_symbols,
+    identifier_tokens,
+)
+from ralph_gold.config import load_config
+from ralph_gold.loop import _build_builtin_context_pack
+from ralph_gold.prd import SelectedTask
+
+AUTH_PY = '''
+class TokenStore(Base):
+    def refresh_token(self, user_id: str) -> str:
+        return ""
+
+async def login(request):
+    pass
+'''
+
+
+def _repo(root: Path) -> Path:
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "auth.py").write_text(AUTH_PY, encoding="utf-8")
+    (root / "src" / "billing.ts").write_text(
+        "export class InvoiceService {\n  constructor() {}\n}\nexport const renderPdf = async (id: string) => id;\n",
+        encoding="utf-8",
+    )
+    (root / "README.md").write_text("not indexed", encoding="utf-8")
+    return root
+
+
+def test_extractors() -> None:
+    symbols = extract_python_symbols(AUTH_PY)
+    assert [(s.kind, s.name, s.line, s.depth) for s in symbols] == [
+        ("class", "TokenStore", 2, 0),
+        ("method", "refresh_token", 3, 1),
+        ("function", "login", 6, 0),
+    ]
+    assert symbols[1].signature == "def refresh_token(self, user_id: str) -> str"
+    assert extract_python_symbols("def broken(:\n") == []
+
+    go = extract_regex_symbols("type Server struct {\n}\nfunc (s *Server) Serve(addr string) error {\n", ".go")
+    assert [(s.kind, s.name) for s in go] == [("type", "Server"), ("function", "Serve")]
+    assert set(identifier_tokens("renderPdfInvoice")) >= {"renderpdfinvoice", "render", "pdf", "invoice"}
+
+
+def test_index_is_incremental_and_ranks_files(tmp_path: Path) -> None:
+    root = _repo(tmp_path)
+    index_path = root / ".ralph" / "cache" / "code_index.json"
+    index = CodeIndex(root, index_path)
+    assert index.update() == 2
+    assert sorted(index.files) == ["src/auth.py", "src/billing.ts"]
+
+    assert index.search("Refresh the login token")[0][0] == "src/auth.py"
+    assert index.search("render invoice PDF")[0][0] == "src/billing.ts"
+
+    reloaded = CodeIndex(root, index_path)
+    assert reloaded.update() == 0
+    billing = root / "src" / "billing.ts"
+    billing.write_text("export function chargeCard() {}\n", encoding="utf-8")
+    st = billing.stat()
+    os.utime(billing, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert reloaded.update() == 1
+    assert reloaded.search("charge card")[0][0] == "src/billing.ts"
+
+
+def test_build_code_map_is_bounded(tmp_path: Path) -> None:
+    root = _repo(tmp_path)
+    task = SelectedTask(id="7", title="Fix token refresh", kind="md", acceptance=["login keeps session"])
+    result = build_code_map(root, task)
+
+    assert result.text.startswith("Code map for task 7: Fix token refresh")
+    assert "### src/auth.py\n- L2: class TokenStore(Base)\n  - L3: def refresh_token" in result.text
+    assert "billing" not in result.text
+    assert result.to_notes()["files_indexed"] == 2
+
+    assert build_code_map(root, task, max_chars=80).text == ""
+    assert build_code_map(root, SelectedTask(id="8", title="kubernetes", kind="md")).text == ""
+
+
+def test_builtin_backend_writes_pack_and_receipt(tmp_path: Path) -> None:
+    root = _repo(tmp_path)
+    (root / ".ralph").mkdir(exist_ok=True)
+    (root / ".ralph" / "ralph.toml").write_text(
+        '[repoprompt]\nenabled = true\ncontext_backend = "builtin"\nmap_max_files = 1\n', encoding="utf-8"
+    )
+    cfg = load_config(root)
+    assert (cfg.repoprompt.context_backend, cfg.repoprompt.map_max_files) == ("builtin", 1)
+
+    context_dir = root / ".ralph" / "context"
+    receipts_dir = root / ".ralph" / "receipts"
+    context_dir.mkdir(parents=True)
+    receipts_dir.mkdir(parents=True)
+    task = SelectedTask(id="1", title="invoice service", kind="md")
+    text = _build_builtin_context_pack(root, cfg, task, context_dir, receipts_dir)
+
+    assert "### src/billing.ts" in text and "auth.py" not in text
+    assert (context_dir / "code_map.md").read_text(encoding="utf-8") == text
+    receipt = json.loads((receipts_dir / "repoprompt_context.json").read_text(encoding="utf-8"))
+    assert receipt["notes"]["backend"] == "builtin"
+    assert receipt["notes"]["files_ranked"] == 1
@@ -11,7 +11,9 @@ import pytest
 from ralph_gold.context_manager import (
     ContextConfig,
     ContextHealth,
+    ProgressIndex,
     _split_progress_entries,
+    progress_window_from_entries,
     archive_old_progress,
     check_context_health,
     load_progress_window,
@@ -206,6 +208,80 @@ class TestArchiveOldProgress:
         assert "Entry 0" in archive_content
 
 
+class TestProgressIndex:
+    """Tests for the entry offset index behind the progress window."""
+
+    @staticmethod
+    def _entries(start, stop):
+        return "".join(
+            f"[2026-01-19T11:{i % 60:02d}:00Z] Entry {i} \u2713\nContent {i}\n\n"
+            for i in range(start, stop)
+        )
+
+    def test_window_matches_full_split(self, tmp_path):
+        """Seeking by offsets yields the same window as splitting the file."""
+        path = tmp_path / "progress.md"
+        content = "preamble\n\n" + self._entries(0, 40) + "2026-01-20 Iteration 3: done\n"
+        path.write_text(content, encoding="utf-8")
+
+        entries = _split_progress_entries(content)
+        for max_lines, max_chars in ((5, 10000), (100, 10000), (10, 120)):
+            assert load_progress_window(path, max_lines, max_chars) == (
+                progress_window_from_entries(entries, max_lines, max_chars)
+            )
+
+    def test_index_extends_on_append_and_rebuilds_on_rewrite(self, tmp_path):
+        """Appends are scanned incrementally; rewrites trigger a rescan."""
+        path = tmp_path / "progress.md"
+        path.write_text(self._entries(0, 5), encoding="utf-8")
+        index = ProgressIndex.open(path)
+        assert len(index) == 5
+        assert index.sidecar.exists()
+
+        with path.open("a", encoding="utf-8") as f:
+            f.write(self._entries(5, 8))
+        reloaded = ProgressIndex.open(path)
+        assert len(reloaded) == 8
+        assert reloaded.starts[:5] == index.starts
+
+        path.write_text(self._entries(100, 102), encoding="utf-8")
+        _, loaded, total = load_progress_window(path)
+        assert (loaded, total) == (2, 2)
+
+    def test_sidecar_lives_in_project_cache(self, tmp_path):
+        """The offsets sidecar goes to .ralph/cache, not a new dir beside the file."""
+        ralph = tmp_path / ".ralph"
+        ralph.mkdir()
+        path = ralph / "progress.md"
+        path.write_text(self._entries(0, 3), encoding="utf-8")
+
+        index = ProgressIndex.open(path)
+        assert index.sidecar == ralph / "cache" / "progress.md.offsets.json"
+        assert index.sidecar.exists()
+        assert sorted(p.name for p in ralph.iterdir()) == ["cache", "progress.md"]
+
+    def test_archive_keeps_index_consistent(self, tmp_path):
+        """Archival shifts the index instead of invalidating it."""
+        path = tmp_path / "progress.md"
+        path.write_text(self._entries(0, 10), encoding="utf-8")
+        archive_dir = tmp_path / "archive"
+
+        assert archive_old_progress(path, archive_dir, keep_lines=4) == 6
+        index = ProgressIndex(path)
+        index._load()
+        assert not index.refresh()  # sidecar already matches the new file
+        assert index.read_entries(0, len(index)) == _split_progress_entries(
+            path.read_text(encoding="utf-8")
+        )
+        assert len(index) == 4
+
+        path.write_text(path.read_text(encoding="utf-8") + self._entries(10, 13), encoding="utf-8")
+        assert archive_old_progress(path, archive_dir, keep_lines=4) == 3
+        archive = next(archive_dir.glob("progress-*.md")).read_text(encoding="utf-8")
+        assert archive.count("] Entry ") == 9
+        assert "Content 5\n\n[2026-01-19T11:06:00Z] Entry 6" in archive
+
+
 class TestCheckContextHealth:
     """Tests for check_context_health function."""
 
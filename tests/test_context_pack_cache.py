@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+from ralph_gold.config import RepoPromptConfig
+from ralph_gold.context_pack_cache import (
+    ContextPackCache,
+    PackPrefetcher,
+    pack_cache_key,
+)
+from ralph_gold.prd import SelectedTask
+
+FAKE_RP_CLI = """\
+import sys, time
+chain = sys.argv[sys.argv.index("-e") + 1]
+path = chain.rsplit('prompt export "', 1)[1].rstrip('"')
+time.sleep(0.2)
+with open(path, "w", encoding="utf-8") as f:
+    f.write("PACK " + chain.split("Task ", 1)[1].split(":", 1)[0])
+with open(sys.argv[0] + ".calls", "a", encoding="utf-8") as f:
+    f.write("call\\n")
+"""
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _repo(root: Path) -> Path:
+    _git(root, "init")
+    (root / "app.py").write_text("x = 1\n", encoding="utf-8")
+    (root / ".ralph").mkdir()
+    (root / ".ralph" / "progress.md").write_text("start\n", encoding="utf-8")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-m", "init")
+    return root
+
+
+def _fake_cli(root: Path) -> RepoPromptConfig:
+    # Kept outside the repo: its call log must not change the source tree.
+    tools = root.parent / "tools"
+    tools.mkdir(exist_ok=True)
+    script = tools / "fake_rp.py"
+    script.write_text(FAKE_RP_CLI, encoding="utf-8")
+    wrapper = tools / "fake-rp-cli"
+    wrapper.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n', encoding="utf-8")
+    wrapper.chmod(0o755)
+    return RepoPromptConfig(enabled=True, cli=str(wrapper), prefetch=True)
+
+
+def test_key_tracks_task_acceptance_and_source_tree(tmp_path: Path) -> None:
+    root = _repo(tmp_path)
+    cfg = RepoPromptConfig(enabled=True)
+    task = SelectedTask(id="1", title="Add login", kind="md", acceptance=["works"])
+    key = pack_cache_key(root, cfg, task)
+    assert key is not None
+
+    assert pack_cache_key(root, cfg, SelectedTask(id="1", title="Add login", kind="md")) != key
+    assert pack_cache_key(root, cfg, SelectedTask(id="2", title="Add login", kind="md", acceptance=["works"])) != key
+
+    # Orchestrator bookkeeping under .ralph/ does not invalidate packs.
+    (root / ".ralph" / "progress.md").write_text("start\nmore\n", encoding="utf-8")
+    _git(root, "commit", "-am", "progress")
+    assert pack_cache_key(root, cfg, task) == key
+
+    (root / "app.py").write_text("x = 2\n", encoding="utf-8")
+    _git(root, "commit", "-am", "code")
+    assert pack_cache_key(root, cfg, task) != key
+    assert pack_cache_key(tmp_path / "not-a-repo", cfg, task) is None
+
+
+def test_key_follows_working_tree_across_auto_commit(tmp_path: Path) -> None:
+    root = _repo(tmp_path)
+    cfg = RepoPromptConfig(enabled=True)
+    task = SelectedTask(id="1", title="Add login", kind="md")
+    clean = pack_cache_key(root, cfg, task)
+
+    # The agent's uncommitted edits are what rp-cli sees and what a prefetch
+    # is keyed on; committing them afterwards keeps the key.
+    (root / "app.py").write_text("x = 2\n", encoding="utf-8")
+    (root / "new.py").write_text("y = 1\n", encoding="utf-8")
+    (root / ".ralph" / "progress.md").write_text("start\niter 1\n", encoding="utf-8")
+    dirty = pack_cache_key(root, cfg, task)
+    assert dirty != clean
+    staged_before = subprocess.run(
+        ["git", "diff", "--cached", "--name-only"], cwd=root, capture_output=True, text=True
+    ).stdout
+    assert staged_before == ""  # the real index is untouched
+
+    _git(root, "add", "-A")
+    _git(root, "commit", "-m", "iteration 1")
+    assert pack_cache_key(root, cfg, task) == dirty
+
+
+def test_prefetch_builds_once_and_lookup_waits(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    root.mkdir()
+    _repo(root)
+    cfg = _fake_cli(root)
+    task = SelectedTask(id="7", title="Next", kind="md")
+    key = pack_cache_key(root, cfg, task)
+    prefetcher = PackPrefetcher()
+
+    assert prefetcher.prefetch(root, cfg, task) is True
+    assert prefetcher.prefetch(root, cfg, task) is False  # already in flight
+
+    pack = prefetcher.lookup(root, key, timeout=30)
+    assert pack is not None and pack.text == "PACK 7"
+    assert pack.meta["prefetched"] is True
+    assert prefetcher.prefetch(root, cfg, task) is False  # cached
+    assert (tmp_path / "tools" / "fake_rp.py.calls").read_text(encoding="utf-8").count("call") == 1
+    assert not list(ContextPackCache(root).root.glob("*.export.md"))
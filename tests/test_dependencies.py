@@ -1,10 +1,17 @@
 """Unit tests for the dependencies module."""
 
 from ralph_gold.dependencies import (
+    ReadySet,
+    _topological_sort,
+    analyze_critical_path,
     build_dependency_graph,
+    compute_critical_path,
     detect_circular_dependencies,
+    estimate_task_durations,
+    format_critical_path,
     format_dependency_graph,
     get_ready_tasks,
+    history_durations,
 )
 
 
@@ -448,3 +455,120 @@ def test_multiple_independent_chains():
     # Complete both chains partially
     ready = get_ready_tasks(graph, {"task-A", "task-X"})
     assert set(ready) == {"task-B", "task-Y"}
+
+
+def test_critical_path_and_slack_on_diamond():
+    """The longer branch of a diamond is critical; the shorter has slack."""
+    tasks = [
+        {"id": "A", "depends_on": []},
+        {"id": "B", "depends_on": ["A"]},
+        {"id": "C", "depends_on": ["A"]},
+        {"id": "D", "depends_on": ["B", "C"]},
+        {"id": "E", "depends_on": []},
+    ]
+    graph = build_dependency_graph(tasks)
+    analysis = compute_critical_path(graph, {"A": 10, "B": 50, "C": 20, "D": 5, "E": 15})
+
+    assert analysis.makespan == 65
+    assert analysis.critical_path == ["A", "B", "D"]
+    assert analysis.slack("C") == 30
+    assert analysis.slack("E") == 50
+    assert analysis.schedule["D"].earliest_start == 60
+    assert analysis.is_critical("A") and not analysis.is_critical("C")
+    # Ready tasks ordered critical-first; ties keep the given order.
+    assert analysis.order(["E", "C", "B"]) == ["B", "C", "E"]
+    assert analysis.slack("unknown") == float("inf")
+    assert "A → B → D" in format_critical_path(analysis)
+
+
+def test_durations_prefer_history_over_estimates():
+    """History averages win; done tasks cost nothing; others are estimated."""
+    history = [
+        {"story_id": "1", "duration_seconds": 100},
+        {"story_id": "1", "duration_seconds": 300},
+        {"story_id": "2", "duration_seconds": 0},
+        {"story_id": None, "duration_seconds": 50},
+    ]
+    assert history_durations(history) == {"1": 200.0}
+
+    tasks = [
+        {"id": "1", "title": "Build API", "status": "open"},
+        {"id": "2", "title": "Fix typo", "status": "open"},
+        {"id": "3", "title": "Ship", "status": "done"},
+    ]
+    durations = estimate_task_durations(tasks, history)
+    assert durations["1"] == 200.0
+    assert durations["2"] > 0
+    assert durations["3"] == 0.0
+
+    _, analysis = analyze_critical_path(
+        [dict(t, depends_on=[]) for t in tasks], history
+    )
+    assert analysis.schedule["3"].duration == 0.0
+
+
+def test_deep_chain_does_not_recurse():
+    """Cycle detection and depths are iterative, so 20k-deep chains work."""
+    n = 20_000
+    tasks = [{"id": f"t{i}", "depends_on": [f"t{i - 1}"] if i else []} for i in range(n)]
+    graph = build_dependency_graph(tasks)
+
+    assert detect_circular_dependencies(graph) == []
+    assert graph.nodes[f"t{n - 1}"].depth == n - 1
+
+    # Closing the chain into a loop is reported as one cycle.
+    tasks[0]["depends_on"] = [f"t{n - 1}"]
+    cycles = detect_circular_dependencies(build_dependency_graph(tasks))
+    assert len(cycles) == 1
+    assert len(cycles[0]) == n + 1
+    assert cycles[0][0] == cycles[0][-1] == "t0"
+
+
+def test_cycles_are_reported_per_component_in_dependency_order():
+    tasks = [
+        {"id": "a", "depends_on": ["c"]},
+        {"id": "b", "depends_on": ["a"]},
+        {"id": "c", "depends_on": ["b"]},
+        {"id": "s", "depends_on": ["s"]},
+        {"id": "x", "depends_on": ["a"]},
+    ]
+    cycles = detect_circular_dependencies(build_dependency_graph(tasks))
+
+    assert cycles == [["a", "c", "b", "a"], ["s", "s"]]
+
+
+def test_topological_sort_breaks_ties_by_input_order():
+    tasks = [
+        {"id": "z", "depends_on": []},
+        {"id": "y", "depends_on": ["x"]},
+        {"id": "x", "depends_on": []},
+        {"id": "w", "depends_on": ["z", "z"]},
+    ]
+    assert _topological_sort(build_dependency_graph(tasks)) == ["z", "x", "y", "w"]
+
+
+def test_ready_set_updates_incrementally():
+    """Completing or reopening a task only touches its dependents."""
+    tasks = [
+        {"id": "a", "depends_on": []},
+        {"id": "b", "depends_on": ["a"]},
+        {"id": "c", "depends_on": ["a", "b"]},
+        {"id": "d", "depends_on": ["missing"]},
+    ]
+    graph = build_dependency_graph(tasks)
+    ready = ReadySet(graph)
+    assert ready.ready() == ["a"]
+
+    assert ready.mark_done("a") == ["b"]
+    assert ready.mark_done("a") == []
+    assert ready.mark_done("b") == ["c"]
+    assert ready.ready() == ["c"]
+    assert ready.ready() == get_ready_tasks(graph, {"a", "b"})
+
+    # Reopening a dependency withdraws its dependents again.
+    assert ready.mark_open("a") == ["c"]
+    assert ready.ready() == ["a"]
+
+    # Dependencies outside the graph count until marked done by name.
+    assert ready.mark_done("missing") == ["d"]
+    assert ReadySet(graph, {"missing"}).is_ready("d")
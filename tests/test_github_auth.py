@@ -324,3 +324,159 @@ class TestCreateAuth:
         with patch.dict(os.environ, {}, clear=True):
             with pytest.raises(GitHubAuthError, match="token not found"):
                 create_auth(auth_method="token")
+
+
+class _MutationServer:
+    """Keep-alive HTTP server that rate-limits the first request."""
+
+    def __init__(self) -> None:
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        self.seen: list[tuple[str, str, int]] = []
+        self.limited = 1
+        self.limited_status = 403
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                server.seen.append((self.command, self.path, self.client_address[1]))
+                if server.limited and server.limited_status != 403:
+                    server.limited -= 1
+                    body = b'{"message": "Bad gateway"}'
+                    self.send_response(server.limited_status)
+                elif server.limited:
+                    server.limited -= 1
+                    body = b'{"message": "You have exceeded a secondary rate limit."}'
+                    self.send_response(403)
+                    self.send_header("Retry-After", "0")
+                else:
+                    body = b"{}"
+                    self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestTokenAuthTransport:
+    """Pooled session, retries and batched calls against a local server."""
+
+    def test_retries_secondary_rate_limit_and_reuses_connection(self):
+        server = _MutationServer()
+        try:
+            auth = TokenAuth(token="ghp_test", base_url=server.url)
+            delays: list[float] = []
+            auth._sleep = delays.append
+
+            assert auth.api_call("GET", "/user") == {}
+            assert auth.api_call("GET", "/user") == {}
+
+            assert delays == [0.0]
+            assert len(server.seen) == 3
+            # All requests went over one kept-alive connection.
+            assert len({port for _, _, port in server.seen}) == 1
+            auth.close()
+        finally:
+            server.close()
+
+    def test_gateway_errors_retry_only_idempotent_methods(self):
+        server = _MutationServer()
+        server.limited_status = 502
+        try:
+            auth = TokenAuth(token="ghp_test", base_url=server.url)
+            delays: list[float] = []
+            auth._sleep = delays.append
+
+            # The comment may have been created behind the gateway: no retry.
+            with pytest.raises(GitHubAuthError, match="502"):
+                auth.api_call("POST", "/repos/o/r/issues/1/comments", {"body": "done"})
+            assert [m for m, _, _ in server.seen] == ["POST"]
+            assert delays == []
+
+            server.limited = 1
+            assert auth.api_call("PATCH", "/repos/o/r/issues/1", {"state": "closed"}) == {}
+            assert [m for m, _, _ in server.seen] == ["POST", "PATCH", "PATCH"]
+            assert len(delays) == 1
+            auth.close()
+        finally:
+            server.close()
+
+    def test_absolute_urls_must_match_the_api_host(self):
+        server = _MutationServer()
+        server.limited = 0
+        try:
+            with TokenAuth(token="ghp_test", base_url=server.url) as auth:
+                assert auth.request("GET", f"{server.url}/repos/o/r/issues?page=2").status == 200
+                for url in (
+                    "https://evil.example.com/repos/o/r/issues?page=2",
+                    server.url.replace("http://", "https://") + "/repos/o/r/issues",
+                ):
+                    with pytest.raises(GitHubAuthError, match="Refusing"):
+                        auth.request("GET", url)
+            assert len(server.seen) == 1
+        finally:
+            server.close()
+
+    def test_batch_returns_results_and_errors_in_order(self):
+        server = _MutationServer()
+        server.limited = 0
+        try:
+            auth = TokenAuth(token="ghp_test", base_url=server.url)
+            calls = [
+                ("PATCH", f"/repos/o/r/issues/{n}", {"state": "closed"})
+                for n in range(1, 7)
+            ]
+            calls.append(("TRACE", "/nope", None))
+
+            results = auth.batch(calls)
+
+            assert results[:6] == [{}] * 6
+            assert isinstance(results[6], GitHubAuthError)
+            assert sorted(path for _, path, _ in server.seen) == sorted(
+                c[1] for c in calls[:6]
+            )
+        finally:
+            server.close()
+
+    def test_batch_keeps_same_key_calls_in_order(self):
+        server = _MutationServer()
+        server.limited = 0
+        try:
+            auth = TokenAuth(token="ghp_test", base_url=server.url)
+            calls = []
+            for n in range(1, 5):
+                calls += [
+                    ("PATCH", f"/repos/o/r/issues/{n}", {"state": "closed"}),
+                    ("POST", f"/repos/o/r/issues/{n}/comments", {"body": "done"}),
+                    ("DELETE", f"/repos/o/r/issues/{n}/labels/wip", None),
+                ]
+            keys = [path.split("/")[5] for _, path, _ in calls]
+
+            for _ in range(5):
+                server.seen.clear()
+                assert auth.batch(calls, keys=keys) == [{}] * len(calls)
+                for n in range(1, 5):
+                    assert [
+                        m for m, path, _ in server.seen if path.split("/")[5] == str(n)
+                    ] == ["PATCH", "POST", "DELETE"]
+            auth.close()
+        finally:
+            server.close()
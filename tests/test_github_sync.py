@@ -0,0 +1,202 @@
+"""Incremental GitHub issue sync against a local fake API server."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from ralph_gold.github_auth import GitHubAuthError, TokenAuth
+from ralph_gold.trackers.github_issues import GitHubIssuesTracker
+
+
+class FakeGitHub:
+    """Serves /repos/o/r/issues with Link pagination, since= and ETags."""
+
+    def __init__(self) -> None:
+        self.issues: Dict[int, Dict[str, Any]] = {}
+        self.requests: List[Dict[str, Any]] = []
+        self.clock = 0
+        self.link_base: str = ""
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                fake.handle(self)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def put(self, number: int, state: str = "open", labels: tuple = ("ready",)) -> None:
+        self.clock += 1
+        self.issues[number] = {
+            "number": number,
+            "title": f"Issue {number}",
+            "state": state,
+            "labels": [{"name": name} for name in labels],
+            "created_at": f"2024-01-01T00:00:{number:02d}Z",
+            "updated_at": f"2024-02-01T00:{self.clock:02d}:00Z",
+        }
+
+    def handle(self, req: BaseHTTPRequestHandler) -> None:
+        parsed = urlparse(req.path)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        self.requests.append(
+            {"query": dict(query), "if_none_match": req.headers.get("If-None-Match")}
+        )
+
+        items = sorted(self.issues.values(), key=lambda i: i["number"])
+        if query.get("state", "open") != "all":
+            items = [i for i in items if i["state"] == query.get("state", "open")]
+        if "labels" in query:
+            items = [
+                i for i in items
+                if query["labels"] in {lbl["name"] for lbl in i["labels"]}
+            ]
+        if "since" in query:
+            items = [i for i in items if i["updated_at"] >= query["since"]]
+            items.sort(key=lambda i: i["updated_at"], reverse=True)
+
+        per_page = int(query.get("per_page", 30))
+        page = int(query.get("page", 1))
+        chunk = items[(page - 1) * per_page : page * per_page]
+        body = json.dumps(chunk).encode("utf-8")
+        etag = f'"{hash(body) & 0xFFFFFFFF:x}"'
+
+        if req.headers.get("If-None-Match") == etag:
+            req.send_response(304)
+            req.send_header("ETag", etag)
+            req.end_headers()
+            return
+
+        req.send_response(200)
+        req.send_header("Content-Type", "application/json")
+        req.send_header("ETag", etag)
+        if page * per_page < len(items):
+            query["page"] = str(page + 1)
+            nxt = "&".join(f"{k}={v}" for k, v in query.items())
+            base = self.link_base or self.url
+            req.send_header("Link", f'<{base}{parsed.path}?{nxt}>; rel="next"')
+        req.send_header("Content-Length", str(len(body)))
+        req.end_headers()
+        req.wfile.write(body)
+
+
+@pytest.fixture
+def fake_github():
+    fake = FakeGitHub()
+    yield fake
+    fake.server.shutdown()
+    fake.server.server_close()
+
+
+def _tracker(tmp_path, fake: FakeGitHub) -> GitHubIssuesTracker:
+    auth = TokenAuth(token="ghp_test", base_url=fake.url)
+    with patch("ralph_gold.trackers.github_issues.create_auth", return_value=auth):
+        return GitHubIssuesTracker(tmp_path, "o/r", cache_ttl_seconds=0)
+
+
+def test_full_sync_follows_link_pagination(tmp_path, fake_github, monkeypatch) -> None:
+    monkeypatch.setattr("ralph_gold.trackers.github_issues._PER_PAGE", 2)
+    for n in range(1, 6):
+        fake_github.put(n)
+    fake_github.put(6, labels=("wip",))
+
+    tracker = _tracker(tmp_path, fake_github)
+
+    assert tracker.counts() == (0, 5)
+    assert [r["query"].get("page", "1") for r in fake_github.requests[:3]] == ["1", "2", "3"]
+
+
+def test_link_to_a_foreign_host_is_not_followed(tmp_path, fake_github, monkeypatch) -> None:
+    monkeypatch.setattr("ralph_gold.trackers.github_issues._PER_PAGE", 2)
+    for n in range(1, 6):
+        fake_github.put(n)
+    foreign = FakeGitHub()
+    try:
+        fake_github.link_base = foreign.url
+        with pytest.raises(GitHubAuthError, match="Refusing"):
+            _tracker(tmp_path, fake_github)
+        # The token never reaches the host named by the response.
+        assert foreign.requests == []
+    finally:
+        foreign.server.shutdown()
+        foreign.server.server_close()
+
+
+def test_delta_sync_uses_since_and_etags(tmp_path, fake_github) -> None:
+    fake_github.put(1)
+    fake_github.put(2)
+    tracker = _tracker(tmp_path, fake_github)
+    assert tracker.counts() == (0, 2)
+
+    # Closing an issue shows up in the next since= delta.
+    fake_github.put(1, state="closed")
+    fake_github.requests.clear()
+    tracker._sync_cache()
+    assert fake_github.requests[0]["query"]["state"] == "all"
+    assert "since" in fake_github.requests[0]["query"]
+    assert tracker.is_task_done("1") is True
+    assert tracker.get_task_status("2") == "open"
+
+    # Nothing changed: the next delta revalidates with the stored ETag.
+    tracker._sync_cache()
+    tracker._sync_cache()
+    assert fake_github.requests[-1]["if_none_match"] is not None
+    assert tracker.counts() == (0, 1)
+
+    # An issue that loses the filter label disappears from the cache.
+    fake_github.put(2, labels=())
+    fake_github.put(3)
+    tracker._sync_cache()
+    assert [t.id for t in tracker.get_parallel_groups()["default"]] == ["3"]
+
+
+def test_cache_file_is_parsed_once(tmp_path, fake_github, monkeypatch) -> None:
+    fake_github.put(1)
+    tracker = _tracker(tmp_path, fake_github)
+    tracker.cache_ttl_seconds = 300
+
+    calls = []
+    real_loads = json.loads
+
+    def counting_loads(*args, **kwargs):
+        calls.append(1)
+        return real_loads(*args, **kwargs)
+
+    monkeypatch.setattr("ralph_gold.trackers.github_issues.json.loads", counting_loads)
+    for _ in range(5):
+        tracker.peek_next_task()
+        tracker.counts()
+    assert calls == []
+
+
+def test_mark_tasks_done_batches_mutations(tmp_path, fake_github) -> None:
+    tracker = _tracker(tmp_path, fake_github)
+    sent = []
+    sent_keys = []
+
+    def fake_batch(calls, max_workers=4, keys=None):
+        sent.append(list(calls))
+        sent_keys.append(list(keys or []))
+        return [{} for _ in calls]
+
+    tracker.auth.batch = fake_batch  # type: ignore[method-assign]
+
+    results = tracker.mark_tasks_done(["1", "2", "3"], remove_labels=["ready"])
+
+    assert results == {"1": True, "2": True, "3": True}
+    assert len(sent) == 1
+    assert [c[0] for c in sent[0]].count("PATCH") == 3
+    assert len(sent[0]) == 9
+    # Each issue's mutations share one ordering key, so they run in sequence.
+    assert sent_keys[0] == ["1"] * 3 + ["2"] * 3 + ["3"] * 3
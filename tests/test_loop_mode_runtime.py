@@ -871,3 +871,43 @@ def test_batch_exec(tmp_path: Path) -> None:
     for i, res in enumerate(results):
         assert res.return_code == 0, f"Task {i} failed"
         assert res.story_id == f"quick-{i + 1}"
+
+
+def test_cache_friendly_prompt_keeps_prefix_stable(tmp_path: Path):
+    from dataclasses import replace
+
+    from ralph_gold.config import load_config
+    from ralph_gold.loop import build_prompt, split_prompt_prefix
+    from ralph_gold.prd import SelectedTask
+
+    ralph = tmp_path / ".ralph"
+    (ralph / "specs").mkdir(parents=True)
+    (ralph / "PROMPT_build.md").write_text("BUILD PROMPT", encoding="utf-8")
+    (ralph / "AGENTS.md").write_text("Run pytest.", encoding="utf-8")
+    (ralph / "PRD.md").write_text("# PRD\n\n## Tasks\n\n- [ ] One\n- [ ] Two\n", encoding="utf-8")
+    (ralph / "specs" / "b.md").write_text("spec b", encoding="utf-8")
+    (ralph / "specs" / "a.md").write_text("spec a", encoding="utf-8")
+    progress = ralph / "progress.md"
+    progress.write_text("- iteration 1 done\n", encoding="utf-8")
+
+    cfg = load_config(tmp_path)
+    cfg = replace(cfg, prompt=replace(cfg.prompt, layout="cache_friendly"))
+
+    first = build_prompt(
+        tmp_path, cfg, SelectedTask(id="1", title="One", kind="md"), 1, anchor_text="dirty: a.py"
+    )
+    progress.write_text("- iteration 1 done\n- iteration 2 done\n", encoding="utf-8")
+    second = build_prompt(
+        tmp_path, cfg, SelectedTask(id="2", title="Two", kind="md"), 2, anchor_text="clean"
+    )
+
+    prefix, rest = split_prompt_prefix(first)
+    assert split_prompt_prefix(second)[0] == prefix
+    assert prefix.startswith("BUILD PROMPT")
+    assert prefix.index("specs/a.md") < prefix.index("specs/b.md") < prefix.index("PRD.md")
+    assert "Iteration: 1" in rest and "iteration 1 done" in rest and "dirty: a.py" in rest
+    assert rest.rstrip().endswith("EXIT_SIGNAL: true  OR  EXIT_SIGNAL: false")
+
+    # The classic layout puts the iteration addendum before project memory.
+    classic = build_prompt(tmp_path, load_config(tmp_path), None, 3)
+    assert split_prompt_prefix(classic)[0].strip() == "BUILD PROMPT"
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from ralph_gold.atomic_file import atomic_write_json
+from ralph_gold.code_map import build_code_map
+from ralph_gold.config import load_config
+from ralph_gold.loop import build_prompt
+from ralph_gold.pipeline import IterationPipeline, predict_next_task, warm_iteration_sources
+from ralph_gold.prompt_cache import get_prompt_cache
+from ralph_gold.trackers import make_tracker
+
+PRD = "# PRD\n\n## Tasks\n\n- [ ] First task\n- [ ] Second task\n- [ ] Third task\n"
+
+
+def _project(root: Path, toml: str = "") -> Path:
+    ralph = root / ".ralph"
+    (ralph / "specs").mkdir(parents=True)
+    (ralph / "PROMPT_build.md").write_text("BUILD", encoding="utf-8")
+    (ralph / "AGENTS.md").write_text("agents", encoding="utf-8")
+    (ralph / "PRD.md").write_text(PRD, encoding="utf-8")
+    (ralph / "progress.md").write_text("[2026-01-01T00:00:00Z]\nstarted\n", encoding="utf-8")
+    (ralph / "specs" / "api.md").write_text("# API\n", encoding="utf-8")
+    (ralph / "ralph.toml").write_text(toml, encoding="utf-8")
+    return root
+
+
+def test_pipeline_config_is_opt_in(tmp_path: Path) -> None:
+    assert load_config(_project(tmp_path)).loop.pipeline is False
+    other = _project(tmp_path / "other", "[loop]\npipeline = true\n")
+    assert load_config(other).loop.pipeline is True
+
+
+def test_prediction_is_used_or_discarded(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    cfg = load_config(root)
+    tracker = make_tracker(root, cfg, reuse=False)
+    first = tracker.select_next_task()
+    assert first is not None
+
+    predicted = predict_next_task(tracker, {str(first.id), ""})
+    assert predicted is not None and predicted.id != first.id
+
+    pipeline = IterationPipeline(root, cfg)
+    assert pipeline.take(first.id) == {}
+    assert pipeline.start(tracker, {str(first.id)}) == predicted.id
+
+    notes = pipeline.take(predicted.id)
+    assert notes["speculation"] == "used"
+    assert notes["speculated_task_id"] == predicted.id
+    assert {"agents", "prd", "progress", "specs"} <= set(notes["speculation_prepared"])
+
+    pipeline.start(tracker, {str(first.id)})
+    assert pipeline.take(first.id)["speculation"] == "discarded"
+    assert (pipeline.used, pipeline.discarded) == (1, 1)
+
+
+def test_warm_up_fills_prompt_cache(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    cfg = load_config(root)
+    tracker = make_tracker(root, cfg, reuse=False)
+    task = tracker.select_next_task()
+    cache = get_prompt_cache()
+    cache.clear()
+
+    pipeline = IterationPipeline(root, cfg)
+    pipeline.start(tracker, set())
+    pipeline.take(task.id)
+
+    with cache.track() as stats:
+        build_prompt(root, cfg, task, 1)
+    spec = str(root / ".ralph" / "specs" / "api.md")
+    assert stats.sections[spec] == "hit"
+    assert stats.sections[str(root / ".ralph" / "AGENTS.md")] == "hit"
+
+
+def test_stop_ends_warm_up_at_a_step_boundary(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    cfg = load_config(root)
+    task = make_tracker(root, cfg, reuse=False).select_next_task()
+    stop = threading.Event()
+    stop.set()
+    prepared: list = []
+    warm_iteration_sources(root, cfg, task, prepared, stop)
+    assert prepared == ["agents", "feedback"]
+
+    pipeline = IterationPipeline(root, cfg)
+    assert pipeline.stop() is True  # nothing running
+    pipeline.start(make_tracker(root, cfg, reuse=False), set())
+    assert pipeline.stop() is True
+    assert pipeline.take(task.id)["speculation"] == "used"
+
+
+def test_concurrent_cache_writers_do_not_collide(tmp_path: Path) -> None:
+    target = tmp_path / "cache" / "index.json"
+    target.parent.mkdir()
+    errors: list = []
+
+    def writer(n: int) -> None:
+        try:
+            for i in range(50):
+                atomic_write_json(target, {"writer": n, "i": i, "pad": "x" * 4096})
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert json.loads(target.read_text(encoding="utf-8"))["i"] == 49
+    assert [p.name for p in target.parent.iterdir()] == ["index.json"]
+
+
+def test_code_map_updates_are_not_duplicated(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    for i in range(40):
+        (root / f"mod{i}.py").write_text(f"def handler_{i}():\n    pass\n", encoding="utf-8")
+    task = make_tracker(root, load_config(root), reuse=False).select_next_task()
+    barrier = threading.Barrier(2)
+    results: list = []
+
+    def build() -> None:
+        barrier.wait()
+        results.append(build_code_map(root, task).files_reindexed)
+
+    threads = [threading.Thread(target=build) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # The second caller waits for the first update and finds nothing to do.
+    assert sorted(results) == [0, 40]
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+from ralph_gold.config import load_config
+from ralph_gold.converters import convert_to_sqlite
+from ralph_gold.loop import build_prompt, split_prompt_prefix
+from ralph_gold.prd import SelectedTask
+from ralph_gold.prd_slice import build_prd_slice, format_prd_slice
+
+STORIES = [
+    {"id": "1", "title": "Schema", "passes": True, "group": "db"},
+    {"id": "2", "title": "API", "depends_on": ["1"], "group": "api", "acceptance": ["GET /items"]},
+    {"id": "3", "title": "Client", "depends_on": ["2"], "group": "ui"},
+    {"id": "4", "title": "Auth", "group": "api", "blocked": True},
+    {"id": "5", "title": "Rate limits", "group": "api"},
+    {"id": "6", "title": "Docs", "group": "docs"},
+]
+
+
+def _prd(tmp_path: Path) -> Path:
+    path = tmp_path / ".ralph" / "prd.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"stories": STORIES}), encoding="utf-8")
+    return path
+
+
+def test_slice_lists_neighbourhood_and_status_counts(tmp_path: Path) -> None:
+    task = SelectedTask(id="2", title="API", kind="json")
+    text = build_prd_slice(_prd(tmp_path), task, ".ralph/prd.json")
+
+    assert text is not None
+    assert "(6 tasks: 1 done, 4 open, 1 blocked)" in text
+    assert "- [ ] 2: API\n  - GET /items" in text
+    assert "### Depends on\n- [x] 1: Schema" in text
+    assert "### Depended on by\n- [ ] 3: Client" in text
+    assert "### Group 'api'\n- [-] 4: Auth\n- [ ] 5: Rate limits" in text
+    assert "Docs" not in text
+
+    assert build_prd_slice(tmp_path / ".ralph" / "prd.json", SelectedTask(id="99", title="?", kind="json"), "x") is None
+
+
+def test_sibling_list_is_capped() -> None:
+    tasks = [
+        {"id": str(i), "title": f"T{i}", "status": "open", "group": "g", "depends_on": [], "acceptance": []}
+        for i in range(30)
+    ]
+    text = format_prd_slice(tasks, SelectedTask(id="0", title="T0", kind="json"), "prd", max_siblings=5)
+    assert text.count("\n- [ ] ") == 1 + 5
+    assert "... 24 more in this group" in text
+
+
+def test_slice_mode_replaces_prd_in_prompt(tmp_path: Path) -> None:
+    _prd(tmp_path)
+    (tmp_path / ".ralph" / "ralph.toml").write_text(
+        '[files]\nprd = ".ralph/prd.json"\n\n[prompt]\nprd_mode = "slice"\nlayout = "cache_friendly"\n',
+        encoding="utf-8",
+    )
+    cfg = load_config(tmp_path)
+    assert cfg.prompt.prd_mode == "slice"
+
+    prompt = build_prompt(tmp_path, cfg, SelectedTask(id="3", title="Client", kind="json"), 1)
+    prefix, rest = split_prompt_prefix(prompt)
+    assert "## .ralph/prd.json (slice)" in rest
+    assert "Rate limits" not in prompt
+    assert "prd.json" not in prefix.split("<PROJECT_MEMORY>")[1]
+
+    # Without a selected task the full PRD is embedded.
+    full = build_prompt(tmp_path, replace(cfg, prompt=replace(cfg.prompt, layout="classic")), None, 1)
+    assert "Rate limits" in full
+
+
+def test_sqlite_prd_is_rendered_as_text_in_prompt(tmp_path: Path) -> None:
+    db = tmp_path / ".ralph" / "tasks.db"
+    convert_to_sqlite(_prd(tmp_path), db)
+    (tmp_path / ".ralph" / "ralph.toml").write_text(
+        '[files]\nprd = ".ralph/tasks.db"\n', encoding="utf-8"
+    )
+    cfg = load_config(tmp_path)
+    task = SelectedTask(id="3", title="Client", kind="sqlite")
+
+    full = build_prompt(tmp_path, cfg, task, 1)
+    assert "SQLite format 3" not in full
+    assert "## .ralph/tasks.db\nTasks in .ralph/tasks.db (6 tasks: 1 done, 4 open, 1 blocked)." in full
+    assert "- [x] 1: Schema" in full
+    assert "- [ ] 2: API\n  - depends on: 1\n  - GET /items" in full
+    assert "`ralph task done 3`" in full
+
+    sliced = build_prompt(tmp_path, replace(cfg, prompt=replace(cfg.prompt, prd_mode="slice")), task, 1)
+    assert "SQLite format 3" not in sliced
+    assert "list it with `ralph task list`" in sliced
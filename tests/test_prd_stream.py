@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ralph_gold import prd as prd_mod
+from ralph_gold.prd import (
+    block_task,
+    iter_json_stories,
+    load_json_prd_index,
+    select_next_task,
+    select_task_by_id,
+    status_counts,
+)
+
+
+def _write_prd(path: Path) -> None:
+    stories = [
+        {"id": "1", "title": "Done", "passes": True, "priority": 1},
+        {"id": "2", "title": "Blocked ü", "status": "blocked", "priority": 1},
+        {"id": "3", "title": "Needs 2", "depends_on": ["2"], "priority": 5},
+        {"id": "4", "title": "Needs 9", "depends_on": ["9"], "priority": 0},
+        {"id": "5", "title": "Ready", "priority": 2, "acceptance": ["run pytest"]},
+        "not a story",
+    ]
+    path.write_text(
+        json.dumps({"project": "demo", "stories": stories, "meta": {"n": 1.5}}, indent=2),
+        encoding="utf-8",
+    )
+
+
+def test_stream_matches_json_loads_with_tiny_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prd_path = tmp_path / "prd.json"
+    _write_prd(prd_path)
+    monkeypatch.setattr(prd_mod, "_STREAM_CHUNK_BYTES", 5)
+
+    expected = [
+        s for s in json.loads(prd_path.read_text(encoding="utf-8"))["stories"]
+        if isinstance(s, dict)
+    ]
+    assert list(iter_json_stories(prd_path)) == expected
+
+
+def test_index_answers_queries_without_full_load(tmp_path: Path) -> None:
+    prd_path = tmp_path / "prd.json"
+    _write_prd(prd_path)
+
+    index = load_json_prd_index(prd_path)
+    assert index is not None
+    assert len(index) == 5
+    assert index.status_counts() == (1, 1, 3, 5)
+    assert index.status("2") == "blocked"
+    assert index.status("missing") == "missing"
+    row = index.position("2")
+    assert row is not None
+    assert index.load_story(row)["title"] == "Blocked ü"
+
+    task = select_next_task(prd_path)
+    assert task is not None
+    assert task.id == "5"
+    assert select_next_task(prd_path, exclude_ids={"5"}).id == "3"
+    assert select_task_by_id(prd_path, "5").acceptance == ["run pytest"]
+
+
+def test_large_prd_persists_sidecar_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prd_path = tmp_path / "prd.json"
+    _write_prd(prd_path)
+    monkeypatch.setattr(prd_mod, "_INDEX_MIN_BYTES", 0)
+    monkeypatch.setattr(prd_mod, "_INDEX_CACHE", {})
+
+    assert status_counts(prd_path) == (1, 1, 3, 5)
+    sidecar = tmp_path / ".ralph" / "cache" / "prd.json.index.json"
+    assert sidecar.exists()
+
+    # A fresh process state reloads from the sidecar instead of re-scanning.
+    monkeypatch.setattr(prd_mod, "_INDEX_CACHE", {})
+    monkeypatch.setattr(prd_mod, "_JsonStoryStream", None)
+    assert status_counts(prd_path) == (1, 1, 3, 5)
+
+    monkeypatch.undo()
+    monkeypatch.setattr(prd_mod, "_INDEX_MIN_BYTES", 0)
+    assert block_task(prd_path, "5", reason="later") is True
+    assert status_counts(prd_path) == (1, 2, 2, 5)
+
+
+def test_sidecar_index_stays_out_of_committed_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ralph = tmp_path / ".ralph"
+    ralph.mkdir()
+    prd_path = ralph / "prd.json"
+    _write_prd(prd_path)
+    monkeypatch.setattr(prd_mod, "_INDEX_MIN_BYTES", 0)
+    monkeypatch.setattr(prd_mod, "_INDEX_CACHE", {})
+
+    status_counts(prd_path)
+    # The auto-commit unstages .ralph/cache/, so nothing else may be written.
+    assert sorted(p.name for p in ralph.iterdir()) == ["cache", "prd.json"]
+    assert (ralph / "cache" / "prd.json.index.json").exists()
+
+
+def test_malformed_json_prd_is_treated_as_unreadable(tmp_path: Path) -> None:
+    prd_path = tmp_path / "prd.json"
+    prd_path.write_text('{"stories": [{"id": "1"}, ', encoding="utf-8")
+
+    assert load_json_prd_index(prd_path) is None
+    assert status_counts(prd_path) == (0, 0, 0, 0)
+    assert select_next_task(prd_path) is None
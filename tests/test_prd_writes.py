@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from ralph_gold.prd import (
+    PrdEditBatch,
+    block_task,
+    force_task_open,
+    force_tasks_open,
+    task_status_by_id,
+)
+
+
+MD_PRD = """# PRD\r
+\r
+## Tasks\r
+\r
+- [x] Done task\r
+- [-] Blocked task — ünïcode\r
+  - Depends on: 1\r
+- [ ] Open task\r
+"""
+
+
+def test_md_block_patches_only_marker(tmp_path: Path) -> None:
+    prd_path = tmp_path / "PRD.md"
+    prd_path.write_bytes(MD_PRD.encode("utf-8"))
+    before = prd_path.read_bytes()
+
+    assert block_task(prd_path, "3", reason="stuck") is True
+
+    after = prd_path.read_bytes()
+    assert len(after) == len(before)
+    diff = [i for i, (a, b) in enumerate(zip(before, after)) if a != b]
+    assert len(diff) == 1
+    assert after.replace(b"- [-] Open task", b"- [ ] Open task") == before
+    assert task_status_by_id(prd_path, "3") == "blocked"
+
+
+def test_md_batch_replaces_the_file_atomically(tmp_path: Path) -> None:
+    prd_path = tmp_path / "PRD.md"
+    prd_path.write_bytes(MD_PRD.encode("utf-8"))
+    inode = prd_path.stat().st_ino
+
+    with PrdEditBatch(prd_path) as batch:
+        batch.force_open("2")
+        batch.block("3", reason="later")
+
+    # A new file was renamed into place rather than edited in place.
+    assert prd_path.stat().st_ino != inode
+    assert [p.name for p in tmp_path.iterdir()] == ["PRD.md"]
+    assert task_status_by_id(prd_path, "3") == "blocked"
+
+
+def test_md_force_open_is_noop_when_already_open(tmp_path: Path) -> None:
+    prd_path = tmp_path / "PRD.md"
+    prd_path.write_bytes(MD_PRD.encode("utf-8"))
+
+    assert force_task_open(prd_path, "3") is False
+    assert prd_path.read_bytes() == MD_PRD.encode("utf-8")
+
+
+def test_md_batch_commits_multiple_edits(tmp_path: Path) -> None:
+    prd_path = tmp_path / "PRD.md"
+    prd_path.write_bytes(MD_PRD.encode("utf-8"))
+
+    with PrdEditBatch(prd_path) as batch:
+        batch.force_open("1")
+        batch.force_open("2")
+        batch.block("3", reason="later")
+        batch.force_open("99")
+
+    assert batch.changed == ["1", "2", "3"]
+    assert task_status_by_id(prd_path, "1") == "open"
+    assert task_status_by_id(prd_path, "2") == "open"
+    assert task_status_by_id(prd_path, "3") == "blocked"
+    # Line endings and unicode content are preserved byte-for-byte.
+    assert prd_path.read_bytes().count(b"\r\n") == MD_PRD.count("\r\n")
+
+
+def test_json_block_splices_only_touched_story(tmp_path: Path) -> None:
+    prd_path = tmp_path / "prd.json"
+    header = '{\n    "project": "demo",\n    "stories": [\n'
+    prd_path.write_text(
+        header
+        + '        {"id": "1", "title": "One", "status": "open"},\n'
+        + '        {\n            "id": "2",\n            "title": "Two",\n'
+        + '            "status": "open"\n        }\n    ]\n}\n',
+        encoding="utf-8",
+    )
+
+    assert block_task(prd_path, "2", reason="flaky") is True
+
+    text = prd_path.read_text(encoding="utf-8")
+    assert text.startswith(header + '        {"id": "1", "title": "One", "status": "open"},\n')
+    assert '            "blocked_reason": "flaky"\n        }\n    ]\n}\n' in text
+    story = json.loads(text)["stories"][1]
+    assert story == {
+        "id": "2",
+        "title": "Two",
+        "status": "blocked",
+        "blocked": True,
+        "blocked_reason": "flaky",
+    }
+
+
+def test_json_force_tasks_open_batch(tmp_path: Path) -> None:
+    prd_path = tmp_path / "prd.json"
+    prd = {
+        "stories": [
+            {"id": "1", "title": "One", "passes": True, "completedAt": "x"},
+            {"id": "2", "title": "Two", "status": "blocked"},
+            {"id": "3", "title": "Three", "status": "open"},
+        ]
+    }
+    prd_path.write_text(json.dumps(prd, indent=2) + "\n", encoding="utf-8")
+
+    assert force_tasks_open(prd_path, ["1", "2", "3"]) == ["1", "2"]
+
+    stories = json.loads(prd_path.read_text(encoding="utf-8"))["stories"]
+    assert stories[0] == {"id": "1", "title": "One", "passes": False}
+    assert stories[1]["status"] == "open"
+    assert stories[2] == {"id": "3", "title": "Three", "status": "open"}
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from pathlib import Path
+
+from ralph_gold.config import load_config
+from ralph_gold.context_manager import load_progress_window
+from ralph_gold.loop import build_prompt
+from ralph_gold.prompt_cache import PromptSectionCache, get_prompt_cache
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_sources_are_read_once_per_version(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "AGENTS.md"
+    path.write_text("run tests", encoding="utf-8")
+    cache = PromptSectionCache()
+
+    reads = []
+    real_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self.name)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+    with cache.track() as first:
+        assert cache.text(path) == "run tests"
+        assert cache.text(tmp_path / "missing.md") == ""
+    with cache.track() as second:
+        assert cache.text(path) == "run tests"
+        assert cache.text(path, limit_chars=3) == "run\n...<truncated>...\n"
+    assert reads == ["AGENTS.md"]
+    assert first.sections == {str(path): "miss", str(tmp_path / "missing.md"): "missing"}
+    assert second.sections == {str(path): "hit"}
+    assert second.to_notes(tmp_path)["prompt_sections"] == {"AGENTS.md": "hit"}
+
+    # Same size, new mtime: re-read.
+    path.write_text("run TESTS", encoding="utf-8")
+    _bump_mtime(path)
+    with cache.track() as third:
+        assert cache.text(path) == "run TESTS"
+    assert third.misses == 1
+    assert len(reads) == 2
+
+
+def test_progress_window_matches_uncached_loader(tmp_path: Path) -> None:
+    progress = tmp_path / "progress.md"
+    progress.write_text(
+        "".join(f"[2026-01-{n:02d}T00:00:00Z]\nentry {n}\n\n" for n in range(1, 31)),
+        encoding="utf-8",
+    )
+    cache = PromptSectionCache()
+
+    for max_lines, max_chars in ((10, 10000), (100, 50), (5, 10000)):
+        assert cache.progress_window(progress, max_lines, max_chars) == load_progress_window(
+            progress, max_lines, max_chars
+        )
+    assert cache.progress_window(tmp_path / "none.md") == ("", 0, 0)
+
+
+def test_build_prompt_reuses_cached_sections(tmp_path: Path) -> None:
+    ralph = tmp_path / ".ralph"
+    (ralph / "specs").mkdir(parents=True)
+    (ralph / "PROMPT_build.md").write_text("BUILD", encoding="utf-8")
+    (ralph / "AGENTS.md").write_text("agents", encoding="utf-8")
+    (ralph / "PRD.md").write_text("# PRD\n\n## Tasks\n\n- [ ] One\n", encoding="utf-8")
+    (ralph / "specs" / "big.md").write_text("x" * 500, encoding="utf-8")
+    cfg = load_config(tmp_path)
+    cfg = replace(cfg, prompt=replace(cfg.prompt, max_single_spec_chars=100))
+
+    cache = get_prompt_cache()
+    cache.clear()
+    with cache.track() as first:
+        text = build_prompt(tmp_path, cfg, None, 1)
+    with cache.track() as second:
+        assert build_prompt(tmp_path, cfg, None, 2).replace("Iteration: 2", "Iteration: 1") == text
+
+    spec = str(ralph / "specs" / "big.md")
+    assert first.sections[spec] == "miss"
+    assert second.sections[spec] == "hit"
+    assert second.misses == 0
+    # The loader's truncation is applied to the content, not just reported.
+    assert "x" * 100 + "\n...<truncated>...\n" in text
+    assert "x" * 101 not in text
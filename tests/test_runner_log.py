@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from ralph_gold.config import load_config
+from ralph_gold.loop import run_iteration
+from ralph_gold.receipts import hash_text
+from ralph_gold.runner_log import OutputTail, RunnerLogCapture
+from ralph_gold.subprocess_helper import run_subprocess_live
+
+NOISY_AGENT = """\
+import sys
+for i in range(20000):
+    print(f"tool trace line {i:05d}")
+    if i % 5000 == 0:
+        print(f"warning {i}", file=sys.stderr)
+print("EXIT_SIGNAL: true")
+"""
+
+
+def test_output_tail_is_bounded() -> None:
+    tail = OutputTail(10)
+    for chunk in ("abcdef", "ghijkl", "mnop"):
+        tail.append(chunk)
+    assert tail.total_chars == 16
+    assert tail.dropped_chars == 6
+    assert tail.text() == "... [6 earlier chars not kept in memory] ...\nghijklmnop"
+
+    short = OutputTail(10)
+    short.append("abc")
+    assert short.text("x.log") == "abc"
+
+
+def test_capture_streams_runner_output_to_log(tmp_path: Path) -> None:
+    log_path = tmp_path / "logs" / "iter0001.log"
+    capture = RunnerLogCapture(log_path, tail_chars=200)
+    capture.start("# ralph-gold log\niteration: 1\n")
+
+    result = run_subprocess_live(
+        [sys.executable, "-c", NOISY_AGENT],
+        capture_output=False,
+        forward_output=False,
+        on_stdout=capture.on_stdout,
+        on_stderr=capture.on_stderr,
+    )
+    assert result.stdout == "" and result.returncode == 0
+    output_hash = capture.finish_output()
+    capture.close("\n--- summary ---\nreturn_code: 0\n")
+
+    stdout = "".join(f"tool trace line {i:05d}\n" for i in range(20000)) + "EXIT_SIGNAL: true\n"
+    stderr = "".join(f"warning {i}\n" for i in range(0, 20000, 5000))
+    assert output_hash == hash_text(stdout + "\n" + stderr)
+    assert log_path.read_text(encoding="utf-8") == (
+        "# ralph-gold log\niteration: 1\n"
+        f"\n--- stdout ---\n{stdout}\n"
+        f"\n--- stderr ---\n{stderr}\n"
+        "\n--- summary ---\nreturn_code: 0\n"
+    )
+    assert not capture.spool_path.exists()
+
+    tail = capture.stdout_text()
+    assert tail.endswith("EXIT_SIGNAL: true\n")
+    assert len(tail) < 400 and "iter0001.log" in tail
+    assert capture.to_notes()["stdout_chars"] == len(stdout)
+
+
+def test_partial_log_survives_an_interrupted_run(tmp_path: Path) -> None:
+    log_path = tmp_path / "iter0002.log"
+    capture = RunnerLogCapture(log_path)
+    capture.start("# ralph-gold log\n")
+    capture.on_stdout("step 1 done\n")
+    capture.on_stderr("retrying\n")
+
+    # Nothing has been closed: what a crash at this point leaves behind.
+    assert log_path.read_text(encoding="utf-8").endswith("--- stdout ---\nstep 1 done\n")
+    assert capture.spool_path.read_text(encoding="utf-8") == "retrying\n"
+    capture.close()
+
+
+def test_runner_capture_config(tmp_path: Path) -> None:
+    assert load_config(tmp_path).loop.runner_capture == "memory"
+    (tmp_path / ".ralph").mkdir()
+    (tmp_path / ".ralph" / "ralph.toml").write_text(
+        '[loop]\nrunner_capture = "Stream"\nrunner_tail_chars = 4096\n', encoding="utf-8"
+    )
+    cfg = load_config(tmp_path)
+    assert (cfg.loop.runner_capture, cfg.loop.runner_tail_chars) == ("stream", 4096)
+
+
+def test_run_iteration_streams_runner_output(tmp_path: Path) -> None:
+    ralph = tmp_path / ".ralph"
+    ralph.mkdir()
+    (ralph / "PRD.md").write_text("# PRD\n\n## Tasks\n\n- [ ] Task 1\n", encoding="utf-8")
+    (ralph / "progress.md").write_text("# Progress\n", encoding="utf-8")
+    (ralph / "AGENTS.md").write_text("# Agents\n", encoding="utf-8")
+    (ralph / "PROMPT_build.md").write_text("# Prompt\n", encoding="utf-8")
+    (ralph / "agent.py").write_text(NOISY_AGENT, encoding="utf-8")
+    (ralph / "ralph.toml").write_text(
+        "[loop]\nmax_iterations = 1\nrunner_capture = \"stream\"\nrunner_tail_chars = 500\n\n"
+        "[git]\nbranch_strategy = \"none\"\nauto_commit = false\n\n"
+        f"[runners.test]\nargv = [{json.dumps(sys.executable)}, \".ralph/agent.py\"]\n",
+        encoding="utf-8",
+    )
+    for argv in (["init"], ["add", "-A"], ["commit", "-m", "init"]):
+        subprocess.run(
+            ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", *argv],
+            cwd=tmp_path,
+            capture_output=True,
+            check=True,
+        )
+
+    result = run_iteration(tmp_path, agent="test", iteration=1)
+
+    log = result.log_path.read_text(encoding="utf-8")
+    assert "runner_capture: stream" in log
+    assert "tool trace line 00000\n" in log and "tool trace line 19999\n" in log
+    assert log.index("--- stdout ---") < log.index("--- stderr ---") < log.index("--- summary ---")
+    assert "warning 15000" in log
+    assert not list((ralph / "logs").glob("*.stderr"))
+    assert "exit_signal_raw: True" in log
+
+    runner = json.loads(next((ralph / "receipts").rglob("runner.json")).read_text(encoding="utf-8"))
+    assert runner["notes"]["runner_capture"] == "stream"
+    assert runner["notes"]["stdout_chars"] > 400_000
+    assert len(runner["notes"]["stdout_tail"]) <= 2000
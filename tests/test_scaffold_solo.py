@@ -44,3 +44,12 @@ def test_init_project_default_uses_standard_template(tmp_path: Path) -> None:
     config_path = tmp_path / ".ralph" / "ralph.toml"
     config_text = config_path.read_text(encoding="utf-8")
     assert "solo defaults" not in config_text
+
+
+def test_init_project_ignores_sqlite_scratch_files(tmp_path: Path) -> None:
+    """The scaffolded .gitignore keeps SQLite WAL/SHM files out of commits."""
+    init_project(tmp_path)
+
+    patterns = (tmp_path / ".ralph" / ".gitignore").read_text(encoding="utf-8").splitlines()
+    assert "*.db-wal" in patterns
+    assert "*.db-shm" in patterns
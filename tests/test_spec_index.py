@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from pathlib import Path
+
+from ralph_gold.config import load_config
+from ralph_gold.loop import build_prompt
+from ralph_gold.prd import SelectedTask
+from ralph_gold.spec_index import SpecIndex, retrieve_spec_sections, split_sections
+
+AUTH_SPEC = """# Authentication
+
+Intro text.
+
+## Login tokens
+
+Users log in with OAuth tokens. Token refresh happens every hour.
+
+## Password reset
+
+Reset emails expire after 24 hours.
+"""
+
+BILLING_SPEC = """# Billing
+
+## Invoices
+
+Invoices are generated monthly as PDF files.
+"""
+
+
+def _specs(root: Path) -> Path:
+    specs = root / ".ralph" / "specs"
+    (specs / "nested").mkdir(parents=True)
+    (specs / "auth.md").write_text(AUTH_SPEC, encoding="utf-8")
+    (specs / "nested" / "billing.md").write_text(BILLING_SPEC, encoding="utf-8")
+    return specs
+
+
+def test_split_sections_by_heading() -> None:
+    sections = split_sections("preamble\n" + AUTH_SPEC)
+    assert [h for h, _, _ in sections] == ["", "Authentication", "Login tokens", "Password reset"]
+    start, end = sections[2][1:]
+    assert ("preamble\n" + AUTH_SPEC)[start:end].startswith("## Login tokens")
+
+
+def test_search_ranks_sections_and_updates_incrementally(tmp_path: Path) -> None:
+    specs = _specs(tmp_path)
+    index_path = tmp_path / ".ralph" / "cache" / "spec_index.json"
+    index = SpecIndex(specs, index_path)
+    assert index.update() == 2
+    assert index_path.exists()
+
+    top, _ = index.search("refresh OAuth token")[0]
+    assert (top.path, top.heading) == ("auth.md", "Login tokens")
+    assert index.search("invoice pdf")[0][0].path == "nested/billing.md"
+    assert index.search("kubernetes") == []
+
+    # A fresh instance loads the persisted index; only changed files re-index.
+    reloaded = SpecIndex(specs, index_path)
+    assert reloaded.update() == 0
+    (specs / "nested" / "billing.md").write_text(BILLING_SPEC + "\n## Refunds\n\nRefund tokens.\n", encoding="utf-8")
+    st = (specs / "nested" / "billing.md").stat()
+    os.utime(specs / "nested" / "billing.md", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert reloaded.update() == 1
+    assert any(s.heading == "Refunds" for s in reloaded.sections)
+
+    (specs / "auth.md").unlink()
+    reloaded.update()
+    assert {s.path for s in reloaded.sections} == {"nested/billing.md"}
+
+
+def test_budget_skips_sections_that_do_not_fit(tmp_path: Path) -> None:
+    index = SpecIndex(_specs(tmp_path), tmp_path / "index.json")
+    index.update()
+
+    matches = retrieve_spec_sections(index, "token reset invoices", max_chars=120, max_section_chars=1000)
+    assert sum(len(m.text) for m in matches) <= 120
+    assert matches and all(m.score > 0 for m in matches)
+
+
+def test_relevance_mode_puts_matching_sections_in_prompt(tmp_path: Path) -> None:
+    _specs(tmp_path)
+    (tmp_path / ".ralph" / "PRD.md").write_text("# PRD\n\n## Tasks\n\n- [ ] Fix\n", encoding="utf-8")
+    cfg = load_config(tmp_path)
+    cfg = replace(cfg, prompt=replace(cfg.prompt, specs_inclusion_order="relevance"))
+
+    task = SelectedTask(id="1", title="Fix token refresh", kind="md", acceptance=["OAuth login works"])
+    prompt = build_prompt(tmp_path, cfg, task, 1)
+    assert "Token refresh happens every hour" in prompt
+    assert "Invoices are generated" not in prompt
+
+    # No match: every spec is included as before.
+    other = SelectedTask(id="2", title="Upgrade kubernetes", kind="md")
+    prompt = build_prompt(tmp_path, cfg, other, 1)
+    assert "Token refresh" in prompt
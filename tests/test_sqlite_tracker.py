@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import ralph_gold
+from ralph_gold.config import load_config
+from ralph_gold.converters import convert_to_sqlite, export_sqlite, load_task_document
+from ralph_gold.loop import run_iteration
+from ralph_gold.trackers import clear_tracker_registry, make_tracker, swap_claimed_task
+from ralph_gold.trackers.sqlite_tracker import SqliteTracker
+
+TASKS = [
+    {"id": "a", "title": "Schema", "priority": 1, "group": "db", "completed": True},
+    {"id": "b", "title": "API", "priority": 2, "group": "api", "depends_on": ["a"]},
+    {"id": "c", "title": "UI", "priority": 1, "group": "ui", "depends_on": ["b"]},
+    {"id": "d", "title": "[QUICK] Docs", "priority": 5, "acceptance": ["README updated"]},
+    {"id": "e", "title": "Blocked", "blocked": True, "blocked_reason": "waiting"},
+    {"id": "f", "title": "Needs missing", "depends_on": ["zzz"]},
+]
+
+
+@pytest.fixture
+def tracker(tmp_path: Path) -> SqliteTracker:
+    t = SqliteTracker(tmp_path / "tasks.db", owner="w1")
+    t.import_tasks(TASKS, metadata={"branch": "ralph/sqlite"})
+    yield t
+    t.close()
+
+
+def test_ready_set_counts_and_groups(tracker: SqliteTracker) -> None:
+    assert tracker.counts() == (1, 6)
+    assert tracker.branch_name() == "ralph/sqlite"
+    assert tracker.get_task_status("e") == "blocked"
+    assert tracker.get_task_status("nope") == "missing"
+
+    task = tracker.select_next_task()
+    assert task is not None and task.id == "b"
+    assert task.depends_on == ["a"]
+    assert tracker.select_next_task(exclude_ids={"b"}).id == "d"
+    assert [t.id for t in tracker.get_quick_batch()] == ["d"]
+
+    groups = tracker.get_parallel_groups()
+    assert {g: [t.id for t in ts] for g, ts in groups.items()} == {
+        "api": ["b"],
+        "default": ["d"],
+    }
+
+    snap = tracker.snapshot()
+    assert snap.ready_ids == ["b", "d"]
+    assert snap.status_counts == {"done": 1, "blocked": 1, "open": 4}
+
+
+def test_status_changes_unlock_dependents(tracker: SqliteTracker) -> None:
+    assert tracker.mark_task_done("b") is True
+    assert tracker.mark_task_done("b") is False
+    assert tracker.select_next_task().id == "c"
+
+    assert tracker.block_task("c", reason="flaky") is True
+    assert tracker.force_tasks_open(["c", "d"]) == ["c"]
+    assert tracker.is_task_done("b") is True
+    assert tracker.all_done() is False
+
+
+def test_claims_are_exclusive_across_owners(tracker: SqliteTracker, tmp_path: Path) -> None:
+    other = SqliteTracker(tmp_path / "tasks.db", owner="w2")
+    try:
+        first = tracker.claim_next_task()
+        second = other.claim_next_task()
+        assert first is not None and second is not None
+        assert {first.id, second.id} == {"b", "d"}
+        # Re-claiming returns the owner's own lease; a third worker gets nothing.
+        assert other.claim_next_task().id == second.id
+        third = SqliteTracker(tmp_path / "tasks.db", owner="w3")
+        assert third.claim_next_task() is None
+        third.close()
+
+        # The owner still sees its own claim; a release frees it for others.
+        assert tracker.select_next_task().id == first.id
+        assert tracker.release_task(first.id) is True
+        assert other.select_next_task().id == first.id
+
+        # Expired leases are reclaimable.
+        other.claim_ttl_seconds = 0
+        tracker.claim_next_task()
+        assert other.select_next_task() is not None
+    finally:
+        other.close()
+
+
+SWAP_WORKER = """\
+import json, sys, time
+from pathlib import Path
+from ralph_gold.trackers.sqlite_tracker import SqliteTracker
+
+db, owner, go = Path(sys.argv[1]), sys.argv[2], Path(sys.argv[3])
+tracker = SqliteTracker(db, owner=owner)
+held = tracker.claim_next_task()
+(go.parent / f"ready-{owner}").touch()
+while not go.exists():
+    time.sleep(0.005)
+swapped = tracker.swap_claim(held.id, "hot")
+print(json.dumps({"claimed": held.id, "swapped": swapped.id if swapped else None}))
+"""
+
+
+def test_swap_claim_never_double_claims_across_processes(tmp_path: Path) -> None:
+    db = tmp_path / "race.db"
+    seed = SqliteTracker(db, owner="seed")
+    seed.import_tasks(
+        [{"id": f"t{i}", "title": f"Task {i}", "priority": 1} for i in range(4)]
+        + [{"id": "hot", "title": "Critical", "priority": 9}]
+    )
+    go = tmp_path / "go"
+    src = str(Path(ralph_gold.__file__).resolve().parents[1])
+    path = os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")]))
+    env = {**os.environ, "PYTHONPATH": path}
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", SWAP_WORKER, str(db), f"w{i}", str(go)],
+            stdout=subprocess.PIPE,
+            text=True,
+            env=env,
+        )
+        for i in range(4)
+    ]
+    deadline = time.monotonic() + 60
+    while len(list(tmp_path.glob("ready-*"))) < len(procs) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    go.touch()
+    outcomes = [json.loads(p.communicate(timeout=60)[0]) for p in procs]
+
+    assert sorted(o["claimed"] for o in outcomes) == ["t0", "t1", "t2", "t3"]
+    winners = [o for o in outcomes if o["swapped"] == "hot"]
+    assert len(winners) == 1
+    assert all(o["swapped"] is None for o in outcomes if o not in winners)
+
+    owners = dict(seed._query("SELECT id, claimed_by FROM tasks"))
+    assert owners["hot"] == f"w{outcomes.index(winners[0])}"
+    assert owners[winners[0]["claimed"]] is None
+    for i, o in enumerate(outcomes):
+        if o is not winners[0]:
+            assert owners[o["claimed"]] == f"w{i}"
+    seed.close()
+
+
+def test_swap_is_skipped_for_trackers_that_cannot_move_claims() -> None:
+    beads = SimpleNamespace(kind="beads", get_task_by_id=lambda tid: pytest.fail("looked up"))
+    assert swap_claimed_task(beads, "1", "2") is None
+
+
+def test_make_tracker_and_round_trip_conversion(tmp_path: Path) -> None:
+    md = tmp_path / "PRD.md"
+    md.write_text(
+        "# PRD\n\n## Tasks\n\n- [x] One\n- [ ] Two\n  - Depends on: 1\n  - It works\n"
+        "- [-] Three\n",
+        encoding="utf-8",
+    )
+    db = tmp_path / ".ralph" / "tasks.db"
+    assert convert_to_sqlite(md, db) == 3
+
+    ralph = tmp_path / ".ralph"
+    (ralph / "ralph.toml").write_text('[files]\nprd = ".ralph/tasks.db"\n', encoding="utf-8")
+    clear_tracker_registry()
+    tracker = make_tracker(tmp_path, load_config(tmp_path))
+    assert tracker.kind == "sqlite"
+    assert tracker.peek_next_task().id == "2"
+    tracker.close()
+
+    out = tmp_path / "prd.json"
+    assert export_sqlite(db, out) == 3
+    stories = json.loads(out.read_text(encoding="utf-8"))["stories"]
+    assert [s["status"] for s in stories] == ["done", "open", "blocked"]
+    assert stories[1]["depends_on"] == ["1"]
+
+    assert load_task_document(db)["tasks"] == load_task_document(out)["tasks"]
+
+
+FAKE_AGENT = """\
+import re, subprocess, sys
+from pathlib import Path
+
+prompt = sys.argv[-1]
+Path(sys.argv[1]).write_text(prompt, encoding="utf-8")
+task_id = re.search(r"`ralph task done (\\S+)`", prompt).group(1)
+Path("feature.txt").write_text(f"done {task_id}\\n", encoding="utf-8")
+subprocess.run(
+    [sys.executable, "-c", "import sys; from ralph_gold.cli import main; sys.exit(main())",
+     "task", "done", task_id],
+    check=True,
+)
+print("EXIT_SIGNAL: true")
+"""
+
+
+def _git(root: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=root, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def test_loop_iteration_completes_and_commits_sqlite_task(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "repo"
+    ralph = root / ".ralph"
+    ralph.mkdir(parents=True)
+    _git(root, "init", "-q")
+    _git(root, "config", "user.email", "test@example.com")
+    _git(root, "config", "user.name", "Test User")
+    db = ralph / "tasks.db"
+    seed = SqliteTracker(db, owner="seed")
+    seed.import_tasks([{"id": "t1", "title": "Write feature"}])
+    seed.close()
+
+    agent = tmp_path / "agent.py"
+    agent.write_text(FAKE_AGENT, encoding="utf-8")
+    prompt_copy = tmp_path / "prompt.txt"
+    (ralph / "PROMPT_build.md").write_text("# Prompt\n", encoding="utf-8")
+    (ralph / "AGENTS.md").write_text("# Agents\n", encoding="utf-8")
+    (ralph / "ralph.toml").write_text(
+        '[loop]\nrunner_timeout_seconds = 60\n\n'
+        '[files]\nprd = ".ralph/tasks.db"\nprompt = ".ralph/PROMPT_build.md"\n'
+        'agents = ".ralph/AGENTS.md"\n\n[git]\nauto_commit = true\n\n'
+        f'[runners.test]\nargv = {json.dumps([sys.executable, str(agent), str(prompt_copy)])}\n',
+        encoding="utf-8",
+    )
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "init")
+
+    src = str(Path(ralph_gold.__file__).resolve().parents[1])
+    monkeypatch.setenv(
+        "PYTHONPATH", os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")]))
+    )
+    monkeypatch.chdir(root)
+    clear_tracker_registry()
+    try:
+        result = run_iteration(root, agent="test", cfg=load_config(root), iteration=1)
+    finally:
+        clear_tracker_registry()
+
+    assert "SQLite format 3" not in prompt_copy.read_text(encoding="utf-8")
+    assert result.story_id == "t1"
+    assert result.exit_signal is True
+    assert result.progress_made is True
+    assert result.repo_clean is True
+
+    # The commit holds the checkpointed database and none of its scratch files.
+    committed = _git(root, "ls-files").split()
+    assert ".ralph/tasks.db" in committed
+    assert not [p for p in committed if p.endswith(("-wal", "-shm"))]
+    snapshot = tmp_path / "committed.db"
+    snapshot.write_bytes(
+        subprocess.run(
+            ["git", "show", "HEAD:.ralph/tasks.db"], cwd=root, check=True, capture_output=True
+        ).stdout
+    )
+    reader = SqliteTracker(snapshot)
+    try:
+        assert reader.is_task_done("t1")
+    finally:
+        reader.close()
@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import os
+import signal
 import sys
+import time
+from pathlib import Path
 
-from ralph_gold.subprocess_helper import run_subprocess
+import pytest
+
+from ralph_gold.subprocess_helper import (
+    get_subprocess_engine,
+    run_subprocess,
+    run_subprocess_live,
+    run_subprocess_many,
+)
 
 
 def test_run_subprocess_supports_stdin_text() -> None:
@@ -13,3 +24,77 @@ def test_run_subprocess_supports_stdin_text() -> None:
 
     assert result.returncode == 0
     assert result.stdout.strip() == "hello from stdin"
+
+
+def test_run_subprocess_live_streams_and_captures(capsys) -> None:
+    result = run_subprocess_live(
+        [sys.executable, "-c", "import sys; sys.stdout.write('a\\r\\nb\\n'); sys.stderr.write('oops\\n')"],
+    )
+
+    assert result.stdout == "a\nb\n"
+    assert result.stderr == "oops\n"
+    captured = capsys.readouterr()
+    assert captured.out == "a\nb\n"
+    assert captured.err == "oops\n"
+
+
+def test_timeout_stops_the_whole_process_group(tmp_path: Path) -> None:
+    marker = tmp_path / "grandchild-survived"
+    # The backgrounded grandchild would touch the marker after 1s.
+    script = f"(sleep 1; touch '{marker}') & sleep 30"
+
+    start = time.monotonic()
+    fast, slow = run_subprocess_many(
+        [[sys.executable, "-c", "print('done')"], ["sh", "-c", script]],
+        timeout=1,
+        new_session=True,
+    )
+    assert time.monotonic() - start < 10
+    assert fast.stdout == "done\n" and not fast.timed_out
+    assert slow.timed_out
+
+    with pytest.raises(RuntimeError, match="timed out"):
+        run_subprocess(["sh", "-c", script], timeout=1, new_session=True)
+
+    time.sleep(1.5)
+    assert not marker.exists()
+
+
+def test_interrupt_cancels_and_stops_the_process_group(tmp_path: Path) -> None:
+    marker = tmp_path / "grandchild-survived"
+
+    def interrupt(signum, frame):
+        raise KeyboardInterrupt
+
+    previous = signal.signal(signal.SIGALRM, interrupt)
+    signal.setitimer(signal.ITIMER_REAL, 0.5)
+    try:
+        with pytest.raises(KeyboardInterrupt):
+            get_subprocess_engine().run(
+                ["sh", "-c", f"(sleep 1; touch '{marker}') & sleep 30"], new_session=True
+            )
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+    time.sleep(1.5)
+    assert not marker.exists()
+
+
+def test_only_runners_get_their_own_session() -> None:
+    probe = [sys.executable, "-c", "import os; print(os.getsid(0), os.getpgrp())"]
+
+    # git, ssh and friends keep our session (and controlling terminal).
+    sid, pgid = map(int, run_subprocess(probe).stdout.split())
+    assert (sid, pgid) == (os.getsid(0), os.getpgrp())
+
+    result = run_subprocess_live(probe, forward_output=False, new_session=True)
+    sid, pgid = map(int, result.stdout.split())
+    assert sid == pgid != os.getsid(0)
+
+
+def test_timeout_stops_a_child_in_our_session() -> None:
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="timed out"):
+        run_subprocess([sys.executable, "-c", "import time; time.sleep(30)"], timeout=1)
+    assert time.monotonic() - start < 10
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+from ralph_gold.config import load_config
+from ralph_gold.loop import build_prompt
+from ralph_gold.prd import SelectedTask
+from ralph_gold.prompt_cache import get_prompt_cache
+from ralph_gold.token_budget import (
+    SectionPolicy,
+    allocate_budget,
+    count_tokens_approx,
+    count_tokens_chars,
+    fit_items,
+    get_tokenizer,
+    truncate_to_tokens,
+)
+
+
+def test_tokenizers() -> None:
+    assert count_tokens_chars("abcdefgh") == 2
+    assert count_tokens_approx("def parse_config(path):") == 10
+    assert count_tokens_approx("   \n\t") == 0
+    assert get_tokenizer("chars") is count_tokens_chars
+    assert get_tokenizer("no-such-tokenizer") is count_tokens_approx
+
+
+def test_allocation_is_priority_ordered_with_shares() -> None:
+    policies = {
+        "high": SectionPolicy(priority=10, max_share=0.5),
+        "mid": SectionPolicy(priority=5, min_share=0.2),
+        "low": SectionPolicy(priority=1),
+    }
+    sections = [("low", "x" * 400), ("high", "x" * 400), ("mid", "x" * 400)]
+    allocation = allocate_budget(sections, 200, count_tokens_chars, fixed_tokens=40, policies=policies)
+    decisions = {s.name: s for s in allocation.sections}
+
+    # 160 available: mid reserves 32, high grows to its 80 cap, mid takes the rest.
+    assert [s.requested for s in allocation.sections] == [100, 100, 100]
+    assert decisions["high"].granted == 80
+    assert decisions["mid"].granted == 80
+    assert (decisions["low"].granted, decisions["low"].action) == (0, "dropped")
+    assert allocation.to_notes()["sections"]["high"]["action"] == "truncated"
+
+    # Everything fits: no truncation even beyond max_share.
+    roomy = allocate_budget(sections, 1000, count_tokens_chars, policies=policies)
+    assert not roomy.changed
+
+
+def test_truncation_is_deterministic_and_line_aligned() -> None:
+    text = "".join(f"line {i}\n" for i in range(100))
+    head = truncate_to_tokens(text, 50, count_tokens_chars)
+    assert head.startswith("line 0\n") and head.endswith("...<truncated>...\n")
+    assert count_tokens_chars(head) <= 50
+    assert head == truncate_to_tokens(text, 50, count_tokens_chars)
+
+    tail = truncate_to_tokens(text, 50, count_tokens_chars, keep="tail")
+    assert tail.endswith("line 99\n") and "\nline" in tail[:40]
+    assert truncate_to_tokens(text, 3, count_tokens_chars) == ""
+
+    items = [("a.md", "a" * 40), ("b.md", "b" * 400), ("c.md", "c" * 4)]
+    fitted = fit_items(items, 30, count_tokens_chars)
+    assert [name for name, _ in fitted] == ["a.md", "b.md"]
+    assert fitted[1][1].endswith("...<truncated>...\n")
+
+
+def test_build_prompt_fits_runner_budget_and_records_allocation(tmp_path: Path) -> None:
+    ralph = tmp_path / ".ralph"
+    (ralph / "specs").mkdir(parents=True)
+    (ralph / "PROMPT_build.md").write_text("BUILD", encoding="utf-8")
+    (ralph / "AGENTS.md").write_text("agents\n" * 50, encoding="utf-8")
+    (ralph / "PRD.md").write_text("# PRD\n\n## Tasks\n\n- [ ] One\n", encoding="utf-8")
+    (ralph / "progress.md").write_text(
+        "".join(f"[2026-01-{n:02d}] entry {n}\n\n" for n in range(1, 29)), encoding="utf-8"
+    )
+    (ralph / "specs" / "big.md").write_text("spec words here\n" * 400, encoding="utf-8")
+    cfg = load_config(tmp_path)
+    cfg = replace(
+        cfg,
+        prompt=replace(cfg.prompt, token_budget=100_000, runner_token_budgets={"codex": 900}, tokenizer="chars"),
+    )
+    task = SelectedTask(id="1", title="One", kind="md")
+
+    cache = get_prompt_cache()
+    with cache.track() as stats:
+        prompt = build_prompt(tmp_path, cfg, task, 1, agent="codex")
+    budget = stats.to_notes()["prompt_budget"]
+    assert count_tokens_chars(prompt) <= 900
+    assert budget["target_tokens"] == 900
+    assert budget["total_tokens"] == count_tokens_chars(prompt)
+    assert budget["sections"]["specs"]["action"] == "truncated"
+    assert budget["sections"]["agents"]["action"] == "kept"
+    # Progress keeps its newest entries.
+    assert "entry 28" in prompt and "entry 1\n" not in prompt
+
+    # The global budget is roomy: nothing is cut.
+    with cache.track() as stats:
+        build_prompt(tmp_path, cfg, task, 1, agent="claude")
+    assert all(s["action"] == "kept" for s in stats.budget["sections"].values())
+
+    # No budget configured: no allocation recorded.
+    plain = replace(cfg, prompt=replace(cfg.prompt, token_budget=0, runner_token_budgets={}))
+    with cache.track() as stats:
+        build_prompt(tmp_path, plain, task, 1, agent="codex")
+    assert "prompt_budget" not in stats.to_notes()
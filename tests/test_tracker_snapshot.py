@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from ralph_gold.config import load_config
+from ralph_gold.trackers import (
+    FileTracker,
+    TrackerSnapshot,
+    clear_tracker_registry,
+    make_tracker,
+    tracker_snapshot,
+)
+from ralph_gold.trackers.github_issues import GitHubIssuesTracker
+from ralph_gold.trackers.yaml_tracker import YamlTracker
+
+MD_PRD = """# PRD
+
+## Tasks
+
+- [x] Done
+- [-] Blocked
+- [ ] Open
+"""
+
+
+def _write_project(root: Path) -> None:
+    ralph_dir = root / ".ralph"
+    ralph_dir.mkdir()
+    (ralph_dir / "PRD.md").write_text(MD_PRD, encoding="utf-8")
+    (ralph_dir / "ralph.toml").write_text('[tracker]\nkind = "markdown"\n', encoding="utf-8")
+
+
+def test_make_tracker_reuses_instance_per_config(tmp_path: Path) -> None:
+    _write_project(tmp_path)
+    cfg = load_config(tmp_path)
+    clear_tracker_registry()
+
+    first = make_tracker(tmp_path, cfg)
+    assert make_tracker(tmp_path, cfg) is first
+    assert make_tracker(tmp_path, cfg, reuse=False) is not first
+
+    clear_tracker_registry()
+    assert make_tracker(tmp_path, cfg) is not first
+
+
+def test_file_snapshot_matches_individual_queries(tmp_path: Path) -> None:
+    prd_path = tmp_path / "PRD.md"
+    prd_path.write_text(MD_PRD, encoding="utf-8")
+    tracker = FileTracker(prd_path=prd_path)
+
+    snap = tracker.snapshot()
+    assert snap.counts() == tracker.counts() == (1, 3)
+    assert snap.status_counts == {"done": 1, "blocked": 1, "open": 1}
+    assert snap.next_task is not None
+    assert snap.next_task.id == tracker.peek_next_task().id
+    assert snap.ready_ids == [snap.next_task.id]
+    assert snap.all_done is tracker.all_done() is False
+    assert snap.all_blocked is tracker.all_blocked() is False
+
+
+def test_yaml_refresh_and_snapshot(tmp_path: Path) -> None:
+    tasks_path = tmp_path / "tasks.yaml"
+    tasks_path.write_text(
+        "version: 1\ntasks:\n  - id: a\n    title: A\n    completed: true\n"
+        "  - id: b\n    title: B\n",
+        encoding="utf-8",
+    )
+    tracker = YamlTracker(prd_path=tasks_path)
+    assert tracker.snapshot().counts() == (1, 2)
+
+    tasks_path.write_text(
+        "version: 1\ntasks:\n  - id: a\n    title: A\n    completed: true\n"
+        "  - id: b\n    title: B\n    completed: true\n",
+        encoding="utf-8",
+    )
+    tracker.refresh()
+    snap = tracker.snapshot()
+    assert snap.counts() == (2, 2)
+    assert snap.all_done is True
+    assert snap.next_task is None
+
+
+def test_tracker_snapshot_falls_back_for_plain_trackers() -> None:
+    class Minimal:
+        def counts(self):
+            return 0, 2
+
+        def peek_next_task(self):
+            return None
+
+        def all_done(self):
+            return False
+
+        def all_blocked(self):
+            raise RuntimeError("not supported")
+
+    snap = tracker_snapshot(Minimal())
+    assert isinstance(snap, TrackerSnapshot)
+    assert snap.counts() == (0, 2)
+    assert snap.status_counts == {"done": 0, "blocked": 0, "open": 2}
+    assert snap.next_task is None
+    assert snap.all_blocked is False
+
+
+def test_default_snapshot_uses_tracker_status_counts(tmp_path: Path) -> None:
+    (tmp_path / ".ralph").mkdir()
+    auth = Mock()
+    auth.api_call = Mock(return_value=[])
+    with patch("ralph_gold.trackers.github_issues.create_auth", return_value=auth):
+        tracker = GitHubIssuesTracker(tmp_path, "owner/repo")
+        tracker._save_cache(
+            [
+                {"number": 1, "title": "A", "state": "open", "labels": [{"name": "blocked"}]},
+                {"number": 2, "title": "B", "state": "open", "labels": [{"name": "ready"}]},
+                {"number": 3, "title": "C", "state": "open", "labels": []},
+            ]
+        )
+        snap = tracker_snapshot(tracker)
+
+    assert snap.status_counts == {"done": 0, "blocked": 1, "open": 2}
+    assert snap.counts() == (0, 3)
+
+    class PrdStyle:
+        def counts(self):
+            return 1, 4
+
+        def status_counts(self):
+            return 1, 2, 1, 4
+
+    assert tracker_snapshot(PrdStyle()).status_counts == {"done": 1, "blocked": 2, "open": 1}
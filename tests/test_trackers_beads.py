@@ -75,3 +75,66 @@ def test_beads_lookup_helpers(tmp_path: Path) -> None:
     assert task is not None
     assert task.id == "bd-3"
     assert tracker.get_task_status("bd-3") == "blocked"
+
+
+def _fake_bd(tracker: BeadsTracker, issues: list[dict]) -> list[list[str]]:
+    import json
+
+    calls: list[list[str]] = []
+
+    def fake_run(argv):
+        calls.append(argv)
+
+        class Dummy:
+            returncode = 0
+            stdout = json.dumps(issues) if argv[1] == "list" else "[]"
+            stderr = ""
+
+        return Dummy()
+
+    tracker._run = fake_run  # type: ignore[assignment]
+    return calls
+
+
+def test_beads_snapshot_uses_one_list_call(tmp_path: Path) -> None:
+    tracker = BeadsTracker(project_root=tmp_path, ready_args=["ready", "--json"])
+    calls = _fake_bd(
+        tracker,
+        [
+            {"id": "bd-1", "title": "Done", "status": "closed"},
+            {"id": "bd-2", "title": "Waits", "status": "open", "priority": 0,
+             "dependencies": [{"depends_on_id": "bd-4", "type": "blocks"}]},
+            {"id": "bd-3", "title": "Ready", "status": "open", "priority": 1,
+             "labels": ["group:api"]},
+            {"id": "bd-4", "title": "Stuck", "status": "blocked"},
+        ],
+    )
+
+    snap = tracker.snapshot()
+    assert snap.counts() == (1, 4)
+    assert snap.status_counts == {"done": 1, "open": 2, "blocked": 1}
+    assert snap.ready_ids == ["bd-3"]
+    assert snap.next_task is not None and snap.next_task.id == "bd-3"
+    assert tracker.counts() == (1, 4)
+    assert tracker.get_task_status("bd-4") == "blocked"
+    assert tracker.is_task_done("bd-1") is True
+    assert not tracker.all_done() and not tracker.all_blocked()
+    assert list(tracker.get_parallel_groups()) == ["api"]
+    assert calls == [["bd", "list", "--json"]]
+
+    tracker.refresh()
+    tracker.counts()
+    assert len(calls) == 2
+
+
+def test_beads_batched_reopen_invalidates_cache(tmp_path: Path) -> None:
+    tracker = BeadsTracker(project_root=tmp_path, ready_args=["ready", "--json"])
+    calls = _fake_bd(tracker, [{"id": "bd-1", "status": "blocked"}])
+
+    assert tracker.all_blocked() is True
+    assert tracker.force_tasks_open(["bd-1", "bd-2"]) == ["bd-1", "bd-2"]
+    assert calls[1] == ["bd", "update", "bd-1", "bd-2", "--status", "open", "--json"]
+
+    tracker.counts()
+    assert calls[-1] == ["bd", "list", "--json"]
+    assert len(calls) == 3
@@ -0,0 +1,365 @@
+"""Web analysis pipeline tests against a local fixture site."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+import threading
+import time
+from collections import Counter
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from ralph_gold.prd import SelectedTask
+from ralph_gold.trackers.web_analysis import (
+    HeadlessCrawler,
+    WebTracker,
+    _PreviousScan,
+    iter_sitemap_entries,
+)
+
+PAGE = """<html><head>
+<script src="/static/app.{n}.js"></script>
+<script src="/static/vendor.0123abcd4567.js"></script>
+</head><body>
+<script>fetch("/api/items/{n}"); axios.get("/api/users")</script>
+</body></html>
+"""
+
+
+class FixtureSite:
+    """Serves a directory and counts requests per (method, path)."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.hits: Counter = Counter()
+        site = self
+
+        class Handler(SimpleHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, directory=str(root), **kwargs)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                site.hits[("GET", self.path)] += 1
+                super().do_GET()
+
+            def do_HEAD(self) -> None:
+                site.hits[("HEAD", self.path)] += 1
+                super().do_HEAD()
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def write(self, rel: str, text: str) -> None:
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    def sitemap(self, paths: list[str]) -> None:
+        urls = "".join(f"<url><loc>{self.url}{p}</loc></url>" for p in paths)
+        self.write(
+            "sitemap.xml",
+            '<?xml version="1.0"?>'
+            f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>',
+        )
+
+
+@pytest.fixture
+def site(tmp_path: Path):
+    root = tmp_path / "site"
+    root.mkdir()
+    fixture = FixtureSite(root)
+    yield fixture
+    fixture.httpd.shutdown()
+    fixture.httpd.server_close()
+
+
+def _build_site(site: FixtureSite, count: int) -> None:
+    paths = []
+    for n in range(count):
+        site.write(f"p{n}.html", PAGE.format(n=n))
+        site.write(f"static/app.{n}.js", "x" * (n + 1))
+        paths.append(f"/p{n}.html")
+    site.write("static/vendor.0123abcd4567.js", "v" * 600_001)
+    site.sitemap(paths)
+
+
+def test_each_page_is_fetched_once(site: FixtureSite, tmp_path: Path) -> None:
+    _build_site(site, 30)
+
+    tracker = WebTracker(tmp_path / "project", base_url=site.url, max_concurrency=8)
+    result = tracker._result
+
+    gets: Dict[str, int] = {p: n for (m, p), n in site.hits.items() if m == "GET"}
+    assert gets.pop("/sitemap.xml") == 1
+    assert len(gets) == 30
+    assert set(gets.values()) == {1}
+
+    api_urls = {e.url for e in result.api_endpoints}
+    assert f"{site.url}/api/users" in api_urls
+    assert f"{site.url}/api/items/7" in api_urls
+    assert len(result.js_bundles) == 31
+
+    # One HEAD per distinct bundle; the large vendor bundle yields a task.
+    heads = [p for (m, p) in site.hits if m == "HEAD"]
+    assert len(heads) == 31
+    sizes = {b.url: b.metadata["size_bytes"] for b in result.js_bundles}
+    assert sizes[f"{site.url}/static/vendor.0123abcd4567.js"] == 600_001
+    assert any(t.id.startswith("bundle-optimize-") for t in result.tasks)
+    assert result.metadata["fetched_pages"] == 30
+
+
+def test_fetch_failures_are_skipped(site: FixtureSite, tmp_path: Path) -> None:
+    site.sitemap(["/missing.html"])
+
+    tracker = WebTracker(tmp_path / "project", base_url=site.url)
+
+    assert [p.url for p in tracker._result.pages] == [f"{site.url}/missing.html"]
+    assert tracker._result.api_endpoints == []
+    assert tracker._result.js_bundles == []
+
+
+def test_rescan_only_reanalyzes_changed_pages(site: FixtureSite, tmp_path: Path) -> None:
+    _build_site(site, 6)
+    tracker = WebTracker(tmp_path / "project", base_url=site.url)
+    first = tracker._result
+    first_ids = [t.id for t in first.tasks]
+
+    # p2 gains a new API call; the other pages answer 304 on revalidation.
+    site.write("p2.html", PAGE.format(n=2).replace("axios.get", 'fetch("/api/new"); axios.get'))
+    later = time.time() + 60
+    os.utime(site.root / "p2.html", (later, later))
+    site.hits.clear()
+    second = tracker.refresh_analysis()
+
+    assert second.metadata["changed_pages"] == 1
+    assert second.metadata["unchanged_pages"] == 5
+    assert second.metadata["new_tasks"] == 1
+    # Known sizes are reused, except for the unhashed bundle of the changed page.
+    assert [p for (m, p) in site.hits if m == "HEAD"] == ["/static/app.2.js"]
+
+    ids = [t.id for t in second.tasks]
+    assert len(ids) == len(set(ids))
+    assert set(first_ids) <= set(ids)
+    (new_task,) = [t for t in second.tasks if t.id not in first_ids]
+    assert new_task.title.endswith("/api/new")
+    assert new_task.id == f"api-review-{len(first_ids) + 1}"
+
+
+def test_resolved_finding_ids_are_not_reused(site: FixtureSite, tmp_path: Path) -> None:
+    _build_site(site, 3)
+    tracker = WebTracker(tmp_path / "project", base_url=site.url)
+    first_ids = [t.id for t in tracker._result.tasks]
+    # The last page's accessibility review holds the highest ID.
+    assert first_ids[-1] == f"a11y--p2.html-{len(first_ids)}"
+
+    # Drop that page: its findings are resolved and leave the task list.
+    site.sitemap(["/p0.html", "/p1.html"])
+    second = tracker.refresh_analysis()
+    assert first_ids[-1] not in [t.id for t in second.tasks]
+
+    # A new finding must not inherit a resolved finding's ID.
+    site.write("p1.html", PAGE.format(n=1).replace("axios.get", 'fetch("/api/new"); axios.get'))
+    later = time.time() + 60
+    os.utime(site.root / "p1.html", (later, later))
+    third = tracker.refresh_analysis()
+
+    (new_task,) = [t for t in third.tasks if t.title.endswith("/api/new")]
+    assert new_task.id == f"api-review-{len(first_ids) + 1}"
+
+
+def test_duplicate_finding_keys_keep_ids_when_others_disappear(
+    site: FixtureSite, tmp_path: Path
+) -> None:
+    _build_site(site, 1)
+    tracker = WebTracker(tmp_path / "project", base_url=site.url)
+
+    def keyed(*keys: str) -> list:
+        return [
+            (key, SelectedTask(id=f"task-{i + 1}", title=key, kind="web"))
+            for i, key in enumerate(keys)
+        ]
+
+    first, first_keys, _ = tracker._merge_tasks(keyed("a", "b", "a", "a"), None)
+    assert set(first_keys) == {"a", "b", "a#2", "a#3"}
+
+    previous = _PreviousScan(result=tracker._result, task_keys=first_keys)
+    second, _, new_tasks = tracker._merge_tasks(keyed("a", "a", "a"), previous)
+    assert [t.id for t in second] == [first[0].id, first[2].id, first[3].id]
+    assert new_tasks == 0
+
+
+def _urlset(urls: list[str]) -> bytes:
+    body = "".join(f"<url><loc>{u}</loc></url>" for u in urls)
+    return (
+        '<?xml version="1.0"?>'
+        f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{body}</urlset>'
+    ).encode("utf-8")
+
+
+def test_sitemap_entries_stream_in_small_gzip_chunks() -> None:
+    data = gzip.compress(_urlset([f"https://x.test/p{n}" for n in range(50)]))
+    chunks = (data[i : i + 7] for i in range(0, len(data), 7))
+
+    entries = list(iter_sitemap_entries(chunks))
+
+    assert len(entries) == 50
+    assert entries[0] == ("url", "https://x.test/p0")
+
+
+def test_sitemap_index_fan_out_shares_page_budget(site: FixtureSite, tmp_path: Path) -> None:
+    def child(name: str, urls: list[str], gz: bool) -> str:
+        path = site.root / name
+        path.write_bytes(gzip.compress(_urlset(urls)) if gz else _urlset(urls))
+        return f"<sitemap><loc>{site.url}/{name}</loc></sitemap>"
+
+    children = [
+        child("a.xml.gz", [f"{site.url}/a{n}" for n in range(40)], gz=True),
+        # Duplicates (after normalization) and off-site URLs are dropped.
+        child("b.xml", [f"{site.url}/a1", f"{site.url}/a2?utm_source=x", "https://other.test/"], gz=False),
+        child("c.xml.gz", [f"{site.url}/c{n}" for n in range(40)], gz=True),
+        f"<sitemap><loc>{site.url}/missing.xml</loc></sitemap>",
+    ]
+    site.write(
+        "sitemap.xml",
+        '<?xml version="1.0"?><sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        + "".join(children)
+        + "</sitemapindex>",
+    )
+
+    tracker = WebTracker(
+        tmp_path / "project", base_url=site.url, max_pages=60, js_analysis=False,
+        api_discovery=False,
+    )
+    urls = [p.url for p in tracker._result.pages]
+
+    assert len(urls) == 60
+    assert len(set(urls)) == 60
+    assert "https://other.test/" not in urls
+
+    unlimited = WebTracker(
+        tmp_path / "other", base_url=site.url, max_pages=1000, js_analysis=False,
+        api_discovery=False,
+    )
+    # 40 + 40 unique pages: b.xml only repeats (normalized) URLs from a.xml.
+    assert len(unlimited._result.pages) == 80
+
+
+class _FakeRequest:
+    def __init__(self, url: str, resource_type: str) -> None:
+        self.url = url
+        self.resource_type = resource_type
+
+
+class _FakeRoute:
+    def __init__(self, request: _FakeRequest, log: list) -> None:
+        self.request = request
+        self.log = log
+
+    async def abort(self) -> None:
+        self.log.append(("abort", self.request.resource_type))
+
+    async def continue_(self) -> None:
+        self.log.append(("continue", self.request.resource_type))
+
+
+class _FakeBrowser:
+    """Just enough of the async Playwright API to drive HeadlessCrawler."""
+
+    def __init__(self, links: Dict[str, list]) -> None:
+        self.links = links
+        self.routes: list = []
+        self.handlers: list = []
+        self.route_log: list = []
+        self.pages_opened = 0
+        self.in_flight = 0
+        self.peak = 0
+        browser = self
+
+        class Page:
+            url = ""
+
+            async def goto(self, url: str, **kwargs: Any) -> Any:
+                browser.in_flight += 1
+                browser.peak = max(browser.peak, browser.in_flight)
+                try:
+                    for req in (
+                        _FakeRequest(url, "document"),
+                        _FakeRequest(url + "/logo.png", "image"),
+                        _FakeRequest(url + "/font.woff2", "font"),
+                        _FakeRequest("https://x.test/api/data", "fetch"),
+                    ):
+                        for handler in browser.handlers:
+                            handler(req)
+                        for route in browser.routes:
+                            await route(_FakeRoute(req, browser.route_log))
+                    await asyncio.sleep(0.01)
+                    if url not in browser.links:
+                        raise TimeoutError("navigation timeout")
+                    self.url = url
+                    return type("Response", (), {"status": 200})()
+                finally:
+                    browser.in_flight -= 1
+
+            async def eval_on_selector_all(self, selector: str, script: str) -> list:
+                return browser.links[self.url]
+
+        class Context:
+            async def route(self, pattern: str, handler: Any) -> None:
+                browser.routes.append(handler)
+
+            def on(self, event: str, handler: Any) -> None:
+                browser.handlers.append(handler)
+
+            async def new_page(self) -> Any:
+                browser.pages_opened += 1
+                return Page()
+
+            async def close(self) -> None:
+                pass
+
+        self._context = Context()
+
+    async def new_context(self) -> Any:
+        return self._context
+
+
+def test_headless_crawler_pools_pages_and_honours_depth() -> None:
+    base = "https://x.test"
+    links = {base: [f"/s{n}" for n in range(8)] + ["/broken", "/doc.pdf", "https://other.test/"]}
+    for n in range(8):
+        links[f"{base}/s{n}"] = [f"/s{n}/deep", "/s0#top"]
+        links[f"{base}/s{n}/deep"] = ["/deeper"]
+
+    browser = _FakeBrowser(links)
+    crawler = HeadlessCrawler(base, max_pages=100, crawl_depth=2, pool_size=3)
+    pages = asyncio.run(crawler.crawl(browser))
+
+    assert browser.pages_opened == 3
+    assert browser.peak == 3
+    # Depth 0 + 8 sections + 8 deep pages; /deeper would be depth 3.
+    assert len(pages) == 17
+    assert f"{base}/deeper" not in pages
+    assert crawler.api_urls == {"https://x.test/api/data"}
+    assert ("abort", "image") in browser.route_log
+    assert ("abort", "font") in browser.route_log
+    assert ("abort", "document") not in browser.route_log
+
+    metrics = crawler.metrics()
+    assert metrics["pages_visited"] == 18
+    assert metrics["pages_failed"] == 1
+    assert metrics["blocked_requests"] == 36
+    assert {t["url"] for t in metrics["pages"] if "error" in t} == {f"{base}/broken"}
+
+    budget = HeadlessCrawler(base, max_pages=5, crawl_depth=2, pool_size=2)
+    assert len(asyncio.run(budget.crawl(_FakeBrowser(links)))) == 5
@@ -1056,3 +1056,102 @@ tasks:
         assert task.depends_on == ["1"]
     finally:
         yaml_path.unlink()
+
+
+def test_yaml_tracker_block_task_preserves_comments_and_order(tmp_path: Path):
+    """Status write-back edits only the touched task's lines."""
+    yaml_path = tmp_path / "tasks.yaml"
+    original = """version: 1
+# Sprint backlog
+tasks:
+  - id: 1
+    title: First task  # owner: api
+    acceptance:
+      - endpoint returns 200
+  - id: 2
+    title: Second task
+    completed: true
+metadata:
+  branch: feature/x
+"""
+    yaml_path.write_text(original, encoding="utf-8")
+
+    tracker = YamlTracker(yaml_path)
+    assert tracker.block_task("1", "needs design") is True
+    assert tracker.force_task_open("2") is True
+
+    assert yaml_path.read_text(encoding="utf-8") == """version: 1
+# Sprint backlog
+tasks:
+  - id: 1
+    title: First task  # owner: api
+    acceptance:
+      - endpoint returns 200
+    blocked: true
+    blocked_reason: "needs design"
+  - id: 2
+    title: Second task
+    completed: false
+metadata:
+  branch: feature/x
+"""
+    reloaded = YamlTracker(yaml_path)
+    assert reloaded.get_task_status("1") == "blocked"
+    assert reloaded.is_task_done("2") is False
+
+
+def test_yaml_tracker_reuses_cached_model(tmp_path: Path, monkeypatch):
+    """Unchanged files are not re-parsed across tracker instances."""
+    from ralph_gold.trackers import yaml_tracker
+
+    yaml_path = tmp_path / "tasks.yaml"
+    yaml_path.write_text(
+        "version: 1\ntasks:\n  - id: 1\n    title: Only task\n", encoding="utf-8"
+    )
+    yaml_tracker.clear_yaml_cache()
+    first = YamlTracker(yaml_path)
+
+    calls = []
+    real_load = yaml_tracker.yaml.load
+    monkeypatch.setattr(
+        yaml_tracker.yaml,
+        "load",
+        lambda *a, **kw: calls.append(1) or real_load(*a, **kw),
+    )
+    second = YamlTracker(yaml_path)
+    assert second.data == first.data
+    assert calls == []
+
+    # Instances never share the mutable model.
+    assert second.data is not first.data
+    second.data["tasks"][0]["title"] = "Mutated"
+    assert first.get_task_by_id("1").title == "Only task"
+    assert YamlTracker(yaml_path).get_task_by_id("1").title == "Only task"
+
+    # Any content change (even same size) invalidates the cache.
+    yaml_path.write_text(
+        "version: 1\ntasks:\n  - id: 1\n    title: Only tasK\n", encoding="utf-8"
+    )
+    third = YamlTracker(yaml_path)
+    assert calls == [1]
+    assert third.get_task_by_id("1").title == "Only tasK"
+
+
+def test_yaml_tracker_block_task_fills_empty_value(tmp_path: Path):
+    """An existing `key:` with no value is patched to valid YAML."""
+    yaml_path = tmp_path / "tasks.yaml"
+    yaml_path.write_text(
+        "version: 1\ntasks:\n  - id: 1\n    title: First task\n    blocked_reason:\n"
+        "  - id: 2\n    title: Second task\n    blocked_reason:\n",
+        encoding="utf-8",
+    )
+
+    assert YamlTracker(yaml_path).block_task("2", "why") is True
+    assert YamlTracker(yaml_path).block_task("1", "needs design") is True
+
+    text = yaml_path.read_text(encoding="utf-8")
+    assert '    blocked_reason: "needs design"\n' in text
+    assert '    blocked_reason: "why"\n' in text
+    reloaded = YamlTracker(yaml_path)
+    assert reloaded.get_task_status("1") == "blocked"
+    assert reloaded.data["tasks"][1]["blocked_reason"] == "why"